@@ -0,0 +1,357 @@
+import os
+import re
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+
+from briefcase.downloads import read_json, write_json
+from briefcase.integrations.filesystem import file_lock, file_lock_held, hold_file_lock
+
+SIZE_UNITS = ['B', 'KB', 'MB', 'GB', 'TB']
+SIZE_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)B?\s*$', re.IGNORECASE)
+
+# Items in a cache directory that are still being created: hidden staging
+# directories, temporary files, and partial downloads (and their segments
+# and validators). They are never entries of the cache.
+IN_PROGRESS_RE = re.compile(r'^\.|\.tmp$|\.part(\d+|\.json)?$')
+
+# The user lock files held by the current process, keyed by path. They are
+# shared by every cache manager in the process, as a process can't acquire
+# a lock file it already holds.
+_user_locks = {}
+_user_locks_lock = threading.Lock()
+
+
+def parse_size(value):
+    """
+    Parse a human-readable size.
+
+    :param value: A size, as a number of bytes (e.g., ``1024``), or with a
+        K, M, G or T suffix (e.g., ``500M``, ``2GB``).
+    :returns: The size in bytes.
+    """
+    match = SIZE_RE.match(value)
+    if match is None:
+        raise ValueError("Invalid size {value!r}".format(value=value))
+
+    number, unit = match.groups()
+    return int(float(number) * 1024 ** ' KMGT'.index(unit.upper() or ' '))
+
+
+def format_size(size):
+    """
+    Format a size in bytes as a human-readable string.
+
+    :param size: The size in bytes.
+    :returns: A string describing the size (e.g., ``45.1 MB``).
+    """
+    for unit in SIZE_UNITS[:-1]:
+        if size < 1024:
+            break
+        size = size / 1024
+    else:
+        unit = SIZE_UNITS[-1]
+
+    if unit == 'B':
+        return '{size} B'.format(size=int(size))
+    return '{size:.1f} {unit}'.format(size=size, unit=unit)
+
+
+def path_size(path):
+    """
+    Compute the disk usage of a file or directory.
+
+    Symlinks are not followed.
+
+    :param path: The path to measure.
+    :returns: The total size (in bytes) of the path and its content.
+    """
+    if not path.is_dir() or path.is_symlink():
+        return path.lstat().st_size
+
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except FileNotFoundError:
+                pass
+    return total
+
+
+class CacheEntry:
+    """
+    An item in a Briefcase cache.
+
+    :param name: The name of the item in the cache directory.
+    :param path: The full path of the item.
+    :param size: The disk usage of the item, in bytes.
+    :param accessed: The time the item was last used.
+    :param hits: The number of times the item has been used from the cache.
+    """
+    def __init__(self, name, path, size, accessed, hits):
+        self.name = name
+        self.path = path
+        self.size = size
+        self.accessed = accessed
+        self.hits = hits
+
+    def __repr__(self):
+        return '<CacheEntry {self.name} ({self.size} bytes)>'.format(self=self)
+
+
+class CacheManager:
+    """
+    Track the use of Briefcase's caches, and evict items that haven't been
+    used recently.
+
+    Each cache category is a directory; each item in that directory is an
+    entry in the cache. Every time an entry is used (a cache hit), or has to
+    be created (a cache miss), the use is recorded in a metadata file, along
+    with the number of bytes that were saved (or had to be downloaded).
+
+    If a category has a size limit, the least recently used entries are
+    evicted until the category fits within the limit. Entries that have been
+    used by a process that is still running (including this one) are never
+    evicted; each process that records the use of an entry holds a lock file
+    for as long as it runs, so the processes that are still using an entry
+    can be identified.
+
+    Updates to the metadata file, and evictions, are made while holding a
+    lock that is shared between processes, so concurrent Briefcase processes
+    (including the workers of a parallel job) don't lose each other's
+    updates, or evict the same entry.
+
+    :param path: The path of the metadata file.
+    :param categories: A dictionary of cache categories. The value for each
+        category is a tuple of the cache directory, and the size limit (in
+        bytes) for that directory; a limit of ``None`` means the category
+        is unlimited.
+    :param shared: The names of the categories whose directory is shared
+        with other tools (e.g., the cookiecutter template directory). Only
+        the items in these directories that Briefcase has recorded using
+        are entries in the cache; any other item is never evicted.
+    """
+    def __init__(self, path, categories, shared=()):
+        self.path = path
+        self.categories = categories
+        self.shared = set(shared)
+        self._lock = threading.Lock()
+        self._in_use = set()
+
+    @property
+    def lock_path(self):
+        "The lock that protects the metadata file and evictions."
+        return self.path.parent / '{name}.lock'.format(name=self.path.stem)
+
+    @property
+    def users_path(self):
+        "The directory of lock files held by the processes using the cache."
+        return self.path.parent / '{name}-users'.format(name=self.path.stem)
+
+    @contextmanager
+    def _locked(self):
+        with self._lock, file_lock(self.lock_path):
+            yield
+
+    def _register_user(self):
+        """
+        Hold the lock file that shows the current process is using the cache.
+
+        A forked worker process doesn't hold the locks of its parent, so it
+        registers itself separately.
+        """
+        pid = os.getpid()
+        lock_path = self.users_path / '{pid}.lock'.format(pid=pid)
+        with _user_locks_lock:
+            if lock_path not in _user_locks:
+                _user_locks[lock_path] = hold_file_lock(lock_path)
+        return pid
+
+    def _active_users(self, record):
+        """
+        Determine the processes that are still using a cache entry.
+
+        :param record: The metadata recorded for the entry.
+        :returns: The list of process IDs of the processes, other than the
+            current process, that are using the entry and are still running.
+        """
+        return [
+            pid
+            for pid in record.get('users', [])
+            if pid != os.getpid()
+            and file_lock_held(self.users_path / '{pid}.lock'.format(pid=pid))
+        ]
+
+    def category_for(self, path):
+        """
+        Determine the cache category that uses a directory.
+
+        :param path: The directory.
+        :returns: The name of the category, or ``None`` if the directory
+            isn't a cache directory.
+        """
+        for category, (cache_path, limit) in self.categories.items():
+            if path == cache_path:
+                return category
+        return None
+
+    def _record(self, category, name, size, hit):
+        with self._locked():
+            self._in_use.add((category, name))
+            pid = self._register_user()
+            metadata = read_json(self.path)
+            stats = metadata.setdefault(category, {})
+            for key in ['hits', 'misses', 'bytes_saved', 'bytes_downloaded']:
+                stats.setdefault(key, 0)
+            entry = stats.setdefault('entries', {}).setdefault(name, {'hits': 0})
+            entry['accessed'] = time.time()
+            # Forget the processes that have stopped using the entry.
+            entry['users'] = self._active_users(entry) + [pid]
+
+            if hit:
+                stats['hits'] += 1
+                stats['bytes_saved'] += size
+                entry['hits'] += 1
+            else:
+                stats['misses'] += 1
+                stats['bytes_downloaded'] += size
+
+            write_json(self.path, metadata)
+
+    def record_hit(self, category, name, size=0):
+        """
+        Record that a cache entry has been used.
+
+        :param category: The cache category.
+        :param name: The name of the entry.
+        :param size: The number of bytes that didn't need to be obtained
+            because the entry was cached.
+        """
+        self._record(category, name, size, hit=True)
+
+    def record_miss(self, category, name, size=0):
+        """
+        Record that a cache entry had to be created.
+
+        :param category: The cache category.
+        :param name: The name of the entry.
+        :param size: The number of bytes that had to be obtained to create
+            the entry.
+        """
+        self._record(category, name, size, hit=False)
+
+    def stats(self, category):
+        """
+        Retrieve the usage statistics for a cache category.
+
+        :param category: The cache category.
+        :returns: A dictionary containing the number of ``hits`` and
+            ``misses``, and the number of ``bytes_saved`` and
+            ``bytes_downloaded``.
+        """
+        stats = read_json(self.path).get(category, {})
+        return {
+            key: stats.get(key, 0)
+            for key in ['hits', 'misses', 'bytes_saved', 'bytes_downloaded']
+        }
+
+    def entries(self, category):
+        """
+        List the entries in a cache category.
+
+        The last access time of an entry is the later of the last recorded
+        use, and the modification time of the entry on disk. If the directory
+        of another category is nested inside this category, it isn't treated
+        as an entry of this category. If the category is shared, items that
+        Briefcase hasn't recorded using aren't entries of the category. Items
+        that are still being created (such as partial downloads, and staging
+        directories) aren't entries, and entries that are removed while they
+        are being listed are ignored.
+
+        :param category: The cache category.
+        :returns: A list of :class:`CacheEntry` objects, ordered from least
+            to most recently used.
+        """
+        cache_path, limit = self.categories[category]
+        recorded = read_json(self.path).get(category, {}).get('entries', {})
+
+        nested = {
+            other_path
+            for other, (other_path, other_limit) in self.categories.items()
+            if other != category
+        }
+
+        entries = []
+        if cache_path.is_dir():
+            for path in cache_path.iterdir():
+                if path in nested:
+                    continue
+                if category in self.shared and path.name not in recorded:
+                    # The item belongs to another tool.
+                    continue
+                if IN_PROGRESS_RE.search(path.name):
+                    continue
+                record = recorded.get(path.name, {})
+                try:
+                    entries.append(CacheEntry(
+                        name=path.name,
+                        path=path,
+                        size=path_size(path),
+                        accessed=max(record.get('accessed', 0), path.lstat().st_mtime),
+                        hits=record.get('hits', 0),
+                    ))
+                except FileNotFoundError:
+                    # The entry has been removed by another process.
+                    pass
+
+        return sorted(entries, key=lambda entry: entry.accessed)
+
+    def prune(self, category, limit=None):
+        """
+        Evict the least recently used entries in a cache category until the
+        category fits within its size limit.
+
+        :param category: The cache category.
+        :param limit: The size limit to enforce, in bytes. Defaults to the
+            size limit of the category.
+        :returns: The list of :class:`CacheEntry` objects that were evicted.
+        """
+        if limit is None:
+            cache_path, limit = self.categories[category]
+            if limit is None:
+                return []
+
+        with self._locked():
+            entries = self.entries(category)
+            total = sum(entry.size for entry in entries)
+            metadata = read_json(self.path)
+            recorded = metadata.get(category, {}).get('entries', {})
+
+            evicted = []
+            for entry in entries:
+                if total <= limit:
+                    break
+                if (category, entry.name) in self._in_use:
+                    continue
+                if self._active_users(recorded.get(entry.name, {})):
+                    continue
+
+                try:
+                    if entry.path.is_dir() and not entry.path.is_symlink():
+                        shutil.rmtree(entry.path)
+                    else:
+                        entry.path.unlink()
+                except FileNotFoundError:
+                    # The entry has already been removed.
+                    pass
+                total -= entry.size
+                evicted.append(entry)
+
+            if evicted:
+                for entry in evicted:
+                    recorded.pop(entry.name, None)
+                write_json(self.path, metadata)
+
+        return evicted
@@ -3,7 +3,13 @@ import sys
 from pathlib import Path
 
 from briefcase import __version__
-from briefcase.commands import DevCommand, NewCommand, UpgradeCommand
+from briefcase.commands import (
+    CacheCommand,
+    DepsCommand,
+    DevCommand,
+    NewCommand,
+    UpgradeCommand
+)
 from briefcase.platforms import get_output_formats, get_platforms
 
 from .exceptions import (
@@ -43,7 +49,7 @@ def parse_cmdline(args):
     parser.add_argument(
         'command',
         choices=[
-            'new', 'dev', 'upgrade',
+            'new', 'dev', 'upgrade', 'cache', 'deps',
             'create', 'update', 'build', 'run', 'package', 'publish'
         ],
         metavar='command',
@@ -91,6 +97,18 @@ def parse_cmdline(args):
             extra=extra
         )
         return command, options
+    elif options.command == 'cache':
+        command = CacheCommand(base_path=Path.cwd())
+        options = command.parse_options(
+            extra=extra
+        )
+        return command, options
+    elif options.command == 'deps':
+        command = DepsCommand(base_path=Path.cwd())
+        options = command.parse_options(
+            extra=extra
+        )
+        return command, options
 
     parser.add_argument(
         'platform',
@@ -1,5 +1,7 @@
 from .build import BuildCommand  # noqa
+from .cache import CacheCommand  # noqa
 from .create import CreateCommand  # noqa
+from .deps import DepsCommand  # noqa
 from .dev import DevCommand  # noqa
 from .new import NewCommand  # noqa
 from .package import PackageCommand  # noqa
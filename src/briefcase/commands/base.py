@@ -2,18 +2,24 @@
 import argparse
 import importlib
 import inspect
+import io
 import os
 import platform
 import shutil
+import subprocess
 import sys
+import tarfile
+import threading
+import time
 from abc import ABC, abstractmethod
 from cgi import parse_header
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from urllib.parse import urlparse
 
-import requests
 from cookiecutter.main import cookiecutter
 from cookiecutter.repository import is_repo_url
+from requests import exceptions as requests_exceptions
 
 try:
     import tomllib
@@ -21,15 +27,40 @@ except ModuleNotFoundError:
     import tomli as tomllib
 
 from briefcase import __version__, integrations
+from briefcase.cache import CacheManager, parse_size
 from briefcase.config import AppConfig, BaseConfig, GlobalConfig, parse_config
 from briefcase.console import Console
+from briefcase.dependencies import is_cacheable_requirement
+from briefcase.downloads import (
+    DownloadIndex,
+    DownloadProgress,
+    HTTPSession,
+    RangeRequestsUnsupported,
+    TarStreamUnpacker,
+    file_sha256,
+    if_range,
+    is_tar_archive,
+    parse_content_range,
+    partial_validator,
+    read_json,
+    write_json
+)
 from briefcase.exceptions import (
+    AppJobsFailed,
     BadNetworkResourceError,
     BriefcaseCommandError,
     BriefcaseConfigError,
-    MissingNetworkResourceError
+    MissingNetworkResourceError,
+    NetworkFailure
 )
+from briefcase.integrations.archives import unpack_zip
+from briefcase.integrations.filesystem import FileCopier, file_lock
 from briefcase.integrations.subprocess import Subprocess
+from briefcase.jobs import parallel_jobs_supported, prefix_output, run_jobs
+
+
+# The file in a template snapshot that records the commit it was made from.
+TEMPLATE_REVISION_FILE = '.briefcase-revision'
 
 
 class TemplateUnsupportedVersion(BriefcaseCommandError):
@@ -121,12 +152,36 @@ class BaseCommand(ABC):
     cmd_line = "briefcase {command} {platform} {output_format}"
     GLOBAL_CONFIG_CLASS = GlobalConfig
     APP_CONFIG_CLASS = AppConfig
+    DOWNLOAD_ATTEMPTS = 3
+    DOWNLOAD_CACHE_TTL = 24 * 60 * 60
+    DOWNLOAD_CONNECTIONS = 4
+    DOWNLOAD_SEGMENT_THRESHOLD = 16 * 1024 * 1024
+    HTTP_RETRIES = 3
+    HTTP_BACKOFF_FACTOR = 0.5
+    HTTP_TIMEOUT = 60
+    TEMPLATE_REFRESH_TTL = 60 * 60
+    CACHE_LIMITS = {
+        'support': 2 * 1024 ** 3,
+        'extracted': 2 * 1024 ** 3,
+        'tools': None,
+        'templates': 1024 ** 3,
+        'dependencies': 2 * 1024 ** 3,
+        'wheels': 2 * 1024 ** 3,
+        'bytecode': 1024 ** 3,
+        'images': 256 * 1024 ** 2,
+        'rendered': 1024 ** 3,
+    }
 
     def __init__(self, base_path, home_path=Path.home(), apps=None, input_enabled=True):
         self.base_path = base_path
         self.home_path = home_path
         self.dot_briefcase_path = home_path / ".briefcase"
         self.tools_path = self.dot_briefcase_path / 'tools'
+        self.wheelhouse_path = self.dot_briefcase_path / 'wheels'
+        self.download_index = DownloadIndex(self.dot_briefcase_path / 'downloads.json')
+        self._prefetches = {}
+        self._download_locks = {}
+        self._download_locks_lock = threading.Lock()
 
         self.global_config = None
         self.apps = {} if apps is None else apps
@@ -139,12 +194,46 @@ class BaseCommand(ABC):
         # External service APIs.
         # These are abstracted to enable testing without patching.
         self.cookiecutter = cookiecutter
-        self.requests = requests
         self.input = Console(enabled=input_enabled)
+        self.verbosity = 1
         self.os = os
         self.sys = sys
         self.shutil = shutil
         self.subprocess = Subprocess(self)
+        self.copier = FileCopier()
+
+        # Briefcase's caches, and their size limits.
+        self.cache = CacheManager(
+            self.dot_briefcase_path / 'cache.json',
+            categories={
+                'support': (self.dot_briefcase_path / 'support', self.cache_limit('support')),
+                'extracted': (
+                    self.dot_briefcase_path / 'support' / 'extracted',
+                    self.cache_limit('extracted'),
+                ),
+                'tools': (self.tools_path, self.cache_limit('tools')),
+                'templates': (self.home_path / '.cookiecutters', self.cache_limit('templates')),
+                'dependencies': (
+                    self.dot_briefcase_path / 'dependencies',
+                    self.cache_limit('dependencies'),
+                ),
+                'wheels': (self.wheelhouse_path, self.cache_limit('wheels')),
+                'bytecode': (self.dot_briefcase_path / 'bytecode', self.cache_limit('bytecode')),
+                'images': (self.dot_briefcase_path / 'images', self.cache_limit('images')),
+                'rendered': (self.dot_briefcase_path / 'rendered', self.cache_limit('rendered')),
+            },
+            # Cookiecutter (and the user) also keep templates in the
+            # template cache directory.
+            shared=['templates'],
+        )
+
+        # A single HTTP session is used for all network access, so that
+        # connections can be reused.
+        self.requests = HTTPSession(
+            retries=self._environ_int('BRIEFCASE_HTTP_RETRIES', self.HTTP_RETRIES),
+            backoff_factor=self.HTTP_BACKOFF_FACTOR,
+            timeout=self._environ_int('BRIEFCASE_HTTP_TIMEOUT', self.HTTP_TIMEOUT),
+        )
 
         # The internal Briefcase integrations API.
         self.integrations = integrations
@@ -404,6 +493,11 @@ class BaseCommand(ABC):
         self.input.enabled = command.input.enabled
         self.verbosity = command.verbosity
 
+        # Share the HTTP session, and any background downloads that are
+        # in progress.
+        self.requests = command.requests
+        self._prefetches = command._prefetches
+
     def add_default_options(self, parser):
         """
         Add the default options that exist on *all* commands
@@ -439,6 +533,82 @@ class BaseCommand(ABC):
         """
         pass
 
+    def add_jobs_option(self, parser):
+        """
+        Add the option controlling how many apps are processed in parallel.
+
+        :param parser: a stub argparse parser for the command.
+        """
+        parser.add_argument(
+            '-j',
+            '--jobs',
+            type=int,
+            default=1,
+            help='The number of apps to process in parallel. Apps processed '
+                 'in parallel cannot request user input. (default: 1)'
+        )
+
+    def run_app_pipelines(self, pipeline, options, jobs=1):
+        """
+        Run a pipeline on every app in the project.
+
+        By default, apps are processed one at a time, in alphabetical order;
+        the state returned by processing each app is passed to the next.
+
+        If more than one job is requested, apps are processed independently,
+        in parallel worker processes. The output of each app is reported,
+        prefixed by the app name, once that app is complete. Every app is
+        processed, even if others fail; the failures are reported once all
+        apps have been processed.
+
+        :param pipeline: A callable that accepts an app config, plus keyword
+            options, and processes that app.
+        :param options: The keyword options to pass to the pipeline.
+        :param jobs: The maximum number of apps to process at the same time.
+        :returns: The state returned by the last app.
+        """
+        app_names = sorted(self.apps.keys())
+        if jobs > 1 and len(app_names) > 1 and not parallel_jobs_supported():
+            print("Parallel jobs are not supported on this platform; processing apps one at a time.")
+            jobs = 1
+
+        if jobs <= 1 or len(app_names) <= 1:
+            state = None
+            for app_name in app_names:
+                state = pipeline(self.apps[app_name], **full_options(state, options))
+            return state
+
+        # Worker processes can't wait for download threads that only exist
+        # in this process, so any background downloads must be completed
+        # before the workers are started.
+        if self._prefetches:
+            print("Waiting for background downloads to complete...")
+            wait(list(self._prefetches.values()))
+
+        # Workers can't share the console.
+        self.input.enabled = False
+
+        print("Processing {count} apps, {jobs} at a time...".format(
+            count=len(app_names),
+            jobs=jobs,
+        ))
+        states = {}
+        failures = {}
+        for app_name, state, output, error in run_jobs(self, pipeline, app_names, options, jobs):
+            prefix = '[{app_name}]'.format(app_name=app_name)
+            print(prefix_output(prefix, output), end='')
+            if error:
+                print('{prefix} {error}'.format(prefix=prefix, error=error))
+                failures[app_name] = error
+            else:
+                states[app_name] = state
+            sys.stdout.flush()
+
+        if failures:
+            raise AppJobsFailed(failures)
+
+        return states[app_names[-1]]
+
     def parse_config(self, filename):
         try:
             with open(filename, 'rb') as config_file:
@@ -471,7 +641,7 @@ class BaseCommand(ABC):
         except FileNotFoundError:
             raise BriefcaseConfigError('configuration file not found')
 
-    def download_url(self, url, download_path):
+    def download_url(self, url, download_path, extract_dir=None):
         """
         Download a given URL, caching it. If it has already been downloaded,
         return the value that has been cached.
@@ -480,24 +650,146 @@ class BaseCommand(ABC):
         install process. The cached filename will be the filename portion of
         the URL, appended to the download path.
 
+        Content is streamed into a ``.part`` file next to the cache filename;
+        the ``.part`` file is only renamed to the cache filename once the full
+        content has been received. If a download is interrupted, it will be
+        resumed (using an HTTP Range request) from the content that has
+        already been received - either immediately, or the next time the
+        same file is requested. A download is only resumed if the server
+        confirms that the resource hasn't changed since the partial content
+        was received.
+
+        Every download is recorded in an index (along with a hash of the
+        content, and any cache validators provided by the server). If the URL
+        has been downloaded within the download cache TTL, the cached file is
+        used without any network access; once the TTL has expired, the server
+        is asked to confirm that the cached content is still current. In
+        either case, the content of the cached file is verified against the
+        hash in the index.
+
+        If the URL is being prefetched in the background (see
+        :meth:`prefetch_downloads`), the background download is used.
+
+        If an extraction directory is provided, the downloaded file is an
+        archive that will be unpacked into that directory. If a tar archive
+        needs to be downloaded, it is unpacked as the content arrives, so
+        the network transfer and the extraction overlap. Any other archive
+        (e.g., a zip file, which can't be unpacked until the central
+        directory at the end of the file has been received) is unpacked once
+        the download is complete.
+
         :param url: The URL to download
         :param download_path: The path to the download cache folder. This path
             will be created if it doesn't exist.
+        :param extract_dir: The directory into which the downloaded archive
+            should be unpacked (optional).
         :returns: The filename of the downloaded (or cached) file.
         """
-        download_path.mkdir(parents=True, exist_ok=True)
+        unpacker = TarStreamUnpacker(extract_dir) if extract_dir is not None else None
 
-        response = self.requests.get(url, stream=True)
-        if response.status_code == 404:
-            raise MissingNetworkResourceError(
-                url=url,
-            )
-        elif response.status_code != 200:
-            raise BadNetworkResourceError(
-                url=url,
-                status_code=response.status_code
+        filename = None
+        prefetch = self._prefetches.pop((url, download_path), None)
+        if prefetch is not None:
+            if not prefetch.done():
+                print('Waiting for background download of {url}...'.format(url=url))
+            try:
+                filename = prefetch.result()
+                print('{filename.name} already downloaded'.format(filename=filename))
+            except Exception:
+                # The background download failed. Retry in the foreground,
+                # so that the problem is reported normally.
+                pass
+
+        if filename is None:
+            filename = self._download_url(url, download_path, unpacker=unpacker)
+
+        if unpacker is not None and not unpacker.unpacked:
+            self.unpack_archive(filename, extract_dir=extract_dir)
+
+        return filename
+
+    def unpack_archive(self, filename, extract_dir):
+        """
+        Unpack an archive.
+
+        Zip files are unpacked using multiple threads, restoring any Unix
+        permissions and symlinks stored in the archive. Any other archive
+        format is unpacked using ``shutil.unpack_archive()``.
+
+        :param filename: The archive to unpack.
+        :param extract_dir: The directory into which the archive should be
+            unpacked.
+        :raises shutil.ReadError: If the archive can't be unpacked.
+        """
+        if os.fsdecode(filename).lower().endswith('.zip'):
+            unpack_zip(filename, extract_dir=extract_dir)
+        else:
+            # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
+            self.shutil.unpack_archive(
+                os.fsdecode(filename),
+                extract_dir=os.fsdecode(extract_dir)
             )
 
+    def _download_url(self, url, download_path, quiet=False, unpacker=None):
+        """
+        Download a given URL, caching it.
+
+        :param url: The URL to download
+        :param download_path: The path to the download cache folder.
+        :param quiet: Should progress output be suppressed?
+        :param unpacker: A :class:`~briefcase.downloads.TarStreamUnpacker`
+            that should unpack the content as it is downloaded (optional).
+            If the content is unpacked, the unpacker will be marked as
+            ``unpacked``.
+        :returns: The filename of the downloaded (or cached) file.
+        """
+        download_path.mkdir(parents=True, exist_ok=True)
+        cache_category = self.cache.category_for(download_path)
+
+        # If we have a record of downloading this URL, see if we can
+        # use the cached file.
+        headers = {}
+        entry = self.download_index.get(url)
+        if entry:
+            filename = Path(entry['filename'])
+            if filename.parent != download_path or not filename.exists():
+                # The cached file isn't where we need it to be.
+                entry = None
+            elif file_sha256(filename) != entry['sha256']:
+                if not quiet:
+                    print('{filename.name} appears to be corrupted; downloading again'.format(
+                        filename=filename
+                    ))
+                filename.unlink()
+                entry = None
+            elif time.time() - entry['fetched'] < self.download_cache_ttl:
+                if not quiet:
+                    print('{filename.name} already downloaded'.format(filename=filename))
+                self._record_cache_use(cache_category, filename, hit=True)
+                return filename
+            else:
+                # The cached file is stale; ask the server if it has changed.
+                if entry.get('etag'):
+                    headers['If-None-Match'] = entry['etag']
+                if entry.get('last_modified'):
+                    headers['If-Modified-Since'] = entry['last_modified']
+
+        if headers:
+            response = self.requests.get(url, stream=True, headers=headers)
+        else:
+            response = self.requests.get(url, stream=True)
+
+        if entry and response.status_code == 304:
+            # The cached file is still current.
+            response.close()
+            self.download_index.refresh(url)
+            if not quiet:
+                print('{filename.name} already downloaded'.format(filename=filename))
+            self._record_cache_use(cache_category, filename, hit=True)
+            return filename
+
+        self._verify_download_response(url, response)
+
         # The initial URL might (read: will) go through URL redirects, so
         # we need the *final* response. We look at either the `Content-Disposition`
         # header, or the final URL, to extract the cache filename.
@@ -510,88 +802,960 @@ class BaseCommand(ABC):
                 cache_full_name = parameters['filename']
         cache_name = cache_full_name.split('/')[-1]
         filename = download_path / cache_name
-        if not filename.exists():
-            # We have meaningful content, and it hasn't been cached previously,
-            # so save it in the requested location
-            print('Downloading {cache_name}...'.format(cache_name=cache_name))
-            with filename.open('wb') as f:
-                total = response.headers.get('content-length')
-                if total is None:
-                    f.write(response.content)
-                else:
-                    downloaded = 0
-                    total = int(total)
+        # Different URLs can resolve to the same file; make sure only one
+        # thread is writing any given file.
+        with self._download_lock(filename):
+            if headers or not filename.exists():
+                # We have meaningful content, and it hasn't been cached previously
+                # (or the server has confirmed that the cached content is out of
+                # date), so save it in the requested location. The new content
+                # replaces any cached content once it has been fully received.
+                if not quiet:
+                    print('Downloading {cache_name}...'.format(cache_name=cache_name))
+                self._download_file(url, response, filename, quiet=quiet, unpacker=unpacker)
+                if not quiet:
+                    print()
+                self._record_cache_use(cache_category, filename, hit=False)
+            else:
+                response.close()
+                if not quiet:
+                    print('{cache_name} already downloaded'.format(cache_name=cache_name))
+                self._record_cache_use(cache_category, filename, hit=True)
+
+        if unpacker is not None and unpacker.unpacked:
+            # The hash was computed as the content was downloaded.
+            sha256 = unpacker.sha256
+        else:
+            sha256 = file_sha256(filename)
+        self.download_index.record(
+            url,
+            filename=filename,
+            sha256=sha256,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+        )
+        return filename
+
+    @property
+    def download_cache_ttl(self):
+        """
+        The time (in seconds) for which a download is assumed to be current.
+
+        Defaults to ``DOWNLOAD_CACHE_TTL``; can be overridden with the
+        ``BRIEFCASE_DOWNLOAD_CACHE_TTL`` environment variable.
+        """
+        return self._environ_int('BRIEFCASE_DOWNLOAD_CACHE_TTL', self.DOWNLOAD_CACHE_TTL)
+
+    @property
+    def template_refresh_ttl(self):
+        """
+        The time (in seconds) for which a template branch is assumed to be
+        current after it has been checked against the template repository.
+
+        Defaults to ``TEMPLATE_REFRESH_TTL``; can be overridden with the
+        ``BRIEFCASE_TEMPLATE_REFRESH_TTL`` environment variable.
+        """
+        return self._environ_int('BRIEFCASE_TEMPLATE_REFRESH_TTL', self.TEMPLATE_REFRESH_TTL)
+
+    @property
+    def use_hardlinks(self):
+        """
+        Can files be hard linked from Briefcase's caches into app bundles?
+
+        Hard links are faster than copies, and don't use any additional
+        disk space; but if a hard linked file in a bundle is modified in
+        place, the cached copy is modified as well. Hard links are only
+        used if the ``BRIEFCASE_USE_HARDLINKS`` environment variable is set.
+        """
+        return self.os.environ.get('BRIEFCASE_USE_HARDLINKS', '').lower() in {'1', 'true', 'yes'}
+
+    def cache_limit(self, category):
+        """
+        The size limit (in bytes) for a cache category.
+
+        Defaults to the value in ``CACHE_LIMITS``; can be overridden with a
+        ``BRIEFCASE_CACHE_LIMIT_<CATEGORY>`` environment variable (e.g.,
+        ``BRIEFCASE_CACHE_LIMIT_SUPPORT=500M``). A value of ``none`` removes
+        the limit.
+
+        :param category: The cache category.
+        :returns: The size limit, or ``None`` if the category is unlimited.
+        """
+        try:
+            value = self.os.environ['BRIEFCASE_CACHE_LIMIT_{category}'.format(
+                category=category.upper()
+            )]
+            if value.lower() == 'none':
+                return None
+            return parse_size(value)
+        except (KeyError, ValueError):
+            return self.CACHE_LIMITS.get(category)
+
+    def _environ_int(self, name, default):
+        """
+        Read an integer setting from the environment.
+
+        :param name: The name of the environment variable.
+        :param default: The value to use if the environment variable isn't
+            set, or isn't an integer.
+        :returns: The value of the setting.
+        """
+        try:
+            return int(self.os.environ[name])
+        except (KeyError, ValueError):
+            return default
+
+    def _record_cache_use(self, cache_category, filename, hit):
+        """
+        Record the use of a downloaded file in the cache metadata.
+
+        If the file had to be downloaded, the cache is pruned to fit within
+        its size limit.
+
+        :param cache_category: The cache category that contains the file.
+            If ``None``, the file isn't in a managed cache.
+        :param filename: The downloaded file.
+        :param hit: Was the file already in the cache?
+        """
+        if cache_category is None:
+            return
+
+        size = filename.stat().st_size
+        if hit:
+            self.cache.record_hit(cache_category, filename.name, size)
+        else:
+            self.cache.record_miss(cache_category, filename.name, size)
+            self.cache.prune(cache_category)
+
+    def _download_lock(self, filename):
+        """
+        Obtain the lock that guards writes to a download cache file.
+
+        :param filename: The download cache file.
+        :returns: A lock object.
+        """
+        with self._download_locks_lock:
+            return self._download_locks.setdefault(filename, threading.Lock())
+
+    def download_plan(self, apps):
+        """
+        Determine the downloads this command will need to perform.
+
+        Subclasses (and platform mixins) should extend this to describe the
+        tools and support packages that they will download. The plan is a
+        best-effort prediction; it should be cheap to compute, and must not
+        have side effects.
+
+        :param apps: The app configs that the command will operate on.
+        :returns: A list of ``(url, download_path)`` pairs.
+        """
+        return []
+
+    def prefetch_downloads(self, apps):
+        """
+        Start downloading every file this command is expected to need.
+
+        Each download in the :meth:`download_plan` is started in a background
+        thread. When :meth:`download_url` is subsequently invoked for a
+        prefetched URL, it waits for the background download to complete,
+        rather than starting a new download.
+
+        The background threads are daemon threads; if the command exits
+        before a prefetch is complete, the partial content will be resumed
+        the next time the file is needed.
+
+        :param apps: The app configs that the command will operate on.
+        """
+        for url, download_path in self.download_plan(apps):
+            key = (url, download_path)
+            if key not in self._prefetches:
+                future = Future()
+                self._prefetches[key] = future
+                threading.Thread(
+                    target=self._prefetch,
+                    args=(url, download_path, future),
+                    daemon=True,
+                ).start()
+
+    def _prefetch(self, url, download_path, future):
+        """
+        Download a URL in the background, reporting the result to a future.
+
+        :param url: The URL to download
+        :param download_path: The path to the download cache folder.
+        :param future: The future that will receive the downloaded filename.
+        """
+        try:
+            future.set_result(self._download_url(url, download_path, quiet=True))
+        except Exception as e:
+            future.set_exception(e)
+
+    def _verify_download_response(self, url, response):
+        """
+        Raise an appropriate error if a download response isn't usable.
+
+        :param url: The URL that was requested.
+        :param response: The response to the download request.
+        """
+        if response.status_code == 404:
+            raise MissingNetworkResourceError(
+                url=url,
+            )
+        elif response.status_code not in {200, 206}:
+            raise BadNetworkResourceError(
+                url=url,
+                status_code=response.status_code
+            )
+
+    def _download_file(self, url, response, filename, quiet=False, unpacker=None):
+        """
+        Stream the content of a download into a cache file.
+
+        If an unpacker has been provided, the file is a tar archive, and
+        the download is starting from scratch, the archive will be unpacked
+        as it is downloaded. If the server supports range requests, and the
+        file is large enough to benefit, the file will be downloaded as
+        multiple segments over parallel connections. Otherwise, the file will
+        be downloaded as a single stream.
+
+        :param url: The URL being downloaded.
+        :param response: An open (streaming) response for the URL.
+        :param filename: The final cache filename for the download.
+        :param quiet: Should progress output be suppressed?
+        :param unpacker: The unpacker for the content of the download
+            (optional).
+        """
+        partial_filename = filename.parent / '{filename.name}.part'.format(
+            filename=filename
+        )
+
+        if (
+            unpacker is not None
+            and is_tar_archive(filename)
+            and response.status_code == 200
+            and not partial_filename.exists()
+        ):
+            if self._stream_unpack(response, partial_filename, unpacker, quiet=quiet):
+                self._complete_partial(partial_filename, filename)
+                return
+
+            # The download was interrupted, or the content couldn't be
+            # unpacked as it arrived; complete the download, and leave the
+            # archive to be unpacked once it is on disk.
+            response.close()
+            if not quiet:
+                print()
+                print('Unable to unpack {filename.name} during download; resuming...'.format(
+                    filename=filename
+                ))
+            if not partial_filename.stat().st_size:
+                response = self.requests.get(url, stream=True)
+                self._verify_download_response(url, response)
+
+        total = response.headers.get('content-length')
+        if (
+            self.DOWNLOAD_CONNECTIONS > 1
+            and response.status_code == 200
+            and total is not None
+            and int(total) >= self.DOWNLOAD_SEGMENT_THRESHOLD
+            and response.headers.get('Accept-Ranges') == 'bytes'
+            and not partial_filename.exists()
+        ):
+            validator = partial_validator(response, int(total))
+            response.close()
+            try:
+                self._download_segments(url, validator, partial_filename, filename, quiet=quiet)
+                self._complete_partial(partial_filename, filename)
+                return
+            except RangeRequestsUnsupported:
+                # The server advertised range support, but didn't honor
+                # a range request. Fall back to a single stream.
+                response = self.requests.get(url, stream=True)
+                self._verify_download_response(url, response)
+
+        self._download_stream(url, response, partial_filename, filename, quiet=quiet)
+        self._complete_partial(partial_filename, filename)
+
+    def _validator_path(self, partial_filename):
+        """
+        Determine the location of the description of a partial download.
+
+        :param partial_filename: The file containing the partial content.
+        :returns: The path of the file describing the version of the resource
+            that is being downloaded (see
+            :func:`~briefcase.downloads.partial_validator`).
+        """
+        return partial_filename.parent / '{partial_filename.name}.json'.format(
+            partial_filename=partial_filename
+        )
+
+    def _discard_partial(self, partial_filename):
+        """
+        Discard a partial download, and its description.
+
+        :param partial_filename: The file containing the partial content.
+        """
+        for path in [partial_filename, self._validator_path(partial_filename)]:
+            if path.exists():
+                path.unlink()
+
+    def _complete_partial(self, partial_filename, filename):
+        """
+        Move a completed download into place.
+
+        :param partial_filename: The file containing the downloaded content.
+        :param filename: The final cache filename for the download.
+        """
+        partial_filename.replace(filename)
+        validator_path = self._validator_path(partial_filename)
+        if validator_path.exists():
+            validator_path.unlink()
+
+    def _download_stream(self, url, response, partial_filename, filename, quiet=False):
+        """
+        Download the content of a URL as a single stream.
+
+        If a partial download exists from a previous attempt, the download
+        will be resumed, rather than restarted. If the connection drops
+        during the download, the download will be resumed up to
+        ``DOWNLOAD_ATTEMPTS`` times before giving up; any partial content
+        will be retained for the next attempt.
+
+        :param url: The URL being downloaded.
+        :param response: An open (streaming) response for the URL.
+        :param partial_filename: The file in which to accumulate content.
+        :param filename: The final cache filename for the download.
+        :param quiet: Should progress output be suppressed?
+        """
+        attempt = 0
+        while True:
+            try:
+                if partial_filename.exists() and partial_filename.stat().st_size:
+                    response.close()
+                    response = self._resume_download(url, partial_filename)
+
+                if self._stream_download(response, partial_filename, quiet=quiet):
+                    break
+            except (
+                requests_exceptions.ConnectionError,
+                requests_exceptions.ChunkedEncodingError,
+                requests_exceptions.Timeout,
+            ):
+                pass
+
+            attempt += 1
+            if attempt >= self.DOWNLOAD_ATTEMPTS:
+                if not quiet:
+                    print()
+                raise NetworkFailure('download {filename.name}'.format(
+                    filename=filename
+                ))
+            if not quiet:
+                print()
+                print('Download interrupted; resuming...')
+
+    def _download_segments(self, url, validator, partial_filename, filename, quiet=False):
+        """
+        Download the content of a URL as parallel segments.
+
+        The content is split into ``DOWNLOAD_CONNECTIONS`` segments; each
+        segment is downloaded into its own file using a range request, and
+        the segments are reassembled once they are all complete. Segments
+        are retained if the download fails, and will be resumed on the next
+        attempt - but only if the resource hasn't changed. Segment requests
+        are conditional (using ``If-Range``) on the resource being unchanged.
+
+        :param url: The URL being downloaded.
+        :param validator: The description of the version of the resource
+            being downloaded (see :func:`~briefcase.downloads.partial_validator`).
+            It must include the ``total`` size of the content.
+        :param partial_filename: The file into which the segments should be
+            reassembled.
+        :param filename: The final cache filename for the download.
+        :param quiet: Should progress output be suppressed?
+        :raises RangeRequestsUnsupported: If the server doesn't honor the
+            range requests, or the resource changes during the download.
+        """
+        total = validator['total']
+        segment_size = -(-total // self.DOWNLOAD_CONNECTIONS)
+        segments = [
+            (
+                partial_filename.parent / '{partial_filename.name}{index}'.format(
+                    partial_filename=partial_filename,
+                    index=index,
+                ),
+                start,
+                min(start + segment_size, total) - 1,
+            )
+            for index, start in enumerate(range(0, total, segment_size))
+        ]
+
+        # Segments left over from a download of a different version of the
+        # resource can't be used.
+        validator_path = self._validator_path(partial_filename)
+        if read_json(validator_path) != validator:
+            for segment_filename, start, end in segments:
+                if segment_filename.exists():
+                    segment_filename.unlink()
+            write_json(validator_path, validator)
+
+        progress = DownloadProgress(total, quiet=quiet)
+        try:
+            with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+                futures = [
+                    executor.submit(
+                        self._download_segment,
+                        url,
+                        validator,
+                        segment_filename,
+                        start,
+                        end,
+                        progress,
+                        filename,
+                    )
+                    for segment_filename, start, end in segments
+                ]
+                for future in futures:
+                    future.result()
+        except RangeRequestsUnsupported:
+            for segment_filename, start, end in segments:
+                if segment_filename.exists():
+                    segment_filename.unlink()
+            validator_path.unlink()
+            raise
+
+        with partial_filename.open('wb') as f:
+            for segment_filename, start, end in segments:
+                with segment_filename.open('rb') as segment:
+                    shutil.copyfileobj(segment, f, 1024 * 1024)
+        for segment_filename, start, end in segments:
+            segment_filename.unlink()
+
+    def _download_segment(self, url, validator, segment_filename, start, end, progress, filename):
+        """
+        Download a single segment of a URL.
+
+        :param url: The URL being downloaded.
+        :param validator: The description of the version of the resource
+            being downloaded.
+        :param segment_filename: The file in which to accumulate the content
+            of the segment. If the file already exists, the download of the
+            segment will be resumed.
+        :param start: The offset of the first byte of the segment.
+        :param end: The offset of the last byte of the segment.
+        :param progress: The progress tracker for the download.
+        :param filename: The final cache filename for the download.
+        :raises RangeRequestsUnsupported: If the server doesn't honor the
+            range request, or returns a range of a different version of the
+            resource.
+        """
+        length = end - start + 1
+        condition = if_range(validator)
+        if segment_filename.exists():
+            if segment_filename.stat().st_size > length:
+                # The segment is left over from a download of different
+                # content; discard it.
+                segment_filename.unlink()
+            else:
+                progress.update(segment_filename.stat().st_size)
+
+        attempt = 0
+        while True:
+            offset = segment_filename.stat().st_size if segment_filename.exists() else 0
+            if offset >= length:
+                return
+
+            headers = {'Range': 'bytes={start}-{end}'.format(
+                start=start + offset,
+                end=end,
+            )}
+            if condition is not None:
+                headers['If-Range'] = condition
+            try:
+                response = self.requests.get(url, stream=True, headers=headers)
+                self._verify_download_response(url, response)
+                if (
+                    response.status_code != 206
+                    or not self._resumes_partial(response, start + offset, validator)
+                ):
+                    # The server ignored the range request, or the resource
+                    # has changed.
+                    response.close()
+                    raise RangeRequestsUnsupported()
+
+                with segment_filename.open('ab') as f:
                     for data in response.iter_content(chunk_size=1024 * 1024):
-                        downloaded += len(data)
                         f.write(data)
-                        done = int(50 * downloaded / total)
-                        print('\r{}{} {}%'.format('#' * done, '.' * (50-done), 2*done), end='', flush=True)
-            print()
+                        progress.update(len(data))
+            except (
+                requests_exceptions.ConnectionError,
+                requests_exceptions.ChunkedEncodingError,
+                requests_exceptions.Timeout,
+            ):
+                pass
+            else:
+                if segment_filename.stat().st_size >= length:
+                    return
+
+            attempt += 1
+            if attempt >= self.DOWNLOAD_ATTEMPTS:
+                raise NetworkFailure('download {filename.name}'.format(
+                    filename=filename
+                ))
+
+    def _stream_unpack(self, response, partial_filename, unpacker, quiet=False):
+        """
+        Write the content of a download to a partial file, unpacking the
+        content as it arrives.
+
+        :param response: An open (streaming) 200 response.
+        :param partial_filename: The file to write.
+        :param unpacker: The unpacker for the content of the download.
+        :param quiet: Should progress output be suppressed?
+        :returns: True if the full content was received and unpacked.
+        """
+        total = response.headers.get('content-length')
+        total = int(total) if total is not None else None
+        write_json(self._validator_path(partial_filename), partial_validator(response, total))
+        progress = DownloadProgress(total, quiet=quiet)
+        try:
+            with partial_filename.open('wb') as f:
+                unpacker.unpack(
+                    response.iter_content(chunk_size=1024 * 1024),
+                    archive=f,
+                    progress=progress,
+                )
+            return True
+        except (
+            requests_exceptions.ConnectionError,
+            requests_exceptions.ChunkedEncodingError,
+            requests_exceptions.Timeout,
+            tarfile.TarError,
+            EOFError,
+            OSError,
+        ):
+            return False
+
+    def _resume_download(self, url, partial_filename):
+        """
+        Request the remainder of a partially downloaded file.
+
+        The range request is conditional (using ``If-Range``) on the resource
+        being the same version as the one that was partially downloaded; the
+        total size reported in the ``Content-Range`` of the response must
+        also match. If the version of the resource can't be confirmed, the
+        partial content is discarded, and the full content is requested.
+
+        :param url: The URL being downloaded.
+        :param partial_filename: The file containing the partial content.
+        :returns: An open (streaming) response. If the server honored the
+            range request, the response will have a 206 status code;
+            otherwise, the response will contain the full content.
+        """
+        offset = partial_filename.stat().st_size
+        validator = read_json(self._validator_path(partial_filename))
+        condition = if_range(validator)
+        if condition is None and validator.get('total') is None:
+            # Nothing identifies the version of the resource that was
+            # partially downloaded, so the partial content can't be trusted.
+            self._discard_partial(partial_filename)
+            response = self.requests.get(url, stream=True)
+            self._verify_download_response(url, response)
+            return response
+
+        headers = {'Range': 'bytes={offset}-'.format(offset=offset)}
+        if condition is not None:
+            headers['If-Range'] = condition
+        response = self.requests.get(url, stream=True, headers=headers)
+        if response.status_code == 416:
+            # The partial file is no use to us (it's at least as large as
+            # the resource on the server); discard it and start again.
+            response.close()
+            self._discard_partial(partial_filename)
+            response = self.requests.get(url, stream=True)
+        self._verify_download_response(url, response)
+
+        if response.status_code == 206 and not self._resumes_partial(response, offset, validator):
+            # The server returned a range of a different version of the
+            # resource; discard the partial content and start again.
+            response.close()
+            self._discard_partial(partial_filename)
+            response = self.requests.get(url, stream=True)
+            self._verify_download_response(url, response)
+        return response
+
+    def _resumes_partial(self, response, offset, validator):
+        """
+        Determine if a range response continues a partial download.
+
+        :param response: A 206 response to a range request.
+        :param offset: The offset that was requested.
+        :param validator: The description of the partially downloaded
+            resource.
+        :returns: True if the response contains the requested range of the
+            same version of the resource.
+        """
+        content_range = parse_content_range(response.headers.get('Content-Range'))
+        if content_range is None:
+            return False
+        start, end, total = content_range
+        etag = response.headers.get('ETag')
+        return (
+            start == offset
+            and (validator.get('total') is None or total == validator['total'])
+            and (not validator.get('etag') or not etag or etag == validator['etag'])
+        )
+
+    def _stream_download(self, response, partial_filename, quiet=False):
+        """
+        Write the content of a download response to a partial file.
+
+        :param response: An open (streaming) response. If the response is a
+            206 (Partial Content) response, the content will be appended to
+            the existing partial file; otherwise, the partial file will be
+            overwritten.
+        :param partial_filename: The file to write.
+        :param quiet: Should progress output be suppressed?
+        :returns: True if the full content was received.
+        """
+        if response.status_code == 206:
+            mode = 'ab'
+            downloaded = partial_filename.stat().st_size
         else:
-            print('{cache_name} already downloaded'.format(cache_name=cache_name))
-        return filename
+            mode = 'wb'
+            downloaded = 0
+
+        total = response.headers.get('content-length')
+        if total is not None:
+            total = downloaded + int(total)
+        if mode == 'wb':
+            # Record the version of the resource, so that the download can
+            # be safely resumed if it is interrupted.
+            write_json(self._validator_path(partial_filename), partial_validator(response, total))
+
+        progress = DownloadProgress(total, downloaded=downloaded, quiet=quiet)
+        with partial_filename.open(mode) as f:
+            for data in response.iter_content(chunk_size=1024 * 1024):
+                f.write(data)
+                progress.update(len(data))
+
+        return total is None or progress.downloaded >= total
+
+    def wheels_available(self, requires):
+        """
+        Determine if the wheelhouse can satisfy a set of requirements.
+
+        The requirements are resolved against the wheelhouse alone; the
+        network isn't used. Only wheels are considered; a source distribution
+        in the wheelhouse can't be installed without fetching its build
+        requirements.
+
+        :param requires: A list of requirements.
+        :returns: True if a wheel for every requirement (and every dependency
+            of those requirements) is available in the wheelhouse.
+        """
+        if not self.wheelhouse_path.is_dir():
+            return False
+
+        try:
+            self.subprocess.run(
+                [
+                    sys.executable, "-m",
+                    "pip", "download",
+                    "--quiet",
+                    "--no-index",
+                    "--only-binary=:all:",
+                    "--find-links={}".format(self.wheelhouse_path),
+                    "--dest={}".format(self.wheelhouse_path),
+                ] + requires,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+            return True
+        except subprocess.CalledProcessError:
+            return False
+
+    def fetch_wheels(self, requires):
+        """
+        Download a set of requirements (and their dependencies) into the
+        wheelhouse.
+
+        Packages that are already in the wheelhouse aren't downloaded again,
+        unless a newer version is available. Packages that are only available
+        as source distributions are built into wheels (fetching their build
+        requirements as needed), so they can later be installed from the
+        wheelhouse without contacting a package index.
+
+        :param requires: A list of requirements.
+        :raises subprocess.CalledProcessError: If the requirements couldn't
+            be downloaded.
+        """
+        self.wheelhouse_path.mkdir(parents=True, exist_ok=True)
+        self.subprocess.run(
+            [
+                sys.executable, "-m",
+                "pip", "wheel",
+                "--find-links={}".format(self.wheelhouse_path),
+                "--wheel-dir={}".format(self.wheelhouse_path),
+            ] + requires,
+            check=True,
+        )
+        self.cache.prune('wheels')
+
+    def pip_install(self, requires, pip_args, lock_path=None):
+        """
+        Install a set of requirements, using the wheelhouse.
+
+        Requirements are installed from the wheelhouse, without contacting
+        a package index. Any requirements that aren't available in the
+        wheelhouse are downloaded into the wheelhouse first. Requirements
+        that refer to local files or version control checkouts can't be
+        stored in the wheelhouse; if there are any, the requirements are
+        installed by pip as normal.
+
+        :param requires: A list of requirements.
+        :param pip_args: Any additional arguments for ``pip install``.
+        :param lock_path: A lock file pinning the packages that satisfy
+            ``requires``. If provided, the packages in the lock file are
+            installed, without resolving their dependencies.
+        :raises subprocess.CalledProcessError: If the requirements couldn't
+            be installed.
+        """
+        if lock_path is not None:
+            requires = ['--no-deps', '--requirement={}'.format(lock_path)]
+            cacheable = True
+        else:
+            cacheable = all(is_cacheable_requirement(requirement) for requirement in requires)
+
+        if cacheable:
+            if not self.wheels_available(requires):
+                print("Fetching dependencies into the wheelhouse...")
+                self.fetch_wheels(requires)
+            index_args = [
+                "--no-index",
+                "--find-links={}".format(self.wheelhouse_path),
+            ]
+        else:
+            index_args = []
+
+        self.subprocess.run(
+            [
+                sys.executable, "-m",
+                "pip", "install",
+            ] + pip_args + index_args + requires,
+            check=True,
+        )
+
+    def template_checked(self, template, branch):
+        """
+        Determine when a template branch was last checked against the
+        template repository.
+
+        :param template: The template URL.
+        :param branch: The template branch.
+        :returns: The time of the last check, or ``None`` if the branch has
+            never been checked.
+        """
+        return read_json(self.dot_briefcase_path / 'templates.json').get(template, {}).get(branch)
+
+    def record_template_check(self, template, branch):
+        """
+        Record that a template branch has been checked against the template
+        repository.
+
+        :param template: The template URL.
+        :param branch: The template branch.
+        """
+        index_path = self.dot_briefcase_path / 'templates.json'
+        entries = read_json(index_path)
+        entries.setdefault(template, {})[branch] = time.time()
+        write_json(index_path, entries)
+
+    def refresh_template(self, repo, branch):
+        """
+        Bring a template branch in a cached template up to date.
+
+        The head of the branch in the template repository is compared with
+        the cached branch (using ``git ls-remote``); the branch is only
+        fetched if it has changed. Fetches are shallow, and only fetch the
+        requested branch.
+
+        :param repo: The repository of the cached template.
+        :param branch: The template branch.
+        :raises git.exc.GitCommandError: If the template repository can't be
+            contacted.
+        """
+        output = repo.git.ls_remote('origin', 'refs/heads/{branch}'.format(branch=branch))
+        remote_sha = output.split()[0] if output.strip() else None
+        if remote_sha is None:
+            # The branch doesn't exist in the template repository.
+            return
+
+        remote = repo.remote(name='origin')
+        try:
+            local_sha = remote.refs[branch].commit.hexsha
+        except IndexError:
+            local_sha = None
+
+        if local_sha != remote_sha:
+            remote.fetch(
+                '+refs/heads/{branch}:refs/remotes/origin/{branch}'.format(branch=branch),
+                depth=1,
+            )
+
+    def template_snapshot_path(self, template, revision):
+        """
+        Determine the location of a snapshot of a template commit.
+
+        :param template: The template URL.
+        :param revision: The hex SHA of the template commit.
+        :returns: The path of the snapshot.
+        """
+        return self.home_path / '.cookiecutters' / '{name}-{revision}'.format(
+            name=cookiecutter_cache_path(template).name,
+            revision=revision[:12],
+        )
+
+    def snapshot_template(self, repo, template, revision):
+        """
+        Obtain a snapshot of a template commit.
+
+        A snapshot is a plain directory containing the files of a commit.
+        Snapshots are never modified once they have been created, so they can
+        be used by any number of Briefcase processes at the same time, even if
+        those processes use different branches of the template.
+
+        :param repo: The repository of the cached template.
+        :param template: The template URL.
+        :param revision: The hex SHA of the template commit.
+        :returns: The path of the snapshot.
+        """
+        snapshot_path = self.template_snapshot_path(template, revision)
+        if snapshot_path.is_dir():
+            self.cache.record_hit('templates', snapshot_path.name)
+            return snapshot_path
+
+        # Extract the commit into a staging directory, and move it into place
+        # once it is complete, so an interrupted extraction is never used.
+        staging_path = snapshot_path.parent / '.{name}.{pid}.tmp'.format(
+            name=snapshot_path.name,
+            pid=os.getpid(),
+        )
+        try:
+            archive = io.BytesIO()
+            repo.archive(archive, treeish=revision, format='tar')
+            archive.seek(0)
+            staging_path.mkdir(parents=True)
+            with tarfile.open(fileobj=archive) as tar:
+                tar.extractall(os.fsdecode(staging_path))
+            (staging_path / TEMPLATE_REVISION_FILE).write_text(revision, encoding='utf-8')
+            staging_path.rename(snapshot_path)
+        finally:
+            if staging_path.exists():
+                shutil.rmtree(staging_path)
+
+        self.cache.record_miss('templates', snapshot_path.name)
+        self.cache.prune('templates')
+        return snapshot_path
 
     def update_cookiecutter_cache(self, template: str, branch='master'):
         """
-        Ensure that we have a current checkout of a template path.
+        Ensure that we have a current snapshot of a template path.
 
         If the path is a local path, use the path as is.
 
-        If the path is a URL, look for a local cache; if one exists, update it,
-        including checking out the required branch.
+        If the path is a URL, look for a local cache; if one exists, update it.
+        If there is no local cache, make a shallow clone of the required
+        branch. The commit at the head of the required branch is then
+        extracted into a snapshot of that commit.
+
+        A template branch is only checked against the template repository if
+        it hasn't been checked within the last ``template_refresh_ttl``
+        seconds.
+
+        The template cache is shared with other Briefcase processes; an
+        inter-process lock is held while the cache is updated.
 
         :param template: The template URL or path.
         :param branch: The template branch to use. Default: ``master``
-        :return: The path to the cached template. This may be the originally
+        :return: The path to the template snapshot. This may be the originally
             provided path if the template was a file path.
         """
-        if is_repo_url(template):
-            # The app template is a repository URL.
-            #
-            # When in `no_input=True` mode, cookiecutter deletes and reclones
-            # a template directory, rather than updating the existing repo.
-            #
-            # Look for a cookiecutter cache of the template; if one exists,
-            # try to update it using git. If no cache exists, or if the cache
-            # directory isn't a git directory, or git fails for some reason,
-            # fall back to using the specified template directly.
+        if not is_repo_url(template):
+            # If this isn't a repository URL, treat it as a local directory
+            return template
+
+        # The app template is a repository URL.
+        #
+        # When in `no_input=True` mode, cookiecutter deletes and reclones
+        # a template directory, rather than updating the existing repo.
+        #
+        # Look for a cookiecutter cache of the template; if one exists,
+        # try to update it using git. If no cache exists, try to clone
+        # the template into the cache. If the cache directory isn't a git
+        # directory, or git fails for some reason, fall back to using the
+        # specified template directly.
+        #
+        # The branch is never checked out in the cache, because other
+        # processes may be using other branches of the same template.
+        cached_template = cookiecutter_cache_path(template)
+        with file_lock(self.dot_briefcase_path / 'templates.lock'):
             try:
-                cached_template = cookiecutter_cache_path(template)
                 repo = self.git.Repo(cached_template)
-                try:
-                    # Attempt to update the repository
-                    remote = repo.remote(name='origin')
-                    remote.fetch()
-                except self.git.exc.GitCommandError:
-                    # We are offline, or otherwise unable to contact
-                    # the origin git repo. It's OK to continue; but warn
-                    # the user that the template may be stale.
-                    print("***************************************************************************")
-                    print("WARNING: Unable to update template (is your computer offline?)")
-                    print("WARNING: Briefcase will use existing template without updating.")
-                    print("***************************************************************************")
-                try:
-                    # Check out the branch for the required version tag.
-                    head = remote.refs[branch]
-
-                    print("Using existing template (sha {hexsha}, updated {datestamp})".format(
-                        hexsha=head.commit.hexsha,
-                        datestamp=head.commit.committed_datetime.strftime("%c")
-                    ))
-                    head.checkout()
-                except IndexError:
-                    # No branch exists for the requested version.
-                    raise TemplateUnsupportedVersion(branch)
+                self.cache.record_hit('templates', cached_template.name)
+                checked = self.template_checked(template, branch)
+                if checked is None or time.time() - checked > self.template_refresh_ttl:
+                    try:
+                        # Attempt to update the repository
+                        self.refresh_template(repo, branch)
+                        self.record_template_check(template, branch)
+                    except self.git.exc.GitCommandError:
+                        # We are offline, or otherwise unable to contact
+                        # the origin git repo. It's OK to continue; but warn
+                        # the user that the template may be stale.
+                        print("***************************************************************************")
+                        print("WARNING: Unable to update template (is your computer offline?)")
+                        print("WARNING: Briefcase will use existing template without updating.")
+                        print("***************************************************************************")
             except self.git.exc.NoSuchPathError:
-                # Template cache path doesn't exist.
-                # Just use the template directly, rather than attempting an update.
-                cached_template = template
+                # Template cache path doesn't exist. Make a shallow clone of
+                # the required branch.
+                self.cache.record_miss('templates', cached_template.name)
+                self.cache.prune('templates')
+                try:
+                    repo = self.git.Repo.clone_from(
+                        template,
+                        cached_template,
+                        depth=1,
+                        branch=branch,
+                        single_branch=True,
+                    )
+                    self.record_template_check(template, branch)
+                except self.git.exc.GitCommandError as e:
+                    # The clone failed (git removes a partial clone).
+                    if 'Remote branch {branch} not found'.format(branch=branch) in str(e.stderr):
+                        # The template repository was contacted, but it
+                        # doesn't have a branch for the requested version.
+                        raise TemplateUnsupportedVersion(branch)
+                    # We are offline, or otherwise unable to contact the
+                    # template repository; just use the template directly,
+                    # so that cookiecutter can report the problem.
+                    return template
             except self.git.exc.InvalidGitRepositoryError:
                 # Template cache path exists, but isn't a git repository
                 # Just use the template directly, rather than attempting an update.
-                cached_template = template
-        else:
-            # If this isn't a repository URL, treat it as a local directory
-            cached_template = template
+                return template
 
-        return cached_template
+            try:
+                # Find the commit for the required version tag.
+                head = repo.remote(name='origin').refs[branch]
+            except IndexError:
+                # No branch exists for the requested version.
+                raise TemplateUnsupportedVersion(branch)
+
+            print("Using existing template (sha {hexsha}, updated {datestamp})".format(
+                hexsha=head.commit.hexsha,
+                datestamp=head.commit.committed_datetime.strftime("%c")
+            ))
+            return self.snapshot_template(repo, template, head.commit.hexsha)
@@ -15,6 +15,7 @@ class BuildCommand(BaseCommand):
             action="store_true",
             help='Update the app before building'
         )
+        self.add_jobs_option(parser)
 
     def build_app(self, app: BaseConfig, **options):
         """
@@ -54,16 +55,22 @@ class BuildCommand(BaseCommand):
         self,
         app: Optional[BaseConfig] = None,
         update: bool = False,
+        jobs: int = 1,
         **options
     ):
+        # Start the downloads that will be needed in the background.
+        self.prefetch_downloads([app] if app else [app for app_name, app in sorted(self.apps.items())])
+
         # Confirm all required tools are available
         self.verify_tools()
 
         if app:
             state = self._build_app(app, update=update, **options)
         else:
-            state = None
-            for app_name, app in sorted(self.apps.items()):
-                state = self._build_app(app, update=update, **full_options(state, options))
+            state = self.run_app_pipelines(
+                lambda app, **options: self._build_app(app, update=update, **options),
+                options,
+                jobs=jobs,
+            )
 
         return state
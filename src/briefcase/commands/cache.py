@@ -0,0 +1,157 @@
+import sys
+from datetime import datetime
+
+from briefcase.cache import format_size, parse_size
+from briefcase.exceptions import BriefcaseCommandError
+
+from .base import BaseCommand
+
+
+class CacheCommand(BaseCommand):
+    cmd_line = 'briefcase cache'
+    command = 'cache'
+    output_format = None
+    description = 'Manage the caches used by Briefcase'
+
+    @property
+    def platform(self):
+        """The cache command always reports as the local platform."""
+        return {
+            'darwin': 'macOS',
+            'linux': 'linux',
+            'win32': 'windows',
+        }[sys.platform]
+
+    def bundle_path(self, app):
+        "A placeholder; Cache command doesn't have a bundle path"
+        raise NotImplementedError()
+
+    def binary_path(self, app):
+        "A placeholder; Cache command doesn't have a binary path"
+        raise NotImplementedError()
+
+    def distribution_path(self, app, packaging_format):
+        "A placeholder; Cache command doesn't have a distribution path"
+        raise NotImplementedError()
+
+    def parse_config(self, filename):
+        """
+        The caches are shared by every project, so the cache command can be
+        used outside a project; this implementation overrides the base so
+        that no config is parsed.
+        """
+        pass
+
+    def add_options(self, parser):
+        parser.add_argument(
+            'action',
+            choices=['list', 'prune', 'stats'],
+            help='The cache action to perform (one of: %(choices)s).'
+        )
+        parser.add_argument(
+            '-c',
+            '--category',
+            dest='categories',
+            action='append',
+            choices=sorted(self.cache.categories.keys()),
+            help='The cache category to operate on. If no category is named, all categories are used.'
+        )
+        parser.add_argument(
+            '--max-size',
+            dest='max_size',
+            type=parse_size,
+            help='When pruning, the size (e.g., 500M) to reduce each cache to, '
+                 'rather than the configured limit.'
+        )
+
+    def describe_limit(self, category):
+        "Describe the size limit of a cache category"
+        cache_path, limit = self.cache.categories[category]
+        if limit is None:
+            return 'unlimited'
+        return format_size(limit)
+
+    def list_cache(self, category):
+        """
+        List the entries in a cache category.
+
+        :param category: The cache category.
+        """
+        cache_path, limit = self.cache.categories[category]
+        entries = self.cache.entries(category)
+        total = sum(entry.size for entry in entries)
+        print("[{category}] {cache_path} ({total}; limit {limit})".format(
+            category=category,
+            cache_path=cache_path,
+            total=format_size(total),
+            limit=self.describe_limit(category),
+        ))
+        if entries:
+            # Most recently used first.
+            for entry in reversed(entries):
+                print(" - {entry.name} ({size}; last used {accessed})".format(
+                    entry=entry,
+                    size=format_size(entry.size),
+                    accessed=datetime.fromtimestamp(entry.accessed).strftime('%Y-%m-%d %H:%M'),
+                ))
+        else:
+            print(" (empty)")
+
+    def prune_cache(self, category, max_size=None):
+        """
+        Evict the least recently used entries from a cache category.
+
+        :param category: The cache category.
+        :param max_size: The size to reduce the category to. Defaults to the
+            configured limit for the category.
+        """
+        evicted = self.cache.prune(category, limit=max_size)
+        if evicted:
+            print("[{category}] Removed {count} item(s), freeing {size}:".format(
+                category=category,
+                count=len(evicted),
+                size=format_size(sum(entry.size for entry in evicted)),
+            ))
+            for entry in evicted:
+                print(" - {entry.name}".format(entry=entry))
+        else:
+            print("[{category}] Nothing to remove.".format(category=category))
+
+    def cache_stats(self, category):
+        """
+        Report the usage statistics for a cache category.
+
+        :param category: The cache category.
+        """
+        stats = self.cache.stats(category)
+        entries = self.cache.entries(category)
+        uses = stats['hits'] + stats['misses']
+        print("[{category}]".format(category=category))
+        print("    Items:            {count}".format(count=len(entries)))
+        print("    Size:             {size} (limit {limit})".format(
+            size=format_size(sum(entry.size for entry in entries)),
+            limit=self.describe_limit(category),
+        ))
+        print("    Hits:             {hits}".format(hits=stats['hits']))
+        print("    Misses:           {misses}".format(misses=stats['misses']))
+        if uses:
+            print("    Hit rate:         {rate:.0%}".format(rate=stats['hits'] / uses))
+        print("    Bytes saved:      {size}".format(size=format_size(stats['bytes_saved'])))
+        print("    Bytes downloaded: {size}".format(size=format_size(stats['bytes_downloaded'])))
+
+    def __call__(self, action, categories=None, max_size=None, **options):
+        if max_size is not None and action != 'prune':
+            raise BriefcaseCommandError(
+                "--max-size can only be used when pruning the cache."
+            )
+
+        if not categories:
+            categories = sorted(self.cache.categories.keys())
+
+        for category in categories:
+            if action == 'list':
+                self.list_cache(category)
+            elif action == 'prune':
+                self.prune_cache(category, max_size=max_size)
+            else:
+                self.cache_stats(category)
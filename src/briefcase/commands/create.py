@@ -1,26 +1,61 @@
+import glob
+import hashlib
+import itertools
+import json
 import os
 import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 from typing import Optional
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from cookiecutter import exceptions as cookiecutter_exceptions
+from cookiecutter.repository import is_repo_url
 from requests import exceptions as requests_exceptions
 
 import briefcase
+from briefcase.cache import format_size
 from briefcase.config import BaseConfig
-from briefcase.exceptions import BriefcaseCommandError, NetworkFailure, MissingNetworkResourceError
+from briefcase.dependencies import (
+    DEFAULT_PRUNE_PATTERNS,
+    dependency_fingerprint,
+    distribution_name,
+    format_constraints,
+    format_lock,
+    is_cacheable_requirement,
+    locked_requires,
+    normalize_requirement,
+    pip_config,
+    resolved_packages
+)
+from briefcase.downloads import file_sha256, read_json, write_json
+from briefcase.exceptions import BriefcaseCommandError, MissingNetworkResourceError, NetworkFailure
+from briefcase.integrations.archives import pack_packages
+from briefcase.integrations.bytecode import compile_tree
+from briefcase.integrations.filesystem import materialize_tree, prune_tree, sync_tree
+from briefcase.integrations.images import (
+    can_generate_images,
+    generate_image,
+    image_dimensions,
+    parse_image_size
+)
+from briefcase.integrations.modulegraph import find_stdlib, scan_imports, shake_stdlib
+from briefcase.jobs import run_stages
 
 from .base import (
+    TEMPLATE_REVISION_FILE,
     BaseCommand,
     TemplateUnsupportedVersion,
-    UnsupportedPlatform,
-    full_options
+    UnsupportedPlatform
 )
 
+# The name of the zip file into which pure-Python dependencies are packed.
+PACKED_ARCHIVE = 'briefcase-packages.zip'
+
 
 class InvalidTemplateRepository(BriefcaseCommandError):
     def __init__(self, template):
@@ -65,6 +100,18 @@ class DependencyInstallError(BriefcaseCommandError):
         )
 
 
+class ZipPackagesUnsupported(BriefcaseCommandError):
+    def __init__(self, app_name):
+        self.app_name = app_name
+        super().__init__(
+            "The app template for {app_name!r} doesn't support zip_packages. "
+            "Packed dependencies can only be imported if the template "
+            "processes the app packages directory as a site directory; "
+            "remove the zip_packages setting, or use a template that supports "
+            "it.".format(app_name=app_name)
+        )
+
+
 class MissingAppSources(BriefcaseCommandError):
     def __init__(self, src):
         self.src = src
@@ -116,12 +163,30 @@ def write_dist_info(app: BaseConfig, dist_info_path: Path):
         f.write('Summary: {app.description}\n'.format(app=app))
 
 
+def installed_names(path):
+    """
+    List the items that have been installed into a directory.
+
+    Bytecode caches are ignored, because they can be created after the
+    content was installed.
+
+    :param path: The directory.
+    :returns: A sorted list of the names of the items in the directory.
+    """
+    return sorted(name for name in os.listdir(path) if name != '__pycache__')
+
+
 class CreateCommand(BaseCommand):
     command = 'create'
 
     def __init__(self, *args, **options):
         super().__init__(*args, **options)
         self._s3 = None
+        self._project_packages = None
+        self._project_resolved = False
+
+    def add_options(self, parser):
+        self.add_jobs_option(parser)
 
     @property
     def app_template_url(self):
@@ -147,6 +212,59 @@ class CreateCommand(BaseCommand):
             query=urlencode(self.support_package_url_query)
         )
 
+    def app_support_package_url(self, app: BaseConfig):
+        """
+        Determine the URL of the support package for an app.
+
+        :param app: The config object for the app
+        :returns: The URL (or local path) of the support package. If the app
+            pins a support revision, the revision will be included in the URL.
+        """
+        # Work out if the app defines a custom override for
+        # the support package URL.
+        try:
+            support_package_url = app.support_package
+        except AttributeError:
+            support_package_url = self.support_package_url
+
+        if support_package_url.startswith('https://') or support_package_url.startswith('http://'):
+            try:
+                support_revision = app.support_revision
+
+                # If a revision has been specified, add the revision
+                # as an query argument in the support package URL.
+                # This is a lot more painful than "add arg to query" should
+                # be because (a) url splits aren't appendable, and
+                # (b) Python 3.5 doesn't guarantee dictionary order.
+                url_parts = list(urlsplit(support_package_url))
+                query = []
+                for key, value in parse_qsl(url_parts[3]):
+                    query.append((key, value))
+                query.append(('revision', support_revision))
+                url_parts[3] = urlencode(query)
+                support_package_url = urlunsplit(url_parts)
+            except AttributeError:
+                # No support revision specified.
+                pass
+
+        return support_package_url
+
+    def download_plan(self, apps):
+        """
+        Determine the downloads this command will need to perform.
+
+        In addition to any tools, every app will need a support package.
+
+        :param apps: The app configs that the command will operate on.
+        :returns: A list of ``(url, download_path)`` pairs.
+        """
+        plan = super().download_plan(apps)
+        for app in apps:
+            support_package_url = self.app_support_package_url(app)
+            if support_package_url.startswith('https://') or support_package_url.startswith('http://'):
+                plan.append((support_package_url, self.dot_briefcase_path / 'support'))
+        return plan
+
     def icon_targets(self, app: BaseConfig):
         """
         Obtain the dictionary of icon targets that the template requires.
@@ -250,10 +368,80 @@ class CreateCommand(BaseCommand):
         """
         return {}
 
+    def template_revision(self, cached_template):
+        """
+        Determine the commit of a template that will be rendered.
+
+        :param cached_template: The template path returned by
+            :meth:`update_cookiecutter_cache`.
+        :returns: The hex SHA of the commit of the template snapshot; or
+            ``None`` if the template isn't a snapshot (e.g., if it is a local
+            template, or the template couldn't be cloned).
+        """
+        try:
+            return (Path(cached_template) / TEMPLATE_REVISION_FILE).read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
+
+    def rendered_template_path(self, app: BaseConfig, revision, extra_context):
+        """
+        Determine the location of the cached rendering of an app's template.
+
+        :param app: The config object for the app
+        :param revision: The commit of the template that is rendered.
+        :param extra_context: The context that the template is rendered with.
+        :returns: The path of the cache entry.
+        """
+        content = {
+            'briefcase': briefcase.__version__,
+            'template': app.template,
+            'branch': app.template_branch,
+            'revision': revision,
+            'context': extra_context,
+        }
+        return self.dot_briefcase_path / 'rendered' / hashlib.sha256(
+            json.dumps(content, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+
+    def cache_rendered_template(self, app: BaseConfig, cache_path):
+        """
+        Store the rendered template of an app in the rendered template cache.
+
+        :param app: The config object for the app
+        :param cache_path: The location of the cache entry.
+        """
+        bundle_path = self.bundle_path(app)
+        if not bundle_path.is_dir() or cache_path.exists():
+            return
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path = Path(tempfile.mkdtemp(dir=os.fsdecode(cache_path.parent), prefix='.'))
+        try:
+            # The bundle will be modified in place, so the cache entry must
+            # be a copy, not a hard link.
+            materialize_tree(bundle_path, staging_path, copier=self.copier)
+            try:
+                staging_path.rename(cache_path)
+            except OSError:
+                # Another process has cached the same rendering.
+                if not cache_path.exists():
+                    raise
+            self.cache.record_miss('rendered', cache_path.name)
+            self.cache.prune('rendered')
+        finally:
+            if staging_path.exists():
+                shutil.rmtree(staging_path)
+
     def generate_app_template(self, app: BaseConfig):
         """
         Create an application bundle.
 
+        Rendered templates are cached, keyed by the commit of the template,
+        the template branch, and the context the template is rendered with.
+        If the same template has been rendered with the same context before,
+        the cached rendering is copied into place, rather than rendering the
+        template again.
+
         :param app: The config object for the app
         """
         # If the app config doesn't explicitly define a template,
@@ -268,8 +456,8 @@ class CreateCommand(BaseCommand):
             template_branch=app.template_branch,
         ))
 
-        # Make sure we have an updated cookiecutter template,
-        # checked out to the right branch
+        # Make sure we have an updated snapshot of the cookiecutter template,
+        # for the right branch
         cached_template = self.update_cookiecutter_cache(
             template=app.template,
             branch=app.template_branch
@@ -291,6 +479,23 @@ class CreateCommand(BaseCommand):
         # Add in any extra template context required by the output format.
         extra_context.update(self.output_format_template_context(app))
 
+        # If the same commit of the template has been rendered with the
+        # same context before, reuse the rendering. A local template may
+        # have uncommitted changes, so its renderings aren't cached.
+        revision = None
+        if is_repo_url(app.template):
+            revision = self.template_revision(cached_template)
+        cache_path = None
+        if revision is not None:
+            cache_path = self.rendered_template_path(app, revision, extra_context)
+            if cache_path.is_dir():
+                print("Using cached rendering of template (sha {revision})".format(
+                    revision=revision,
+                ))
+                materialize_tree(cache_path, self.bundle_path(app), copier=self.copier)
+                self.cache.record_hit('rendered', cache_path.name)
+                return
+
         try:
             # Create the platform directory (if it doesn't already exist)
             output_path = self.bundle_path(app).parent
@@ -315,12 +520,114 @@ class CreateCommand(BaseCommand):
             # Branch does not exist for python version
             raise TemplateUnsupportedVersion(app.template_branch)
 
+        if cache_path is not None:
+            self.cache_rendered_template(app, cache_path)
+
+    def extracted_support_path(self, support_package_url, support_filename):
+        """
+        Determine the location of an extracted support package.
+
+        Every distinct support package (as identified by its URL - which
+        includes any pinned revision - and the hash of its content) is
+        extracted into its own directory.
+
+        :param support_package_url: The URL of the support package.
+        :param support_filename: The downloaded support package.
+        :returns: The path of the directory into which the support package
+            should be extracted.
+        """
+        entry = self.download_index.get(support_package_url)
+        if entry and Path(entry['filename']) == support_filename:
+            sha256 = entry['sha256']
+        else:
+            sha256 = file_sha256(support_filename)
+
+        key = hashlib.sha256('{support_package_url}\n{sha256}'.format(
+            support_package_url=support_package_url,
+            sha256=sha256,
+        ).encode('utf-8')).hexdigest()[:16]
+
+        name = support_filename.name
+        for suffix in ['.tar.gz', '.tgz', '.tar.bz2', '.tar.xz', '.tar', '.zip']:
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+                break
+
+        return self.dot_briefcase_path / 'support' / 'extracted' / '{name}-{key}'.format(
+            name=name,
+            key=key,
+        )
+
+    def extract_support_package(self, support_package_url):
+        """
+        Download a support package, and extract it into the store of
+        extracted support packages.
+
+        A support package is only extracted once; every app that uses the
+        same support package is installed from the same extracted copy.
+        If the support package hasn't been downloaded before, it is
+        extracted as it is downloaded.
+
+        :param support_package_url: The URL of the support package.
+        :returns: The path of the extracted support package.
+        """
+        download_path = self.dot_briefcase_path / 'support'
+        store_path = download_path / 'extracted'
+        store_path.mkdir(parents=True, exist_ok=True)
+
+        staging_path = None
+        try:
+            if self.download_index.get(support_package_url):
+                # We've downloaded this support package before;
+                # it may have already been extracted.
+                support_filename = self.download_url(
+                    url=support_package_url,
+                    download_path=download_path,
+                )
+                extracted_path = self.extracted_support_path(
+                    support_package_url,
+                    support_filename,
+                )
+                if extracted_path.exists():
+                    self.cache.record_hit('extracted', extracted_path.name)
+                    return extracted_path
+
+                print("Unpacking support package...")
+                staging_path = Path(tempfile.mkdtemp(dir=os.fsdecode(store_path), prefix='.'))
+                self.unpack_archive(support_filename, extract_dir=staging_path)
+            else:
+                # Unpack the support package as it is downloaded.
+                staging_path = Path(tempfile.mkdtemp(dir=os.fsdecode(store_path), prefix='.'))
+                support_filename = self.download_url(
+                    url=support_package_url,
+                    download_path=download_path,
+                    extract_dir=staging_path,
+                )
+                extracted_path = self.extracted_support_path(
+                    support_package_url,
+                    support_filename,
+                )
+
+            try:
+                staging_path.rename(extracted_path)
+            except OSError:
+                # Another process has extracted the same support package.
+                if not extracted_path.exists():
+                    raise
+            self.cache.record_miss('extracted', extracted_path.name)
+            self.cache.prune('extracted')
+            return extracted_path
+        finally:
+            if staging_path is not None and staging_path.exists():
+                shutil.rmtree(staging_path)
+
     def install_app_support_package(self, app: BaseConfig):
         """
         Install the application support package.
 
         :param app: The config object for the app
         """
+        support_path = self.support_path(app)
         try:
             # Work out if the app defines a custom override for
             # the support package URL.
@@ -342,31 +649,27 @@ class CreateCommand(BaseCommand):
                     print("... pinned to revision {app.support_revision}".format(
                         app=app
                     ))
-                    # If a revision has been specified, add the revision
-                    # as an query argument in the support package URL.
-                    # This is a lot more painful than "add arg to query" should
-                    # be because (a) url splits aren't appendable, and
-                    # (b) Python 3.5 doesn't guarantee dictionary order.
-                    url_parts = list(urlsplit(support_package_url))
-                    query = []
-                    for key, value in parse_qsl(url_parts[3]):
-                        query.append((key, value))
-                    query.append(('revision', app.support_revision))
-                    url_parts[3] = urlencode(query)
-                    support_package_url = urlunsplit(url_parts)
-
                 except AttributeError:
                     # No support revision specified.
                     print("... using most recent revision")
-
-                # Download the support file, caching the result
-                # in the user's briefcase support cache directory.
-                support_filename = self.download_url(
-                    url=support_package_url,
-                    download_path=self.dot_briefcase_path / 'support'
+                support_package_url = self.app_support_package_url(app)
+
+                # Download the support file, caching the result in the
+                # user's briefcase support cache directory, and extract
+                # it into the store of extracted support packages.
+                extracted_path = self.extract_support_package(support_package_url)
+
+                print("Installing support package...")
+                materialize_tree(
+                    extracted_path,
+                    support_path,
+                    hardlink=self.use_hardlinks,
+                    copier=self.copier,
                 )
             else:
-                support_filename = Path(support_package_url)
+                print("Unpacking support package...")
+                support_path.mkdir(parents=True, exist_ok=True)
+                self.unpack_archive(support_package_url, extract_dir=support_path)
         except MissingNetworkResourceError:
             # If there is a custom support package, report the missing resource as-is.
             if custom_support_package:
@@ -378,28 +681,457 @@ class CreateCommand(BaseCommand):
                 )
         except requests_exceptions.ConnectionError:
             raise NetworkFailure('downloading support package')
-
-        try:
-            print("Unpacking support package...")
-            support_path = self.support_path(app)
-            support_path.mkdir(parents=True, exist_ok=True)
-            # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-            self.shutil.unpack_archive(
-                os.fsdecode(support_filename),
-                extract_dir=os.fsdecode(support_path)
-            )
         except (shutil.ReadError, EOFError):
             print()
             raise InvalidSupportPackage(support_package_url)
 
+    def stdlib_manifest_path(self, app: BaseConfig):
+        """
+        Obtain the path of the record of the standard library modules that
+        have been removed from the bundle.
+
+        :param app: The config object for the app
+        :returns: The path of the standard library manifest.
+        """
+        return self.bundle_path(app) / 'briefcase-stdlib.json'
+
+    def prune_app_stdlib(self, app: BaseConfig):
+        """
+        Remove the standard library modules that the app can't import from
+        the support package in the bundle.
+
+        The imports of the app code and its dependencies are traced through
+        the standard library; modules that can't be reached (along with any
+        modules named by the ``stdlib_includes`` setting of the app) are
+        removed.
+
+        :param app: The config object for the app
+        """
+        manifest_path = self.stdlib_manifest_path(app)
+        stdlib_path = find_stdlib(self.support_path(app))
+        if stdlib_path is None:
+            print("The support package doesn't contain a standard library that can be pruned.")
+            return
+
+        sources = [
+            path
+            for path in [self.app_path(app), self.app_packages_path(app)]
+            if path.is_dir()
+        ]
+        includes = list(getattr(app, 'stdlib_includes', []))
+
+        # Modules removed by an earlier prune can't be restored without
+        # reinstalling the support package.
+        previously_removed = set(read_json(manifest_path).get('removed', []))
+        missing = sorted(
+            previously_removed & (scan_imports(sources) | {name.split('.')[0] for name in includes})
+        )
+        if missing:
+            print()
+            print(
+                "WARNING: The app now imports {missing}, which {verb} removed from the "
+                "standard library when the app was created. Run `briefcase create` to "
+                "restore the full standard library.".format(
+                    missing=', '.join(missing),
+                    verb='was' if len(missing) == 1 else 'were',
+                )
+            )
+            print()
+
+        print("Tracing standard library imports...")
+        removed = shake_stdlib(stdlib_path, sources, includes=includes)
+        write_json(manifest_path, {'removed': sorted(previously_removed | set(removed))})
+
+        if removed:
+            largest = sorted(removed.items(), key=lambda item: (-item[1]['bytes'], item[0]))
+            for name, totals in largest[:10]:
+                print(" - {name}: {size} ({files} file(s))".format(
+                    name=name,
+                    size=format_size(totals['bytes']),
+                    files=totals['files'],
+                ))
+            if len(largest) > 10:
+                print(" - ... and {count} other module(s)".format(count=len(largest) - 10))
+            print("Removed {count} module(s) ({size}) from the standard library.".format(
+                count=len(removed),
+                size=format_size(sum(totals['bytes'] for totals in removed.values())),
+            ))
+        else:
+            print("Nothing to prune.")
+
+    def dependencies_manifest_path(self, app: BaseConfig):
+        """
+        Obtain the path of the record of the dependencies that have been
+        installed into the bundle.
+
+        :param app: The config object for the app
+        :returns: The path of the dependencies manifest.
+        """
+        return self.bundle_path(app) / 'briefcase-dependencies.json'
+
+    def dependency_fingerprint(self, app: BaseConfig):
+        """
+        Compute a fingerprint for the dependencies of an app.
+
+        The fingerprint identifies everything that affects the packages
+        that will be installed: the requirements of the app (and the lock
+        file pinning them, if there is one), the content that is pruned from
+        the installed packages, whether packages are packed into a zip file,
+        the Python version, the platform and output
+        format being targeted, the host machine, whether the dependencies
+        are installed in a Docker container, and the pip configuration.
+
+        :param app: The config object for the app
+        :returns: The fingerprint, or ``None`` if the dependencies of the app
+            can't be cached.
+        """
+        lock_path = self.dependency_lock_path(app)
+        return dependency_fingerprint(
+            app.requires,
+            lock=file_sha256(lock_path) if lock_path.exists() else None,
+            prune=self.prune_patterns(app),
+            zip_packages=bool(getattr(app, 'zip_packages', False)),
+            python_version_tag=self.python_version_tag,
+            platform=self.platform,
+            output_format=self.output_format,
+            host_os=self.host_os,
+            host_arch=self.host_arch,
+            use_docker=bool(getattr(self, 'use_docker', False)),
+            pip=pip_config(self.home_path, self.os.environ),
+        )
+
+    def dependency_lock_path(self, app: BaseConfig):
+        """
+        Obtain the path of the lock file pinning the dependencies of the app.
+
+        Lock files are stored in the project, so they can be shared (e.g., by
+        committing them to version control). There is a lock file for each
+        combination of app, platform, host architecture and Python version.
+
+        :param app: The config object for the app
+        :returns: The path of the lock file.
+        """
+        return self.base_path / 'briefcase-locks' / '{app.app_name}-{platform}-{arch}-py{tag}.txt'.format(
+            app=app,
+            platform=self.platform,
+            arch=self.host_arch,
+            tag=self.python_version_tag,
+        )
+
+    def resolve_requirements(self, app: BaseConfig, requires, constraints=None):
+        """
+        Resolve a set of requirements, without installing anything.
+
+        :param app: The config object for the app whose bundle will be used
+            for temporary files.
+        :param requires: The requirements to resolve.
+        :param constraints: A list of resolved packages that constrain the
+            versions that can be selected.
+        :returns: A list of resolved packages (see
+            :func:`~briefcase.dependencies.resolved_packages`).
+        :raises subprocess.CalledProcessError: If pip can't resolve the
+            requirements.
+        :raises ValueError: If the resolution can't be used for a lock file.
+        """
+        # Temporary files are written into the bundle, because the bundle
+        # is visible to pip even if pip is running in a container.
+        report_path = self.bundle_path(app) / 'briefcase-resolution.json'
+        constraints_path = self.bundle_path(app) / 'briefcase-constraints.txt'
+        args = [
+            sys.executable, "-m",
+            "pip", "install",
+            "--dry-run",
+            "--ignore-installed",
+            "--quiet",
+            "--report={}".format(report_path),
+        ]
+        if self.wheelhouse_path.is_dir():
+            args.append("--find-links={}".format(self.wheelhouse_path))
+        if constraints:
+            constraints_path.write_text(format_constraints(constraints), encoding='utf-8')
+            args.append("--constraint={}".format(constraints_path))
+
+        try:
+            self.subprocess.run(args + list(requires), check=True)
+            return resolved_packages(read_json(report_path))
+        finally:
+            for path in [report_path, constraints_path]:
+                if path.exists():
+                    path.unlink()
+
+    def project_packages(self, app: BaseConfig):
+        """
+        Resolve the requirements of every app in the project together.
+
+        The resolution is only performed once per command. Apps that have
+        requirements that can't be locked aren't included.
+
+        :param app: The config object for the app whose bundle will be used
+            for temporary files.
+        :returns: A list of resolved packages, or ``None`` if the project
+            only has one app with lockable requirements, or the requirements
+            of the apps conflict.
+        """
+        if not self._project_resolved:
+            self._project_resolved = True
+            lockable = [
+                other
+                for other in self.apps.values()
+                if other.requires and all(
+                    is_cacheable_requirement(requirement)
+                    for requirement in other.requires
+                )
+            ]
+            if len(lockable) > 1:
+                try:
+                    self._project_packages = self.resolve_requirements(
+                        app,
+                        sorted({
+                            normalize_requirement(requirement)
+                            for other in lockable
+                            for requirement in other.requires
+                        }),
+                    )
+                except (subprocess.CalledProcessError, ValueError):
+                    # The apps can't share a resolution; each app
+                    # will be resolved independently.
+                    pass
+        return self._project_packages
+
+    def lock_app_dependencies(self, app: BaseConfig):
+        """
+        Ensure there is a current lock file for the dependencies of the app.
+
+        If the lock file exists, and was generated for the current
+        requirements of the app, it is used as is. Otherwise, the
+        requirements are resolved, and a new lock file is written. Where
+        possible, the requirements are resolved consistently with the other
+        apps in the project, so that all the apps use the same versions of
+        their shared dependencies.
+
+        :param app: The config object for the app
+        :returns: The path of the lock file, or ``None`` if the requirements
+            couldn't be locked.
+        """
+        lock_path = self.dependency_lock_path(app)
+        requires = sorted(normalize_requirement(requirement) for requirement in app.requires)
+        if lock_path.exists() and locked_requires(lock_path.read_text(encoding='utf-8')) == requires:
+            return lock_path
+
+        print("Resolving dependencies...")
+        try:
+            packages = None
+            constraints = self.project_packages(app)
+            if constraints:
+                try:
+                    packages = self.resolve_requirements(app, app.requires, constraints)
+                except (subprocess.CalledProcessError, ValueError):
+                    # Fall back to resolving the app by itself.
+                    pass
+            if packages is None:
+                packages = self.resolve_requirements(app, app.requires)
+        except (subprocess.CalledProcessError, ValueError):
+            print("Unable to lock dependencies; they will be installed without a lock file.")
+            return None
+
+        content = format_lock(
+            packages,
+            app.requires,
+            description=(
+                "Dependencies of {app.app_name} for {platform} ({arch}), Python {tag}.\n"
+                "Generated by Briefcase; delete this file to resolve the dependencies again."
+            ).format(
+                app=app,
+                platform=self.platform,
+                arch=self.host_arch,
+                tag=self.python_version_tag,
+            ),
+        )
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = lock_path.parent / '.{lock_path.name}.{pid}.tmp'.format(
+            lock_path=lock_path,
+            pid=os.getpid(),
+        )
+        temp_path.write_text(content, encoding='utf-8')
+        temp_path.replace(lock_path)
+        return lock_path
+
+    def cache_app_dependencies(self, app_packages_path, cache_path):
+        """
+        Store a copy of an installed set of dependencies in the cache.
+
+        :param app_packages_path: The directory containing the installed
+            dependencies.
+        :param cache_path: The location in the cache for the dependencies.
+        """
+        if not app_packages_path.is_dir():
+            return
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path = Path(tempfile.mkdtemp(dir=os.fsdecode(cache_path.parent), prefix='.'))
+        try:
+            # Bundles can be modified in place (e.g., by code signing), so
+            # the cache must never share files with the bundle.
+            materialize_tree(app_packages_path, staging_path, copier=self.copier)
+            try:
+                staging_path.rename(cache_path)
+            except OSError:
+                # Another process has cached the same dependencies.
+                if not cache_path.exists():
+                    raise
+            self.cache.record_miss('dependencies', cache_path.name)
+            self.cache.prune('dependencies')
+        finally:
+            if staging_path.exists():
+                shutil.rmtree(staging_path)
+
+    def prune_patterns(self, app: BaseConfig):
+        """
+        Determine the content that should be pruned from the app's installed
+        dependencies.
+
+        Pruning is enabled by the ``prune`` setting of the app. The default
+        patterns can be extended with the ``prune_patterns`` setting.
+
+        :param app: The config object for the app
+        :returns: A list of glob patterns, relative to the app packages
+            directory; or ``None`` if pruning is disabled.
+        """
+        if not getattr(app, 'prune', False):
+            return None
+        return DEFAULT_PRUNE_PATTERNS + list(getattr(app, 'prune_patterns', []))
+
+    def prune_app_packages(self, app: BaseConfig):
+        """
+        Remove content that isn't needed at runtime (e.g., tests, type stubs
+        and documentation) from the app's installed dependencies.
+
+        :param app: The config object for the app
+        """
+        patterns = self.prune_patterns(app)
+        if patterns is None:
+            return
+
+        print("Pruning installed dependencies...")
+        removed = {}
+        for name, stats in prune_tree(self.app_packages_path(app), patterns).items():
+            totals = removed.setdefault(distribution_name(name), {'files': 0, 'bytes': 0})
+            totals['files'] += stats['files']
+            totals['bytes'] += stats['bytes']
+
+        if removed:
+            for name, totals in sorted(removed.items(), key=lambda item: (-item[1]['bytes'], item[0])):
+                print(" - {name}: {size} ({files} file(s))".format(
+                    name=name,
+                    size=format_size(totals['bytes']),
+                    files=totals['files'],
+                ))
+            print("Removed {size} from installed dependencies.".format(
+                size=format_size(sum(totals['bytes'] for totals in removed.values())),
+            ))
+        else:
+            print("Nothing to prune.")
+
+    def verify_zip_packages(self, app: BaseConfig):
+        """
+        Verify that the app's dependencies can be packed into a zip file.
+
+        Packed dependencies are added to ``sys.path`` by a ``.pth`` file, so
+        the app template must declare (with the ``app_packages_site_dir``
+        setting in ``briefcase.toml``) that its runtime processes the app
+        packages directory as a site directory.
+
+        :param app: The config object for the app
+        """
+        if not getattr(app, 'zip_packages', False):
+            return
+
+        # If the index file hasn't been loaded for this app, load it.
+        try:
+            path_index = self._path_index[app]
+        except KeyError:
+            path_index = self._load_path_index(app)
+
+        if not path_index.get('app_packages_site_dir', False):
+            raise ZipPackagesUnsupported(app.app_name)
+
+    def pack_app_packages(self, app: BaseConfig):
+        """
+        Pack the app's pure-Python dependencies into a zip file.
+
+        Packing is enabled by the ``zip_packages`` setting of the app. Packages
+        that can't be imported from a zip file (e.g., because they contain
+        native extensions) are left in place, and reported.
+
+        :param app: The config object for the app
+        """
+        if not getattr(app, 'zip_packages', False):
+            return
+        self.verify_zip_packages(app)
+
+        print("Packing installed dependencies into {archive}...".format(archive=PACKED_ARCHIVE))
+        target = self.app_packages_path(app)
+        packed, blocked = pack_packages(target, PACKED_ARCHIVE)
+        if packed:
+            print("Packed {count} package(s) into {archive} ({size}).".format(
+                count=len(packed),
+                archive=PACKED_ARCHIVE,
+                size=format_size((target / PACKED_ARCHIVE).stat().st_size),
+            ))
+        else:
+            print("No packages could be packed.")
+
+        if blocked:
+            print("The following packages were left on disk:")
+            for name, reason in sorted(blocked.items()):
+                print(" - {name}: {reason}".format(name=name, reason=reason))
+
     def install_app_dependencies(self, app: BaseConfig):
         """
         Install the dependencies for the app.
 
+        The requirements of the app are pinned by a lock file, so that
+        subsequent installs don't need to resolve them again (see
+        :meth:`lock_app_dependencies`).
+
+        Installed dependencies are cached, keyed by the fingerprint of the
+        app's dependencies. If the bundle already contains the dependencies
+        for the current fingerprint, nothing is installed; if the cache
+        contains them, they are installed from the cache, rather than by pip.
+
         :param app: The config object for the app
         """
 
+        self.verify_zip_packages(app)
+
         target = self.app_packages_path(app)
+        manifest_path = self.dependencies_manifest_path(app)
+        lock_path = None
+        if app.requires and all(is_cacheable_requirement(requirement) for requirement in app.requires):
+            lock_path = self.lock_app_dependencies(app)
+        fingerprint = self.dependency_fingerprint(app) if app.requires else None
+        cache_path = (
+            self.dot_briefcase_path / 'dependencies' / fingerprint
+            if fingerprint
+            else None
+        )
+
+        # If the bundle has the current dependencies (and they are still
+        # current in the cache), there's nothing to do.
+        if (
+            cache_path is not None
+            and cache_path.is_dir()
+            and target.is_dir()
+            and read_json(manifest_path).get('fingerprint') == fingerprint
+            and installed_names(target) == installed_names(cache_path)
+        ):
+            print("Dependencies are up to date.")
+            self.cache.record_hit('dependencies', cache_path.name)
+            return
+
+        # The dependencies that have been installed are about to be replaced.
+        if manifest_path.exists():
+            manifest_path.unlink()
 
         # Clear existing dependency directory
         if target.is_dir():
@@ -408,48 +1140,90 @@ class CreateCommand(BaseCommand):
 
         # Install  dependencies
         if app.requires:
-            try:
-                self.subprocess.run(
-                    [
-                        sys.executable, "-m",
-                        "pip", "install",
-                        "--upgrade",
-                        "--no-user",
-                        "--target={}".format(target),
-                    ] + app.requires,
-                    check=True,
+            if cache_path is not None and cache_path.is_dir():
+                print("Installing cached dependencies...")
+                materialize_tree(
+                    cache_path,
+                    target,
+                    hardlink=self.use_hardlinks,
+                    copier=self.copier,
                 )
-            except subprocess.CalledProcessError:
-                raise DependencyInstallError()
+                self.cache.record_hit('dependencies', cache_path.name)
+            else:
+                bundle_lock_path = None
+                if lock_path is not None:
+                    # The lock file is copied into the bundle, where it is
+                    # visible to pip even if pip is running in a container.
+                    bundle_lock_path = self.bundle_path(app) / 'briefcase-requirements.txt'
+                    shutil.copyfile(lock_path, bundle_lock_path)
+
+                try:
+                    self.pip_install(
+                        app.requires,
+                        [
+                            "--upgrade",
+                            "--no-user",
+                            "--target={}".format(target),
+                        ],
+                        lock_path=bundle_lock_path,
+                    )
+                except subprocess.CalledProcessError:
+                    raise DependencyInstallError()
+
+                self.prune_app_packages(app)
+                self.pack_app_packages(app)
+                if cache_path is not None:
+                    self.cache_app_dependencies(target, cache_path)
+
+            if fingerprint is not None:
+                write_json(manifest_path, {'fingerprint': fingerprint})
         else:
             print("No application dependencies.")
 
+    def sources_manifest_path(self, app: BaseConfig):
+        """
+        Obtain the path of the manifest describing the app code that has been
+        installed into the bundle.
+
+        :param app: The config object for the app
+        :returns: The path of the sources manifest.
+        """
+        return self.bundle_path(app) / 'briefcase-sources.json'
+
     def install_app_code(self, app: BaseConfig):
         """
         Install the application code into the bundle.
 
+        The code is synchronized with the bundle, rather than copied: a
+        manifest of the installed files is kept in the bundle, and only the
+        files that have been added or modified since the last install are
+        copied. Files that have been removed from the sources are removed
+        from the bundle.
+
         :param app: The config object for the app
         """
         if app.sources:
+            manifest_path = self.sources_manifest_path(app)
+            manifest = read_json(manifest_path)
+            installed = {}
             for src in app.sources:
-                print("Installing {src}...".format(src=src))
+                print("Installing {src}...".format(src=src), end='', flush=True)
                 original = self.base_path / src
                 target = self.app_path(app) / original.name
 
-                # Remove existing versions of the code
-                if target.exists():
-                    if target.is_dir():
-                        self.shutil.rmtree(target)
-                    else:
-                        target.unlink()
-
-                # Install the new copy of the app code.
                 if not original.exists():
+                    print()
                     raise MissingAppSources(src)
-                elif original.is_dir():
-                    self.shutil.copytree(original, target)
-                else:
-                    self.shutil.copy(original, target)
+
+                installed[original.name], counts = sync_tree(
+                    original,
+                    target,
+                    manifest=manifest.get(original.name),
+                    copier=self.copier,
+                )
+                print(" {copied} copied, {removed} removed, {unchanged} unchanged.".format(**counts))
+
+            write_json(manifest_path, installed)
         else:
             print("No sources defined for {app.app_name}.".format(app=app))
 
@@ -461,10 +1235,10 @@ class CreateCommand(BaseCommand):
             )
         )
 
-    def install_image(self, role, variant, size, source, target):
+    def resolve_image(self, role, variant, size, source, target):
         """
-        Install an icon/image of the requested size at a target location, using
-        the source images defined by the app config.
+        Determine the source image that should be installed at a target
+        location, using the source images defined by the app config.
 
         :param role: A string describing the role the of the image.
         :param variant: The image variant. A variant of ``None`` means the image
@@ -476,166 +1250,435 @@ class CreateCommand(BaseCommand):
             modifier; these will be added based on the requested target and
             variant.
         :param target: The full path where the image should be installed.
+        :returns: A tuple of the full path of the source image, the target,
+            the source filename and a description of the image's role; or
+            ``None`` if there is no source for the image.
         """
-        if source is not None:
-            if size is None:
-                if variant is None:
+        if source is None:
+            return None
+
+        # The source of a sized image, if the image can be generated from
+        # an image of a different size.
+        sized_source = None
+        if size is None:
+            if variant is None:
+                source_filename = '{source}{target.suffix}'.format(
+                    source=source,
+                    target=target,
+                )
+                full_role = role
+            else:
+                try:
                     source_filename = '{source}{target.suffix}'.format(
-                        source=source,
+                        source=source[variant],
                         target=target,
                     )
-                    full_role = role
-                else:
-                    try:
-                        source_filename = '{source}{target.suffix}'.format(
-                            source=source[variant],
-                            target=target,
-                        )
-                        full_role = '{variant} {role}'.format(
+                    full_role = '{variant} {role}'.format(
+                        variant=variant,
+                        role=role,
+                    )
+                except (TypeError, KeyError):
+                    print(
+                        "Unable to find {variant} variant for {role}; "
+                        "using default".format(
                             variant=variant,
                             role=role,
                         )
-                    except (TypeError, KeyError):
-                        print(
-                            "Unable to find {variant} variant for {role}; "
-                            "using default".format(
-                                variant=variant,
-                                role=role,
-                            )
-                        )
-                        return
-            else:
-                if variant is None:
-                    # An annoying edge case is the case of an unsized variant.
-                    # In that case, `size` is actually the variant, and the
-                    # source is a dictionary keyed by variant. Try that
-                    # lookup; if it fails, we have a sized image with no
-                    # variant.
-                    try:
-                        source_filename = '{source}{target.suffix}'.format(
-                            source=source[size],
-                            target=target,
-                        )
-                        full_role = '{size} {role}'.format(
-                            size=size,
-                            role=role,
-                        )
-                    except TypeError:
-                        # The lookup on the source failed; that means we
-                        # have an sized image without variants.
-                        source_filename = '{source}-{size}{target.suffix}'.format(
-                            source=source,
-                            size=size,
-                            target=target,
-                        )
-                        full_role = '{size}px {role}'.format(
-                            size=size,
-                            role=role,
-                        )
+                    )
+                    return None
+        else:
+            if variant is None:
+                # An annoying edge case is the case of an unsized variant.
+                # In that case, `size` is actually the variant, and the
+                # source is a dictionary keyed by variant. Try that
+                # lookup; if it fails, we have a sized image with no
+                # variant.
+                try:
+                    source_filename = '{source}{target.suffix}'.format(
+                        source=source[size],
+                        target=target,
+                    )
+                    full_role = '{size} {role}'.format(
+                        size=size,
+                        role=role,
+                    )
+                except TypeError:
+                    # The lookup on the source failed; that means we
+                    # have an sized image without variants.
+                    sized_source = source
+                    source_filename = '{source}-{size}{target.suffix}'.format(
+                        source=source,
+                        size=size,
+                        target=target,
+                    )
+                    full_role = '{size}px {role}'.format(
+                        size=size,
+                        role=role,
+                    )
 
-                else:
-                    try:
-                        source_filename = '{source}-{size}{target.suffix}'.format(
-                            source=source[variant],
-                            size=size,
-                            target=target,
-                        )
-                        full_role = '{size}px {variant} {role}'.format(
+            else:
+                try:
+                    sized_source = source[variant]
+                    source_filename = '{source}-{size}{target.suffix}'.format(
+                        source=source[variant],
+                        size=size,
+                        target=target,
+                    )
+                    full_role = '{size}px {variant} {role}'.format(
+                        size=size,
+                        variant=variant,
+                        role=role,
+                    )
+                except (TypeError, KeyError):
+                    print(
+                        "Unable to find {size}px {variant} variant for {role}; "
+                        "using default".format(
                             size=size,
                             variant=variant,
                             role=role,
                         )
-                    except (TypeError, KeyError):
-                        print(
-                            "Unable to find {size}px {variant} variant for {role}; "
-                            "using default".format(
-                                size=size,
-                                variant=variant,
-                                role=role,
-                            )
-                        )
-                        return
-
-            full_source = self.base_path / source_filename
-            if full_source.exists():
-                print("Installing {source_filename} as {full_role}...".format(
+                    )
+                    return None
+
+        full_source = self.base_path / source_filename
+        dimensions = parse_image_size(size)
+        if not full_source.exists() and sized_source is not None and dimensions is not None:
+            width, height = dimensions
+            derived = self.derive_image(sized_source, width, target.suffix, height=height)
+            if derived is not None:
+                derived_path, master_filename = derived
+                source_filename = '{source_filename} (generated from {master_filename})'.format(
                     source_filename=source_filename,
-                    full_role=full_role,
-                ))
+                    master_filename=master_filename,
+                )
+                return derived_path, target, source_filename, full_role
 
-                # Make sure the target directory exists
-                target.parent.mkdir(parents=True, exist_ok=True)
-                # Copy the source image to the target location
-                self.shutil.copy(full_source, target)
-            else:
+        return full_source, target, source_filename, full_role
+
+    def derive_image(self, source, size, suffix, height=None):
+        """
+        Generate an image of the requested size from the largest image that
+        is available for the same source.
+
+        The candidate images are the unsized image (e.g., ``icon.png``) and
+        every sized image (e.g., ``icon-1024.png``), in the requested format
+        or as PNG. Images are only ever scaled down. If a height is requested
+        (e.g., for a ``1024x768`` splash image), the image is scaled to cover
+        the requested size, and cropped to it. Generated images are cached in
+        ``~/.briefcase/images``.
+
+        :param source: The image source, without any extension or size
+            modifier.
+        :param size: The requested width of the image, in pixels.
+        :param suffix: The file extension of the requested image.
+        :param height: The requested height of the image, in pixels; or
+            ``None`` to preserve the aspect ratio of the source.
+        :returns: A tuple of the path of the generated image, and the name
+            of the image it was generated from; or ``None`` if the image
+            can't be generated.
+        """
+        if not can_generate_images():
+            return None
+
+        source_path = self.base_path / source
+        candidates = []
+        for candidate_suffix in dict.fromkeys([suffix, '.png']):
+            candidates.append(source_path.parent / (source_path.name + candidate_suffix))
+            prefix = source_path.name + '-'
+            candidates.extend(
+                path
+                for path in source_path.parent.glob(glob.escape(prefix) + '*' + candidate_suffix)
+                if path.name[len(prefix):-len(candidate_suffix)].isdigit()
+            )
+
+        masters = []
+        for path in candidates:
+            if path.is_file():
+                dimensions = image_dimensions(path)
+                if (
+                    dimensions is not None
+                    and dimensions[0] >= size
+                    and (height is None or dimensions[1] >= height)
+                ):
+                    masters.append((dimensions[0], path.name, path))
+        if not masters:
+            return None
+
+        _, _, master_path = max(masters)
+        result = generate_image(
+            master_path,
+            size,
+            suffix,
+            self.dot_briefcase_path / 'images',
+            height=height,
+        )
+        if result is None:
+            print("Unable to generate a {suffix} image from {master_filename}.".format(
+                suffix=suffix,
+                master_filename=master_path.relative_to(self.base_path).as_posix(),
+            ))
+            return None
+
+        output_path, generated = result
+        output_path = Path(output_path)
+        if generated:
+            self.cache.record_miss('images', output_path.name, output_path.stat().st_size)
+        else:
+            self.cache.record_hit('images', output_path.name, output_path.stat().st_size)
+        return output_path, master_path.relative_to(self.base_path).as_posix()
+
+    def place_images(self, images):
+        """
+        Copy resolved images into position.
+
+        Targets whose content already matches their source aren't copied
+        again. The remaining images are copied concurrently.
+
+        :param images: A list of images, as returned by :meth:`resolve_image`.
+        :returns: A dictionary describing the number of images that were
+            ``copied``, ``unchanged`` and ``missing``.
+        """
+        counts = {'copied': 0, 'unchanged': 0, 'missing': 0}
+        source_hashes = {}
+        pending = []
+        for full_source, target, source_filename, full_role in images:
+            if not full_source.exists():
                 print(
                     "Unable to find {source_filename} for {full_role}; using default".format(
                         full_role=full_role,
                         source_filename=source_filename,
                     )
                 )
+                counts['missing'] += 1
+                continue
+
+            if full_source not in source_hashes:
+                source_hashes[full_source] = file_sha256(full_source)
+            if (
+                target.is_file()
+                and target.stat().st_size == full_source.stat().st_size
+                and file_sha256(target) == source_hashes[full_source]
+            ):
+                counts['unchanged'] += 1
+                continue
+
+            print("Installing {source_filename} as {full_role}...".format(
+                source_filename=source_filename,
+                full_role=full_role,
+            ))
+            # Make sure the target directory exists
+            target.parent.mkdir(parents=True, exist_ok=True)
+            pending.append((full_source, target))
+
+        # Copy the source images to the target locations
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=self.copier.workers) as executor:
+                list(executor.map(lambda pair: self.copier.copy(*pair), pending))
+        else:
+            for full_source, target in pending:
+                self.copier.copy(full_source, target)
+        counts['copied'] = len(pending)
+        return counts
 
-    def install_app_resources(self, app: BaseConfig):
+    def install_image(self, role, variant, size, source, target):
         """
-        Install the application resources (such as icons and splash screens) into
-        the bundle.
+        Install an icon/image of the requested size at a target location, using
+        the source images defined by the app config.
+
+        :param role: A string describing the role the of the image.
+        :param variant: The image variant. A variant of ``None`` means the image
+            has no variants
+        :param size: The requested size for the image. A size of
+            ``None`` means the largest available size should be used.
+        :param source: The image source; or a dictionary of sources for each
+            variant. The sources will *not* include any extension or size
+            modifier; these will be added based on the requested target and
+            variant.
+        :param target: The full path where the image should be installed.
+        """
+        image = self.resolve_image(role, variant=variant, size=size, source=source, target=target)
+        if image is not None:
+            self.place_images([image])
+
+    def image_targets(self, app: BaseConfig):
+        """
+        Resolve every image that the app's template requires to its source.
 
         :param app: The config object for the app
+        :returns: A list of images, as returned by :meth:`resolve_image`.
         """
+        images = []
         for variant_or_size, targets in self.icon_targets(app).items():
             try:
                 # Treat the targets as a dictionary of sizes;
                 # if there's no `items`, then it's an icon without variants.
                 for size, target in targets.items():
-                    self.install_image(
+                    images.append(self.resolve_image(
                         'application icon',
                         source=app.icon,
                         variant=variant_or_size,
                         size=size,
                         target=self.bundle_path(app) / target
-                    )
+                    ))
             except AttributeError:
                 # Either a single variant, or a single size.
-                self.install_image(
+                images.append(self.resolve_image(
                     'application icon',
                     source=app.icon,
                     variant=None,
                     size=variant_or_size,
                     target=self.bundle_path(app) / targets
-                )
+                ))
 
         for variant_or_size, targets in self.splash_image_targets(app).items():
             try:
                 # Treat the targets as a dictionary of sizes;
                 # if there's no `items`, then it's a splash without variants
                 for size, target in targets.items():
-                    self.install_image(
+                    images.append(self.resolve_image(
                         'splash image',
                         source=app.splash,
                         variant=variant_or_size,
                         size=size,
                         target=self.bundle_path(app) / target
-                    )
+                    ))
             except AttributeError:
                 # Either a single variant, or a single size.
-                self.install_image(
+                images.append(self.resolve_image(
                     'splash image',
                     source=app.splash,
                     variant=None,
                     size=variant_or_size,
                     target=self.bundle_path(app) / targets
-                )
+                ))
 
         for extension, doctype in self.document_type_icon_targets(app).items():
             for size, target in doctype.items():
-                self.install_image(
+                images.append(self.resolve_image(
                     'icon for .{extension} documents'.format(extension=extension),
                     size=size,
                     source=app.document_types[extension]['icon'],
                     variant=None,
                     target=self.bundle_path(app) / target,
+                ))
+
+        return [image for image in images if image is not None]
+
+    def install_app_resources(self, app: BaseConfig):
+        """
+        Install the application resources (such as icons and splash screens) into
+        the bundle.
+
+        Every image is resolved to its source before any are installed. Images
+        whose target is already up to date aren't copied again. If an image
+        of the required size isn't provided, it is generated from a larger
+        image (see :meth:`derive_image`).
+
+        :param app: The config object for the app
+        """
+        images = self.image_targets(app)
+        if images:
+            counts = self.place_images(images)
+            self.cache.prune('images')
+            print(
+                "{copied} image(s) installed, {unchanged} already up to date, "
+                "{missing} not found.".format(**counts)
+            )
+            if counts['missing'] and not can_generate_images():
+                print(
+                    "Install Pillow (`pip install Pillow`) to generate missing "
+                    "image sizes from the largest image that is available."
                 )
 
+    def measure_import_time(self, app: BaseConfig):
+        """
+        Measure the time taken to import the app's module from the bundle.
+
+        The import is performed by the Python interpreter running Briefcase,
+        so this is only an approximation of the import time on the target
+        device. No bytecode is written by the import.
+
+        :param app: The config object for the app
+        :returns: The import time, in seconds, or ``None`` if the module
+            couldn't be imported.
+        """
+        paths = [os.fsdecode(self.app_path(app)), os.fsdecode(self.app_packages_path(app))]
+        script = (
+            "import sys, time; sys.path[:0] = {paths!r}; "
+            "start = time.perf_counter(); import {module}; "
+            "print(time.perf_counter() - start)"
+        ).format(paths=paths, module=app.module_name)
+        try:
+            output = self.subprocess.check_output(
+                [sys.executable, '-B', '-c', script],
+                stderr=subprocess.DEVNULL,
+                universal_newlines=True,
+            )
+            return float(output.strip().splitlines()[-1])
+        except (subprocess.CalledProcessError, ValueError, IndexError):
+            return None
+
+    def precompile_app(self, app: BaseConfig):
+        """
+        Compile the app code and dependencies in the bundle to bytecode.
+
+        Bytecode is compiled into unchecked-hash pyc files, so the app never
+        needs to compile (or validate) its modules at runtime. Compiled
+        output is cached by the hash of each source file, so only modules
+        that have changed are compiled again.
+
+        In verbose mode, the time taken to import the app's module is
+        reported before and after compilation.
+
+        :param app: The config object for the app
+        """
+        paths = [
+            path
+            for path in [self.app_path(app), self.app_packages_path(app)]
+            if path.is_dir()
+        ]
+
+        verbose = self.verbosity >= 2
+        if verbose:
+            before = self.measure_import_time(app)
+
+        counts = compile_tree(paths, self.dot_briefcase_path / 'bytecode')
+        self.cache.prune('bytecode')
+        print(
+            "{compiled} compiled, {cached} from cache, {unchanged} unchanged, "
+            "{failed} could not be compiled.".format(**counts)
+        )
+
+        if verbose:
+            after = self.measure_import_time(app)
+            if before is None or after is None:
+                print("Unable to measure the import time of {app.module_name}.".format(app=app))
+            else:
+                print(
+                    "Import time of {app.module_name}: {before:.3f}s before precompiling, "
+                    "{after:.3f}s after.".format(app=app, before=before, after=after)
+                )
+
+    def concurrent_stages(self, app: BaseConfig):
+        """
+        Determine if the stages that populate the bundle of an app can be run
+        concurrently.
+
+        Stages can only run concurrently if they install content into
+        separate parts of the bundle. If the support package, dependencies
+        and code of the app are installed into overlapping paths (e.g., an
+        AppImage, whose support package is installed into ``AppDir/usr``),
+        the stages are run one after the other.
+
+        :param app: The config object for the app
+        :returns: True if the stages can be run concurrently.
+        """
+        paths = [self.support_path(app), self.app_packages_path(app), self.app_path(app)]
+        for path, other in itertools.combinations(paths, 2):
+            if path == other or path in other.parents or other in path.parents:
+                return False
+        return True
+
     def create_app(self, app: BaseConfig, **options):
         """
         Create an application bundle.
@@ -663,35 +1706,58 @@ class CreateCommand(BaseCommand):
             ))
             self.shutil.rmtree(bundle_path)
 
-        print()
-        print('[{app.app_name}] Generating application template...'.format(
-            app=app
-        ))
-        self.generate_app_template(app=app)
-
-        print()
-        print('[{app.app_name}] Installing support package...'.format(
-            app=app
-        ))
-        self.install_app_support_package(app=app)
-
-        print()
-        print('[{app.app_name}] Installing dependencies...'.format(
-            app=app
-        ))
-        self.install_app_dependencies(app=app)
-
-        print()
-        print('[{app.app_name}] Installing application code...'.format(
-            app=app
-        ))
-        self.install_app_code(app=app)
+        def stage(description, method):
+            def run():
+                print()
+                print('[{app.app_name}] {description}...'.format(
+                    app=app,
+                    description=description,
+                ))
+                method(app=app)
+            return run
+
+        # Every other stage needs the template, and the template describes
+        # where each stage installs its content.
+        stage('Generating application template', self.generate_app_template)()
+
+        stages = [
+            (
+                'support',
+                stage('Installing support package', self.install_app_support_package),
+                [],
+            ),
+            (
+                'dependencies',
+                stage('Installing dependencies', self.install_app_dependencies),
+                [],
+            ),
+            (
+                'code',
+                stage('Installing application code', self.install_app_code),
+                [],
+            ),
+            (
+                'resources',
+                stage('Installing application resources', self.install_app_resources),
+                [],
+            ),
+        ]
+        if getattr(app, 'prune_stdlib', False):
+            stages.append((
+                'stdlib',
+                stage('Pruning standard library', self.prune_app_stdlib),
+                ['support', 'dependencies', 'code'],
+            ))
+        if getattr(app, 'precompile', False):
+            stages.append((
+                'bytecode',
+                stage('Precompiling bytecode', self.precompile_app),
+                ['dependencies', 'code'],
+            ))
 
-        print()
-        print('[{app.app_name}] Installing application resources...'.format(
-            app=app
-        ))
-        self.install_app_resources(app=app)
+        # If the stages are independent of each other, they are run
+        # concurrently; output is still reported in stage order.
+        run_stages(stages, concurrent=self.concurrent_stages(app))
         print()
 
         print("[{app.app_name}] Created {filename}".format(
@@ -707,15 +1773,16 @@ class CreateCommand(BaseCommand):
         """
         self.git = self.integrations.git.verify_git_is_installed(self)
 
-    def __call__(self, app: Optional[BaseConfig] = None, **options):
+    def __call__(self, app: Optional[BaseConfig] = None, jobs: int = 1, **options):
+        # Start the downloads that will be needed in the background.
+        self.prefetch_downloads([app] if app else [app for app_name, app in sorted(self.apps.items())])
+
         # Confirm all required tools are available
         self.verify_tools()
 
         if app:
             state = self.create_app(app, **options)
         else:
-            state = None
-            for app_name, app in sorted(self.apps.items()):
-                state = self.create_app(app, **full_options(state, options))
+            state = self.run_app_pipelines(self.create_app, options, jobs=jobs)
 
         return state
@@ -0,0 +1,136 @@
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from briefcase.dependencies import is_cacheable_requirement
+from briefcase.exceptions import BriefcaseCommandError
+
+from .base import BaseCommand
+from .create import DependencyInstallError
+
+
+class DepsCommand(BaseCommand):
+    cmd_line = 'briefcase deps'
+    command = 'deps'
+    output_format = None
+    description = 'Manage the dependencies of the apps in a project'
+
+    @property
+    def platform(self):
+        """The deps command always reports as the local platform."""
+        return {
+            'darwin': 'macOS',
+            'linux': 'linux',
+            'win32': 'windows',
+        }[sys.platform]
+
+    def bundle_path(self, app):
+        "A placeholder; Deps command doesn't have a bundle path"
+        raise NotImplementedError()
+
+    def binary_path(self, app):
+        "A placeholder; Deps command doesn't have a binary path"
+        raise NotImplementedError()
+
+    def distribution_path(self, app, packaging_format):
+        "A placeholder; Deps command doesn't have a distribution path"
+        raise NotImplementedError()
+
+    def parse_config(self, filename):
+        """
+        The wheelhouse is shared by every project, so the deps command can be
+        used outside a project; if there is no project configuration, there
+        are no apps.
+        """
+        if Path(filename).exists():
+            super().parse_config(filename)
+
+    def add_options(self, parser):
+        parser.add_argument(
+            'action',
+            choices=['fetch'],
+            help='The dependency action to perform (one of: %(choices)s).'
+        )
+        parser.add_argument(
+            'requirements',
+            nargs='*',
+            help='Additional requirements to fetch into the wheelhouse.'
+        )
+        parser.add_argument(
+            '-a',
+            '--app',
+            dest='appnames',
+            action='append',
+            help='The app whose dependencies should be used. If no app is named, all apps are used.'
+        )
+
+    def fetch_app_wheels(self, app):
+        """
+        Download the dependencies of an app into the wheelhouse.
+
+        :param app: The config object for the app
+        """
+        requires = [
+            requirement
+            for requirement in app.requires or []
+            if is_cacheable_requirement(requirement)
+        ]
+        skipped = len(app.requires or []) - len(requires)
+        if skipped:
+            print(
+                "Skipping {skipped} requirement(s) that refer to local files "
+                "or version control checkouts.".format(skipped=skipped)
+            )
+
+        if requires:
+            try:
+                self.fetch_wheels(requires)
+            except subprocess.CalledProcessError:
+                raise DependencyInstallError()
+        else:
+            print("No application dependencies.")
+
+    def __call__(
+        self,
+        action,
+        requirements: Optional[List[str]] = None,
+        appnames: Optional[List[str]] = None,
+        **options
+    ):
+        if appnames:
+            try:
+                apps = [self.apps[appname] for appname in appnames]
+            except KeyError as e:
+                raise BriefcaseCommandError(
+                    "Project doesn't define an application named '{appname}'".format(
+                        appname=e.args[0]
+                    ))
+        elif requirements:
+            apps = []
+        else:
+            apps = list(self.apps.values())
+
+        if not apps and not requirements:
+            raise BriefcaseCommandError(
+                "No requirements to fetch. Run this command in a project, "
+                "or name the requirements to fetch."
+            )
+
+        if requirements:
+            print()
+            print('Fetching requirements into {wheelhouse}...'.format(
+                wheelhouse=self.wheelhouse_path,
+            ))
+            try:
+                self.fetch_wheels(requirements)
+            except subprocess.CalledProcessError:
+                raise DependencyInstallError()
+
+        for app in apps:
+            print()
+            print('[{app.app_name}] Fetching dependencies into {wheelhouse}...'.format(
+                app=app,
+                wheelhouse=self.wheelhouse_path,
+            ))
+            self.fetch_app_wheels(app)
@@ -66,14 +66,7 @@ class DevCommand(BaseCommand):
         """
         if app.requires:
             try:
-                self.subprocess.run(
-                    [
-                        sys.executable, "-m",
-                        "pip", "install",
-                        "--upgrade",
-                    ] + app.requires,
-                    check=True,
-                )
+                self.pip_install(app.requires, ["--upgrade"])
             except subprocess.CalledProcessError:
                 raise DependencyInstallError()
         else:
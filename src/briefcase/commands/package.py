@@ -104,25 +104,28 @@ class PackageCommand(BaseCommand):
                  'checksum, or the full name of the identity.',
             required=False,
         )
+        self.add_jobs_option(parser)
 
     def __call__(
         self,
         app: Optional[BaseConfig] = None,
         update: bool = False,
+        jobs: int = 1,
         **options
     ):
+        # Start the downloads that will be needed in the background.
+        self.prefetch_downloads([app] if app else [app for app_name, app in sorted(self.apps.items())])
+
         # Confirm all required tools are available
         self.verify_tools()
 
         if app:
             state = self._package_app(app, update=update, **options)
         else:
-            state = None
-            for app_name, app in sorted(self.apps.items()):
-                state = self._package_app(
-                    app,
-                    update=update,
-                    **full_options(state, options)
-                )
+            state = self.run_app_pipelines(
+                lambda app, **options: self._package_app(app, update=update, **options),
+                options,
+                jobs=jobs,
+            )
 
         return state
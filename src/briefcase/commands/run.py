@@ -39,6 +39,9 @@ class RunCommand(BaseCommand):
         update: Optional[bool] = False,
         **options
     ):
+        # Start the downloads that will be needed in the background.
+        self.prefetch_downloads([app for app_name, app in sorted(self.apps.items())])
+
         # Confirm all required tools are available
         self.verify_tools()
 
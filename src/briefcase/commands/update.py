@@ -2,7 +2,6 @@ from typing import Optional
 
 from briefcase.config import BaseConfig
 
-from .base import full_options
 from .create import CreateCommand
 
 
@@ -10,6 +9,7 @@ class UpdateCommand(CreateCommand):
     command = 'update'
 
     def add_options(self, parser):
+        super().add_options(parser)
         parser.add_argument(
             '-d',
             '--update-dependencies',
@@ -23,6 +23,18 @@ class UpdateCommand(CreateCommand):
             help='Update app resources (icons, splash screens, etc)'
         )
 
+    def download_plan(self, apps):
+        """
+        Determine the downloads this command will need to perform.
+
+        An update doesn't reinstall the support package; only tools will be
+        downloaded.
+
+        :param apps: The app configs that the command will operate on.
+        :returns: A list of ``(url, download_path)`` pairs.
+        """
+        return super(CreateCommand, self).download_plan(apps)
+
     def update_app(self, app: BaseConfig, update_dependencies=False, update_resources=False, **options):
         """
         Update an existing application bundle.
@@ -60,6 +72,20 @@ class UpdateCommand(CreateCommand):
             ))
             self.install_app_resources(app=app)
 
+        if getattr(app, 'prune_stdlib', False):
+            print()
+            print('[{app.app_name}] Pruning standard library...'.format(
+                app=app
+            ))
+            self.prune_app_stdlib(app=app)
+
+        if getattr(app, 'precompile', False):
+            print()
+            print('[{app.app_name}] Precompiling bytecode...'.format(
+                app=app
+            ))
+            self.precompile_app(app=app)
+
         print()
         print('[{app.app_name}] Application updated.'.format(
             app=app
@@ -70,8 +96,12 @@ class UpdateCommand(CreateCommand):
         app: Optional[BaseConfig] = None,
         update_dependencies: bool = False,
         update_resources: bool = False,
+        jobs: int = 1,
         **options
     ):
+        # Start the downloads that will be needed in the background.
+        self.prefetch_downloads([app] if app else [app for app_name, app in sorted(self.apps.items())])
+
         # Confirm all required tools are available
         self.verify_tools()
 
@@ -83,13 +113,15 @@ class UpdateCommand(CreateCommand):
                 **options,
             )
         else:
-            state = None
-            for app_name, app in sorted(self.apps.items()):
-                state = self.update_app(
+            state = self.run_app_pipelines(
+                lambda app, **options: self.update_app(
                     app,
                     update_dependencies=update_dependencies,
                     update_resources=update_resources,
-                    **full_options(state, options),
-                )
+                    **options,
+                ),
+                options,
+                jobs=jobs,
+            )
 
         return state
@@ -0,0 +1,265 @@
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+
+from briefcase.downloads import file_sha256
+
+# The header line of a lock file that records the locked requirements.
+LOCK_REQUIRES_PREFIX = '# requires: '
+
+# The content of installed packages that isn't needed at runtime. Patterns
+# are relative to the directory into which packages are installed. Test
+# suites and documentation are only matched at the top level of a package;
+# a deeper ``tests``, ``test`` or ``docs`` directory may be a subpackage
+# that is used at runtime.
+DEFAULT_PRUNE_PATTERNS = [
+    # Test suites
+    '*/tests/',
+    '*/test/',
+    # Bytecode compiled for the machine that installed the packages
+    '**/__pycache__/',
+    # Type stubs and markers
+    '**/*.pyi',
+    '**/py.typed',
+    # Documentation
+    '*/docs/',
+    # Cython sources
+    '**/*.pyx',
+    '**/*.pxd',
+    # Scripts installed by pip
+    'bin/',
+    # Installation records
+    '*.dist-info/RECORD',
+    '*.dist-info/INSTALLER',
+    '*.dist-info/REQUESTED',
+    '*.dist-info/direct_url.json',
+]
+
+# Version control schemes that pip can install from. The content of a
+# checkout can change without the requirement changing.
+VCS_RE = re.compile(r'\b(git|hg|svn|bzr)\+', re.IGNORECASE)
+
+
+def normalize_requirement(requirement):
+    """
+    Normalize the formatting of a requirement.
+
+    :param requirement: A requirement specifier (e.g., ``toga >= 0.3``).
+    :returns: The requirement, with redundant whitespace removed.
+    """
+    return ' '.join(requirement.split())
+
+
+def distribution_name(name):
+    """
+    Determine the distribution that owns an item in an install directory.
+
+    :param name: The name of an item at the top level of the directory into
+        which packages have been installed (e.g., ``numpy`` or
+        ``numpy-1.22.0.dist-info``).
+    :returns: The name of the distribution, if it can be determined from the
+        name of a metadata directory; otherwise, the name of the item.
+    """
+    if name.endswith(('.dist-info', '.egg-info')):
+        return name.rsplit('.', 1)[0].split('-', 1)[0]
+    return name
+
+
+def is_cacheable_requirement(requirement):
+    """
+    Determine if the packages installed for a requirement can be cached.
+
+    The result of installing a requirement can only be cached if it is
+    determined by the requirement itself. Requirements that refer to local
+    files or directories, or to version control checkouts, can change
+    without the requirement changing, so they can't be cached.
+
+    :param requirement: A requirement specifier.
+    :returns: True if the installed packages can be cached.
+    """
+    requirement = requirement.strip()
+    if requirement.startswith(('.', '/', '~', '-')) or 'file:' in requirement:
+        return False
+    if VCS_RE.search(requirement):
+        return False
+    if '://' not in requirement and ('/' in requirement or '\\' in requirement):
+        # A relative path to a directory, wheel or sdist.
+        return False
+    return True
+
+
+def pip_config_files(home_path, environ):
+    """
+    List the configuration files that can affect the behavior of pip.
+
+    :param home_path: The user's home directory.
+    :param environ: The environment in which pip will run.
+    :returns: A list of paths; not all of them will exist.
+    """
+    paths = [
+        os.path.join(sys.prefix, 'pip.ini' if sys.platform == 'win32' else 'pip.conf'),
+        '/etc/pip.conf',
+        '/etc/xdg/pip/pip.conf',
+        os.path.join(home_path, '.pip', 'pip.conf'),
+        os.path.join(home_path, '.config', 'pip', 'pip.conf'),
+        os.path.join(home_path, 'Library', 'Application Support', 'pip', 'pip.conf'),
+    ]
+    if 'APPDATA' in environ:
+        paths.append(os.path.join(environ['APPDATA'], 'pip', 'pip.ini'))
+    if 'PIP_CONFIG_FILE' in environ:
+        paths.append(environ['PIP_CONFIG_FILE'])
+    return paths
+
+
+def pip_config(home_path, environ):
+    """
+    Describe the configuration that pip will use.
+
+    :param home_path: The user's home directory.
+    :param environ: The environment in which pip will run.
+    :returns: A dictionary containing the ``PIP_*`` environment variables,
+        and the content of any pip configuration files.
+    """
+    files = {}
+    for path in pip_config_files(home_path, environ):
+        try:
+            with open(path, 'rb') as f:
+                files[os.fsdecode(path)] = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            pass
+
+    return {
+        'environment': {
+            key: value
+            for key, value in environ.items()
+            if key.startswith('PIP_')
+        },
+        'files': files,
+    }
+
+
+def dependency_fingerprint(requires, **context):
+    """
+    Compute a fingerprint for a set of installed dependencies.
+
+    :param requires: The list of requirements that will be installed.
+    :param context: Any other values that affect the packages that will be
+        installed (e.g., the Python version, or the target platform). Values
+        must be serializable as JSON.
+    :returns: A hex digest identifying the installed dependencies, or
+        ``None`` if the requirements can't be cached.
+    """
+    if not all(is_cacheable_requirement(requirement) for requirement in requires):
+        return None
+
+    content = dict(
+        context,
+        requires=sorted(normalize_requirement(requirement) for requirement in requires),
+    )
+    return hashlib.sha256(
+        json.dumps(content, sort_keys=True).encode('utf-8')
+    ).hexdigest()
+
+
+def resolved_packages(report):
+    """
+    Extract the packages that pip selected from an installation report.
+
+    :param report: The content of the JSON report produced by
+        ``pip install --dry-run --report``.
+    :returns: A list of ``(name, version, sha256)`` tuples, sorted by name.
+        ``sha256`` is ``None`` if the hash of the package is unknown.
+    :raises ValueError: If the report isn't a valid installation report, or
+        if a package wasn't resolved to a package archive (e.g., because it
+        is a local directory).
+    """
+    if 'install' not in report:
+        raise ValueError("pip did not produce an installation report")
+
+    packages = []
+    for item in report['install']:
+        name = item['metadata']['name']
+        version = item['metadata']['version']
+        download_info = item.get('download_info', {})
+        archive_info = download_info.get('archive_info')
+        if archive_info is None:
+            raise ValueError("{name} was not resolved to a package archive".format(name=name))
+
+        sha256 = archive_info.get('hashes', {}).get('sha256')
+        if sha256 is None and archive_info.get('hash', '').startswith('sha256='):
+            sha256 = archive_info['hash'][len('sha256='):]
+        if sha256 is None:
+            url = urlsplit(download_info.get('url', ''))
+            if url.scheme == 'file':
+                sha256 = file_sha256(Path(url2pathname(url.path)))
+
+        packages.append((name, version, sha256))
+
+    return sorted(packages, key=lambda package: package[0].lower())
+
+
+def format_lock(packages, requires, description):
+    """
+    Format the content of a lock file.
+
+    If the hash of every package is known, the hashes are included in the
+    lock file, so pip will verify them when the lock file is installed.
+
+    :param packages: The resolved packages, as returned by
+        :func:`resolved_packages`.
+    :param requires: The requirements that were resolved.
+    :param description: A description of what the lock file is for; it is
+        included as a comment at the start of the file.
+    :returns: The content of the lock file.
+    """
+    lines = ['# {line}'.format(line=line) for line in description.splitlines()]
+    lines.append(LOCK_REQUIRES_PREFIX + json.dumps(
+        sorted(normalize_requirement(requirement) for requirement in requires)
+    ))
+
+    hashed = all(sha256 for name, version, sha256 in packages)
+    for name, version, sha256 in packages:
+        if hashed:
+            lines.append('{name}=={version} \\\n    --hash=sha256:{sha256}'.format(
+                name=name, version=version, sha256=sha256,
+            ))
+        else:
+            lines.append('{name}=={version}'.format(name=name, version=version))
+
+    return '\n'.join(lines) + '\n'
+
+
+def format_constraints(packages):
+    """
+    Format a set of resolved packages as a pip constraints file.
+
+    :param packages: The resolved packages, as returned by
+        :func:`resolved_packages`.
+    :returns: The content of the constraints file.
+    """
+    return ''.join(
+        '{name}=={version}\n'.format(name=name, version=version)
+        for name, version, sha256 in packages
+    )
+
+
+def locked_requires(content):
+    """
+    Determine the requirements that a lock file was generated for.
+
+    :param content: The content of the lock file.
+    :returns: The sorted, normalized list of requirements, or ``None`` if the
+        lock file doesn't record its requirements.
+    """
+    for line in content.splitlines():
+        if line.startswith(LOCK_REQUIRES_PREFIX):
+            try:
+                return json.loads(line[len(LOCK_REQUIRES_PREFIX):])
+            except ValueError:
+                return None
+    return None
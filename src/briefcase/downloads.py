@@ -0,0 +1,406 @@
+import hashlib
+import json
+import os
+import re
+import tarfile
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def read_json(path):
+    """
+    Read a JSON index file.
+
+    :param path: The path of the index file.
+    :returns: The dictionary stored in the file. If the file doesn't exist,
+        or doesn't contain a dictionary, an empty dictionary is returned.
+    """
+    try:
+        with path.open('r', encoding='utf-8') as f:
+            content = json.load(f)
+    except (FileNotFoundError, ValueError):
+        # No index, or the index is corrupted; either way,
+        # there's nothing we can use.
+        return {}
+
+    if not isinstance(content, dict):
+        return {}
+    return content
+
+
+def write_json(path, content):
+    """
+    Atomically write a JSON index file.
+
+    The content is written to a temporary file, which is then moved into
+    place, so a concurrent reader will never see a partially written file.
+
+    :param path: The path of the index file.
+    :param content: The dictionary to store.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.parent / '{path.name}.{pid}-{thread}.tmp'.format(
+        path=path,
+        pid=os.getpid(),
+        thread=threading.get_ident(),
+    )
+    with temp_path.open('w', encoding='utf-8') as f:
+        json.dump(content, f, indent=2, sort_keys=True)
+    temp_path.replace(path)
+
+
+def file_sha256(filename):
+    """
+    Compute the SHA256 hash of the content of a file.
+
+    :param filename: The path of the file to hash.
+    :returns: The hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with filename.open('rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+TAR_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+def is_tar_archive(filename):
+    """
+    Determine if a filename describes a tar archive.
+
+    :param filename: The filename to check.
+    :returns: True if the filename has a (possibly compressed) tar suffix.
+    """
+    return filename.name.lower().endswith(TAR_SUFFIXES)
+
+
+CONTENT_RANGE_RE = re.compile(r'^\s*bytes\s+(\d+)-(\d+)/(\d+|\*)\s*$', re.IGNORECASE)
+
+
+def parse_content_range(value):
+    """
+    Parse the value of a ``Content-Range`` header.
+
+    :param value: The header value (e.g., ``bytes 100-199/1000``).
+    :returns: A tuple of the offsets of the first and last bytes in the
+        response, and the total size of the resource (``None`` if the server
+        doesn't know the total size); or ``None`` if the value can't be
+        parsed.
+    """
+    match = CONTENT_RANGE_RE.match(value or '')
+    if match is None:
+        return None
+    start, end, total = match.groups()
+    return int(start), int(end), None if total == '*' else int(total)
+
+
+def partial_validator(response, total):
+    """
+    Describe the version of a resource that is being downloaded.
+
+    The description is stored with a partial download, so that a resumed
+    download can be checked against the content that has already been
+    received.
+
+    :param response: The (200) response for the resource.
+    :param total: The total size of the resource, or ``None`` if the size
+        isn't known.
+    :returns: A dictionary containing the ``etag``, ``last_modified`` and
+        ``total`` of the resource.
+    """
+    return {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'total': total,
+    }
+
+
+def if_range(validator):
+    """
+    Determine the ``If-Range`` header for resuming a partial download.
+
+    Weak ETags can't be used in an ``If-Range`` header, so a
+    ``Last-Modified`` date is used if the ETag isn't strong.
+
+    :param validator: The description of the partially downloaded resource,
+        as returned by :func:`partial_validator`.
+    :returns: The value for the header, or ``None`` if the resource has no
+        usable validator.
+    """
+    etag = validator.get('etag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return validator.get('last_modified') or None
+
+
+class HTTPSession(requests.Session):
+    """
+    A requests session configured for Briefcase's network access.
+
+    Connections are pooled (and kept alive) per host, so multiple downloads
+    from the same host don't each pay for a new TCP and TLS handshake.
+    Requests that fail because of a connection error, or because the server
+    returns a 5xx error, are retried with exponential backoff. Every request
+    has a timeout, unless one is explicitly provided.
+
+    :param retries: The number of times a failed request will be retried.
+    :param backoff_factor: The backoff factor for retries. Retry ``n`` will
+        wait ``backoff_factor * 2 ** (n - 1)`` seconds before starting.
+    :param timeout: The timeout to apply to requests, in seconds. Either a
+        single value, or a (connect, read) tuple.
+    :param pool_size: The maximum number of connections to keep alive for
+        each host.
+    """
+    def __init__(self, retries=3, backoff_factor=0.5, timeout=(10, 60), pool_size=16):
+        super().__init__()
+        self.timeout = timeout
+
+        adapter = HTTPAdapter(
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                connect=retries,
+                read=retries,
+                status=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=(500, 502, 503, 504),
+                # If the retries are exhausted, return the last response,
+                # rather than raising an error; the caller can then report
+                # the status code.
+                raise_on_status=False,
+            ),
+        )
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+class RangeRequestsUnsupported(Exception):
+    "The server didn't honor a range request, or the resource has changed"
+
+
+class DownloadProgress:
+    """
+    A progress bar for a download.
+
+    Progress can be reported from multiple threads.
+
+    :param total: The total size of the download, or ``None`` if the size
+        isn't known. If the size isn't known, no progress bar is displayed.
+    :param downloaded: The amount of content that has already been downloaded.
+    :param quiet: Should the progress bar be suppressed?
+    """
+    def __init__(self, total, downloaded=0, quiet=False):
+        self.total = total
+        self.downloaded = downloaded
+        self.quiet = quiet
+        self._lock = threading.Lock()
+
+    def update(self, count):
+        """
+        Record that more content has been downloaded.
+
+        :param count: The amount of content that has been downloaded.
+        """
+        with self._lock:
+            self.downloaded += count
+            if self.total and not self.quiet:
+                done = int(50 * self.downloaded / self.total)
+                print('\r{}{} {}%'.format('#' * done, '.' * (50-done), 2*done), end='', flush=True)
+
+
+class DownloadIndex:
+    """
+    A persistent record of the URLs that have been downloaded.
+
+    Each entry in the index is keyed by the URL that was requested, and
+    records the file that the URL was cached as, the SHA256 hash of the file
+    content, the cache validators (ETag and Last-Modified) provided by the
+    server, and the time at which the content was last confirmed to be
+    current.
+
+    The index is stored as a JSON file. It is re-read before every update,
+    and written atomically, so that multiple Briefcase processes can share a
+    single index. Updates within a single process are serialized.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _load(self):
+        return read_json(self.path)
+
+    def _save(self, entries):
+        write_json(self.path, entries)
+
+    def get(self, url):
+        """
+        Retrieve the index entry for a URL.
+
+        :param url: The URL to look up.
+        :returns: The index entry for the URL, or ``None`` if the URL hasn't
+            been downloaded.
+        """
+        return self._load().get(url)
+
+    def record(self, url, filename, sha256, etag=None, last_modified=None):
+        """
+        Record the download of a URL.
+
+        :param url: The URL that was downloaded.
+        :param filename: The file containing the downloaded content.
+        :param sha256: The SHA256 hash of the downloaded content.
+        :param etag: The ETag provided by the server (if any).
+        :param last_modified: The Last-Modified date provided by the server
+            (if any).
+        """
+        with self._lock:
+            entries = self._load()
+            entries[url] = {
+                'filename': os.fsdecode(filename),
+                'sha256': sha256,
+                'etag': etag,
+                'last_modified': last_modified,
+                'fetched': time.time(),
+            }
+            self._save(entries)
+
+    def refresh(self, url):
+        """
+        Record that the cached content for a URL has been confirmed as current.
+
+        :param url: The URL that was revalidated.
+        """
+        with self._lock:
+            entries = self._load()
+            try:
+                entries[url]['fetched'] = time.time()
+            except KeyError:
+                return
+            self._save(entries)
+
+    def discard(self, url):
+        """
+        Remove the index entry for a URL.
+
+        :param url: The URL to forget.
+        """
+        with self._lock:
+            entries = self._load()
+            if entries.pop(url, None) is not None:
+                self._save(entries)
+
+
+class StreamReader:
+    """
+    A read-only file-like view of a stream of content.
+
+    As content is read from the stream, it is written to a sink file, hashed,
+    and reported to a progress tracker.
+
+    :param chunks: An iterable producing the content of the stream as
+        a series of byte strings.
+    :param sink: A file-like object to which all content will be written.
+    :param progress: The :class:`DownloadProgress` for the stream.
+    """
+    def __init__(self, chunks, sink, progress):
+        self.sink = sink
+        self.progress = progress
+        self.digest = hashlib.sha256()
+        self._chunks = iter(chunks)
+        self._chunk = b''
+        self._offset = 0
+
+    def _next_chunk(self):
+        for data in self._chunks:
+            if data:
+                self.sink.write(data)
+                self.digest.update(data)
+                self.progress.update(len(data))
+                return data
+        return b''
+
+    def read(self, size=-1):
+        """
+        Read content from the stream.
+
+        :param size: The maximum number of bytes to read; if negative, all
+            the remaining content will be read.
+        :returns: The content that was read. An empty byte string indicates
+            the end of the stream.
+        """
+        parts = []
+        while size != 0:
+            if self._offset >= len(self._chunk):
+                self._chunk = self._next_chunk()
+                self._offset = 0
+                if not self._chunk:
+                    break
+
+            if size < 0:
+                piece = self._chunk[self._offset:]
+            else:
+                piece = self._chunk[self._offset:self._offset + size]
+                size -= len(piece)
+            self._offset += len(piece)
+            parts.append(piece)
+
+        return b''.join(parts)
+
+    def drain(self):
+        """
+        Consume the rest of the stream, without returning it.
+        """
+        while self._next_chunk():
+            pass
+
+
+class TarStreamUnpacker:
+    """
+    Unpack a tar archive while it is being downloaded.
+
+    Members of the archive are decompressed and written to disk as soon as
+    their content arrives, rather than waiting for the full archive to be
+    downloaded. The archive itself is written to disk at the same time, and
+    its SHA256 hash is computed on the fly.
+
+    :param extract_dir: The directory into which the archive will be unpacked.
+    """
+    def __init__(self, extract_dir):
+        self.extract_dir = extract_dir
+        self.unpacked = False
+        self.sha256 = None
+
+    def unpack(self, chunks, archive, progress):
+        """
+        Unpack the content of an archive.
+
+        :param chunks: An iterable producing the content of the archive.
+        :param archive: A file-like object to which the (raw) content of the
+            archive will be written.
+        :param progress: The :class:`DownloadProgress` for the download. If
+            the progress tracker has a total, the content is verified to
+            be complete.
+        """
+        reader = StreamReader(chunks, archive, progress)
+        self.extract_dir.mkdir(parents=True, exist_ok=True)
+        with tarfile.open(fileobj=reader, mode='r|*') as tar:
+            # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
+            tar.extractall(os.fsdecode(self.extract_dir))
+        # Tar archives can have trailing padding that isn't read by the
+        # extractor; make sure the full archive is written.
+        reader.drain()
+        if progress.total and progress.downloaded < progress.total:
+            raise EOFError('Archive content is incomplete')
+
+        self.unpacked = True
+        self.sha256 = reader.digest.hexdigest()
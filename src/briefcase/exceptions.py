@@ -79,6 +79,18 @@ class BriefcaseCommandError(BriefcaseError):
         return self.msg
 
 
+class AppJobsFailed(BriefcaseCommandError):
+    def __init__(self, failures):
+        self.failures = failures
+        super().__init__(msg="{count} app(s) failed:\n{details}".format(
+            count=len(failures),
+            details='\n'.join(
+                "  [{app_name}] {error}".format(app_name=app_name, error=error)
+                for app_name, error in sorted(failures.items())
+            ),
+        ))
+
+
 class NetworkFailure(BriefcaseCommandError):
     def __init__(self, action):
         self.action = action
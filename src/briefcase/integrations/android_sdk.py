@@ -168,6 +168,30 @@ class AndroidSDK:
         else:
             raise MissingToolError('Android SDK')
 
+    @classmethod
+    def download_plan(cls, command):
+        """
+        Determine the downloads that are needed to provide an Android SDK.
+
+        :param command: The command that will need the Android SDK.
+        :returns: A list of ``(url, download_path)`` pairs. This includes
+            any downloads needed to provide a JDK.
+        """
+        plan = JDK.download_plan(command)
+
+        sdk_root = command.os.environ.get("ANDROID_SDK_ROOT")
+        if sdk_root and AndroidSDK(command=command, jdk=None, root_path=Path(sdk_root)).exists():
+            return plan
+
+        sdk = AndroidSDK(
+            command=command,
+            jdk=None,
+            root_path=command.tools_path / "android_sdk"
+        )
+        if not sdk.exists():
+            plan.append((sdk.sdk_url, command.tools_path))
+        return plan
+
     def exists(self):
         """Confirm that the SDK actually exists.
 
@@ -200,8 +224,7 @@ class AndroidSDK:
 
         try:
             print("Install Android SDK...")
-            # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-            self.command.shutil.unpack_archive(os.fsdecode(sdk_zip_path), extract_dir=os.fsdecode(self.root_path))
+            self.command.unpack_archive(sdk_zip_path, extract_dir=self.root_path)
         except (shutil.ReadError, EOFError):
             raise BriefcaseCommandError(
                 """\
@@ -216,13 +239,6 @@ Delete {sdk_zip_path} and run briefcase again.""".format(
         # Zip file no longer needed once unpacked.
         sdk_zip_path.unlink()
 
-        # Python zip unpacking ignores permission metadata.
-        # On non-Windows, we manually fix permissions.
-        if self.command.host_os != "Windows":
-            for binpath in (self.root_path / "tools" / "bin").glob("*"):
-                if not self.command.os.access(binpath, self.command.os.X_OK):
-                    binpath.chmod(0o755)
-
         # Licences must be accepted.
         self.verify_license()
 
@@ -0,0 +1,294 @@
+import os
+import shutil
+import stat
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from briefcase.integrations.bytecode import compile_pyc
+
+# File extensions of compiled extension modules and shared libraries, which
+# can't be imported from a zip file.
+NATIVE_SUFFIXES = ('.so', '.pyd', '.dll', '.dylib')
+
+# The timestamp used for every member of a packed archive, so that packing
+# the same content always produces the same archive.
+PACKED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def _member_path(extract_dir, name):
+    """
+    Determine the location where a zip member should be extracted.
+
+    Absolute paths, and any ``.`` or ``..`` components, are removed from the
+    member name, so a member can't be extracted outside the extraction
+    directory. This mirrors the sanitization performed by
+    ``ZipFile.extract()``.
+
+    :param extract_dir: The directory into which the archive is extracted.
+    :param name: The name of the zip member.
+    :returns: The path for the member.
+    """
+    parts = [
+        part
+        for part in name.replace('\\', '/').split('/')
+        if part not in {'', '.', '..'}
+    ]
+    if parts:
+        parts[0] = os.path.splitdrive(parts[0])[1] or parts[0]
+    return os.path.join(extract_dir, *parts)
+
+
+def _member_mode(info):
+    """
+    Determine the Unix mode of a zip member.
+
+    :param info: The ``ZipInfo`` for the member.
+    :returns: The Unix mode of the member, or 0 if the archive wasn't created
+        with Unix permission metadata.
+    """
+    return info.external_attr >> 16
+
+
+def _extract_batch(filename, extract_dir, names):
+    """
+    Extract a batch of members from a zip file.
+
+    :param filename: The zip file.
+    :param extract_dir: The directory into which the archive is extracted.
+    :param names: The names of the members to extract.
+    """
+    # Each batch uses its own handle on the archive, so that members can be
+    # read (and decompressed) concurrently.
+    with zipfile.ZipFile(filename) as archive:
+        for name in names:
+            info = archive.getinfo(name)
+            path = archive.extract(info, extract_dir)
+            mode = _member_mode(info)
+            if mode and not info.is_dir():
+                os.chmod(path, stat.S_IMODE(mode))
+
+
+def unpack_zip(filename, extract_dir, workers=None):
+    """
+    Unpack a zip file, using multiple threads.
+
+    Unlike ``shutil.unpack_archive()``, Unix permissions and symlinks stored
+    in the archive are restored. Members are divided into batches of roughly
+    equal size, and the batches are decompressed concurrently. Symlinks are
+    created once all other members have been extracted, so that a symlink in
+    the archive can't be used to write outside the extraction directory.
+
+    :param filename: The zip file to unpack.
+    :param extract_dir: The directory into which the archive should be
+        unpacked. It will be created if it doesn't exist.
+    :param workers: The number of threads to use. Defaults to the number of
+        CPUs available (up to a maximum of 8).
+    :raises shutil.ReadError: If the file isn't a valid zip file.
+    """
+    extract_dir = os.fsdecode(extract_dir)
+    try:
+        with zipfile.ZipFile(filename) as archive:
+            members = archive.infolist()
+    except (zipfile.BadZipFile, FileNotFoundError) as e:
+        raise shutil.ReadError(str(e))
+
+    if workers is None:
+        workers = min(os.cpu_count() or 1, 8)
+
+    links = []
+    files = []
+    directories = []
+    for info in members:
+        if stat.S_ISLNK(_member_mode(info)):
+            links.append(info)
+        elif info.is_dir():
+            directories.append(info)
+        else:
+            files.append(info)
+
+    # Create the directory structure up front, so that concurrent
+    # extractions don't race to create the same parent directory.
+    os.makedirs(extract_dir, exist_ok=True)
+    for info in directories:
+        os.makedirs(_member_path(extract_dir, info.filename), exist_ok=True)
+    for info in files:
+        os.makedirs(os.path.dirname(_member_path(extract_dir, info.filename)), exist_ok=True)
+
+    # Assign the largest files first, always to the smallest batch.
+    batches = [[] for _ in range(max(1, min(workers, len(files))))]
+    sizes = [0] * len(batches)
+    for info in sorted(files, key=lambda info: info.file_size, reverse=True):
+        index = sizes.index(min(sizes))
+        batches[index].append(info.filename)
+        sizes[index] += info.file_size
+
+    try:
+        if len(batches) == 1:
+            _extract_batch(filename, extract_dir, batches[0])
+        else:
+            with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+                futures = [
+                    executor.submit(_extract_batch, filename, extract_dir, batch)
+                    for batch in batches
+                ]
+                for future in futures:
+                    future.result()
+
+        if links:
+            with zipfile.ZipFile(filename) as archive:
+                for info in links:
+                    path = _member_path(extract_dir, info.filename)
+                    target = archive.read(info).decode('utf-8')
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    if os.path.lexists(path):
+                        os.unlink(path)
+                    try:
+                        os.symlink(target, path)
+                    except OSError:
+                        # Symlinks aren't available (e.g., on Windows
+                        # without the required privileges); fall back to
+                        # the behavior of ZipFile, writing the link target
+                        # as the content of a file.
+                        archive.extract(info, extract_dir)
+    except (zipfile.BadZipFile, EOFError) as e:
+        raise shutil.ReadError(str(e))
+
+    # Restore directory permissions once their content is in place,
+    # so that read-only directories can be populated.
+    for info in directories:
+        mode = _member_mode(info)
+        if mode:
+            os.chmod(_member_path(extract_dir, info.filename), stat.S_IMODE(mode))
+
+
+def zip_import_blocker(path):
+    """
+    Determine why an installed package can't be imported from a zip file.
+
+    :param path: A top-level item in a directory into which packages have
+        been installed.
+    :returns: ``None`` if the item is a package or module that can be
+        imported from a zip file; otherwise, a description of why it can't
+        be. Items that aren't Python packages or modules (e.g.,
+        ``.dist-info`` directories) are described as ``not a package``.
+    """
+    name = os.path.basename(path)
+    if os.path.islink(path):
+        return 'not a package'
+    if os.path.isfile(path):
+        if name.endswith(NATIVE_SUFFIXES):
+            return 'native extension'
+        if name.endswith('.py'):
+            return None
+        return 'not a package'
+    if name.endswith(('.dist-info', '.egg-info')) or name == '__pycache__' or not name.isidentifier():
+        return 'not a package'
+    if not os.path.isfile(os.path.join(path, '__init__.py')):
+        return 'namespace package'
+
+    uses_file = False
+    has_data = False
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [dirname for dirname in dirs if dirname != '__pycache__']
+        for filename in files:
+            if filename.endswith(NATIVE_SUFFIXES):
+                return 'contains native extensions'
+            elif filename.endswith('.py'):
+                with open(os.path.join(root, filename), 'rb') as f:
+                    if b'__file__' in f.read():
+                        uses_file = True
+            elif not filename.endswith(('.pyc', '.pyi')) and filename != 'py.typed':
+                has_data = True
+
+    if uses_file and has_data:
+        return 'accesses data files using __file__'
+    return None
+
+
+def pack_packages(path, archive_name):
+    """
+    Move the pure-Python packages in an install directory into a zip file.
+
+    Every package (and module) that can be imported from a zip file is added
+    to the archive, along with bytecode compiled from its source, and then
+    removed from the install directory. Packages with native extensions, or
+    that access data files relative to ``__file__``, are left in place. A
+    ``.pth`` file naming the archive is written alongside it, so that the
+    archive is added to ``sys.path`` when the install directory is processed
+    as a site directory.
+
+    If the archive already exists, its content is retained.
+
+    :param path: The directory into which packages have been installed.
+    :param archive_name: The file name of the archive.
+    :returns: A tuple of the list of names of the packages that were packed,
+        and a dictionary describing why each of the other packages couldn't
+        be packed. Items that aren't packages aren't included in either.
+    """
+    path = os.fsdecode(path)
+    archive_path = os.path.join(path, archive_name)
+    packed = []
+    blocked = {}
+    for name in sorted(os.listdir(path)):
+        if name == archive_name:
+            continue
+        blocker = zip_import_blocker(os.path.join(path, name))
+        if blocker is None:
+            packed.append(name)
+        elif blocker != 'not a package':
+            blocked[name] = blocker
+
+    if not packed:
+        return packed, blocked
+
+    members = {}
+    if os.path.exists(archive_path):
+        with zipfile.ZipFile(archive_path) as existing:
+            for info in existing.infolist():
+                members[info.filename] = existing.read(info)
+
+    for name in packed:
+        item_path = os.path.join(path, name)
+        if os.path.isfile(item_path):
+            sources = [(item_path, name)]
+        else:
+            sources = []
+            for root, dirs, files in os.walk(item_path):
+                dirs[:] = [dirname for dirname in dirs if dirname != '__pycache__']
+                for filename in files:
+                    if not filename.endswith('.pyc'):
+                        full_path = os.path.join(root, filename)
+                        sources.append((full_path, os.path.relpath(full_path, path).replace(os.sep, '/')))
+
+        for full_path, member in sources:
+            with open(full_path, 'rb') as f:
+                data = f.read()
+            members[member] = data
+            if member.endswith('.py'):
+                # zipimport looks for bytecode next to the source,
+                # rather than in __pycache__.
+                try:
+                    members[member + 'c'] = compile_pyc(data, member)
+                except (SyntaxError, ValueError):
+                    pass
+
+    temp_path = archive_path + '.tmp'
+    with zipfile.ZipFile(temp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for member, data in sorted(members.items()):
+            info = zipfile.ZipInfo(member, date_time=PACKED_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            archive.writestr(info, data)
+    os.replace(temp_path, archive_path)
+
+    with open(os.path.splitext(archive_path)[0] + '.pth', 'w', encoding='utf-8') as f:
+        f.write(archive_name + '\n')
+
+    for name in packed:
+        item_path = os.path.join(path, name)
+        if os.path.isdir(item_path):
+            shutil.rmtree(item_path)
+        else:
+            os.unlink(item_path)
+
+    return packed, blocked
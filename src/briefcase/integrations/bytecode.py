@@ -0,0 +1,176 @@
+import hashlib
+import importlib.util
+import marshal
+import multiprocessing
+import os
+import py_compile
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# The flags in the header of a pyc file that is validated by the hash of its
+# source, but whose hash is never checked at runtime (PEP 552).
+UNCHECKED_HASH_FLAGS = 0b01
+
+# Starting a worker process isn't worthwhile for fewer files than this.
+FILES_PER_WORKER = 64
+
+
+def _is_current(source_data, pyc_path):
+    """
+    Determine if a pyc file is an unchecked-hash pyc for the given source.
+
+    :param source_data: The content of the source file.
+    :param pyc_path: The pyc file.
+    :returns: True if the pyc file was compiled from the source.
+    """
+    try:
+        with open(pyc_path, 'rb') as f:
+            header = f.read(16)
+    except OSError:
+        return False
+
+    return (
+        len(header) == 16
+        and header[:4] == importlib.util.MAGIC_NUMBER
+        and int.from_bytes(header[4:8], 'little') == UNCHECKED_HASH_FLAGS
+        and header[8:16] == importlib.util.source_hash(source_data)
+    )
+
+
+def compile_pyc(source_data, dfile):
+    """
+    Compile Python source into the content of an unchecked-hash pyc file.
+
+    :param source_data: The content of the source file.
+    :param dfile: The name of the source file to record in the bytecode.
+    :returns: The content of the pyc file.
+    :raises SyntaxError: If the source isn't valid Python.
+    :raises ValueError: If the source contains null bytes.
+    """
+    code = compile(source_data, dfile, 'exec', dont_inherit=True, optimize=0)
+    return b''.join([
+        importlib.util.MAGIC_NUMBER,
+        UNCHECKED_HASH_FLAGS.to_bytes(4, 'little'),
+        importlib.util.source_hash(source_data),
+        marshal.dumps(code),
+    ])
+
+
+def compile_file(source_path, dfile, cache_path):
+    """
+    Compile a Python source file into an unchecked-hash pyc file.
+
+    The pyc file is written into the ``__pycache__`` folder next to the
+    source file. Compiled output is cached by the hash of the source: if the
+    cache contains the output for the same source, it is used rather than
+    compiling the source again.
+
+    :param source_path: The source file to compile.
+    :param dfile: The name of the source file to record in the pyc file.
+    :param cache_path: The directory that caches compiled output.
+    :returns: ``unchanged`` if the existing pyc file is current; ``cached``
+        if the pyc file was obtained from the cache; ``compiled`` if the
+        source was compiled; or ``failed`` if the source couldn't be compiled
+        (e.g., because it isn't valid Python).
+    """
+    pyc_path = importlib.util.cache_from_source(source_path, optimization='')
+    with open(source_path, 'rb') as f:
+        source_data = f.read()
+
+    if _is_current(source_data, pyc_path):
+        return 'unchanged'
+
+    cached_path = os.path.join(
+        cache_path,
+        '{tag}-{digest}.pyc'.format(
+            tag=sys.implementation.cache_tag,
+            digest=hashlib.sha256(source_data).hexdigest(),
+        )
+    )
+    # The pyc file may be a hard link to a file that is shared with other
+    # trees (e.g., the dependency cache), so it is never written in place;
+    # a new file is written, and then moved into place.
+    temp_pyc_path = '{pyc_path}.{pid}.tmp'.format(pyc_path=pyc_path, pid=os.getpid())
+    os.makedirs(os.path.dirname(pyc_path), exist_ok=True)
+    if os.path.exists(cached_path):
+        shutil.copyfile(cached_path, temp_pyc_path)
+        os.replace(temp_pyc_path, pyc_path)
+        # Mark the cached output as recently used.
+        os.utime(cached_path)
+        return 'cached'
+
+    try:
+        py_compile.compile(
+            source_path,
+            cfile=temp_pyc_path,
+            dfile=dfile,
+            doraise=True,
+            optimize=0,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+        )
+    except py_compile.PyCompileError:
+        return 'failed'
+
+    temp_path = '{cached_path}.{pid}.tmp'.format(cached_path=cached_path, pid=os.getpid())
+    shutil.copyfile(temp_pyc_path, temp_path)
+    os.replace(temp_path, cached_path)
+    os.replace(temp_pyc_path, pyc_path)
+    return 'compiled'
+
+
+def _compile_batch(batch, cache_path):
+    return [
+        compile_file(source_path, dfile, cache_path)
+        for source_path, dfile in batch
+    ]
+
+
+def compile_tree(paths, cache_path, workers=None):
+    """
+    Compile every Python source file in a set of directories.
+
+    Files are compiled into unchecked-hash pyc files: the pyc is always used
+    by the importer, without checking the modification time or the hash of
+    the source. Compilation is performed by a pool of worker processes.
+
+    :param paths: The directories to compile.
+    :param cache_path: The directory that caches compiled output.
+    :param workers: The number of worker processes to use. Defaults to the
+        number of CPUs available.
+    :returns: A dictionary describing the number of files that were
+        ``compiled``, ``cached``, ``unchanged`` and ``failed``.
+    """
+    os.makedirs(cache_path, exist_ok=True)
+    sources = []
+    for path in paths:
+        path = os.fsdecode(path)
+        for root, dirs, files in os.walk(path):
+            dirs[:] = [name for name in dirs if name != '__pycache__']
+            for name in files:
+                if name.endswith('.py'):
+                    source_path = os.path.join(root, name)
+                    sources.append((source_path, os.path.relpath(source_path, os.path.dirname(path))))
+
+    counts = {'compiled': 0, 'cached': 0, 'unchanged': 0, 'failed': 0}
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(sources) // FILES_PER_WORKER))
+
+    batches = [sources[i::workers] for i in range(workers)]
+    if workers == 1:
+        results = [_compile_batch(sources, cache_path)]
+    else:
+        # Workers are spawned, rather than forked, because compilation may
+        # be requested from a thread; forking a multithreaded process isn't
+        # safe.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+        ) as executor:
+            results = list(executor.map(_compile_batch, batches, [cache_path] * workers))
+
+    for result in results:
+        for outcome in result:
+            counts[outcome] += 1
+    return counts
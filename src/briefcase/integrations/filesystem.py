@@ -0,0 +1,577 @@
+import errno
+import os
+import re
+import shutil
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from briefcase.downloads import file_sha256
+
+# The ioctl request number for FICLONE on Linux.
+FICLONE = 0x40049409
+
+# Errors that indicate a filesystem (or pair of filesystems) doesn't support
+# a particular way of linking files.
+UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EPERM,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.EMLINK,
+    errno.ENOSYS,
+    errno.EOPNOTSUPP,
+    getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP),
+}
+
+
+def reflink(source, target):
+    """
+    Create a copy-on-write clone of a file.
+
+    The clone shares storage with the original file until either file is
+    modified; creating it is almost instantaneous, regardless of the size
+    of the file. Clones are supported on Btrfs and XFS (Linux), and on APFS
+    (macOS).
+
+    :param source: The file to clone.
+    :param target: The path of the clone. This path must not exist.
+    :raises OSError: If the filesystem doesn't support clones.
+    """
+    if sys.platform == 'linux':
+        import fcntl
+
+        with open(source, 'rb') as src, open(target, 'xb') as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            except OSError:
+                dst.close()
+                os.unlink(target)
+                raise
+        shutil.copystat(source, target)
+    elif sys.platform == 'darwin':
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(source), os.fsencode(target), 0) != 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code), os.fsdecode(source))
+    else:
+        raise OSError(errno.EOPNOTSUPP, "Clones are not supported on this platform")
+
+
+def _remove(path):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        os.unlink(path)
+
+
+def copy_range(source, target):
+    """
+    Copy a file using ``copy_file_range()``.
+
+    The content of the file is copied by the kernel, without passing through
+    userspace. On filesystems that support it (e.g., Btrfs, XFS or NFS), the
+    copy may be performed by sharing storage, or on the server.
+
+    :param source: The file to copy.
+    :param target: The path of the copy. This path must not exist.
+    :raises OSError: If ``copy_file_range()`` isn't available, or isn't
+        supported for these files (including if it stops copying before the
+        end of the file). The partial copy is removed.
+    """
+    if not hasattr(os, 'copy_file_range'):
+        # Only available on Linux, with Python 3.8+.
+        raise OSError(errno.ENOSYS, "copy_file_range() is not available")
+
+    with open(source, 'rb') as src, open(target, 'xb') as dst:
+        try:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    # Some filesystems (e.g., procfs, or some network and
+                    # overlay filesystems) report success without copying
+                    # anything; treat them as not supporting the copy.
+                    raise OSError(errno.EXDEV, "copy_file_range() copied nothing", os.fsdecode(source))
+                remaining -= copied
+        except OSError:
+            dst.close()
+            os.unlink(target)
+            raise
+    shutil.copystat(source, target)
+
+
+def _lock(f, blocking=True):
+    """
+    Acquire an exclusive lock on an open lock file.
+
+    :param f: The lock file, opened for writing.
+    :param blocking: Should the lock be waited for? If not, an ``OSError``
+        is raised if the lock is held by someone else.
+    """
+    if sys.platform == 'win32':
+        import msvcrt
+
+        f.seek(0)
+        if not blocking:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            return
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                break
+            except OSError:
+                # LK_LOCK gives up after 10 seconds; keep waiting.
+                pass
+    else:
+        import fcntl
+
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def _unlock(f):
+    """
+    Release the lock on an open lock file.
+
+    :param f: The lock file.
+    """
+    if sys.platform == 'win32':
+        import msvcrt
+
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def file_lock(path):
+    """
+    Hold an exclusive lock that is shared between processes.
+
+    The lock is an advisory lock on a file; the file is created if it
+    doesn't exist, and is never removed. Locks held by a process are
+    released when the process exits, even if it exits abnormally.
+
+    :param path: The lock file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a+b') as f:
+        _lock(f)
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+def hold_file_lock(path):
+    """
+    Acquire an exclusive lock (see :func:`file_lock`) that is held until
+    the returned file is closed, or the process exits.
+
+    :param path: The lock file.
+    :returns: The open lock file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    f = open(path, 'a+b')
+    try:
+        _lock(f)
+    except BaseException:
+        f.close()
+        raise
+    return f
+
+
+def file_lock_held(path):
+    """
+    Determine if the lock on a lock file is currently held.
+
+    :param path: The lock file.
+    :returns: True if the lock is held by someone other than the caller.
+    """
+    if not path.exists():
+        return False
+
+    with open(path, 'a+b') as f:
+        try:
+            _lock(f, blocking=False)
+        except OSError:
+            return True
+        _unlock(f)
+    return False
+
+
+def _device(path):
+    return os.stat(path).st_dev
+
+
+class FileCopier:
+    """
+    Copy files using the cheapest mechanism the filesystem supports.
+
+    Each file is copied with a copy-on-write clone if possible; then with
+    ``copy_file_range()``; then (if allowed) with a hard link; and finally,
+    with a conventional copy. When a mechanism fails because it isn't
+    supported, it isn't attempted again for files on the same pair of
+    devices.
+
+    Hard links share content with the source file, so any modification of
+    the target will also modify the source. They should only be used when
+    the target won't be modified in place.
+
+    :param workers: The number of threads to use when copying many files.
+        Defaults to the number of CPUs available (up to a maximum of 8).
+    """
+    # Copying fewer files than this isn't worth the overhead of a thread pool.
+    PARALLEL_THRESHOLD = 32
+
+    def __init__(self, workers=None):
+        if workers is None:
+            workers = min(os.cpu_count() or 1, 8)
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._unsupported = {}
+
+    def methods(self, hardlink=False):
+        """
+        The mechanisms that can be used to copy a file, in order of preference.
+
+        :param hardlink: Can hard links be used?
+        :returns: A list of (name, function) pairs.
+        """
+        methods = [('reflink', reflink), ('copy_file_range', copy_range)]
+        if hardlink:
+            methods.append(('hardlink', os.link))
+        methods.append(('copy', shutil.copy2))
+        return methods
+
+    def copy(self, source, target, hardlink=False):
+        """
+        Copy a file.
+
+        If the target exists, it is replaced.
+
+        :param source: The file to copy.
+        :param target: The path of the copy.
+        :param hardlink: Can a hard link be used?
+        :returns: The name of the mechanism that was used (``reflink``,
+            ``copy_file_range``, ``hardlink`` or ``copy``).
+        """
+        if os.path.lexists(target):
+            os.unlink(target)
+
+        devices = (_device(source), _device(os.path.dirname(os.path.abspath(target))))
+        with self._lock:
+            unsupported = self._unsupported.setdefault(devices, set())
+
+        for name, method in self.methods(hardlink=hardlink):
+            if name in unsupported:
+                continue
+            try:
+                method(source, target)
+                return name
+            except OSError as e:
+                if name == 'copy' or e.errno not in UNSUPPORTED_ERRNOS:
+                    raise
+                # This mechanism isn't supported; don't try it again.
+                with self._lock:
+                    unsupported.add(name)
+
+    def copy_files(self, pairs, hardlink=False):
+        """
+        Copy a collection of files.
+
+        If there are enough files to make it worthwhile, the files are
+        copied concurrently.
+
+        :param pairs: A list of (source, target) pairs.
+        :param hardlink: Can hard links be used?
+        :returns: A dictionary describing the number of files that were
+            copied with each mechanism (``reflink``, ``copy_file_range``,
+            ``hardlink`` and ``copy``).
+        """
+        counts = {'reflink': 0, 'copy_file_range': 0, 'hardlink': 0, 'copy': 0}
+        if len(pairs) < self.PARALLEL_THRESHOLD or self.workers < 2:
+            for source, target in pairs:
+                counts[self.copy(source, target, hardlink=hardlink)] += 1
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for name in executor.map(
+                    lambda pair: self.copy(*pair, hardlink=hardlink),
+                    pairs
+                ):
+                    counts[name] += 1
+        return counts
+
+
+def materialize_tree(source, target, hardlink=False, copier=None):
+    """
+    Reproduce a directory tree at a new location.
+
+    Every file is reproduced using the cheapest mechanism the filesystem
+    supports (see :class:`FileCopier`). Symlinks are reproduced as symlinks.
+
+    Hard links share content with the source tree, so any modification of a
+    file in the target tree will also modify the source tree. They should
+    only be used when the target tree won't be modified in place.
+
+    If the target directory already exists, the content of the source tree
+    is merged into it; existing files are replaced.
+
+    :param source: The directory to reproduce.
+    :param target: The location of the reproduction.
+    :param hardlink: Can hard links be used?
+    :param copier: The :class:`FileCopier` to use. If not provided, a new
+        copier will be created.
+    :returns: A dictionary describing the number of files that were
+        reproduced with each mechanism (``reflink``, ``copy_file_range``,
+        ``hardlink`` and ``copy``).
+    """
+    if copier is None:
+        copier = FileCopier()
+
+    pairs = []
+    directories = []
+    for root, dirs, files in os.walk(source):
+        relative = os.path.relpath(root, source)
+        target_root = os.path.normpath(os.path.join(target, relative))
+        os.makedirs(target_root, exist_ok=True)
+        directories.append((root, target_root))
+
+        # os.walk lists symlinks to directories as directories;
+        # they need to be reproduced as links, not descended into.
+        for name in list(dirs):
+            if os.path.islink(os.path.join(root, name)):
+                dirs.remove(name)
+                files.append(name)
+
+        for name in files:
+            src = os.path.join(root, name)
+            dst = os.path.join(target_root, name)
+            if os.path.lexists(dst):
+                _remove(dst)
+
+            if os.path.islink(src):
+                os.symlink(os.readlink(src), dst)
+            else:
+                pairs.append((src, dst))
+
+    counts = copier.copy_files(pairs, hardlink=hardlink)
+
+    # Apply directory metadata once the content is in place, so the
+    # directories are writable while the tree is reproduced.
+    for src, dst in reversed(directories):
+        shutil.copystat(src, dst)
+
+    return counts
+
+
+def sync_tree(source, target, manifest=None, checksum=False, copier=None):
+    """
+    Synchronize a target with a source file or directory.
+
+    Only files that have been added or changed since the last
+    synchronization are copied; files in the target that no longer exist
+    in the source are removed.
+
+    A file is considered unchanged if the target exists, and the size and
+    modification time of the source match the values recorded in the
+    manifest of the previous synchronization. If ``checksum`` is enabled,
+    a file whose size and modification time have changed is also
+    considered unchanged if its content hash matches the manifest.
+
+    If there is no manifest, the target is replaced with a full copy of
+    the source.
+
+    :param source: The source file or directory.
+    :param target: The target file or directory.
+    :param manifest: The manifest returned by the previous synchronization
+        of the same source and target (if any).
+    :param checksum: Should content hashes be used to detect changes?
+    :param copier: The :class:`FileCopier` to use. If not provided, a new
+        copier will be created.
+    :returns: A tuple containing the new manifest, and a dictionary
+        describing the number of files that were ``copied``, ``removed``
+        and ``unchanged``.
+    """
+    source = os.fsdecode(source)
+    target = os.fsdecode(target)
+    if copier is None:
+        copier = FileCopier()
+    counts = {'copied': 0, 'removed': 0, 'unchanged': 0}
+
+    recorded = manifest.get('files', {}) if manifest else None
+    if recorded is None and os.path.lexists(target):
+        # We don't know what's in the target; start again.
+        _remove(target)
+
+    # Enumerate the source files, keyed by path relative to the source.
+    files = {}
+    directories = set()
+    if os.path.isdir(source):
+        for root, dirs, names in os.walk(source, followlinks=True):
+            relative = os.path.relpath(root, source)
+            directories.add('' if relative == '.' else relative)
+            for name in names:
+                files[os.path.normpath(os.path.join(relative, name))] = os.stat(
+                    os.path.join(root, name)
+                )
+    else:
+        files[''] = os.stat(source)
+
+    # Remove anything in the target that isn't in the source.
+    if recorded is not None:
+        if not directories:
+            if os.path.isdir(target) and not os.path.islink(target):
+                shutil.rmtree(target)
+        elif os.path.lexists(target) and not os.path.isdir(target):
+            os.unlink(target)
+        elif os.path.isdir(target):
+            for root, dirs, names in os.walk(target):
+                relative = os.path.relpath(root, target)
+                for name in list(dirs):
+                    path = os.path.normpath(os.path.join(relative, name))
+                    if path not in directories:
+                        counts['removed'] += sum(
+                            len(walked) for _, _, walked in os.walk(os.path.join(root, name))
+                        )
+                        _remove(os.path.join(root, name))
+                        dirs.remove(name)
+                for name in names:
+                    path = os.path.normpath(os.path.join(relative, name))
+                    if path not in files:
+                        os.unlink(os.path.join(root, name))
+                        counts['removed'] += 1
+
+    for relative in sorted(directories):
+        os.makedirs(os.path.join(target, relative), exist_ok=True)
+
+    pairs = []
+    new_files = {}
+    for relative, stat_result in sorted(files.items()):
+        src = os.path.join(source, relative) if relative else source
+        dst = os.path.join(target, relative) if relative else target
+        entry = [stat_result.st_size, stat_result.st_mtime_ns, None]
+
+        previous = recorded.get(relative) if recorded else None
+        if previous and os.path.isfile(dst):
+            if previous[:2] == entry[:2]:
+                new_files[relative] = previous
+                counts['unchanged'] += 1
+                continue
+            if checksum and previous[2] and previous[0] == entry[0]:
+                entry[2] = file_sha256(Path(src))
+                if entry[2] == previous[2]:
+                    new_files[relative] = entry
+                    counts['unchanged'] += 1
+                    continue
+
+        if os.path.lexists(dst):
+            _remove(dst)
+        pairs.append((src, dst))
+        if checksum and entry[2] is None:
+            entry[2] = file_sha256(Path(src))
+        new_files[relative] = entry
+
+    copier.copy_files(pairs)
+    counts['copied'] = len(pairs)
+
+    return {'files': new_files}, counts
+
+
+def glob_regex(pattern):
+    """
+    Convert a glob pattern into a regular expression.
+
+    Patterns are matched against the whole of a relative path, using ``/``
+    as the separator. ``*`` and ``?`` match within a single path component;
+    ``**/`` matches any number of leading directories. A pattern that ends
+    with ``/`` only matches directories.
+
+    :param pattern: The glob pattern.
+    :returns: A tuple of the compiled regular expression, and a boolean
+        indicating if the pattern only matches directories.
+    """
+    directory = pattern.endswith('/')
+    pattern = pattern.rstrip('/')
+    regex = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            regex.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            regex.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            regex.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            regex.append('[^/]')
+            i += 1
+        else:
+            regex.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile(''.join(regex) + r'\Z'), directory
+
+
+def prune_tree(path, patterns):
+    """
+    Remove the files and directories in a tree that match a set of patterns.
+
+    :param path: The root of the tree.
+    :param patterns: A list of glob patterns (see :func:`glob_regex`),
+        relative to the root of the tree.
+    :returns: A dictionary, keyed by the name of each top-level item in the
+        tree that had content removed, describing the number of ``files``
+        and ``bytes`` that were removed.
+    """
+    path = os.fsdecode(path)
+    compiled = [glob_regex(pattern) for pattern in patterns]
+
+    def matches(relative, is_dir):
+        return any(
+            regex.match(relative) and (is_dir or not directory)
+            for regex, directory in compiled
+        )
+
+    removed = {}
+
+    def record(relative, files, size):
+        top = relative.split('/', 1)[0]
+        stats = removed.setdefault(top, {'files': 0, 'bytes': 0})
+        stats['files'] += files
+        stats['bytes'] += size
+
+    for root, dirs, files in os.walk(path):
+        relative_root = os.path.relpath(root, path).replace(os.sep, '/')
+        prefix = '' if relative_root == '.' else relative_root + '/'
+        for name in list(dirs):
+            full_path = os.path.join(root, name)
+            if matches(prefix + name, is_dir=not os.path.islink(full_path)):
+                dirs.remove(name)
+                if os.path.islink(full_path):
+                    record(prefix + name, 1, os.lstat(full_path).st_size)
+                    os.unlink(full_path)
+                else:
+                    count = 0
+                    size = 0
+                    for walk_root, walk_dirs, walk_files in os.walk(full_path):
+                        for walk_name in walk_files:
+                            count += 1
+                            size += os.lstat(os.path.join(walk_root, walk_name)).st_size
+                    shutil.rmtree(full_path)
+                    record(prefix + name, count, size)
+        for name in files:
+            full_path = os.path.join(root, name)
+            if matches(prefix + name, is_dir=False):
+                record(prefix + name, 1, os.lstat(full_path).st_size)
+                os.unlink(full_path)
+
+    return removed
@@ -0,0 +1,127 @@
+import os
+import re
+
+from briefcase.downloads import file_sha256
+
+try:
+    from PIL import Image
+except ImportError:
+    # Pillow is optional; without it, images can't be generated, so every
+    # image size must be provided by the app.
+    Image = None
+
+# Formats that can't store an alpha channel.
+OPAQUE_SUFFIXES = {'.bmp', '.jpg', '.jpeg'}
+
+# An image size: a width, or a width and height (e.g., ``1024x768``).
+IMAGE_SIZE_RE = re.compile(r'(\d+)(?:x(\d+))?\Z')
+
+
+def can_generate_images():
+    """
+    Determine if images can be generated.
+
+    :returns: True if Pillow is installed.
+    """
+    return Image is not None
+
+
+def image_dimensions(path):
+    """
+    Read the dimensions of an image.
+
+    :param path: The image file.
+    :returns: A ``(width, height)`` tuple, or ``None`` if the file can't be
+        read as an image.
+    """
+    try:
+        with Image.open(path) as image:
+            return image.size
+    except (OSError, ValueError):
+        return None
+
+
+def parse_image_size(size):
+    """
+    Parse the size of an image requested by a template.
+
+    :param size: The requested size; a width (e.g., ``180``), or a width and
+        height (e.g., ``1024x768``).
+    :returns: A ``(width, height)`` tuple, where the height is ``None`` if
+        only a width was requested; or ``None`` if the size isn't a size in
+        pixels.
+    """
+    match = IMAGE_SIZE_RE.match(str(size))
+    if match is None:
+        return None
+    width, height = match.groups()
+    return int(width), int(height) if height else None
+
+
+def generate_image(source_path, width, suffix, cache_path, height=None):
+    """
+    Generate an image of a given size from a larger source image.
+
+    The image is resampled with a high-quality (Lanczos) filter. If only a
+    width is requested, the aspect ratio of the source is preserved. If a
+    height is also requested, the source is scaled to cover the requested
+    size, and then cropped to it, keeping the center of the source.
+    Generated images are cached, keyed by the hash of the source image, the
+    size and the format, so each image is only generated once.
+
+    :param source_path: The source image.
+    :param width: The width of the generated image, in pixels.
+    :param suffix: The file extension of the generated image, which
+        determines its format (e.g., ``.png`` or ``.ico``).
+    :param cache_path: The directory that caches generated images.
+    :param height: The height of the generated image, in pixels; or ``None``
+        to preserve the aspect ratio of the source.
+    :returns: A tuple of the path of the generated image, and a boolean
+        indicating if the image was generated (``False`` if it was found in
+        the cache); or ``None`` if the image can't be generated (e.g.,
+        because Pillow can't write the requested format).
+    """
+    output_path = os.path.join(
+        os.fsdecode(cache_path),
+        '{digest}-{size}{suffix}'.format(
+            digest=file_sha256(source_path),
+            size=width if height is None else '{width}x{height}'.format(width=width, height=height),
+            suffix=suffix.lower(),
+        )
+    )
+    if os.path.exists(output_path):
+        # Mark the cached image as recently used.
+        os.utime(output_path)
+        return output_path, False
+
+    os.makedirs(os.fsdecode(cache_path), exist_ok=True)
+    temp_path = '{output_path}.{pid}.tmp'.format(output_path=output_path, pid=os.getpid())
+    try:
+        image_format = Image.registered_extensions()[suffix.lower()]
+        with Image.open(source_path) as source:
+            source.load()
+            image = source.convert('RGB' if suffix.lower() in OPAQUE_SUFFIXES else 'RGBA')
+
+        if height is None:
+            resized = image.resize(
+                (width, max(1, round(image.height * width / image.width))),
+                Image.LANCZOS,
+            )
+        else:
+            scale = max(width / image.width, height / image.height)
+            scaled_width = max(width, round(image.width * scale))
+            scaled_height = max(height, round(image.height * scale))
+            left = (scaled_width - width) // 2
+            top = (scaled_height - height) // 2
+            resized = image.resize((scaled_width, scaled_height), Image.LANCZOS).crop(
+                (left, top, left + width, top + height)
+            )
+
+        resized.save(temp_path, format=image_format)
+    except (KeyError, OSError, ValueError):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return None
+
+    os.replace(temp_path, output_path)
+    return output_path, True
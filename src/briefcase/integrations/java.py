@@ -227,6 +227,27 @@ class JDK:
             else:
                 raise MissingToolError('Java')
 
+    @classmethod
+    def download_plan(cls, command):
+        """
+        Determine the downloads that are needed to provide a JDK.
+
+        A JDK download is only planned if the user hasn't provided a JDK and
+        there is no Briefcase-managed JDK. On macOS, the user may have a
+        JDK that can only be found by invoking ``/usr/libexec/java_home``;
+        as that isn't a cheap check, no download is planned.
+
+        :param command: The command that will need the JDK.
+        :returns: A list of ``(url, download_path)`` pairs.
+        """
+        if command.os.environ.get('JAVA_HOME') or command.host_os == 'Darwin':
+            return []
+
+        jdk = JDK(command, java_home=command.tools_path / 'java')
+        if jdk.exists():
+            return []
+        return [(jdk.adoptOpenJDK_download_url, command.tools_path)]
+
     def exists(self):
         return (self.java_home / 'bin').exists()
 
@@ -245,29 +266,25 @@ class JDK:
         """
         Download and install a JDK.
         """
+        print("Installing AdoptOpenJDK...")
         try:
+            # The JDK is unpacked as it is downloaded (if possible),
+            # or once the download is complete.
             jdk_zip_path = self.command.download_url(
                 url=self.adoptOpenJDK_download_url,
                 download_path=self.command.tools_path,
+                extract_dir=self.command.tools_path,
             )
         except requests_exceptions.ConnectionError:
             raise NetworkFailure("download Java 8 JDK")
-
-        try:
-            print("Installing AdoptOpenJDK...")
-            # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-            self.command.shutil.unpack_archive(
-                os.fsdecode(jdk_zip_path),
-                extract_dir=os.fsdecode(self.command.tools_path)
-            )
         except (shutil.ReadError, EOFError):
             raise BriefcaseCommandError(
                 """\
 Unable to unpack AdoptOpenJDK ZIP file. The download may have been interrupted
 or corrupted.
 
-Delete {jdk_zip_path} and run briefcase again.""".format(
-                    jdk_zip_path=jdk_zip_path
+Delete the AdoptOpenJDK archive in {tools_path} and run briefcase again.""".format(
+                    tools_path=self.command.tools_path
                 )
             )
         jdk_zip_path.unlink()  # Zip file no longer needed once unpacked.
@@ -53,6 +53,19 @@ class LinuxDeploy:
 
         return LinuxDeploy(command)
 
+    @classmethod
+    def download_plan(cls, command):
+        """
+        Determine the downloads that are needed to provide linuxdeploy.
+
+        :param command: The command that will need linuxdeploy.
+        :returns: A list of ``(url, download_path)`` pairs.
+        """
+        linuxdeploy = LinuxDeploy(command)
+        if linuxdeploy.exists():
+            return []
+        return [(linuxdeploy.linuxdeploy_download_url, command.tools_path)]
+
     def exists(self):
         return self.appimage_path.exists()
 
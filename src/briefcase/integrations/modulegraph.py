@@ -0,0 +1,333 @@
+import ast
+import os
+import shutil
+import zipfile
+
+# Modules that the interpreter needs in order to start, or that it imports
+# without an import statement that can be traced (e.g., codecs, which are
+# looked up by name). These are always retained, along with everything they
+# import.
+ESSENTIAL_MODULES = [
+    '__future__',
+    '_collections_abc',
+    '_sitebuiltins',
+    'abc',
+    'codecs',
+    'encodings',
+    'genericpath',
+    'importlib',
+    'io',
+    'locale',
+    'ntpath',
+    'os',
+    'posixpath',
+    'runpy',
+    'site',
+    'stat',
+    'sysconfig',
+    'traceback',
+    'warnings',
+    'zipimport',
+]
+
+# Top-level modules whose names start with these prefixes are always
+# retained. They are imported by name (e.g., ``_sysconfigdata_*`` is
+# imported by ``sysconfig`` using a name computed at runtime).
+ESSENTIAL_PREFIXES = ('_sysconfigdata',)
+
+# Modules that are only used for development (e.g., running tests, or
+# interactive help). The standard library imports these in code that an app
+# won't normally run (e.g., in self-test functions), so these modules are
+# only retained if the app (or one of its dependencies) imports them
+# directly.
+DEVELOPMENT_MODULES = {
+    'distutils',
+    'doctest',
+    'ensurepip',
+    'idlelib',
+    'lib2to3',
+    'pydoc',
+    'pydoc_data',
+    'test',
+    'tkinter',
+    'turtle',
+    'turtledemo',
+    'unittest',
+    'venv',
+}
+
+# Suffixes of compiled extension modules.
+EXTENSION_SUFFIXES = ('.so', '.pyd')
+
+
+def _string_value(node):
+    "Obtain the value of an AST node if it is a string literal."
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    # Python 3.7 represents string literals as ast.Str.
+    if type(node).__name__ == 'Str':
+        return node.s
+    return None
+
+
+def _is_script_only(node):
+    """
+    Determine if an AST node is only run when a module is executed as a
+    script: an ``if __name__ == '__main__':`` block, or a ``_test()``
+    function.
+    """
+    if isinstance(node, ast.FunctionDef):
+        return node.name == '_test'
+    test = getattr(node, 'test', None) if isinstance(node, ast.If) else None
+    return (
+        isinstance(test, ast.Compare)
+        and isinstance(test.left, ast.Name)
+        and test.left.id == '__name__'
+        and len(test.comparators) == 1
+        and _string_value(test.comparators[0]) == '__main__'
+    )
+
+
+def _walk(tree):
+    """
+    Iterate over the nodes of an AST, skipping the code that is only run
+    when a module is executed as a script.
+    """
+    pending = [tree]
+    while pending:
+        node = pending.pop()
+        yield node
+        pending.extend(
+            child
+            for child in ast.iter_child_nodes(node)
+            if not _is_script_only(child)
+        )
+
+
+def imported_names(source, filename='<unknown>'):
+    """
+    Find the names of the top-level modules imported by Python source.
+
+    Import statements are found anywhere in the source (including inside
+    functions, and in ``try`` blocks), except in code that only runs when the
+    module is executed as a script (``if __name__ == '__main__':`` blocks,
+    and ``_test()`` functions). Calls to ``importlib.import_module()``
+    and ``__import__()`` that name a module with a string literal are also
+    found. Relative imports are ignored.
+
+    :param source: The Python source to analyze.
+    :param filename: The name of the file containing the source.
+    :returns: A set of top-level module names.
+    :raises SyntaxError: If the source isn't valid Python.
+    :raises ValueError: If the source contains null bytes.
+    """
+    names = set()
+    for node in _walk(ast.parse(source, filename)):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                names.add(alias.name.split('.')[0])
+        elif isinstance(node, ast.ImportFrom):
+            if node.level == 0 and node.module:
+                names.add(node.module.split('.')[0])
+        elif isinstance(node, ast.Call) and node.args:
+            func = node.func
+            func_name = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+            if func_name in {'import_module', '__import__'}:
+                module = _string_value(node.args[0])
+                if module and not module.startswith('.'):
+                    names.add(module.split('.')[0])
+    return names
+
+
+def _sources(path):
+    """
+    Iterate over the Python sources in a directory, including the sources
+    in any zip file at the top level of the directory.
+
+    :param path: The directory to scan.
+    :returns: An iterator of ``(filename, source)`` pairs.
+    """
+    path = os.fsdecode(path)
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [name for name in dirs if name != '__pycache__']
+        for name in files:
+            full_path = os.path.join(root, name)
+            if name.endswith('.py'):
+                with open(full_path, 'rb') as f:
+                    yield full_path, f.read()
+            elif root == path and name.endswith('.zip'):
+                with zipfile.ZipFile(full_path) as archive:
+                    for member in archive.namelist():
+                        if member.endswith('.py'):
+                            yield '{}/{}'.format(full_path, member), archive.read(member)
+
+
+def scan_imports(paths):
+    """
+    Find the names of the top-level modules imported by the Python sources in
+    a set of files and directories.
+
+    Sources that can't be parsed are ignored.
+
+    :param paths: The files and directories to scan.
+    :returns: A set of top-level module names.
+    """
+    names = set()
+    for path in paths:
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                sources = [(os.fsdecode(path), f.read())]
+        else:
+            sources = _sources(path)
+
+        for filename, source in sources:
+            try:
+                names.update(imported_names(source, filename))
+            except (SyntaxError, ValueError):
+                pass
+    return names
+
+
+def find_stdlib(path):
+    """
+    Find the directory containing the standard library in a support package.
+
+    :param path: The directory containing an installed support package.
+    :returns: The path of the standard library directory (the directory
+        containing ``os.py``), or ``None`` if the standard library isn't
+        stored as files in the support package (e.g., if it is stored in a
+        zip file).
+    """
+    path = os.fsdecode(path)
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        if 'os.py' in files and os.path.isdir(os.path.join(root, 'encodings')):
+            return root
+        # Installed packages are never part of the standard library.
+        dirs[:] = [name for name in dirs if name not in {'site-packages', '__pycache__'}]
+    return None
+
+
+def stdlib_modules(stdlib_path):
+    """
+    Find the top-level modules in a standard library directory.
+
+    Pure-Python modules and packages are found in the standard library
+    directory; extension modules are found in its ``lib-dynload``
+    subdirectory.
+
+    :param stdlib_path: The standard library directory.
+    :returns: A dictionary mapping the name of each top-level module to the
+        list of paths that provide it.
+    """
+    modules = {}
+    for directory in [stdlib_path, os.path.join(stdlib_path, 'lib-dynload')]:
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            full_path = os.path.join(directory, name)
+            if os.path.isdir(full_path):
+                if name.isidentifier() and os.path.isfile(os.path.join(full_path, '__init__.py')):
+                    modules.setdefault(name, []).append(full_path)
+            elif name.endswith('.py'):
+                modules.setdefault(name[:-3], []).append(full_path)
+            elif name.endswith(EXTENSION_SUFFIXES):
+                modules.setdefault(name.split('.')[0], []).append(full_path)
+    return modules
+
+
+def reachable_modules(roots, modules):
+    """
+    Determine which standard library modules can be imported from a set of
+    root modules.
+
+    The sources of each reachable module are analyzed to find the modules
+    that it imports, in turn. The sources of a package are analyzed in full,
+    because any of its submodules may be imported. Development modules
+    (see :data:`DEVELOPMENT_MODULES`) are only reachable if they are roots.
+
+    :param roots: The names of the modules imported by the app.
+    :param modules: The standard library modules, as returned by
+        :func:`stdlib_modules`.
+    :returns: The set of names of reachable standard library modules.
+    """
+    reachable = set()
+    pending = [name for name in roots if name in modules]
+    while pending:
+        name = pending.pop()
+        if name in reachable:
+            continue
+        reachable.add(name)
+        for imported in scan_imports(modules[name]):
+            if (
+                imported in modules
+                and imported not in reachable
+                and imported not in DEVELOPMENT_MODULES
+            ):
+                pending.append(imported)
+    return reachable
+
+
+def _size(path):
+    "Count the files and bytes in a file or directory."
+    if os.path.isfile(path):
+        return 1, os.path.getsize(path)
+    files = 0
+    total = 0
+    for root, dirs, filenames in os.walk(path):
+        for name in filenames:
+            files += 1
+            total += os.path.getsize(os.path.join(root, name))
+    return files, total
+
+
+def shake_stdlib(stdlib_path, sources, includes=()):
+    """
+    Remove the standard library modules that an app can't import.
+
+    Modules are traced from the imports in the app's sources, the modules
+    the interpreter always needs, and any explicitly included modules.
+    Only top-level modules are removed; content that isn't a module (e.g.,
+    ``site-packages``) is never removed.
+
+    :param stdlib_path: The standard library directory.
+    :param sources: The directories containing the app's code and its
+        installed dependencies.
+    :param includes: The names of additional modules to retain.
+    :returns: A dictionary describing the ``files`` and ``bytes`` removed
+        for each module that was removed.
+    """
+    stdlib_path = os.fsdecode(stdlib_path)
+    modules = stdlib_modules(stdlib_path)
+    roots = scan_imports([os.fsdecode(path) for path in sources])
+    roots.update(ESSENTIAL_MODULES)
+    roots.update(name.split('.')[0] for name in includes)
+    roots.update(name for name in modules if name.startswith(ESSENTIAL_PREFIXES))
+    reachable = reachable_modules(roots, modules)
+
+    removed = {}
+    for name, paths in sorted(modules.items()):
+        if name in reachable:
+            continue
+        totals = {'files': 0, 'bytes': 0}
+        for path in paths:
+            files, size = _size(path)
+            totals['files'] += files
+            totals['bytes'] += size
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.unlink(path)
+
+        # Remove any bytecode for a top-level module.
+        pycache_path = os.path.join(stdlib_path, '__pycache__')
+        if os.path.isdir(pycache_path):
+            for filename in os.listdir(pycache_path):
+                if filename.split('.')[0] == name:
+                    path = os.path.join(pycache_path, filename)
+                    files, size = _size(path)
+                    totals['files'] += files
+                    totals['bytes'] += size
+                    os.unlink(path)
+        removed[name] = totals
+    return removed
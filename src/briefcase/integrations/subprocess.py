@@ -1,6 +1,8 @@
 import shlex
 import subprocess
 
+from briefcase.jobs import stage_output
+
 
 class Subprocess:
     """
@@ -50,6 +52,12 @@ class Subprocess:
         except for the `env` argument. If provided, the current system
         environment will be copied, and the contents of env overwritten
         into that environment.
+
+        If the process is run by a stage that is running concurrently with
+        other stages (see :func:`~briefcase.jobs.run_stages`), and the
+        output of the process isn't otherwise redirected, the output is
+        captured, and written to the output of the stage once the process
+        completes, so that it is reported in stage order.
         """
         # Invoke subprocess.run().
         # Pass through all arguments as-is.
@@ -59,12 +67,37 @@ class Subprocess:
                 cmdline=' '.join(shlex.quote(str(arg)) for arg in args)
             ))
 
-        return self._subprocess.run(
-            [
-                str(arg) for arg in args
-            ],
-            **self.final_kwargs(**kwargs)
-        )
+        stream = stage_output()
+        if stream is None or {'stdout', 'stderr', 'capture_output'} & set(kwargs):
+            return self._subprocess.run(
+                [
+                    str(arg) for arg in args
+                ],
+                **self.final_kwargs(**kwargs)
+            )
+
+        try:
+            result = self._subprocess.run(
+                [
+                    str(arg) for arg in args
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                **self.final_kwargs(**kwargs)
+            )
+        except subprocess.CalledProcessError as e:
+            stream.write(self._decode_output(e.output))
+            raise
+        stream.write(self._decode_output(result.stdout))
+        return result
+
+    def _decode_output(self, output):
+        """Convert the captured output of a process into text."""
+        if output is None:
+            return ''
+        elif isinstance(output, bytes):
+            return output.decode('utf-8', errors='replace')
+        return output
 
     def check_output(self, args, **kwargs):
         """A wrapper for subprocess.check_output()
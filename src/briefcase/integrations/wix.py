@@ -1,4 +1,3 @@
-import os
 import shutil
 from pathlib import Path
 
@@ -102,6 +101,22 @@ WiX Toolset. Current value: {wix_home!r}
 
         return wix
 
+    @classmethod
+    def download_plan(cls, command):
+        """
+        Determine the downloads that are needed to provide WiX.
+
+        :param command: The command that will need WiX.
+        :returns: A list of ``(url, download_path)`` pairs.
+        """
+        if command.host_os != 'Windows' or command.os.environ.get("WIX"):
+            return []
+
+        wix = WiX(command=command, bin_install=True)
+        if wix.exists():
+            return []
+        return [(WIX_DOWNLOAD_URL, command.tools_path)]
+
     def exists(self):
         return (
             self.heat_exe.exists()
@@ -134,11 +149,7 @@ WiX Toolset. Current value: {wix_home!r}
 
         try:
             print("Installing WiX...")
-            # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-            self.command.shutil.unpack_archive(
-                os.fsdecode(wix_zip_path),
-                extract_dir=os.fsdecode(self.wix_home)
-            )
+            self.command.unpack_archive(wix_zip_path, extract_dir=self.wix_home)
         except (shutil.ReadError, EOFError):
             raise BriefcaseCommandError("""
 Unable to unpack WiX ZIP file. The download may have been
@@ -0,0 +1,304 @@
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import traceback
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait
+)
+from contextlib import redirect_stderr, redirect_stdout
+
+from briefcase.exceptions import BriefcaseError
+
+# The pipeline being executed by the worker processes. Workers are forked
+# from the parent process, so they inherit the pipeline (and the command
+# that owns it) without it needing to be pickled.
+_pipeline = None
+
+
+def parallel_jobs_supported():
+    """
+    Determine if app pipelines can be executed in parallel.
+
+    Parallel execution requires worker processes to be forked, which isn't
+    possible on Windows.
+
+    :returns: True if parallel jobs are supported.
+    """
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def prefix_output(prefix, output):
+    """
+    Prefix every line of output.
+
+    Lines that already start with the prefix aren't modified. Where a line
+    has been rewritten in place (e.g., by a progress bar), only the final
+    version of the line is retained.
+
+    :param prefix: The prefix to add (e.g., ``[myapp]``).
+    :param output: The output to prefix.
+    :returns: The prefixed output.
+    """
+    lines = []
+    for line in output.split('\n'):
+        line = line.rstrip('\r').rsplit('\r', 1)[-1]
+        if line and not line.startswith(prefix):
+            line = '{prefix} {line}'.format(prefix=prefix, line=line)
+        lines.append(line)
+    if lines[-1] == '':
+        # The output ended with a newline
+        lines.pop()
+    return ''.join(line + '\n' for line in lines)
+
+
+def _run_job(app_name, options):
+    """
+    Run the current pipeline on a single app, capturing all output.
+
+    :param app_name: The name of the app to process.
+    :param options: The options to pass to the pipeline.
+    :returns: A tuple of the state returned by the pipeline, the captured
+        output, and a description of the error that occurred (or ``None``
+        if the pipeline succeeded).
+    """
+    command, pipeline = _pipeline
+    app = command.apps[app_name]
+
+    state = None
+    error = None
+    with tempfile.TemporaryFile() as log:
+        # Redirect at the file descriptor level, so that the output of
+        # subprocesses is captured as well as Python output.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved = os.dup(1), os.dup(2)
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        stream = open(log.fileno(), 'w', encoding='utf-8', buffering=1, closefd=False)
+        try:
+            with redirect_stdout(stream), redirect_stderr(stream):
+                try:
+                    state = pipeline(app, **options)
+                except BriefcaseError as e:
+                    error = str(e)
+                except Exception as e:
+                    traceback.print_exc()
+                    error = 'Unexpected error: {e}'.format(e=e)
+        finally:
+            stream.close()
+            os.dup2(saved[0], 1)
+            os.dup2(saved[1], 2)
+            os.close(saved[0])
+            os.close(saved[1])
+
+        log.seek(0)
+        output = log.read().decode('utf-8', errors='replace')
+
+    return state, output, error
+
+
+def run_jobs(command, pipeline, app_names, options, jobs):
+    """
+    Run a pipeline on a number of apps in parallel.
+
+    Each app is processed in a separate (forked) worker process. The output
+    of each app is captured, and reported as a single block when processing
+    of that app is complete, so output from different apps is never
+    interleaved.
+
+    :param command: The command that owns the pipeline.
+    :param pipeline: A callable that accepts an app config, plus keyword
+        options, and processes that app.
+    :param app_names: The names of the apps to process.
+    :param options: The keyword options to pass to the pipeline.
+    :param jobs: The maximum number of apps to process at the same time.
+    :returns: An iterator of (app_name, state, output, error) tuples, in the
+        order that processing completes. ``error`` is ``None`` if the app was
+        processed successfully.
+    """
+    global _pipeline
+    _pipeline = (command, pipeline)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(app_names)),
+            mp_context=multiprocessing.get_context('fork'),
+        ) as executor:
+            futures = {
+                executor.submit(_run_job, app_name, options): app_name
+                for app_name in app_names
+            }
+            for future in as_completed(futures):
+                app_name = futures[future]
+                try:
+                    state, output, error = future.result()
+                except Exception as e:
+                    # The worker died, or its result couldn't be returned.
+                    state, output, error = None, '', 'Unexpected error: {e}'.format(e=e)
+                yield app_name, state, output, error
+    finally:
+        _pipeline = None
+
+
+class OrderedOutput:
+    """
+    A replacement for ``sys.stdout`` that keeps the output of concurrent
+    stages in stage order.
+
+    The output of the earliest incomplete stage (and of any thread that
+    isn't running a stage) is written immediately. The output of later
+    stages is buffered, and written when all earlier stages are complete.
+    The combined output is therefore the same as if the stages had been run
+    one after the other.
+
+    :param stream: The stream to which output will be written.
+    :param names: The names of the stages, in order.
+    """
+    def __init__(self, stream, names):
+        self.stream = stream
+        self.pending = list(names)
+        self.buffers = {name: [] for name in names}
+        self.done = set()
+        self.local = threading.local()
+        self._lock = threading.Lock()
+
+    def write(self, text):
+        stage = getattr(self.local, 'stage', None)
+        with self._lock:
+            if stage is None or not self.pending or stage == self.pending[0]:
+                self.stream.write(text)
+            else:
+                self.buffers[stage].append(text)
+        return len(text)
+
+    def flush(self):
+        with self._lock:
+            self.stream.flush()
+
+    def __getattr__(self, attr):
+        return getattr(self.stream, attr)
+
+    def complete(self, stage):
+        """
+        Record that a stage is complete, writing any buffered output that
+        is no longer blocked by an earlier stage.
+
+        :param stage: The name of the stage that is complete.
+        """
+        with self._lock:
+            self.done.add(stage)
+            while self.pending and self.pending[0] in self.done:
+                self.pending.pop(0)
+                if self.pending:
+                    head = self.pending[0]
+                    self.stream.write(''.join(self.buffers[head]))
+                    self.buffers[head] = []
+
+    def release(self):
+        "Write any output that is still buffered."
+        with self._lock:
+            for stage in self.pending:
+                self.stream.write(''.join(self.buffers[stage]))
+                self.buffers[stage] = []
+            self.pending = []
+
+
+def stage_output():
+    """
+    Find the stream that is ordering the output of the stage that the
+    current thread is running.
+
+    :returns: The :class:`OrderedOutput` that the stage is writing to; or
+        ``None`` if the current thread isn't running a stage.
+    """
+    stream = sys.stdout
+    if isinstance(stream, OrderedOutput) and getattr(stream.local, 'stage', None) is not None:
+        return stream
+    return None
+
+
+def run_stages(stages, workers=None, concurrent=True):
+    """
+    Run a set of stages concurrently, respecting their dependencies.
+
+    Each stage is started (in a thread) as soon as all the stages it
+    depends on are complete. Output written to ``sys.stdout`` by each
+    stage is reported in stage order (see :class:`OrderedOutput`), as is
+    the output of any subprocess a stage runs with
+    :meth:`~briefcase.integrations.subprocess.Subprocess.run`. Stages that
+    run concurrently must not write to overlapping paths, or share state
+    that they modify.
+
+    If a stage fails, no further stages are started; the stages that are
+    already running are allowed to finish, and then the error raised by the
+    first failed stage (in stage order) is re-raised.
+
+    If the stages can't safely run concurrently (e.g., because they write to
+    overlapping paths), ``concurrent`` can be ``False``. The stages are then
+    run one after the other, in stage order, in the current thread; output
+    is written as it is produced, and the first failure is raised
+    immediately.
+
+    :param stages: A list of ``(name, func, dependencies)`` tuples, in the
+        order the stages would be run serially. ``func`` is a callable that
+        takes no arguments; ``dependencies`` is a collection of the names of
+        the stages that must be complete before this stage can start. A stage
+        can only depend on stages that precede it in the list.
+    :param workers: The maximum number of stages to run at the same time.
+        Defaults to the number of stages.
+    :param concurrent: Can the stages run concurrently?
+    """
+    if not concurrent:
+        for name, func, dependencies in stages:
+            func()
+        return
+
+    names = [name for name, func, dependencies in stages]
+    output = OrderedOutput(sys.stdout, names)
+    stdout = sys.stdout
+    sys.stdout = output
+
+    def run(name, func):
+        output.local.stage = name
+        try:
+            return func()
+        finally:
+            output.local.stage = None
+            output.complete(name)
+
+    remaining = list(stages)
+    complete = set()
+    errors = {}
+    try:
+        with ThreadPoolExecutor(max_workers=workers or len(stages) or 1) as executor:
+            running = {}
+            while remaining or running:
+                if not errors:
+                    for stage in list(remaining):
+                        name, func, dependencies = stage
+                        if complete.issuperset(dependencies):
+                            remaining.remove(stage)
+                            running[executor.submit(run, name, func)] = name
+                if not running:
+                    break
+
+                done, not_done = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        future.result()
+                        complete.add(name)
+                    except BaseException as e:
+                        errors[name] = e
+    finally:
+        output.release()
+        sys.stdout = stdout
+
+    for name in names:
+        if name in errors:
+            raise errors[name]
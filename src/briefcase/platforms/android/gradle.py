@@ -83,6 +83,9 @@ class GradleMixin:
         gradlew = "gradlew.bat" if self.host_os == "Windows" else "gradlew"
         return self.bundle_path(app) / gradlew
 
+    def download_plan(self, apps):
+        return super().download_plan(apps) + AndroidSDK.download_plan(self)
+
     def verify_tools(self):
         """
         Verify that we the Android APK tools in `briefcase` will operate on
@@ -131,6 +131,20 @@ class LinuxAppImageCreateCommand(LinuxAppImageMixin, CreateCommand):
             ('arch', self.host_arch),
         ]
 
+    def concurrent_stages(self, app: BaseConfig):
+        """
+        Determine if the stages that populate the bundle of an app can be run
+        concurrently.
+
+        While dependencies are installed in Docker, ``self.subprocess`` is
+        replaced by a proxy into the container (see :meth:`dockerize`), so
+        no other stage can run at the same time.
+
+        :param app: The config object for the app
+        :returns: True if the stages can be run concurrently.
+        """
+        return not self.use_docker and super().concurrent_stages(app)
+
     def install_app_dependencies(self, app: BaseConfig):
         """
         Install application dependencies.
@@ -152,6 +166,9 @@ class LinuxAppImageUpdateCommand(LinuxAppImageMixin, UpdateCommand):
 class LinuxAppImageBuildCommand(LinuxAppImageMixin, BuildCommand):
     description = "Build a Linux AppImage."
 
+    def download_plan(self, apps):
+        return super().download_plan(apps) + LinuxDeploy.download_plan(self)
+
     def verify_tools(self):
         super().verify_tools()
         self.linuxdeploy = LinuxDeploy.verify(self)
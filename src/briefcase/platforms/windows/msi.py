@@ -27,6 +27,9 @@ class WindowsMSIMixin(WindowsMixin):
     def distribution_path(self, app, packaging_format):
         return self.platform_path / '{app.formal_name}-{app.version}.msi'.format(app=app)
 
+    def download_plan(self, apps):
+        return super().download_plan(apps) + WiX.download_plan(self)
+
     def verify_tools(self):
         super().verify_tools()
         self.wix = WiX.verify(self)
@@ -0,0 +1,305 @@
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from briefcase.cache import CacheManager
+from briefcase.downloads import write_json
+from briefcase.integrations.filesystem import hold_file_lock
+
+
+def create_entry(cache_path, name, size, mtime):
+    "Create a cache entry of a given size, last modified at a given time"
+    cache_path.mkdir(parents=True, exist_ok=True)
+    path = cache_path / name
+    path.write_bytes(b'x' * size)
+    os.utime(str(path), (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / 'support'
+
+
+@pytest.fixture
+def cache(tmp_path, cache_path):
+    return CacheManager(
+        tmp_path / 'cache.json',
+        categories={
+            'support': (cache_path, 250),
+            'tools': (tmp_path / 'tools', None),
+        },
+    )
+
+
+def test_category_for(cache, tmp_path, cache_path):
+    "A cache directory can be mapped to its category"
+    assert cache.category_for(cache_path) == 'support'
+    assert cache.category_for(tmp_path / 'tools') == 'tools'
+    assert cache.category_for(tmp_path / 'other') is None
+
+
+def test_empty_stats(cache):
+    "If nothing has been recorded, all the stats are zero"
+    assert cache.stats('support') == {
+        'hits': 0,
+        'misses': 0,
+        'bytes_saved': 0,
+        'bytes_downloaded': 0,
+    }
+
+
+def test_record_use(cache):
+    "Hits and misses are accumulated in the stats"
+    cache.record_miss('support', 'first.tar.gz', 100)
+    cache.record_hit('support', 'first.tar.gz', 100)
+    cache.record_hit('support', 'first.tar.gz', 100)
+
+    assert cache.stats('support') == {
+        'hits': 2,
+        'misses': 1,
+        'bytes_saved': 200,
+        'bytes_downloaded': 100,
+    }
+    # The other category is unaffected
+    assert cache.stats('tools')['hits'] == 0
+
+
+def test_stats_shared(cache, tmp_path, cache_path):
+    "Stats are persisted, and visible to other cache managers"
+    cache.record_hit('support', 'first.tar.gz', 100)
+
+    other = CacheManager(tmp_path / 'cache.json', categories={'support': (cache_path, None)})
+    assert other.stats('support')['hits'] == 1
+
+
+def test_entries(cache, cache_path):
+    "Entries are listed from least to most recently used"
+    create_entry(cache_path, 'first.tar.gz', 100, mtime=1000)
+    create_entry(cache_path, 'second.tar.gz', 50, mtime=3000)
+    create_entry(cache_path, 'third.tar.gz', 10, mtime=2000)
+
+    entries = cache.entries('support')
+    assert [entry.name for entry in entries] == [
+        'first.tar.gz', 'third.tar.gz', 'second.tar.gz'
+    ]
+    assert [entry.size for entry in entries] == [100, 10, 50]
+
+
+def test_entries_recorded_use(cache, cache_path):
+    "A recorded use makes an entry the most recently used"
+    create_entry(cache_path, 'first.tar.gz', 100, mtime=1000)
+    create_entry(cache_path, 'second.tar.gz', 50, mtime=3000)
+    cache.record_hit('support', 'first.tar.gz', 100)
+
+    entries = cache.entries('support')
+    assert [entry.name for entry in entries] == ['second.tar.gz', 'first.tar.gz']
+    assert entries[1].hits == 1
+
+
+def test_entries_directory(cache, tmp_path):
+    "A directory entry is measured by its content"
+    tools_path = tmp_path / 'tools'
+    create_entry(tools_path / 'java' / 'bin', 'java', 100, mtime=1000)
+    create_entry(tools_path / 'java' / 'lib', 'rt.jar', 200, mtime=1000)
+
+    entries = cache.entries('tools')
+    assert len(entries) == 1
+    assert entries[0].name == 'java'
+    assert entries[0].size == 300
+
+
+def test_entries_nested_category(tmp_path, cache_path):
+    "A category nested inside another category isn't an entry of the outer category"
+    cache = CacheManager(
+        tmp_path / 'cache.json',
+        categories={
+            'support': (cache_path, None),
+            'extracted': (cache_path / 'extracted', None),
+        },
+    )
+    create_entry(cache_path, 'first.tar.gz', 100, mtime=1000)
+    create_entry(cache_path / 'extracted', 'first', 500, mtime=1000)
+
+    assert [entry.name for entry in cache.entries('support')] == ['first.tar.gz']
+    assert [entry.name for entry in cache.entries('extracted')] == ['first']
+
+
+def test_entries_no_cache(cache):
+    "If the cache directory doesn't exist, there are no entries"
+    assert cache.entries('tools') == []
+
+
+def test_prune_within_limit(cache, cache_path):
+    "If a cache is within its limit, nothing is evicted"
+    create_entry(cache_path, 'first.tar.gz', 100, mtime=1000)
+    create_entry(cache_path, 'second.tar.gz', 100, mtime=2000)
+
+    assert cache.prune('support') == []
+    assert (cache_path / 'first.tar.gz').exists()
+    assert (cache_path / 'second.tar.gz').exists()
+
+
+def test_prune(cache, cache_path):
+    "The least recently used entries are evicted until the cache fits"
+    create_entry(cache_path, 'first.tar.gz', 100, mtime=1000)
+    create_entry(cache_path, 'second.tar.gz', 100, mtime=3000)
+    create_entry(cache_path, 'third.tar.gz', 100, mtime=2000)
+
+    evicted = cache.prune('support')
+
+    assert [entry.name for entry in evicted] == ['first.tar.gz']
+    assert not (cache_path / 'first.tar.gz').exists()
+    assert (cache_path / 'second.tar.gz').exists()
+    assert (cache_path / 'third.tar.gz').exists()
+
+
+def test_prune_explicit_limit(cache, cache_path):
+    "An explicit limit overrides the configured limit"
+    create_entry(cache_path, 'first.tar.gz', 100, mtime=1000)
+    create_entry(cache_path, 'second.tar.gz', 100, mtime=3000)
+    create_entry(cache_path, 'third.tar.gz', 100, mtime=2000)
+
+    evicted = cache.prune('support', limit=0)
+
+    assert [entry.name for entry in evicted] == [
+        'first.tar.gz', 'third.tar.gz', 'second.tar.gz'
+    ]
+    assert list(cache_path.iterdir()) == []
+
+
+def test_prune_unlimited(cache, tmp_path):
+    "An unlimited cache is never pruned"
+    create_entry(tmp_path / 'tools', 'java', 1000, mtime=1000)
+
+    assert cache.prune('tools') == []
+    assert (tmp_path / 'tools' / 'java').exists()
+
+
+def test_prune_directory(cache, tmp_path):
+    "Directory entries are removed with their content"
+    tools_path = tmp_path / 'tools'
+    create_entry(tools_path / 'java' / 'bin', 'java', 100, mtime=1000)
+
+    evicted = cache.prune('tools', limit=0)
+
+    assert [entry.name for entry in evicted] == ['java']
+    assert not (tools_path / 'java').exists()
+
+
+def test_prune_in_use(cache, cache_path):
+    "Entries used by the current process are never evicted"
+    create_entry(cache_path, 'first.tar.gz', 200, mtime=1000)
+    create_entry(cache_path, 'second.tar.gz', 100, mtime=3000)
+    cache.record_miss('support', 'first.tar.gz', 200)
+    # Make sure the recorded use doesn't make first the most recent entry.
+    create_entry(cache_path, 'second.tar.gz', 100, mtime=4000000000)
+
+    evicted = cache.prune('support', limit=0)
+
+    assert [entry.name for entry in evicted] == ['second.tar.gz']
+    assert (cache_path / 'first.tar.gz').exists()
+
+
+def test_prune_forgets_evicted(cache, tmp_path, cache_path):
+    "Evicted entries are removed from the cache metadata"
+    create_entry(cache_path, 'first.tar.gz', 100, mtime=1000)
+    other = CacheManager(tmp_path / 'cache.json', categories={'support': (cache_path, 0)})
+    other.record_hit('support', 'first.tar.gz', 100)
+
+    # A fresh manager hasn't used the entry, so it can evict it.
+    cache.prune('support', limit=0)
+
+    # A new entry with the same name has no history.
+    create_entry(cache_path, 'first.tar.gz', 100, mtime=1000)
+    assert cache.entries('support')[0].hits == 0
+
+
+def test_prune_shared(tmp_path, cache_path):
+    "Items in a shared category that Briefcase hasn't recorded are never evicted"
+    create_entry(cache_path, 'my-own-template', 100, mtime=1000)
+    create_entry(cache_path, 'briefcase-template', 100, mtime=2000)
+    cache = CacheManager(
+        tmp_path / 'cache.json',
+        categories={'support': (cache_path, 0)},
+        shared=['support'],
+    )
+    other = CacheManager(tmp_path / 'cache.json', categories={'support': (cache_path, 0)})
+    other.record_miss('support', 'briefcase-template', 100)
+
+    assert [entry.name for entry in cache.entries('support')] == ['briefcase-template']
+
+    evicted = cache.prune('support')
+
+    assert [entry.name for entry in evicted] == ['briefcase-template']
+    assert (cache_path / 'my-own-template').exists()
+    assert not (cache_path / 'briefcase-template').exists()
+
+
+def test_in_progress_items(cache, cache_path):
+    "Items that are still being created aren't entries, and are never evicted"
+    for name in ['first.tar.gz.part', 'first.tar.gz.part2', 'first.tar.gz.part.json', 'second.1234.tmp', '.staging']:
+        create_entry(cache_path, name, 100, mtime=1000)
+    create_entry(cache_path, 'third.tar.gz', 100, mtime=2000)
+
+    assert [entry.name for entry in cache.entries('support')] == ['third.tar.gz']
+
+    cache.prune('support', limit=0)
+
+    assert (cache_path / 'first.tar.gz.part').exists()
+    assert (cache_path / 'first.tar.gz.part2').exists()
+    assert (cache_path / '.staging').exists()
+    assert not (cache_path / 'third.tar.gz').exists()
+
+
+def test_prune_used_by_other_process(cache, tmp_path, cache_path):
+    "Entries used by another process that is still running are never evicted"
+    create_entry(cache_path, 'first.tar.gz', 100, mtime=1000)
+    write_json(tmp_path / 'cache.json', {
+        'support': {'entries': {'first.tar.gz': {'hits': 1, 'accessed': 1000, 'users': [12345]}}},
+    })
+
+    other_process = hold_file_lock(cache.users_path / '12345.lock')
+    try:
+        assert cache.prune('support', limit=0) == []
+        assert (cache_path / 'first.tar.gz').exists()
+    finally:
+        other_process.close()
+
+    # Once the other process has exited, the entry can be evicted.
+    assert [entry.name for entry in cache.prune('support', limit=0)] == ['first.tar.gz']
+
+
+def test_prune_already_removed(cache, cache_path, monkeypatch):
+    "An entry that is removed by someone else while it is being evicted is ignored"
+    create_entry(cache_path, 'first.tar.gz', 100, mtime=1000)
+
+    def remove(path):
+        os.unlink(str(path))
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(Path, 'unlink', remove)
+
+    assert [entry.name for entry in cache.prune('support', limit=0)] == ['first.tar.gz']
+
+
+def test_concurrent_updates(tmp_path, cache_path):
+    "Updates made by separate cache managers (e.g., in separate processes) aren't lost"
+    managers = [
+        CacheManager(tmp_path / 'cache.json', categories={'support': (cache_path, None)})
+        for i in range(4)
+    ]
+
+    def record(manager):
+        for i in range(10):
+            manager.record_hit('support', 'first.tar.gz', 1)
+
+    threads = [threading.Thread(target=record, args=(manager,)) for manager in managers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert managers[0].stats('support')['hits'] == 40
@@ -0,0 +1,44 @@
+import pytest
+
+from briefcase.cache import format_size, parse_size
+
+
+@pytest.mark.parametrize(
+    'value, size',
+    [
+        ('1024', 1024),
+        ('0', 0),
+        ('10K', 10 * 1024),
+        ('500M', 500 * 1024 ** 2),
+        ('500MB', 500 * 1024 ** 2),
+        ('2gb', 2 * 1024 ** 3),
+        ('1.5G', int(1.5 * 1024 ** 3)),
+        (' 1T ', 1024 ** 4),
+    ]
+)
+def test_parse_size(value, size):
+    "Sizes can be provided with or without a unit suffix"
+    assert parse_size(value) == size
+
+
+@pytest.mark.parametrize('value', ['', 'lots', '10X', '-5M'])
+def test_parse_bad_size(value):
+    "Invalid sizes raise an error"
+    with pytest.raises(ValueError):
+        parse_size(value)
+
+
+@pytest.mark.parametrize(
+    'size, description',
+    [
+        (0, '0 B'),
+        (1023, '1023 B'),
+        (1024, '1.0 KB'),
+        (45 * 1024 ** 2 + 100 * 1024, '45.1 MB'),
+        (3 * 1024 ** 3, '3.0 GB'),
+        (5 * 1024 ** 5, '5120.0 TB'),
+    ]
+)
+def test_format_size(size, description):
+    "Sizes are formatted in the largest sensible unit"
+    assert format_size(size) == description
@@ -33,7 +33,7 @@ class DummyCommand(BaseCommand):
 
 @pytest.fixture
 def base_command(tmp_path):
-    command = DummyCommand(base_path=tmp_path)
+    command = DummyCommand(base_path=tmp_path, home_path=tmp_path / 'home')
     command.parse_options(['-r', 'default'])
     return command
 
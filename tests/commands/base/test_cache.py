@@ -0,0 +1,114 @@
+from unittest import mock
+
+from urllib3.response import HTTPHeaderDict
+
+
+def _download(base_command, download_path, content=b'all content'):
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers = HTTPHeaderDict({})
+    response.iter_content.return_value = iter([content])
+    base_command.requests.get.return_value = response
+
+    return base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=download_path,
+    )
+
+
+def test_cache_categories(base_command, tmp_path):
+    "The command has a cache for each kind of content that Briefcase caches"
+    assert base_command.cache.categories == {
+        'support': (tmp_path / 'home' / '.briefcase' / 'support', 2 * 1024 ** 3),
+        'extracted': (tmp_path / 'home' / '.briefcase' / 'support' / 'extracted', 2 * 1024 ** 3),
+        'tools': (tmp_path / 'home' / '.briefcase' / 'tools', None),
+        'templates': (tmp_path / 'home' / '.cookiecutters', 1024 ** 3),
+        'dependencies': (tmp_path / 'home' / '.briefcase' / 'dependencies', 2 * 1024 ** 3),
+        'wheels': (tmp_path / 'home' / '.briefcase' / 'wheels', 2 * 1024 ** 3),
+        'bytecode': (tmp_path / 'home' / '.briefcase' / 'bytecode', 1024 ** 3),
+        'images': (tmp_path / 'home' / '.briefcase' / 'images', 256 * 1024 ** 2),
+        'rendered': (tmp_path / 'home' / '.briefcase' / 'rendered', 1024 ** 3),
+    }
+
+
+def test_use_hardlinks(base_command):
+    "Hard links are only used if explicitly requested"
+    base_command.os = mock.MagicMock()
+    base_command.os.environ = {}
+    assert not base_command.use_hardlinks
+
+    base_command.os.environ = {'BRIEFCASE_USE_HARDLINKS': '1'}
+    assert base_command.use_hardlinks
+
+    base_command.os.environ = {'BRIEFCASE_USE_HARDLINKS': 'no'}
+    assert not base_command.use_hardlinks
+
+
+def test_cache_limit(base_command):
+    "Cache limits can be overridden by environment variables"
+    base_command.os = mock.MagicMock()
+    base_command.os.environ = {}
+    assert base_command.cache_limit('support') == 2 * 1024 ** 3
+    assert base_command.cache_limit('tools') is None
+
+    base_command.os.environ = {
+        'BRIEFCASE_CACHE_LIMIT_SUPPORT': '500M',
+        'BRIEFCASE_CACHE_LIMIT_TEMPLATES': 'None',
+        'BRIEFCASE_CACHE_LIMIT_TOOLS': '10G',
+    }
+    assert base_command.cache_limit('support') == 500 * 1024 ** 2
+    assert base_command.cache_limit('templates') is None
+    assert base_command.cache_limit('tools') == 10 * 1024 ** 3
+
+    base_command.os.environ = {'BRIEFCASE_CACHE_LIMIT_SUPPORT': 'garbage'}
+    assert base_command.cache_limit('support') == 2 * 1024 ** 3
+
+
+def test_download_cache_miss(base_command):
+    "A new download into a cache is recorded as a miss"
+    _download(base_command, base_command.dot_briefcase_path / 'support')
+
+    assert base_command.cache.stats('support') == {
+        'hits': 0,
+        'misses': 1,
+        'bytes_saved': 0,
+        'bytes_downloaded': 11,
+    }
+
+
+def test_download_cache_hit(base_command):
+    "Reusing a cached download is recorded as a hit"
+    support_path = base_command.dot_briefcase_path / 'support'
+    _download(base_command, support_path)
+    _download(base_command, support_path)
+
+    stats = base_command.cache.stats('support')
+    assert stats['hits'] == 1
+    assert stats['bytes_saved'] == 11
+    assert base_command.cache.entries('support')[0].hits == 1
+
+
+def test_download_prunes_cache(base_command):
+    "A new download into a cache prunes the cache"
+    support_path = base_command.dot_briefcase_path / 'support'
+    support_path.mkdir(parents=True)
+    with (support_path / 'old.tar.gz').open('wb') as f:
+        f.write(b'x' * 100)
+    base_command.cache.categories['support'] = (support_path, 50)
+
+    filename = _download(base_command, support_path)
+
+    # The old entry has been evicted; the new download is retained,
+    # even though it's in excess of the limit.
+    assert not (support_path / 'old.tar.gz').exists()
+    assert filename.exists()
+
+
+def test_download_outside_cache(base_command):
+    "A download that isn't into a cache isn't recorded"
+    _download(base_command, base_command.base_path / 'downloads')
+
+    for category in base_command.cache.categories:
+        assert base_command.cache.stats(category)['misses'] == 0
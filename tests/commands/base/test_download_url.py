@@ -1,11 +1,16 @@
+import hashlib
 from unittest import mock
 
 import pytest
 from urllib3.response import HTTPHeaderDict
 
+from requests import exceptions as requests_exceptions
+
+from briefcase.downloads import write_json
 from briefcase.exceptions import (
     BadNetworkResourceError,
-    MissingNetworkResourceError
+    MissingNetworkResourceError,
+    NetworkFailure
 )
 
 
@@ -43,7 +48,7 @@ def test_new_download_oneshot(base_command, url, content_disposition):
     response.headers = mock.Mock(wraps=HTTPHeaderDict({
             'content-disposition': content_disposition,
         } if content_disposition is not None else {}))
-    response.content = b'all content'
+    response.iter_content.return_value = iter([b'all content'])
     base_command.requests.get.return_value = response
 
     # Download the file
@@ -52,13 +57,14 @@ def test_new_download_oneshot(base_command, url, content_disposition):
         download_path=base_command.base_path / 'downloads',
     )
 
-    # requests.get has been invoked, but content isn't iterated
+    # requests.get has been invoked, and content is streamed, even though
+    # there's no content length.
     base_command.requests.get.assert_called_with(
         'https://example.com/support?useful=Yes',
         stream=True,
     )
-    response.headers.get.assert_called_with('content-length')
-    response.iter_content.assert_not_called()
+    response.headers.get.assert_any_call('content-length')
+    response.iter_content.assert_called_once_with(chunk_size=1048576)
 
     # The filename is derived from the URL or header
     assert filename == base_command.base_path / 'downloads' / 'something.zip'
@@ -67,6 +73,9 @@ def test_new_download_oneshot(base_command, url, content_disposition):
     with (base_command.base_path / 'downloads' / 'something.zip').open() as f:
         assert f.read() == 'all content'
 
+    # The partial download file has been moved into place
+    assert not (base_command.base_path / 'downloads' / 'something.zip.part').exists()
+
 
 def test_new_download_chunked(base_command):
     base_command.requests = mock.MagicMock()
@@ -92,7 +101,7 @@ def test_new_download_chunked(base_command):
         'https://example.com/support?useful=Yes',
         stream=True,
     )
-    response.headers.get.assert_called_with('content-length')
+    response.headers.get.assert_any_call('content-length')
     response.iter_content.assert_called_once_with(chunk_size=1048576)
 
     # The filename is derived from the URL
@@ -130,9 +139,14 @@ def test_already_downloaded(base_command):
     )
 
     # The request's Content-Disposition header is consumed to
-    # examine the filename; the request is abandoned before
-    # any other headers are read.
-    response.headers.get.assert_called_once_with('Content-Disposition')
+    # examine the filename, and the cache validators are recorded;
+    # but the content is never read.
+    assert response.headers.get.mock_calls == [
+        mock.call('Content-Disposition'),
+        mock.call('ETag'),
+        mock.call('Last-Modified'),
+    ]
+    response.iter_content.assert_not_called()
 
     # but the file existed, so the method returns
     assert filename == existing_file
@@ -187,3 +201,807 @@ def test_bad_resource(base_command):
 
     # The file doesn't exist as a result of the download failure
     assert not (base_command.base_path / 'something.zip').exists()
+
+
+def test_resume_partial_download(base_command):
+    "If a partial download exists, the download is resumed with a conditional range request"
+    # Create a partial download from a previous attempt
+    partial_file = base_command.base_path / 'something.zip.part'
+    with partial_file.open('wb') as f:
+        f.write(b'chunk-1;')
+    write_json(base_command.base_path / 'something.zip.part.json', {
+        'etag': '"v1"',
+        'last_modified': None,
+        'total': 24,
+    })
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers.get.return_value = None
+
+    resume_response = mock.MagicMock()
+    resume_response.status_code = 206
+    resume_response.headers = HTTPHeaderDict({
+        'Content-Length': '16',
+        'Content-Range': 'bytes 8-23/24',
+        'ETag': '"v1"',
+    })
+    resume_response.iter_content.return_value = iter([
+        b'chunk-2;',
+        b'chunk-3;',
+    ])
+    base_command.requests.get.side_effect = [response, resume_response]
+
+    # Download the file
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    # The original response was abandoned, and a range request was made,
+    # conditional on the resource being unchanged.
+    response.close.assert_called_once_with()
+    response.iter_content.assert_not_called()
+    base_command.requests.get.assert_called_with(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+        headers={'Range': 'bytes=8-', 'If-Range': '"v1"'},
+    )
+
+    # The resumed content has been appended to the partial content,
+    # and moved into place.
+    assert filename == base_command.base_path / 'something.zip'
+    with filename.open() as f:
+        assert f.read() == 'chunk-1;chunk-2;chunk-3;'
+    assert not partial_file.exists()
+    assert not (base_command.base_path / 'something.zip.part.json').exists()
+
+
+def test_resume_partial_download_last_modified(base_command):
+    "If the resource doesn't have a strong ETag, the modification date is used to resume"
+    partial_file = base_command.base_path / 'something.zip.part'
+    with partial_file.open('wb') as f:
+        f.write(b'chunk-1;')
+    write_json(base_command.base_path / 'something.zip.part.json', {
+        'etag': 'W/"weak"',
+        'last_modified': 'Wed, 21 Oct 2015 07:28:00 GMT',
+        'total': 24,
+    })
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers.get.return_value = None
+
+    resume_response = mock.MagicMock()
+    resume_response.status_code = 206
+    resume_response.headers = HTTPHeaderDict({
+        'Content-Length': '16',
+        'Content-Range': 'bytes 8-23/24',
+    })
+    resume_response.iter_content.return_value = iter([b'chunk-2;chunk-3;'])
+    base_command.requests.get.side_effect = [response, resume_response]
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    base_command.requests.get.assert_called_with(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+        headers={'Range': 'bytes=8-', 'If-Range': 'Wed, 21 Oct 2015 07:28:00 GMT'},
+    )
+    with filename.open() as f:
+        assert f.read() == 'chunk-1;chunk-2;chunk-3;'
+
+
+def test_resume_partial_download_unidentified(base_command):
+    "If the version of a partial download is unknown, it is discarded"
+    partial_file = base_command.base_path / 'something.zip.part'
+    with partial_file.open('wb') as f:
+        f.write(b'unknown;')
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers.get.return_value = None
+
+    restart_response = mock.MagicMock()
+    restart_response.status_code = 200
+    restart_response.headers = HTTPHeaderDict({'Content-Length': '16'})
+    restart_response.iter_content.return_value = iter([b'chunk-1;', b'chunk-2;'])
+    base_command.requests.get.side_effect = [response, restart_response]
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    # The download was restarted without a range.
+    base_command.requests.get.assert_called_with(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+    )
+    with filename.open() as f:
+        assert f.read() == 'chunk-1;chunk-2;'
+
+
+def test_resume_resource_resized(base_command):
+    "If a range response is for a resource of a different size, the partial download is discarded"
+    partial_file = base_command.base_path / 'something.zip.part'
+    with partial_file.open('wb') as f:
+        f.write(b'chunk-1;')
+    write_json(base_command.base_path / 'something.zip.part.json', {
+        'etag': None,
+        'last_modified': None,
+        'total': 24,
+    })
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers.get.return_value = None
+
+    # The resource on the server is now 32 bytes long.
+    resume_response = mock.MagicMock()
+    resume_response.status_code = 206
+    resume_response.headers = HTTPHeaderDict({
+        'Content-Length': '24',
+        'Content-Range': 'bytes 8-31/32',
+    })
+
+    restart_response = mock.MagicMock()
+    restart_response.status_code = 200
+    restart_response.headers = HTTPHeaderDict({'Content-Length': '32'})
+    restart_response.iter_content.return_value = iter([b'new-1;new-2;new-3;new-4;new-5;..'])
+    base_command.requests.get.side_effect = [response, resume_response, restart_response]
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    # Only the size could be checked, so the range request was unconditional.
+    assert base_command.requests.get.call_args_list[1] == mock.call(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+        headers={'Range': 'bytes=8-'},
+    )
+    # The mismatched range was abandoned, and the download restarted.
+    resume_response.close.assert_called_once_with()
+    resume_response.iter_content.assert_not_called()
+    base_command.requests.get.assert_called_with(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+    )
+    with filename.open() as f:
+        assert f.read() == 'new-1;new-2;new-3;new-4;new-5;..'
+
+
+def test_resume_range_ignored(base_command):
+    "If the resource has changed (or the server ignores a range request), the partial download is replaced"
+    partial_file = base_command.base_path / 'something.zip.part'
+    with partial_file.open('wb') as f:
+        f.write(b'stale;')
+    write_json(base_command.base_path / 'something.zip.part.json', {
+        'etag': '"v1"',
+        'last_modified': None,
+        'total': 24,
+    })
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers.get.return_value = None
+
+    # The If-Range condition fails, so the full content is returned.
+    resume_response = mock.MagicMock()
+    resume_response.status_code = 200
+    resume_response.headers = HTTPHeaderDict({'Content-Length': '16', 'ETag': '"v2"'})
+    resume_response.iter_content.return_value = iter([
+        b'chunk-1;',
+        b'chunk-2;',
+    ])
+    base_command.requests.get.side_effect = [response, resume_response]
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    # The full content replaced the stale partial content.
+    with filename.open() as f:
+        assert f.read() == 'chunk-1;chunk-2;'
+    assert not partial_file.exists()
+    assert not (base_command.base_path / 'something.zip.part.json').exists()
+
+
+def test_resume_range_not_satisfiable(base_command):
+    "If the partial download is unusable, it is discarded and the download restarted"
+    partial_file = base_command.base_path / 'something.zip.part'
+    with partial_file.open('wb') as f:
+        f.write(b'far too much stale content;')
+    write_json(base_command.base_path / 'something.zip.part.json', {
+        'etag': '"v1"',
+        'last_modified': None,
+        'total': 16,
+    })
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers.get.return_value = None
+
+    resume_response = mock.MagicMock()
+    resume_response.status_code = 416
+
+    restart_response = mock.MagicMock()
+    restart_response.status_code = 200
+    restart_response.headers.get.return_value = '16'
+    restart_response.iter_content.return_value = iter([
+        b'chunk-1;',
+        b'chunk-2;',
+    ])
+    base_command.requests.get.side_effect = [
+        response,
+        resume_response,
+        restart_response,
+    ]
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    # The download was restarted without a range.
+    base_command.requests.get.assert_called_with(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+    )
+    with filename.open() as f:
+        assert f.read() == 'chunk-1;chunk-2;'
+    assert not partial_file.exists()
+
+
+def _interrupted_content(*chunks):
+    "Yield some chunks of content, then drop the connection"
+    yield from chunks
+    raise requests_exceptions.ChunkedEncodingError()
+
+
+def test_interrupted_download_resumed(base_command):
+    "If the connection drops during a download, the download is resumed"
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers = HTTPHeaderDict({'Content-Length': '24', 'ETag': '"v1"'})
+    response.iter_content.return_value = _interrupted_content(b'chunk-1;')
+
+    resume_response = mock.MagicMock()
+    resume_response.status_code = 206
+    resume_response.headers = HTTPHeaderDict({
+        'Content-Length': '16',
+        'Content-Range': 'bytes 8-23/24',
+        'ETag': '"v1"',
+    })
+    resume_response.iter_content.return_value = iter([
+        b'chunk-2;',
+        b'chunk-3;',
+    ])
+    base_command.requests.get.side_effect = [response, resume_response]
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    base_command.requests.get.assert_called_with(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+        headers={'Range': 'bytes=8-', 'If-Range': '"v1"'},
+    )
+    with filename.open() as f:
+        assert f.read() == 'chunk-1;chunk-2;chunk-3;'
+    assert not (base_command.base_path / 'something.zip.part').exists()
+
+
+def test_truncated_download_resumed(base_command):
+    "If a download ends before the advertised content length, it is resumed"
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers = HTTPHeaderDict({'Content-Length': '24', 'ETag': '"v1"'})
+    response.iter_content.return_value = iter([b'chunk-1;'])
+
+    resume_response = mock.MagicMock()
+    resume_response.status_code = 206
+    resume_response.headers = HTTPHeaderDict({
+        'Content-Length': '16',
+        'Content-Range': 'bytes 8-23/24',
+        'ETag': '"v1"',
+    })
+    resume_response.iter_content.return_value = iter([
+        b'chunk-2;',
+        b'chunk-3;',
+    ])
+    base_command.requests.get.side_effect = [response, resume_response]
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    with filename.open() as f:
+        assert f.read() == 'chunk-1;chunk-2;chunk-3;'
+
+
+def test_interrupted_download_failure(base_command):
+    "If a download can't be completed, the partial content is retained"
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers.get.return_value = '24'
+    response.iter_content.return_value = _interrupted_content(b'chunk-1;')
+
+    # Every attempt to resume fails
+    base_command.requests.get.side_effect = [
+        response,
+        requests_exceptions.ConnectionError(),
+        requests_exceptions.ConnectionError(),
+    ]
+
+    with pytest.raises(NetworkFailure):
+        base_command.download_url(
+            url='https://example.com/support?useful=Yes',
+            download_path=base_command.base_path
+        )
+
+    # 3 attempts were made.
+    assert base_command.requests.get.call_count == 3
+
+    # The final file doesn't exist, but the partial content is retained
+    assert not (base_command.base_path / 'something.zip').exists()
+    with (base_command.base_path / 'something.zip.part').open() as f:
+        assert f.read() == 'chunk-1;'
+
+
+def test_download_recorded_in_index(base_command):
+    "A new download is recorded in the download index"
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers = HTTPHeaderDict({
+        'ETag': '"abcd1234"',
+        'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT',
+    })
+    response.iter_content.return_value = iter([b'all content'])
+    base_command.requests.get.return_value = response
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    entry = base_command.download_index.get('https://example.com/support?useful=Yes')
+    assert entry['filename'] == str(filename)
+    assert entry['sha256'] == hashlib.sha256(b'all content').hexdigest()
+    assert entry['etag'] == '"abcd1234"'
+    assert entry['last_modified'] == 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+
+def _cached_download(base_command, content=b'cached content', fetched=None, etag='"abcd1234"'):
+    "Create a cached download, and a matching index entry"
+    filename = base_command.base_path / 'something.zip'
+    with filename.open('wb') as f:
+        f.write(content)
+
+    base_command.download_index.record(
+        'https://example.com/support?useful=Yes',
+        filename=filename,
+        sha256=hashlib.sha256(b'cached content').hexdigest(),
+        etag=etag,
+    )
+    if fetched is not None:
+        entries = base_command.download_index._load()
+        entries['https://example.com/support?useful=Yes']['fetched'] = fetched
+        base_command.download_index._save(entries)
+
+    return filename
+
+
+def test_fresh_cached_download(base_command):
+    "If a URL has been downloaded recently, the network isn't used"
+    cached_file = _cached_download(base_command)
+    base_command.requests = mock.MagicMock()
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    assert filename == cached_file
+    base_command.requests.get.assert_not_called()
+
+
+def test_cached_download_other_path(base_command):
+    "If a URL has been cached in a different location, it is downloaded again"
+    _cached_download(base_command)
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers = HTTPHeaderDict({})
+    response.iter_content.return_value = iter([b'new content'])
+    base_command.requests.get.return_value = response
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path / 'other'
+    )
+
+    assert filename == base_command.base_path / 'other' / 'something.zip'
+    base_command.requests.get.assert_called_once_with(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+    )
+
+
+def test_corrupted_cached_download(base_command):
+    "If a cached file doesn't match the recorded hash, it is downloaded again"
+    _cached_download(base_command, content=b'corrupted content')
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers = HTTPHeaderDict({})
+    response.iter_content.return_value = iter([b'cached content'])
+    base_command.requests.get.return_value = response
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    # An unconditional request was made
+    base_command.requests.get.assert_called_once_with(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+    )
+    with filename.open() as f:
+        assert f.read() == 'cached content'
+
+
+def test_stale_cached_download_not_modified(base_command):
+    "If a cached download is stale, but hasn't changed, it is revalidated"
+    cached_file = _cached_download(base_command, fetched=0)
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.status_code = 304
+    base_command.requests.get.return_value = response
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    # A conditional request was made
+    base_command.requests.get.assert_called_once_with(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+        headers={'If-None-Match': '"abcd1234"'},
+    )
+    response.iter_content.assert_not_called()
+
+    # The cached file is used, and the index has been refreshed.
+    assert filename == cached_file
+    entry = base_command.download_index.get('https://example.com/support?useful=Yes')
+    assert entry['fetched'] > 0
+
+
+def test_stale_cached_download_modified(base_command):
+    "If a cached download is stale, and the resource has changed, it is downloaded"
+    _cached_download(base_command, fetched=0)
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something-2.zip'
+    response.status_code = 200
+    response.headers = HTTPHeaderDict({'ETag': '"efgh5678"'})
+    response.iter_content.return_value = iter([b'new content'])
+    base_command.requests.get.return_value = response
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    assert filename == base_command.base_path / 'something-2.zip'
+    with filename.open() as f:
+        assert f.read() == 'new content'
+
+    entry = base_command.download_index.get('https://example.com/support?useful=Yes')
+    assert entry['filename'] == str(filename)
+    assert entry['etag'] == '"efgh5678"'
+
+
+def test_stale_cached_download_modified_same_filename(base_command):
+    "If a cached download is stale, and the resource has changed under the same name, the cached file is replaced"
+    _cached_download(base_command, fetched=0)
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = 'https://example.com/path/to/something.zip'
+    response.status_code = 200
+    response.headers = HTTPHeaderDict({'ETag': '"efgh5678"'})
+    response.iter_content.return_value = iter([b'new content'])
+    base_command.requests.get.return_value = response
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    # The new content replaced the cached content.
+    assert filename == base_command.base_path / 'something.zip'
+    with filename.open() as f:
+        assert f.read() == 'new content'
+    assert not (base_command.base_path / 'something.zip.part').exists()
+
+    # The index describes the new content.
+    entry = base_command.download_index.get('https://example.com/support?useful=Yes')
+    assert entry['etag'] == '"efgh5678"'
+    assert entry['sha256'] == hashlib.sha256(b'new content').hexdigest()
+
+
+def test_download_cache_ttl(base_command):
+    "The download cache TTL can be overridden by an environment variable"
+    base_command.os = mock.MagicMock()
+    base_command.os.environ = {}
+    assert base_command.download_cache_ttl == 24 * 60 * 60
+
+    base_command.os.environ = {'BRIEFCASE_DOWNLOAD_CACHE_TTL': '0'}
+    assert base_command.download_cache_ttl == 0
+
+    base_command.os.environ = {'BRIEFCASE_DOWNLOAD_CACHE_TTL': 'garbage'}
+    assert base_command.download_cache_ttl == 24 * 60 * 60
+
+
+def _ranged_server(content, honor_ranges=True, etag='"v1"'):
+    "Create a requests.get side effect that serves (ranges of) content"
+    def get(url, stream, headers=None):
+        response = mock.MagicMock()
+        response.url = 'https://example.com/path/to/something.zip'
+        response.headers = HTTPHeaderDict({
+            'Accept-Ranges': 'bytes',
+            'ETag': etag,
+        })
+        if (
+            headers
+            and 'Range' in headers
+            and honor_ranges
+            and headers.get('If-Range', etag) == etag
+        ):
+            start, end = headers['Range'].split('=')[1].split('-')
+            end = int(end) if end else len(content) - 1
+            data = content[int(start):end + 1]
+            response.status_code = 206
+            response.headers['Content-Range'] = 'bytes {start}-{end}/{total}'.format(
+                start=start,
+                end=end,
+                total=len(content),
+            )
+        else:
+            data = content
+            response.status_code = 200
+        response.headers['Content-Length'] = str(len(data))
+        response.iter_content.return_value = iter([data])
+        return response
+
+    return get
+
+
+def test_segmented_download(base_command):
+    "A large file is downloaded as parallel segments"
+    base_command.DOWNLOAD_SEGMENT_THRESHOLD = 16
+    content = b''.join(b'chunk-%d;' % i for i in range(10))
+
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = _ranged_server(content)
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    # The initial request, plus one request per segment.
+    assert base_command.requests.get.call_count == 5
+    ranges = sorted(
+        call[2]['headers']['Range']
+        for call in base_command.requests.get.mock_calls[1:]
+    )
+    assert ranges == [
+        'bytes=0-19',
+        'bytes=20-39',
+        'bytes=40-59',
+        'bytes=60-79',
+    ]
+
+    # The segments have been reassembled, and cleaned up
+    with filename.open('rb') as f:
+        assert f.read() == content
+    assert sorted(p.name for p in base_command.base_path.iterdir()) == [
+        'home',
+        'something.zip',
+    ]
+
+
+def test_segmented_download_resumed(base_command):
+    "Segments that have already been downloaded are resumed"
+    base_command.DOWNLOAD_SEGMENT_THRESHOLD = 16
+    content = b''.join(b'chunk-%d;' % i for i in range(10))
+
+    # Segment 0 is complete; segment 1 is partially complete.
+    with (base_command.base_path / 'something.zip.part0').open('wb') as f:
+        f.write(content[0:20])
+    with (base_command.base_path / 'something.zip.part1').open('wb') as f:
+        f.write(content[20:30])
+    write_json(base_command.base_path / 'something.zip.part.json', {
+        'etag': '"v1"',
+        'last_modified': None,
+        'total': 80,
+    })
+
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = _ranged_server(content)
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    # Segment 0 wasn't requested; segment 1 was resumed. Every segment
+    # request was conditional on the resource being unchanged.
+    ranges = sorted(
+        call[2]['headers']['Range']
+        for call in base_command.requests.get.mock_calls[1:]
+    )
+    assert ranges == [
+        'bytes=30-39',
+        'bytes=40-59',
+        'bytes=60-79',
+    ]
+    assert all(
+        call[2]['headers']['If-Range'] == '"v1"'
+        for call in base_command.requests.get.mock_calls[1:]
+    )
+    with filename.open('rb') as f:
+        assert f.read() == content
+    assert not (base_command.base_path / 'something.zip.part.json').exists()
+
+
+def test_segmented_download_stale_segments(base_command):
+    "Segments left over from a download of a different version of the resource are discarded"
+    base_command.DOWNLOAD_SEGMENT_THRESHOLD = 16
+    content = b''.join(b'chunk-%d;' % i for i in range(10))
+
+    # Segment 0 is from an older version of the resource.
+    with (base_command.base_path / 'something.zip.part0').open('wb') as f:
+        f.write(b'old content;')
+    write_json(base_command.base_path / 'something.zip.part.json', {
+        'etag': '"v0"',
+        'last_modified': None,
+        'total': 80,
+    })
+
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = _ranged_server(content)
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    # Every segment was downloaded in full.
+    ranges = sorted(
+        call[2]['headers']['Range']
+        for call in base_command.requests.get.mock_calls[1:]
+    )
+    assert ranges == [
+        'bytes=0-19',
+        'bytes=20-39',
+        'bytes=40-59',
+        'bytes=60-79',
+    ]
+    with filename.open('rb') as f:
+        assert f.read() == content
+
+
+def test_segmented_download_resource_changed(base_command):
+    "If the resource changes during a segmented download, a single stream is used"
+    base_command.DOWNLOAD_SEGMENT_THRESHOLD = 16
+    content = b''.join(b'chunk-%d;' % i for i in range(10))
+
+    original = _ranged_server(content)
+    changed = _ranged_server(content, etag='"v2"')
+
+    def get(url, stream, headers=None):
+        # The resource changes after the initial request.
+        server = original if base_command.requests.get.call_count == 1 else changed
+        return server(url, stream, headers=headers)
+
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = get
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    # The segment requests failed their If-Range condition, so the content
+    # was downloaded as a single stream.
+    base_command.requests.get.assert_called_with(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+    )
+    with filename.open('rb') as f:
+        assert f.read() == content
+    assert sorted(p.name for p in base_command.base_path.iterdir()) == [
+        'home',
+        'something.zip',
+    ]
+
+
+def test_segmented_download_range_unsupported(base_command):
+    "If the server doesn't honor range requests, a single stream is used"
+    base_command.DOWNLOAD_SEGMENT_THRESHOLD = 16
+    content = b''.join(b'chunk-%d;' % i for i in range(10))
+
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = _ranged_server(content, honor_ranges=False)
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    # The final request was a plain request.
+    base_command.requests.get.assert_called_with(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+    )
+    with filename.open('rb') as f:
+        assert f.read() == content
+    assert sorted(p.name for p in base_command.base_path.iterdir()) == [
+        'home',
+        'something.zip',
+    ]
+
+
+def test_small_download_not_segmented(base_command):
+    "A file smaller than the segment threshold is downloaded as a single stream"
+    content = b''.join(b'chunk-%d;' % i for i in range(10))
+
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = _ranged_server(content)
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=base_command.base_path
+    )
+
+    base_command.requests.get.assert_called_once_with(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+    )
+    with filename.open('rb') as f:
+        assert f.read() == content
@@ -0,0 +1,148 @@
+import hashlib
+import io
+import tarfile
+import zipfile
+from unittest import mock
+
+from urllib3.response import HTTPHeaderDict
+
+
+def tar_content():
+    "Create the content of a gzipped tar archive"
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as tar:
+        for name, data in [('support/first.txt', b'first'), ('support/second.txt', b'second')]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def zip_content():
+    "Create the content of a zip archive"
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('support/first.txt', 'first')
+    return buffer.getvalue()
+
+
+def mock_response(url, content, status_code=200, chunk_size=100):
+    response = mock.MagicMock()
+    response.url = url
+    response.status_code = status_code
+    response.headers = HTTPHeaderDict({'Content-Length': str(len(content))})
+    response.iter_content.return_value = iter([
+        content[i:i + chunk_size]
+        for i in range(0, len(content), chunk_size)
+    ])
+    return response
+
+
+def test_tar_unpacked_while_downloading(base_command, tmp_path):
+    "A tar archive is unpacked as it is downloaded"
+    content = tar_content()
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.return_value = mock_response(
+        'https://example.com/path/to/support.tar.gz',
+        content,
+    )
+    base_command.shutil = mock.MagicMock()
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=tmp_path / 'downloads',
+        extract_dir=tmp_path / 'extract',
+    )
+
+    # The archive has been unpacked, without being unpacked after download.
+    assert (tmp_path / 'extract' / 'support' / 'first.txt').read_text() == 'first'
+    assert (tmp_path / 'extract' / 'support' / 'second.txt').read_text() == 'second'
+    base_command.shutil.unpack_archive.assert_not_called()
+
+    # The archive has been retained in the download cache,
+    # and recorded with the hash computed during download.
+    assert filename == tmp_path / 'downloads' / 'support.tar.gz'
+    assert filename.read_bytes() == content
+    assert not (tmp_path / 'downloads' / 'support.tar.gz.part').exists()
+    entry = base_command.download_index.get('https://example.com/support?useful=Yes')
+    assert entry['sha256'] == hashlib.sha256(content).hexdigest()
+
+
+def test_zip_unpacked_after_download(base_command, tmp_path):
+    "A zip archive is unpacked once the download is complete"
+    content = zip_content()
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.return_value = mock_response(
+        'https://example.com/path/to/support.zip',
+        content,
+    )
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=tmp_path / 'downloads',
+        extract_dir=tmp_path / 'extract',
+    )
+
+    assert filename.read_bytes() == content
+    assert (tmp_path / 'extract' / 'support' / 'first.txt').read_text() == 'first'
+
+
+def test_cached_tar_unpacked(base_command, tmp_path):
+    "A cached tar archive is unpacked from the cache"
+    content = tar_content()
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.return_value = mock_response(
+        'https://example.com/path/to/support.tar.gz',
+        content,
+    )
+    base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=tmp_path / 'downloads',
+    )
+
+    base_command.requests.get.reset_mock()
+    base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=tmp_path / 'downloads',
+        extract_dir=tmp_path / 'extract',
+    )
+
+    base_command.requests.get.assert_not_called()
+    assert (tmp_path / 'extract' / 'support' / 'first.txt').read_text() == 'first'
+
+
+def test_interrupted_tar_download(base_command, tmp_path):
+    "If a streamed tar download is interrupted, it is resumed, then unpacked"
+    content = tar_content()
+    truncated = mock_response('https://example.com/path/to/support.tar.gz', content)
+    truncated.headers['ETag'] = '"v1"'
+    truncated.iter_content.return_value = iter([content[:50]])
+    remainder = mock_response(
+        'https://example.com/path/to/support.tar.gz',
+        content[50:],
+        status_code=206,
+    )
+    remainder.headers['ETag'] = '"v1"'
+    remainder.headers['Content-Range'] = 'bytes 50-{end}/{total}'.format(
+        end=len(content) - 1,
+        total=len(content),
+    )
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = [truncated, remainder]
+
+    filename = base_command.download_url(
+        url='https://example.com/support?useful=Yes',
+        download_path=tmp_path / 'downloads',
+        extract_dir=tmp_path / 'extract',
+    )
+
+    # The download was resumed from the content that was received.
+    base_command.requests.get.assert_called_with(
+        'https://example.com/support?useful=Yes',
+        stream=True,
+        headers={'Range': 'bytes=50-', 'If-Range': '"v1"'},
+    )
+    assert filename.read_bytes() == content
+    assert (tmp_path / 'extract' / 'support' / 'second.txt').read_text() == 'second'
+    entry = base_command.download_index.get('https://example.com/support?useful=Yes')
+    assert entry['sha256'] == hashlib.sha256(content).hexdigest()
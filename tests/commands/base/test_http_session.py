@@ -0,0 +1,31 @@
+from unittest import mock
+
+from briefcase.downloads import HTTPSession
+
+from .conftest import DummyCommand
+
+
+def test_default_session(tmp_path):
+    "A command uses a pooled HTTP session"
+    command = DummyCommand(base_path=tmp_path, home_path=tmp_path / 'home')
+
+    assert isinstance(command.requests, HTTPSession)
+    assert command.requests.timeout == 60
+    assert command.requests.get_adapter('https://example.com').max_retries.total == 3
+
+
+def test_configured_session(tmp_path, monkeypatch):
+    "The retries and timeout of the HTTP session can be configured"
+    monkeypatch.setenv('BRIEFCASE_HTTP_RETRIES', '7')
+    monkeypatch.setenv('BRIEFCASE_HTTP_TIMEOUT', '5')
+    command = DummyCommand(base_path=tmp_path, home_path=tmp_path / 'home')
+
+    assert command.requests.timeout == 5
+    assert command.requests.get_adapter('https://example.com').max_retries.total == 7
+
+
+def test_session_shared(base_command):
+    "Commands created from another command share the HTTP session"
+    base_command.requests = mock.MagicMock()
+
+    assert base_command.create_command.requests is base_command.requests
@@ -0,0 +1,170 @@
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture
+def pip_command(base_command):
+    base_command.subprocess = mock.MagicMock()
+    return base_command
+
+
+def test_wheelhouse_path(base_command, tmp_path):
+    "The wheelhouse is stored in the .briefcase folder"
+    assert base_command.wheelhouse_path == tmp_path / 'home' / '.briefcase' / 'wheels'
+
+
+def test_empty_wheelhouse(pip_command):
+    "If the wheelhouse doesn't exist, requirements are fetched, then installed from the wheelhouse"
+    pip_command.pip_install(['first', 'second'], ['--upgrade'])
+
+    wheelhouse = pip_command.wheelhouse_path
+    assert wheelhouse.is_dir()
+    pip_command.subprocess.run.assert_has_calls([
+        mock.call(
+            [
+                sys.executable, '-m',
+                'pip', 'wheel',
+                '--find-links={}'.format(wheelhouse),
+                '--wheel-dir={}'.format(wheelhouse),
+                'first', 'second',
+            ],
+            check=True,
+        ),
+        mock.call(
+            [
+                sys.executable, '-m',
+                'pip', 'install',
+                '--upgrade',
+                '--no-index',
+                '--find-links={}'.format(wheelhouse),
+                'first', 'second',
+            ],
+            check=True,
+        ),
+    ])
+    assert pip_command.subprocess.run.call_count == 2
+
+
+def test_wheelhouse_complete(pip_command):
+    "If the wheelhouse can satisfy the requirements, nothing is fetched"
+    wheelhouse = pip_command.wheelhouse_path
+    wheelhouse.mkdir(parents=True)
+
+    pip_command.pip_install(['first'], ['--upgrade'])
+
+    pip_command.subprocess.run.assert_has_calls([
+        mock.call(
+            [
+                sys.executable, '-m',
+                'pip', 'download',
+                '--quiet',
+                '--no-index',
+                '--only-binary=:all:',
+                '--find-links={}'.format(wheelhouse),
+                '--dest={}'.format(wheelhouse),
+                'first',
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        ),
+        mock.call(
+            [
+                sys.executable, '-m',
+                'pip', 'install',
+                '--upgrade',
+                '--no-index',
+                '--find-links={}'.format(wheelhouse),
+                'first',
+            ],
+            check=True,
+        ),
+    ])
+    assert pip_command.subprocess.run.call_count == 2
+
+
+def test_wheelhouse_incomplete(pip_command, capsys):
+    "If the wheelhouse can't satisfy the requirements, the missing requirements are fetched"
+    pip_command.wheelhouse_path.mkdir(parents=True)
+    pip_command.subprocess.run.side_effect = [
+        subprocess.CalledProcessError(cmd=['pip'], returncode=1),
+        None,
+        None,
+    ]
+
+    pip_command.pip_install(['first'], ['--upgrade'])
+
+    assert [
+        call.args[0][3]
+        for call in pip_command.subprocess.run.call_args_list
+    ] == ['download', 'wheel', 'install']
+    assert '--no-index' not in pip_command.subprocess.run.call_args_list[1].args[0]
+    assert 'Fetching dependencies into the wheelhouse...' in capsys.readouterr().out
+
+
+def test_sdist_only_requirement(pip_command):
+    "A requirement that is only available as an sdist is built into the wheelhouse once"
+    wheelhouse = pip_command.wheelhouse_path
+
+    def pip(args, **kwargs):
+        if args[3] == 'download':
+            # Only wheels in the wheelhouse satisfy the check.
+            if not (wheelhouse / 'sdist_only-1.0-py3-none-any.whl').exists():
+                raise subprocess.CalledProcessError(cmd=args, returncode=1)
+        elif args[3] == 'wheel':
+            # The sdist is downloaded and built into a wheel.
+            (wheelhouse / 'sdist_only-1.0-py3-none-any.whl').write_bytes(b'wheel')
+
+    pip_command.subprocess.run.side_effect = pip
+
+    # An sdist left in the wheelhouse (e.g., by an older version of
+    # Briefcase) doesn't satisfy the requirement.
+    wheelhouse.mkdir(parents=True)
+    (wheelhouse / 'sdist-only-1.0.tar.gz').write_bytes(b'sdist')
+
+    pip_command.pip_install(['sdist-only'], ['--upgrade'])
+    pip_command.pip_install(['sdist-only'], ['--upgrade'])
+
+    # The wheel was only built once; the second install used it.
+    assert [
+        call.args[0][3]
+        for call in pip_command.subprocess.run.call_args_list
+    ] == ['download', 'wheel', 'install', 'download', 'install']
+    assert '--only-binary=:all:' in pip_command.subprocess.run.call_args_list[0].args[0]
+
+
+def test_fetch_failure(pip_command):
+    "If the requirements can't be fetched, the error is raised"
+    pip_command.subprocess.run.side_effect = subprocess.CalledProcessError(cmd=['pip'], returncode=1)
+
+    with pytest.raises(subprocess.CalledProcessError):
+        pip_command.pip_install(['does-not-exist'], ['--upgrade'])
+
+    # No install was attempted.
+    assert pip_command.subprocess.run.call_count == 1
+
+
+@pytest.mark.parametrize(
+    'requirement',
+    [
+        './local',
+        'git+https://github.com/beeware/toga.git',
+    ]
+)
+def test_uncacheable_requirements(pip_command, requirement):
+    "Requirements that can't be stored in the wheelhouse are installed as normal"
+    pip_command.pip_install(['first', requirement], ['--upgrade'])
+
+    pip_command.subprocess.run.assert_called_once_with(
+        [
+            sys.executable, '-m',
+            'pip', 'install',
+            '--upgrade',
+            'first', requirement,
+        ],
+        check=True,
+    )
+    assert not pip_command.wheelhouse_path.exists()
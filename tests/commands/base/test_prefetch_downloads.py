@@ -0,0 +1,97 @@
+from unittest import mock
+
+
+def test_no_plan(base_command):
+    "If there's nothing to download, no prefetch is started"
+    base_command._download_url = mock.MagicMock()
+
+    base_command.prefetch_downloads([])
+
+    assert base_command._prefetches == {}
+    base_command._download_url.assert_not_called()
+
+
+def test_prefetch(base_command, tmp_path):
+    "Every planned download is started in the background, and used by download_url"
+    base_command.download_plan = mock.MagicMock(return_value=[
+        ('https://example.com/first.zip', tmp_path / 'downloads'),
+        ('https://example.com/second.zip', tmp_path / 'downloads'),
+        # Duplicates are only downloaded once
+        ('https://example.com/first.zip', tmp_path / 'downloads'),
+    ])
+    base_command._download_url = mock.MagicMock(
+        side_effect=lambda url, download_path, quiet: download_path / url.split('/')[-1]
+    )
+
+    base_command.prefetch_downloads(['app'])
+
+    # The plan was computed for the requested apps
+    base_command.download_plan.assert_called_once_with(['app'])
+
+    # Obtaining a prefetched URL uses the result of the prefetch.
+    filename = base_command.download_url(
+        url='https://example.com/second.zip',
+        download_path=tmp_path / 'downloads',
+    )
+    assert filename == tmp_path / 'downloads' / 'second.zip'
+
+    filename = base_command.download_url(
+        url='https://example.com/first.zip',
+        download_path=tmp_path / 'downloads',
+    )
+    assert filename == tmp_path / 'downloads' / 'first.zip'
+
+    # Each URL was only downloaded once, in the background.
+    assert sorted(base_command._download_url.mock_calls) == [
+        mock.call('https://example.com/first.zip', tmp_path / 'downloads', quiet=True),
+        mock.call('https://example.com/second.zip', tmp_path / 'downloads', quiet=True),
+    ]
+    assert base_command._prefetches == {}
+
+
+def test_prefetch_other_path(base_command, tmp_path):
+    "A prefetch for a different download path isn't used"
+    base_command.download_plan = mock.MagicMock(return_value=[
+        ('https://example.com/first.zip', tmp_path / 'downloads'),
+    ])
+    base_command._download_url = mock.MagicMock(
+        side_effect=lambda url, download_path, quiet=False, unpacker=None: download_path / url.split('/')[-1]
+    )
+
+    base_command.prefetch_downloads(['app'])
+
+    filename = base_command.download_url(
+        url='https://example.com/first.zip',
+        download_path=tmp_path / 'other',
+    )
+    assert filename == tmp_path / 'other' / 'first.zip'
+    base_command._download_url.assert_called_with(
+        'https://example.com/first.zip',
+        tmp_path / 'other',
+        unpacker=None,
+    )
+
+
+def test_prefetch_failure(base_command, tmp_path):
+    "If a prefetch fails, the download is retried in the foreground"
+    base_command.download_plan = mock.MagicMock(return_value=[
+        ('https://example.com/first.zip', tmp_path / 'downloads'),
+    ])
+    base_command._download_url = mock.MagicMock(
+        side_effect=[
+            ConnectionError(),
+            tmp_path / 'downloads' / 'first.zip',
+        ]
+    )
+
+    base_command.prefetch_downloads(['app'])
+
+    filename = base_command.download_url(
+        url='https://example.com/first.zip',
+        download_path=tmp_path / 'downloads',
+    )
+    assert filename == tmp_path / 'downloads' / 'first.zip'
+    assert base_command._download_url.mock_calls == [
+        mock.call('https://example.com/first.zip', tmp_path / 'downloads', quiet=True),
+        mock.call('https://example.com/first.zip', tmp_path / 'downloads', unpacker=None),
+    ]
@@ -0,0 +1,113 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from briefcase.config import AppConfig
+from briefcase.exceptions import AppJobsFailed, BriefcaseCommandError
+from briefcase import jobs
+
+needs_fork = pytest.mark.skipif(
+    not jobs.parallel_jobs_supported(),
+    reason="Parallel jobs require fork()",
+)
+
+
+@pytest.fixture
+def multi_app_command(base_command):
+    base_command.apps = {
+        name: AppConfig(
+            app_name=name,
+            bundle='com.example',
+            version='0.0.1',
+            description='An app',
+            sources=['src/{name}'.format(name=name)],
+        )
+        for name in ['first', 'second', 'third']
+    }
+    return base_command
+
+
+def test_serial(multi_app_command):
+    "By default, apps are processed in order, chaining the state"
+    calls = []
+
+    def pipeline(app, **options):
+        calls.append((app.app_name, options))
+        return {'previous': app.app_name}
+
+    state = multi_app_command.run_app_pipelines(pipeline, {'extra': 1})
+
+    assert calls == [
+        ('first', {'extra': 1}),
+        ('second', {'extra': 1, 'previous': 'first'}),
+        ('third', {'extra': 1, 'previous': 'second'}),
+    ]
+    assert state == {'previous': 'third'}
+
+
+def test_serial_unsupported(multi_app_command, monkeypatch, capsys):
+    "If parallel jobs aren't supported, apps are processed in order"
+    monkeypatch.setattr('briefcase.commands.base.parallel_jobs_supported', lambda: False)
+    calls = []
+
+    def pipeline(app, **options):
+        calls.append(app.app_name)
+
+    multi_app_command.run_app_pipelines(pipeline, {}, jobs=4)
+
+    assert calls == ['first', 'second', 'third']
+    assert "Parallel jobs are not supported" in capsys.readouterr().out
+
+
+@needs_fork
+def test_parallel(multi_app_command, capfd):
+    "Apps can be processed in parallel, with prefixed output for each app"
+    def pipeline(app, **options):
+        print("Processing {app.app_name} (extra={extra})".format(app=app, **options))
+        # Output from subprocesses is captured as well.
+        subprocess.run([sys.executable, '-c', 'print("child of {pid}")'.format(pid=os.getpid())])
+        return {'app': app.app_name, 'pid': os.getpid()}
+
+    state = multi_app_command.run_app_pipelines(pipeline, {'extra': 1}, jobs=2)
+
+    # The state of the last app is returned; it was processed in a worker.
+    assert state['app'] == 'third'
+    assert state['pid'] != os.getpid()
+
+    # Input is disabled when processing in parallel.
+    assert not multi_app_command.input.enabled
+
+    output = capfd.readouterr().out
+    assert "Processing 3 apps, 2 at a time..." in output
+    for name in ['first', 'second', 'third']:
+        assert "[{name}] Processing {name} (extra=1)\n[{name}] child of ".format(name=name) in output
+
+
+@needs_fork
+def test_parallel_failures(multi_app_command, capfd):
+    "If some apps fail, all apps are processed, and the failures are reported"
+    def pipeline(app, **options):
+        print("Starting {app.app_name}".format(app=app))
+        if app.app_name == 'first':
+            raise BriefcaseCommandError("first is broken")
+        elif app.app_name == 'third':
+            raise ValueError("third is broken")
+
+    with pytest.raises(AppJobsFailed) as exc_info:
+        multi_app_command.run_app_pipelines(pipeline, {}, jobs=3)
+
+    assert exc_info.value.failures == {
+        'first': 'first is broken',
+        'third': 'Unexpected error: third is broken',
+    }
+    assert str(exc_info.value) == (
+        "2 app(s) failed:\n"
+        "  [first] first is broken\n"
+        "  [third] Unexpected error: third is broken"
+    )
+
+    output = capfd.readouterr().out
+    assert "[second] Starting second\n" in output
+    assert "[first] first is broken\n" in output
@@ -0,0 +1,28 @@
+import os
+import zipfile
+from unittest import mock
+
+
+def test_unpack_zip(base_command, tmp_path):
+    "Zip files are unpacked with the parallel zip extractor"
+    zip_path = tmp_path / 'archive.zip'
+    with zipfile.ZipFile(zip_path, 'w') as archive:
+        archive.writestr('internal/file.txt', 'hello world')
+    base_command.shutil = mock.MagicMock()
+
+    base_command.unpack_archive(zip_path, extract_dir=tmp_path / 'out')
+
+    assert (tmp_path / 'out' / 'internal' / 'file.txt').read_text() == 'hello world'
+    base_command.shutil.unpack_archive.assert_not_called()
+
+
+def test_unpack_other(base_command, tmp_path):
+    "Other archive formats are unpacked with shutil"
+    base_command.shutil = mock.MagicMock()
+
+    base_command.unpack_archive(tmp_path / 'archive.tar.gz', extract_dir=tmp_path / 'out')
+
+    base_command.shutil.unpack_archive.assert_called_once_with(
+        os.fsdecode(tmp_path / 'archive.tar.gz'),
+        extract_dir=os.fsdecode(tmp_path / 'out'),
+    )
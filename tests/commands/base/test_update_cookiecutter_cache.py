@@ -1,5 +1,7 @@
+import tarfile
 from unittest import mock
 
+import git
 import pytest
 from git import exc as git_exceptions
 
@@ -7,6 +9,7 @@ from briefcase.commands.base import (
     TemplateUnsupportedVersion,
     cookiecutter_cache_path
 )
+from tests.utils import template_archive
 
 
 def test_non_url(base_command, mock_git):
@@ -24,12 +27,15 @@ def test_non_url(base_command, mock_git):
 
 
 def test_explicit_new_repo_template(base_command, mock_git):
-    "If a previously unknown URL template is specified it is used"
+    "If a previously unknown URL template is specified, a shallow clone is made"
     base_command.git = mock_git
 
     # There won't be a cookiecutter cache, so there won't be
     # a repo path (yet).
     base_command.git.Repo.side_effect = git_exceptions.NoSuchPathError
+    mock_repo = base_command.git.Repo.clone_from.return_value
+    mock_repo.remote.return_value.refs.__getitem__.return_value.commit.hexsha = 'abc123'
+    mock_repo.archive.side_effect = template_archive({'cookiecutter.json': '{}'})
 
     cached_path = cookiecutter_cache_path('https://example.com/magic/special-template.git')
 
@@ -39,26 +45,112 @@ def test_explicit_new_repo_template(base_command, mock_git):
         branch='special',
     )
 
+    # The cookiecutter cache location will be interrogated.
+    base_command.git.Repo.assert_called_once_with(cached_path)
+
+    # A shallow clone of the requested branch was made.
+    base_command.git.Repo.clone_from.assert_called_once_with(
+        'https://example.com/magic/special-template.git',
+        cached_path,
+        depth=1,
+        branch='special',
+        single_branch=True,
+    )
+
+    # The template that will be used is a snapshot of the branch
+    assert cached_template == base_command.home_path / '.cookiecutters' / 'special-template-abc123'
+    assert (cached_template / 'cookiecutter.json').read_text() == '{}'
+    assert (cached_template / '.briefcase-revision').read_text() == 'abc123'
+
+    # The branch is recorded as current.
+    assert base_command.template_checked(
+        'https://example.com/magic/special-template.git',
+        'special',
+    ) is not None
+
+
+def test_new_repo_template_clone_fails(base_command, mock_git):
+    "If a previously unknown URL template can't be cloned, the URL is used"
+    base_command.git = mock_git
+
+    base_command.git.Repo.side_effect = git_exceptions.NoSuchPathError
+    base_command.git.Repo.clone_from.side_effect = git_exceptions.GitCommandError(
+        'git',
+        128,
+        stderr="fatal: unable to access 'https://example.com/magic/special-template.git/': Could not resolve host",
+    )
+
+    # Update the cache
+    cached_template = base_command.update_cookiecutter_cache(
+        template='https://example.com/magic/special-template.git',
+        branch='special',
+    )
+
     # The template that will be used is the original URL
     assert cached_template == 'https://example.com/magic/special-template.git'
 
-    # The cookiecutter cache location will be interrogated.
-    base_command.git.Repo.assert_called_once_with(cached_path)
+    # The branch hasn't been checked.
+    assert base_command.template_checked(
+        'https://example.com/magic/special-template.git',
+        'special',
+    ) is None
 
 
-def test_explicit_cached_repo_template(base_command, mock_git):
-    "If a previously known URL template is specified it is used"
+def test_new_repo_template_missing_branch(base_command, mock_git):
+    "If a previously unknown URL template doesn't have the requested branch, an error is raised"
     base_command.git = mock_git
 
+    base_command.git.Repo.side_effect = git_exceptions.NoSuchPathError
+    base_command.git.Repo.clone_from.side_effect = git_exceptions.GitCommandError(
+        'git',
+        128,
+        stderr=(
+            "Cloning into '/path/to/special-template'...\n"
+            "warning: Could not find remote branch invalid to clone.\n"
+            "fatal: Remote branch invalid not found in upstream origin"
+        ),
+    )
+
+    with pytest.raises(TemplateUnsupportedVersion):
+        base_command.update_cookiecutter_cache(
+            template='https://example.com/magic/special-template.git',
+            branch='invalid',
+        )
+
+    # The branch hasn't been checked.
+    assert base_command.template_checked(
+        'https://example.com/magic/special-template.git',
+        'invalid',
+    ) is None
+
+
+@pytest.fixture
+def cached_repo(mock_git):
+    """
+    A cached template repository, whose ``special`` branch is at ``abc123``
+    in the template repository, and at ``def456`` in the cache.
+    """
     mock_repo = mock.MagicMock()
     mock_remote = mock.MagicMock()
     mock_remote_head = mock.MagicMock()
 
     # Git returns a Repo, that repo can return a remote, and it has
     # heads that can be accessed.
-    base_command.git.Repo.return_value = mock_repo
+    mock_git.Repo.return_value = mock_repo
     mock_repo.remote.return_value = mock_remote
+    mock_repo.git.ls_remote.return_value = 'abc123\trefs/heads/special\n'
     mock_remote.refs.__getitem__.return_value = mock_remote_head
+    mock_remote_head.commit.hexsha = 'def456'
+    mock_repo.archive.side_effect = template_archive({'cookiecutter.json': '{}'})
+
+    return mock_repo
+
+
+def test_explicit_cached_repo_template(base_command, mock_git, cached_repo):
+    "If a previously known URL template is specified it is used"
+    base_command.git = mock_git
+    mock_remote = cached_repo.remote.return_value
+    mock_remote_head = mock_remote.refs.__getitem__.return_value
 
     cached_path = cookiecutter_cache_path('https://example.com/magic/special-template.git')
 
@@ -71,35 +163,116 @@ def test_explicit_cached_repo_template(base_command, mock_git):
     # The cookiecutter cache location will be interrogated.
     base_command.git.Repo.assert_called_once_with(cached_path)
 
-    # The origin of the repo was fetched
-    mock_repo.remote.assert_called_once_with(name='origin')
-    mock_remote.fetch.assert_called_once_with()
+    # The head of the branch in the template repository was checked
+    cached_repo.git.ls_remote.assert_called_once_with('origin', 'refs/heads/special')
+
+    # The branch has changed, so it was fetched (shallowly).
+    cached_repo.remote.assert_called_with(name='origin')
+    mock_remote.fetch.assert_called_once_with(
+        '+refs/heads/special:refs/remotes/origin/special',
+        depth=1,
+    )
 
     # The right branch was accessed
-    mock_remote.refs.__getitem__.assert_called_once_with('special')
+    mock_remote.refs.__getitem__.assert_called_with('special')
 
-    # The remote head was checked out.
-    mock_remote_head.checkout.assert_called_once_with()
+    # The branch wasn't checked out in the cached template.
+    mock_remote_head.checkout.assert_not_called()
 
-    # The template that will be used is the original URL
-    assert cached_template == cached_path
+    # The template that will be used is a snapshot of the branch
+    cached_repo.archive.assert_called_once_with(mock.ANY, treeish='def456', format='tar')
+    assert cached_template == base_command.home_path / '.cookiecutters' / 'special-template-def456'
 
 
-def test_offline_repo_template(base_command, mock_git):
-    "If the user is offline the first time a repo template is requested, an error is raised"
+def test_cached_repo_template_unchanged(base_command, mock_git, cached_repo):
+    "If the branch in the template repository hasn't changed, it isn't fetched"
     base_command.git = mock_git
+    mock_remote = cached_repo.remote.return_value
+    mock_remote_head = mock_remote.refs.__getitem__.return_value
+    mock_remote_head.commit.hexsha = 'abc123'
 
-    mock_repo = mock.MagicMock()
-    mock_remote = mock.MagicMock()
-    mock_remote_head = mock.MagicMock()
+    # Update the cache
+    cached_template = base_command.update_cookiecutter_cache(
+        template='https://example.com/magic/special-template.git',
+        branch='special',
+    )
+
+    # The head of the branch in the template repository was checked,
+    # but nothing was fetched.
+    cached_repo.git.ls_remote.assert_called_once_with('origin', 'refs/heads/special')
+    mock_remote.fetch.assert_not_called()
+
+    # A snapshot of the branch will be used.
+    assert cached_template == base_command.home_path / '.cookiecutters' / 'special-template-abc123'
+
+    # The branch is recorded as current.
+    assert base_command.template_checked(
+        'https://example.com/magic/special-template.git',
+        'special',
+    ) is not None
+
+
+def test_cached_repo_template_recently_checked(base_command, mock_git, cached_repo):
+    "If the branch was checked recently, the template repository isn't contacted"
+    base_command.git = mock_git
+    mock_remote = cached_repo.remote.return_value
+
+    base_command.record_template_check('https://example.com/magic/special-template.git', 'special')
+
+    # Update the cache
+    cached_template = base_command.update_cookiecutter_cache(
+        template='https://example.com/magic/special-template.git',
+        branch='special',
+    )
+
+    # The template repository wasn't contacted
+    cached_repo.git.ls_remote.assert_not_called()
+    mock_remote.fetch.assert_not_called()
+
+    # A snapshot of the branch will be used.
+    assert cached_template == base_command.home_path / '.cookiecutters' / 'special-template-def456'
 
-    # Git returns a Repo, that repo can return a remote, and it has
-    # heads that can be accessed. However, calling fetch on the remote
-    # will cause a git error (error code 128).
-    base_command.git.Repo.return_value = mock_repo
-    mock_repo.remote.return_value = mock_remote
-    mock_remote.refs.__getitem__.return_value = mock_remote_head
-    mock_remote.fetch.side_effect = git_exceptions.GitCommandError('git', 128)
+
+def test_cached_repo_template_other_branch(base_command, mock_git, cached_repo):
+    "A recent check of one branch doesn't apply to other branches"
+    base_command.git = mock_git
+
+    base_command.record_template_check('https://example.com/magic/special-template.git', 'other')
+
+    base_command.update_cookiecutter_cache(
+        template='https://example.com/magic/special-template.git',
+        branch='special',
+    )
+
+    # The template repository was checked
+    cached_repo.git.ls_remote.assert_called_once_with('origin', 'refs/heads/special')
+
+
+def test_cached_repo_template_refresh_ttl(base_command, mock_git, cached_repo, monkeypatch):
+    "The time for which a branch is assumed current can be configured"
+    base_command.git = mock_git
+    monkeypatch.setenv('BRIEFCASE_TEMPLATE_REFRESH_TTL', '0')
+
+    with mock.patch('briefcase.commands.base.time.time', return_value=1000):
+        base_command.record_template_check('https://example.com/magic/special-template.git', 'special')
+    with mock.patch('briefcase.commands.base.time.time', return_value=1001):
+        base_command.update_cookiecutter_cache(
+            template='https://example.com/magic/special-template.git',
+            branch='special',
+        )
+
+    # The check has expired, so the template repository was checked
+    cached_repo.git.ls_remote.assert_called_once_with('origin', 'refs/heads/special')
+
+
+def test_offline_repo_template(base_command, mock_git, cached_repo, capsys):
+    "If the user is offline, the cached template is used, with a warning"
+    base_command.git = mock_git
+    mock_remote = cached_repo.remote.return_value
+    mock_remote_head = mock_remote.refs.__getitem__.return_value
+
+    # Contacting the template repository causes a git error (error code 128).
+    cached_repo.git.ls_remote.side_effect = git_exceptions.GitCommandError('git', 128)
 
     cached_path = cookiecutter_cache_path('https://example.com/magic/special-template.git')
 
@@ -112,32 +285,36 @@ def test_offline_repo_template(base_command, mock_git):
     # The cookiecutter cache location will be interrogated.
     base_command.git.Repo.assert_called_once_with(cached_path)
 
-    # The origin of the repo was fetched
-    mock_repo.remote.assert_called_once_with(name='origin')
-    mock_remote.fetch.assert_called_once_with()
+    # Nothing was fetched
+    mock_remote.fetch.assert_not_called()
+    assert "Unable to update template (is your computer offline?)" in capsys.readouterr().out
 
     # The right branch was accessed
     mock_remote.refs.__getitem__.assert_called_once_with('special')
 
-    # The remote head was checked out.
-    mock_remote_head.checkout.assert_called_once_with()
+    # The branch wasn't checked out in the cached template.
+    mock_remote_head.checkout.assert_not_called()
 
-    # The template that will be used is the original URL
-    assert cached_template == cached_path
+    # The template that will be used is a snapshot of the branch
+    cached_repo.archive.assert_called_once_with(mock.ANY, treeish='def456', format='tar')
+    assert cached_template == base_command.home_path / '.cookiecutters' / 'special-template-def456'
+
+    # The branch isn't recorded as current, so it will be checked next time.
+    assert base_command.template_checked(
+        'https://example.com/magic/special-template.git',
+        'special',
+    ) is None
 
 
-def test_cached_missing_branch_template(base_command, mock_git):
+def test_cached_missing_branch_template(base_command, mock_git, cached_repo):
     "If the cached repo doesn't have the requested branch, an error is raised"
     base_command.git = mock_git
+    mock_remote = cached_repo.remote.return_value
 
-    mock_repo = mock.MagicMock()
-    mock_remote = mock.MagicMock()
-
-    # Git returns a Repo, that repo can return a remote. However, it doesn't
-    # have a head corresponding to the requested Python version, so it
+    # The template repository doesn't have a head corresponding to the
+    # requested Python version, and neither does the cache, so it
     # raises an IndexError
-    base_command.git.Repo.return_value = mock_repo
-    mock_repo.remote.return_value = mock_remote
+    cached_repo.git.ls_remote.return_value = ''
     mock_remote.refs.__getitem__.side_effect = IndexError
 
     cached_path = cookiecutter_cache_path('https://example.com/magic/special-template.git')
@@ -152,9 +329,132 @@ def test_cached_missing_branch_template(base_command, mock_git):
     # The cookiecutter cache location will be interrogated.
     base_command.git.Repo.assert_called_once_with(cached_path)
 
-    # The origin of the repo was fetched
-    mock_repo.remote.assert_called_once_with(name='origin')
-    mock_remote.fetch.assert_called_once_with()
+    # The branch was looked for, but there was nothing to fetch
+    cached_repo.git.ls_remote.assert_called_once_with('origin', 'refs/heads/invalid')
+    mock_remote.fetch.assert_not_called()
 
     # An attempt to access the branch was made
     mock_remote.refs.__getitem__.assert_called_once_with('invalid')
+
+
+def test_cached_repo_template_snapshot_reused(base_command, mock_git, cached_repo):
+    "If a snapshot of the branch head already exists, it is reused"
+    base_command.git = mock_git
+
+    first = base_command.update_cookiecutter_cache(
+        template='https://example.com/magic/special-template.git',
+        branch='special',
+    )
+    second = base_command.update_cookiecutter_cache(
+        template='https://example.com/magic/special-template.git',
+        branch='special',
+    )
+
+    # The commit was only extracted once.
+    assert first == second
+    cached_repo.archive.assert_called_once()
+    assert base_command.cache.stats('templates')['hits'] == 3
+
+
+def test_cached_repo_template_branches(base_command, mock_git, cached_repo):
+    "Each branch of a template has its own snapshot"
+    base_command.git = mock_git
+    heads = {
+        'special': mock.MagicMock(),
+        'other': mock.MagicMock(),
+    }
+    heads['special'].commit.hexsha = 'abc123'
+    heads['other'].commit.hexsha = 'def456'
+    cached_repo.remote.return_value.refs.__getitem__.side_effect = heads.__getitem__
+
+    special = base_command.update_cookiecutter_cache(
+        template='https://example.com/magic/special-template.git',
+        branch='special',
+    )
+    other = base_command.update_cookiecutter_cache(
+        template='https://example.com/magic/special-template.git',
+        branch='other',
+    )
+
+    assert special == base_command.home_path / '.cookiecutters' / 'special-template-abc123'
+    assert other == base_command.home_path / '.cookiecutters' / 'special-template-def456'
+    assert special.is_dir()
+    assert other.is_dir()
+
+    # Neither branch was checked out in the shared clone.
+    heads['special'].checkout.assert_not_called()
+    heads['other'].checkout.assert_not_called()
+
+
+def test_cached_repo_template_snapshot_fails(base_command, mock_git, cached_repo):
+    "If a snapshot can't be extracted, nothing is left in the cache"
+    base_command.git = mock_git
+    cached_repo.archive.side_effect = lambda ostream, **kwargs: ostream.write(b'not a tar archive')
+
+    with pytest.raises(tarfile.ReadError):
+        base_command.update_cookiecutter_cache(
+            template='https://example.com/magic/special-template.git',
+            branch='special',
+        )
+
+    assert list((base_command.home_path / '.cookiecutters').iterdir()) == []
+
+
+def test_cache_update_locked(base_command, mock_git, cached_repo):
+    "The template cache is updated while holding an inter-process lock"
+    base_command.git = mock_git
+    mock_lock = mock.MagicMock()
+
+    def ls_remote(*args):
+        # The lock is held while the template repository is contacted.
+        assert mock_lock.return_value.__enter__.called
+        assert not mock_lock.return_value.__exit__.called
+        return 'def456\trefs/heads/special\n'
+    cached_repo.git.ls_remote.side_effect = ls_remote
+
+    with mock.patch('briefcase.commands.base.file_lock', mock_lock):
+        base_command.update_cookiecutter_cache(
+            template='https://example.com/magic/special-template.git',
+            branch='special',
+        )
+
+    # The lock is shared by every Briefcase process.
+    mock_lock.assert_called_once_with(base_command.dot_briefcase_path / 'templates.lock')
+    cached_repo.git.ls_remote.assert_called_once()
+    assert mock_lock.return_value.__exit__.called
+
+
+def test_snapshot_template(base_command, tmp_path):
+    "A snapshot contains the files of a commit, and isn't affected by later commits"
+    repo = git.Repo.init(tmp_path / 'template')
+    (tmp_path / 'template' / 'cookiecutter.json').write_text('{"app_name": "app"}')
+    (tmp_path / 'template' / '{{ cookiecutter.app_name }}').mkdir()
+    (tmp_path / 'template' / '{{ cookiecutter.app_name }}' / 'version.txt').write_text('1')
+    repo.index.add(['cookiecutter.json', '{{ cookiecutter.app_name }}/version.txt'])
+    first = repo.index.commit('Initial commit').hexsha
+
+    (tmp_path / 'template' / '{{ cookiecutter.app_name }}' / 'version.txt').write_text('2')
+    repo.index.add(['{{ cookiecutter.app_name }}/version.txt'])
+    second = repo.index.commit('Second commit').hexsha
+
+    snapshot = base_command.snapshot_template(
+        repo,
+        'https://example.com/magic/special-template.git',
+        first,
+    )
+
+    assert snapshot == base_command.home_path / '.cookiecutters' / 'special-template-{}'.format(first[:12])
+    assert (snapshot / 'cookiecutter.json').read_text() == '{"app_name": "app"}'
+    assert (snapshot / '{{ cookiecutter.app_name }}' / 'version.txt').read_text() == '1'
+    assert (snapshot / '.briefcase-revision').read_text() == first
+    # A snapshot isn't a git repository.
+    assert not (snapshot / '.git').exists()
+
+    # A snapshot of another commit is independent.
+    other = base_command.snapshot_template(
+        repo,
+        'https://example.com/magic/special-template.git',
+        second,
+    )
+    assert (other / '{{ cookiecutter.app_name }}' / 'version.txt').read_text() == '2'
+    assert (snapshot / '{{ cookiecutter.app_name }}' / 'version.txt').read_text() == '1'
@@ -0,0 +1,30 @@
+import os
+
+import pytest
+
+from briefcase.commands import CacheCommand
+
+
+def create_entry(cache_path, name, size, mtime):
+    "Create a cache entry of a given size, last modified at a given time"
+    cache_path.mkdir(parents=True, exist_ok=True)
+    path = cache_path / name
+    path.write_bytes(b'x' * size)
+    os.utime(str(path), (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def cache_command(tmp_path):
+    command = CacheCommand(base_path=tmp_path, home_path=tmp_path / 'home')
+
+    # Use small cache limits.
+    command.cache.categories['support'] = (command.dot_briefcase_path / 'support', 250)
+    command.cache.categories['templates'] = (command.home_path / '.cookiecutters', None)
+
+    support_path = command.dot_briefcase_path / 'support'
+    create_entry(support_path, 'old.tar.gz', 100, mtime=1000)
+    create_entry(support_path, 'middle.tar.gz', 100, mtime=2000)
+    create_entry(support_path, 'new.tar.gz', 100, mtime=3000)
+
+    return command
@@ -0,0 +1,86 @@
+import pytest
+
+from briefcase.exceptions import BriefcaseCommandError
+
+
+def test_list(cache_command, capsys):
+    "The content of every cache can be listed"
+    cache_command('list')
+
+    output = capsys.readouterr().out
+    assert '[support]' in output
+    assert '[templates]' in output
+    assert '[tools]' in output
+    # Entries are listed most recently used first.
+    assert output.index('new.tar.gz') < output.index('middle.tar.gz') < output.index('old.tar.gz')
+    assert '300 B; limit 250 B' in output
+
+
+def test_list_category(cache_command, capsys):
+    "A single cache can be listed"
+    cache_command('list', categories=['templates'])
+
+    output = capsys.readouterr().out
+    assert '[templates]' in output
+    assert 'limit unlimited' in output
+    assert '(empty)' in output
+    assert '[support]' not in output
+
+
+def test_prune(cache_command, capsys):
+    "Pruning reduces each cache to its size limit"
+    cache_command('prune')
+
+    output = capsys.readouterr().out
+    assert '[support] Removed 1 item(s), freeing 100 B' in output
+    assert '[tools] Nothing to remove.' in output
+
+    support_path = cache_command.dot_briefcase_path / 'support'
+    assert not (support_path / 'old.tar.gz').exists()
+    assert (support_path / 'middle.tar.gz').exists()
+    assert (support_path / 'new.tar.gz').exists()
+
+
+def test_prune_max_size(cache_command, capsys):
+    "Pruning can use an explicit size"
+    cache_command('prune', categories=['support'], max_size=150)
+
+    output = capsys.readouterr().out
+    assert '[support] Removed 2 item(s), freeing 200 B' in output
+
+    support_path = cache_command.dot_briefcase_path / 'support'
+    assert [path.name for path in support_path.iterdir()] == ['new.tar.gz']
+
+
+def test_max_size_without_prune(cache_command):
+    "A maximum size can only be used when pruning"
+    with pytest.raises(BriefcaseCommandError):
+        cache_command('list', max_size=150)
+
+
+def test_stats(cache_command, capsys):
+    "Cache usage statistics can be reported"
+    cache_command.cache.record_miss('support', 'new.tar.gz', 100)
+    cache_command.cache.record_hit('support', 'new.tar.gz', 100)
+    cache_command.cache.record_hit('support', 'new.tar.gz', 100)
+    cache_command.cache.record_hit('support', 'new.tar.gz', 100)
+
+    cache_command('stats', categories=['support'])
+
+    output = capsys.readouterr().out
+    assert 'Items:            3' in output
+    assert 'Size:             300 B (limit 250 B)' in output
+    assert 'Hits:             3' in output
+    assert 'Misses:           1' in output
+    assert 'Hit rate:         75%' in output
+    assert 'Bytes saved:      300 B' in output
+    assert 'Bytes downloaded: 100 B' in output
+
+
+def test_stats_unused(cache_command, capsys):
+    "If a cache hasn't been used, no hit rate is reported"
+    cache_command('stats', categories=['tools'])
+
+    output = capsys.readouterr().out
+    assert 'Hits:             0' in output
+    assert 'Hit rate' not in output
@@ -0,0 +1,8 @@
+def test_no_project(cache_command, tmp_path, capsys):
+    "The cache command can be used outside a project"
+    assert not (tmp_path / 'pyproject.toml').exists()
+
+    cache_command.parse_config(str(tmp_path / 'pyproject.toml'))
+    cache_command('list', categories=['support'])
+
+    assert '[support]' in capsys.readouterr().out
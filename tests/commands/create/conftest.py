@@ -79,6 +79,16 @@ class TrackingCreateCommand(DummyCreateCommand):
         super().__init__(*args, **kwargs)
 
         self.actions = []
+        self.prefetched = None
+        self.template_paths = {
+            'app_path': 'path/to/app',
+            'app_packages_path': 'path/to/app_packages',
+            'support_path': 'path/to/support',
+        }
+
+    def prefetch_downloads(self, apps):
+        # Don't start any background downloads; just record the apps.
+        self.prefetched = apps
 
     def verify_tools(self,):
         super().verify_tools()
@@ -93,6 +103,8 @@ class TrackingCreateCommand(DummyCreateCommand):
         self.bundle_path(app).mkdir(parents=True, exist_ok=True)
         with (self.bundle_path(app) / 'new').open('w') as f:
             f.write('new template!')
+        with (self.bundle_path(app) / 'briefcase.toml').open('wb') as f:
+            tomli_w.dump({'paths': self.template_paths}, f)
 
     def install_app_support_package(self, app):
         self.actions.append(('support', app))
@@ -106,6 +118,12 @@ class TrackingCreateCommand(DummyCreateCommand):
     def install_app_resources(self, app):
         self.actions.append(('resources', app))
 
+    def prune_app_stdlib(self, app):
+        self.actions.append(('stdlib', app))
+
+    def precompile_app(self, app):
+        self.actions.append(('bytecode', app))
+
 
 @pytest.fixture
 def create_command(tmp_path, mock_git):
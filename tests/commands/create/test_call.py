@@ -3,6 +3,7 @@ from unittest import mock
 import pytest
 
 from briefcase.exceptions import BriefcaseCommandError
+from tests.commands.create.utils import in_stage_order
 
 
 def test_no_git(tracking_create_command):
@@ -27,7 +28,7 @@ def test_create(tracking_create_command):
     tracking_create_command()
 
     # The right sequence of things will be done
-    assert tracking_create_command.actions == [
+    assert in_stage_order(tracking_create_command.actions) == [
         ('verify', ),
 
         # Create the first app
@@ -45,6 +46,12 @@ def test_create(tracking_create_command):
         ('resources', tracking_create_command.apps['second']),
     ]
 
+    # Downloads for both apps were prefetched
+    assert tracking_create_command.prefetched == [
+        tracking_create_command.apps['first'],
+        tracking_create_command.apps['second'],
+    ]
+
     # New app content has been created
     assert (tracking_create_command.platform_path / 'first.bundle' / 'new').exists()
     assert (tracking_create_command.platform_path / 'second.bundle' / 'new').exists()
@@ -55,7 +62,7 @@ def test_create_single(tracking_create_command):
     tracking_create_command(app=tracking_create_command.apps['first'])
 
     # The right sequence of things will be done
-    assert tracking_create_command.actions == [
+    assert in_stage_order(tracking_create_command.actions) == [
         ('verify', ),
 
         # Create the first app
@@ -66,6 +73,11 @@ def test_create_single(tracking_create_command):
         ('resources', tracking_create_command.apps['first']),
     ]
 
+    # Only downloads for the first app were prefetched
+    assert tracking_create_command.prefetched == [
+        tracking_create_command.apps['first'],
+    ]
+
     # New app content has been created
     assert (tracking_create_command.platform_path / 'first.bundle' / 'new').exists()
     assert not (tracking_create_command.platform_path / 'second.bundle' / 'new').exists()
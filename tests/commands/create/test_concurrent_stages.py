@@ -0,0 +1,25 @@
+def test_separate_paths(create_command, myapp, bundle_path):
+    "If the stages install into separate paths, they can run concurrently"
+    assert create_command.concurrent_stages(myapp)
+
+
+def test_overlapping_paths(create_command, myapp, bundle_path):
+    "If the support package contains the app code, the stages can't run concurrently"
+    create_command._path_index[myapp] = {
+        'app_path': 'AppDir/usr/app',
+        'app_packages_path': 'AppDir/usr/app_packages',
+        'support_path': 'AppDir/usr',
+    }
+
+    assert not create_command.concurrent_stages(myapp)
+
+
+def test_same_path(create_command, myapp, bundle_path):
+    "If the code and dependencies are installed into the same path, the stages can't run concurrently"
+    create_command._path_index[myapp] = {
+        'app_path': 'app',
+        'app_packages_path': 'app',
+        'support_path': 'support',
+    }
+
+    assert not create_command.concurrent_stages(myapp)
@@ -1,7 +1,11 @@
+from unittest import mock
+
 import pytest
 
+from briefcase import jobs
 from briefcase.commands.base import UnsupportedPlatform
 from briefcase.config import AppConfig
+from tests.commands.create.utils import in_stage_order
 
 
 def test_create_app(tracking_create_command):
@@ -12,7 +16,7 @@ def test_create_app(tracking_create_command):
     assert tracking_create_command.input.prompts == []
 
     # The right sequence of things will be done
-    assert tracking_create_command.actions == [
+    assert in_stage_order(tracking_create_command.actions) == [
         ('generate', tracking_create_command.apps['first']),
         ('support', tracking_create_command.apps['first']),
         ('dependencies', tracking_create_command.apps['first']),
@@ -24,6 +28,63 @@ def test_create_app(tracking_create_command):
     assert (tracking_create_command.platform_path / 'first.bundle' / 'new').exists()
 
 
+def test_create_app_precompile(tracking_create_command):
+    "If the app requests precompilation, bytecode is compiled once the code and dependencies are installed"
+    tracking_create_command.apps['first'].precompile = True
+
+    tracking_create_command.create_app(tracking_create_command.apps['first'])
+
+    assert in_stage_order(tracking_create_command.actions) == [
+        ('generate', tracking_create_command.apps['first']),
+        ('support', tracking_create_command.apps['first']),
+        ('dependencies', tracking_create_command.apps['first']),
+        ('code', tracking_create_command.apps['first']),
+        ('resources', tracking_create_command.apps['first']),
+        ('bytecode', tracking_create_command.apps['first']),
+    ]
+    # Compilation happened after the code and dependencies were installed.
+    actions = [action[0] for action in tracking_create_command.actions]
+    assert actions.index('bytecode') > actions.index('dependencies')
+    assert actions.index('bytecode') > actions.index('code')
+
+
+def test_create_app_prune_stdlib(tracking_create_command):
+    "If the app requests stdlib pruning, it happens once the support package, code and dependencies are installed"
+    tracking_create_command.apps['first'].prune_stdlib = True
+
+    tracking_create_command.create_app(tracking_create_command.apps['first'])
+
+    assert in_stage_order(tracking_create_command.actions) == [
+        ('generate', tracking_create_command.apps['first']),
+        ('support', tracking_create_command.apps['first']),
+        ('dependencies', tracking_create_command.apps['first']),
+        ('code', tracking_create_command.apps['first']),
+        ('resources', tracking_create_command.apps['first']),
+        ('stdlib', tracking_create_command.apps['first']),
+    ]
+    actions = [action[0] for action in tracking_create_command.actions]
+    for stage in ['support', 'dependencies', 'code']:
+        assert actions.index('stdlib') > actions.index(stage)
+
+
+def test_create_app_overlapping_paths(tracking_create_command, monkeypatch):
+    "If the stages install into overlapping paths, they are run one after the other"
+    tracking_create_command.template_paths['support_path'] = 'path/to'
+    run_stages = mock.MagicMock(side_effect=jobs.run_stages)
+    monkeypatch.setattr('briefcase.commands.create.run_stages', run_stages)
+
+    tracking_create_command.create_app(tracking_create_command.apps['first'])
+
+    assert run_stages.call_args.kwargs['concurrent'] is False
+    assert tracking_create_command.actions == [
+        ('generate', tracking_create_command.apps['first']),
+        ('support', tracking_create_command.apps['first']),
+        ('dependencies', tracking_create_command.apps['first']),
+        ('code', tracking_create_command.apps['first']),
+        ('resources', tracking_create_command.apps['first']),
+    ]
+
+
 def test_create_existing_app_overwrite(tracking_create_command):
     "An existing app can be overwritten if requested"
     # Answer yes when asked
@@ -43,7 +104,7 @@ def test_create_existing_app_overwrite(tracking_create_command):
     ]
 
     # The right sequence of things will be done
-    assert tracking_create_command.actions == [
+    assert in_stage_order(tracking_create_command.actions) == [
         ('generate', tracking_create_command.apps['first']),
         ('support', tracking_create_command.apps['first']),
         ('dependencies', tracking_create_command.apps['first']),
@@ -0,0 +1,177 @@
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture
+def images(create_command, monkeypatch):
+    "Mock the image integration, so that image sizes are encoded in their content"
+    monkeypatch.setattr('briefcase.commands.create.can_generate_images', lambda: True)
+    monkeypatch.setattr(
+        'briefcase.commands.create.image_dimensions',
+        lambda path: tuple(int(value) for value in '{0}x{0}'.format(path.read_text()).split('x')[:2]),
+    )
+
+    def generate_image(source_path, width, suffix, cache_path, height=None):
+        cache_path.mkdir(parents=True, exist_ok=True)
+        output_path = cache_path / 'generated-{width}{suffix}'.format(width=width, suffix=suffix)
+        generated = not output_path.exists()
+        output_path.write_text(str(width))
+        return str(output_path), generated
+
+    generate = mock.MagicMock(side_effect=generate_image)
+    monkeypatch.setattr('briefcase.commands.create.generate_image', generate)
+
+    (create_command.base_path / 'images').mkdir()
+    return generate
+
+
+def create_image(path, width, height=None):
+    "Create an image whose content is its size; square, unless a height is given"
+    path.write_text(str(width) if height is None else '{width}x{height}'.format(width=width, height=height))
+
+
+def test_generate_from_largest(create_command, images, tmp_path):
+    "A missing size is generated from the largest available image"
+    create_image(tmp_path / 'images' / 'icon-64.png', 64)
+    create_image(tmp_path / 'images' / 'icon-1024.png', 1024)
+    create_image(tmp_path / 'images' / 'icon-512.png', 512)
+
+    image = create_command.resolve_image(
+        'application icon',
+        variant=None,
+        size='180',
+        source='images/icon',
+        target=tmp_path / 'bundle' / 'icon-180.png',
+    )
+
+    assert image == (
+        create_command.dot_briefcase_path / 'images' / 'generated-180.png',
+        tmp_path / 'bundle' / 'icon-180.png',
+        'images/icon-180.png (generated from images/icon-1024.png)',
+        '180px application icon',
+    )
+    images.assert_called_once_with(
+        tmp_path / 'images' / 'icon-1024.png',
+        180,
+        '.png',
+        create_command.dot_briefcase_path / 'images',
+        height=None,
+    )
+
+
+def test_generate_from_png(create_command, images, tmp_path):
+    "An image in a different format can be generated from a PNG master image"
+    create_image(tmp_path / 'images' / 'icon.png', 1024)
+
+    image = create_command.resolve_image(
+        'application icon',
+        variant='round',
+        size='48',
+        source={'round': 'images/icon'},
+        target=tmp_path / 'bundle' / 'icon-48.ico',
+    )
+
+    assert image[2] == 'images/icon-48.ico (generated from images/icon.png)'
+    images.assert_called_once_with(
+        tmp_path / 'images' / 'icon.png',
+        48,
+        '.ico',
+        create_command.dot_briefcase_path / 'images',
+        height=None,
+    )
+
+
+def test_existing_size_used(create_command, images, tmp_path):
+    "If the requested size exists, it isn't generated"
+    create_image(tmp_path / 'images' / 'icon-180.png', 180)
+    create_image(tmp_path / 'images' / 'icon-1024.png', 1024)
+
+    image = create_command.resolve_image(
+        'application icon',
+        variant=None,
+        size='180',
+        source='images/icon',
+        target=tmp_path / 'bundle' / 'icon-180.png',
+    )
+
+    assert image[0] == tmp_path / 'images' / 'icon-180.png'
+    images.assert_not_called()
+
+
+def test_no_upscaling(create_command, images, tmp_path):
+    "Images aren't generated from smaller images"
+    create_image(tmp_path / 'images' / 'icon-64.png', 64)
+
+    image = create_command.resolve_image(
+        'application icon',
+        variant=None,
+        size='180',
+        source='images/icon',
+        target=tmp_path / 'bundle' / 'icon-180.png',
+    )
+
+    assert image[0] == tmp_path / 'images' / 'icon-180.png'
+    images.assert_not_called()
+
+
+def test_pillow_not_installed(create_command, tmp_path, monkeypatch):
+    "If Pillow isn't installed, missing sizes aren't generated"
+    monkeypatch.setattr('briefcase.commands.create.can_generate_images', lambda: False)
+    (tmp_path / 'images').mkdir()
+    create_image(tmp_path / 'images' / 'icon-1024.png', 1024)
+
+    assert create_command.derive_image('images/icon', 180, '.png') is None
+
+
+def test_generated_images_cached(create_command, images, tmp_path):
+    "Generated images are recorded in the images cache"
+    create_image(tmp_path / 'images' / 'icon-1024.png', 1024)
+
+    create_command.derive_image('images/icon', 180, '.png')
+    create_command.derive_image('images/icon', 180, '.png')
+
+    stats = create_command.cache.stats('images')
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+
+def test_generate_width_and_height(create_command, images, tmp_path):
+    "An image with a width and height can be generated from an image that covers it"
+    create_image(tmp_path / 'images' / 'splash.png', 2048, 1024)
+    create_image(tmp_path / 'images' / 'splash-1200.png', 1200, 600)
+
+    image = create_command.resolve_image(
+        'splash image',
+        variant=None,
+        size='1024x768',
+        source='images/splash',
+        target=tmp_path / 'bundle' / 'splash-1024x768.png',
+    )
+
+    assert image[2] == 'images/splash-1024x768.png (generated from images/splash.png)'
+    images.assert_called_once_with(
+        tmp_path / 'images' / 'splash.png',
+        1024,
+        '.png',
+        create_command.dot_briefcase_path / 'images',
+        height=768,
+    )
+
+
+def test_generate_failure(create_command, images, tmp_path, capsys):
+    "If an image can't be generated, the default image is used"
+    create_image(tmp_path / 'images' / 'icon-1024.png', 1024)
+    images.side_effect = None
+    images.return_value = None
+
+    image = create_command.resolve_image(
+        'application icon',
+        variant=None,
+        size='180',
+        source='images/icon',
+        target=tmp_path / 'bundle' / 'icon-180.icns',
+    )
+
+    assert image[0] == tmp_path / 'images' / 'icon-180.icns'
+    assert capsys.readouterr().out == "Unable to generate a .icns image from images/icon-1024.png.\n"
@@ -0,0 +1,31 @@
+def test_download_plan(create_command, myapp):
+    "A support package is planned for each app"
+    plan = create_command.download_plan([myapp])
+
+    assert plan == [
+        (
+            'https://briefcase-support.org/python?platform=tester&version=3.X&arch=gothic',
+            create_command.dot_briefcase_path / 'support',
+        ),
+    ]
+
+
+def test_download_plan_pinned(create_command, myapp):
+    "If the app pins a support revision, the revision is in the planned URL"
+    myapp.support_revision = '42'
+
+    plan = create_command.download_plan([myapp])
+
+    assert plan == [
+        (
+            'https://briefcase-support.org/python?platform=tester&version=3.X&arch=gothic&revision=42',
+            create_command.dot_briefcase_path / 'support',
+        ),
+    ]
+
+
+def test_download_plan_local_support_package(create_command, myapp, tmp_path):
+    "A support package on the local filesystem doesn't need to be downloaded"
+    myapp.support_package = str(tmp_path / 'support.zip')
+
+    assert create_command.download_plan([myapp]) == []
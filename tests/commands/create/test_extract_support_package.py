@@ -0,0 +1,137 @@
+import hashlib
+import os
+import shutil
+import zipfile
+from unittest import mock
+
+import pytest
+
+
+def make_support_package(path, content='hello world'):
+    "Create a support package zipfile"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, 'w') as support_zip:
+        support_zip.writestr('internal/file.txt', data=content)
+    return path
+
+
+@pytest.fixture
+def support_file(create_command):
+    return make_support_package(
+        create_command.dot_briefcase_path / 'support' / 'Python-3.X-tester-support.b1.zip'
+    )
+
+
+@pytest.fixture
+def mock_download(create_command, support_file):
+    "Replace download_url with a mock that records the download in the index"
+    def download_url(url, download_path, extract_dir=None):
+        create_command.download_index.record(
+            url,
+            filename=support_file,
+            sha256=hashlib.sha256(support_file.read_bytes()).hexdigest(),
+        )
+        if extract_dir is not None:
+            shutil.unpack_archive(os.fsdecode(support_file), extract_dir=os.fsdecode(extract_dir))
+        return support_file
+
+    create_command.download_url = mock.MagicMock(side_effect=download_url)
+    return create_command.download_url
+
+
+def test_first_extraction(create_command, mock_download):
+    "A support package that hasn't been downloaded is unpacked as it downloads"
+    extracted_path = create_command.extract_support_package('https://example.com/support.zip')
+
+    # The support package was unpacked as part of the download
+    mock_download.assert_called_once_with(
+        url='https://example.com/support.zip',
+        download_path=create_command.dot_briefcase_path / 'support',
+        extract_dir=mock.ANY,
+    )
+
+    # The package has been extracted into the store,
+    # using a name derived from the package filename.
+    assert extracted_path.parent == create_command.dot_briefcase_path / 'support' / 'extracted'
+    assert extracted_path.name.startswith('Python-3.X-tester-support.b1-')
+    assert (extracted_path / 'internal' / 'file.txt').read_text() == 'hello world'
+
+    # There's no leftover staging content in the store
+    assert list(extracted_path.parent.iterdir()) == [extracted_path]
+
+    # The extraction was recorded as a cache miss.
+    assert create_command.cache.stats('extracted')['misses'] == 1
+
+
+def test_reuse_extraction(create_command, mock_download):
+    "A support package that has been extracted isn't extracted again"
+    first_path = create_command.extract_support_package('https://example.com/support.zip')
+
+    create_command.unpack_archive = mock.MagicMock()
+    mock_download.reset_mock()
+    second_path = create_command.extract_support_package('https://example.com/support.zip')
+
+    assert second_path == first_path
+    # The package was downloaded (or validated) without being unpacked.
+    mock_download.assert_called_once_with(
+        url='https://example.com/support.zip',
+        download_path=create_command.dot_briefcase_path / 'support',
+    )
+    create_command.unpack_archive.assert_not_called()
+    assert create_command.cache.stats('extracted')['hits'] == 1
+
+
+def test_downloaded_not_extracted(create_command, mock_download):
+    "A support package that has been downloaded but not extracted is unpacked from the cache"
+    first_path = create_command.extract_support_package('https://example.com/support.zip')
+    shutil.rmtree(first_path)
+
+    second_path = create_command.extract_support_package('https://example.com/support.zip')
+
+    assert second_path == first_path
+    assert (second_path / 'internal' / 'file.txt').read_text() == 'hello world'
+    assert list(second_path.parent.iterdir()) == [second_path]
+
+
+def test_changed_support_package(create_command, mock_download, support_file):
+    "If the content of a support package changes, it is extracted again"
+    first_path = create_command.extract_support_package('https://example.com/support.zip')
+
+    make_support_package(support_file, content='goodbye world')
+    second_path = create_command.extract_support_package('https://example.com/support.zip')
+
+    assert second_path != first_path
+    assert (second_path / 'internal' / 'file.txt').read_text() == 'goodbye world'
+
+
+def test_different_url(create_command, mock_download):
+    "The same content from a different URL is extracted separately"
+    first_path = create_command.extract_support_package('https://example.com/support.zip')
+    second_path = create_command.extract_support_package('https://example.com/support.zip?revision=2')
+
+    assert second_path != first_path
+
+
+def test_failed_extraction(create_command, mock_download, support_file):
+    "If extraction fails, no partial content is left in the store"
+    support_file.write_text("This isn't a zip file")
+
+    with pytest.raises(shutil.ReadError):
+        create_command.extract_support_package('https://example.com/support.zip')
+
+    store_path = create_command.dot_briefcase_path / 'support' / 'extracted'
+    assert list(store_path.iterdir()) == []
+
+
+def test_shared_between_apps(create_command, mock_download, myapp, support_path, tmp_path):
+    "The support package is installed into the bundle from the extracted store"
+    create_command.install_app_support_package(myapp)
+
+    assert (support_path / 'internal' / 'file.txt').read_text() == 'hello world'
+
+    # Modifying the installed package doesn't modify the store.
+    (support_path / 'internal' / 'file.txt').write_text('modified')
+    extracted_path = create_command.extract_support_package(
+        create_command.app_support_package_url(myapp)
+    )
+    assert (extracted_path / 'internal' / 'file.txt').read_text() == 'hello world'
@@ -11,6 +11,7 @@ from git import exc as git_exceptions
 from briefcase.commands.base import TemplateUnsupportedVersion
 from briefcase.commands.create import InvalidTemplateRepository
 from briefcase.exceptions import NetworkFailure
+from tests.utils import template_archive
 
 
 def full_context(extra):
@@ -46,11 +47,27 @@ def full_context(extra):
     return context
 
 
+def mock_template_repo(repo, hexsha='abc123'):
+    "Configure a mock template repository, with every branch at the same commit"
+    repo.remote.return_value.refs.__getitem__.return_value.commit.hexsha = hexsha
+    repo.archive.side_effect = template_archive({'cookiecutter.json': '{}'})
+    return repo
+
+
+def snapshot_path(create_command, name, hexsha='abc123'):
+    "The path of a snapshot of a template commit"
+    return os.fsdecode(create_command.home_path / '.cookiecutters' / '{name}-{hexsha}'.format(
+        name=name,
+        hexsha=hexsha,
+    ))
+
+
 def test_default_template(create_command, myapp):
     "Absent of other information, the default template is used"
     # There won't be a cookiecutter cache, so there won't be
     # a cache path (yet).
     create_command.git.Repo.side_effect = git_exceptions.NoSuchPathError
+    mock_template_repo(create_command.git.Repo.clone_from.return_value)
 
     # Generate the template.
     create_command.generate_app_template(myapp)
@@ -58,9 +75,18 @@ def test_default_template(create_command, myapp):
     # App's template has been set
     assert myapp.template == 'https://github.com/beeware/briefcase-tester-dummy-template.git'
 
-    # Cookiecutter was invoked with the expected template name and context.
-    create_command.cookiecutter.assert_called_once_with(
+    # A shallow clone of the template was made
+    create_command.git.Repo.clone_from.assert_called_once_with(
         'https://github.com/beeware/briefcase-tester-dummy-template.git',
+        Path.home() / '.cookiecutters' / 'briefcase-tester-dummy-template',
+        depth=1,
+        branch=create_command.python_version_tag,
+        single_branch=True,
+    )
+
+    # Cookiecutter was invoked with the path to a snapshot of the template
+    create_command.cookiecutter.assert_called_once_with(
+        snapshot_path(create_command, 'briefcase-tester-dummy-template'),
         no_input=True,
         checkout=create_command.python_version_tag,
         output_dir=os.fsdecode(create_command.platform_path),
@@ -76,6 +102,7 @@ def test_explicit_branch(create_command, myapp):
     branch = 'some_branch'
     myapp.template_branch = branch
     create_command.git.Repo.side_effect = git_exceptions.NoSuchPathError
+    mock_template_repo(create_command.git.Repo.clone_from.return_value)
 
     # Generate the template.
     create_command.generate_app_template(myapp)
@@ -83,9 +110,18 @@ def test_explicit_branch(create_command, myapp):
     # App's template has been set
     assert myapp.template == 'https://github.com/beeware/briefcase-tester-dummy-template.git'
 
-    # Cookiecutter was invoked with the expected template name and context.
-    create_command.cookiecutter.assert_called_once_with(
+    # A shallow clone of the template was made
+    create_command.git.Repo.clone_from.assert_called_once_with(
         'https://github.com/beeware/briefcase-tester-dummy-template.git',
+        Path.home() / '.cookiecutters' / 'briefcase-tester-dummy-template',
+        depth=1,
+        branch=branch,
+        single_branch=True,
+    )
+
+    # Cookiecutter was invoked with the path to a snapshot of the template
+    create_command.cookiecutter.assert_called_once_with(
+        snapshot_path(create_command, 'briefcase-tester-dummy-template'),
         no_input=True,
         checkout=branch,
         output_dir=os.fsdecode(create_command.platform_path),
@@ -101,6 +137,7 @@ def test_platform_exists(create_command, myapp):
     # There won't be a cookiecutter cache, so there won't be
     # a cache path (yet).
     create_command.git.Repo.side_effect = git_exceptions.NoSuchPathError
+    mock_template_repo(create_command.git.Repo.clone_from.return_value)
 
     # Create the platform directory
     create_command.platform_path.mkdir(parents=True)
@@ -111,9 +148,18 @@ def test_platform_exists(create_command, myapp):
     # App's template has been set
     assert myapp.template == 'https://github.com/beeware/briefcase-tester-dummy-template.git'
 
-    # Cookiecutter was invoked with the expected template name and context.
-    create_command.cookiecutter.assert_called_once_with(
+    # A shallow clone of the template was made
+    create_command.git.Repo.clone_from.assert_called_once_with(
         'https://github.com/beeware/briefcase-tester-dummy-template.git',
+        Path.home() / '.cookiecutters' / 'briefcase-tester-dummy-template',
+        depth=1,
+        branch=create_command.python_version_tag,
+        single_branch=True,
+    )
+
+    # Cookiecutter was invoked with the path to a snapshot of the template
+    create_command.cookiecutter.assert_called_once_with(
+        snapshot_path(create_command, 'briefcase-tester-dummy-template'),
         no_input=True,
         checkout=create_command.python_version_tag,
         output_dir=os.fsdecode(create_command.platform_path),
@@ -131,6 +177,7 @@ def test_explicit_repo_template(create_command, myapp):
     # There won't be a cookiecutter cache, so there won't be
     # a repo path (yet).
     create_command.git.Repo.side_effect = git_exceptions.NoSuchPathError
+    mock_template_repo(create_command.git.Repo.clone_from.return_value)
 
     # Generate the template.
     create_command.generate_app_template(myapp)
@@ -138,9 +185,18 @@ def test_explicit_repo_template(create_command, myapp):
     # App's template hasn't been changed
     assert myapp.template == 'https://example.com/magic/special-template.git'
 
-    # Cookiecutter was invoked with the expected template name and context.
-    create_command.cookiecutter.assert_called_once_with(
+    # A shallow clone of the template was made
+    create_command.git.Repo.clone_from.assert_called_once_with(
         'https://example.com/magic/special-template.git',
+        Path.home() / '.cookiecutters' / 'special-template',
+        depth=1,
+        branch=create_command.python_version_tag,
+        single_branch=True,
+    )
+
+    # Cookiecutter was invoked with the path to a snapshot of the template
+    create_command.cookiecutter.assert_called_once_with(
+        snapshot_path(create_command, 'special-template'),
         no_input=True,
         checkout=create_command.python_version_tag,
         output_dir=os.fsdecode(create_command.platform_path),
@@ -183,6 +239,10 @@ def test_offline_repo_template(create_command, myapp):
     # a repo path (yet).
     create_command.git.Repo.side_effect = git_exceptions.NoSuchPathError
 
+    # The template can't be cloned into the cache, so the URL is passed
+    # to cookiecutter.
+    create_command.git.Repo.clone_from.side_effect = git_exceptions.GitCommandError('git', 128)
+
     # Calling cookiecutter on a repository while offline causes a CalledProcessError
     create_command.cookiecutter.side_effect = subprocess.CalledProcessError(
         cmd=['git', 'clone', 'https://github.com/beeware/briefcase-tester-dummy-template.git'],
@@ -217,6 +277,10 @@ def test_invalid_repo_template(create_command, myapp):
     # a repo path (yet).
     create_command.git.Repo.side_effect = git_exceptions.NoSuchPathError
 
+    # The template can't be cloned into the cache, so the URL is passed
+    # to cookiecutter.
+    create_command.git.Repo.clone_from.side_effect = git_exceptions.GitCommandError('git', 128)
+
     # Calling cookiecutter on a URL that isn't a valid repository causes an error
     create_command.cookiecutter.side_effect = cookiecutter_exceptions.RepositoryNotFound
 
@@ -248,6 +312,10 @@ def test_missing_branch_template(create_command, myapp):
     # a repo path (yet).
     create_command.git.Repo.side_effect = git_exceptions.NoSuchPathError
 
+    # The template can't be cloned into the cache, so the URL is passed
+    # to cookiecutter.
+    create_command.git.Repo.clone_from.side_effect = git_exceptions.GitCommandError('git', 128)
+
     # Calling cookiecutter on a URL that doesn't have the requested branch
     # causes an error
     create_command.cookiecutter.side_effect = cookiecutter_exceptions.RepositoryCloneFailed
@@ -283,23 +351,25 @@ def test_cached_template(create_command, myapp):
     create_command.git.Repo.return_value = mock_repo
     mock_repo.remote.return_value = mock_remote
     mock_remote.refs.__getitem__.return_value = mock_remote_head
+    mock_repo.git.ls_remote.return_value = 'fedcba\trefs/heads/3.X\n'
+    mock_template_repo(mock_repo)
 
     # Generate the template.
     create_command.generate_app_template(myapp)
 
-    # The origin of the repo was fetched
-    mock_repo.remote.assert_called_once_with(name='origin')
-    mock_remote.fetch.assert_called_once_with()
+    # The branch had changed, so it was fetched
+    mock_repo.git.ls_remote.assert_called_once_with('origin', 'refs/heads/3.X')
+    mock_remote.fetch.assert_called_once_with('+refs/heads/3.X:refs/remotes/origin/3.X', depth=1)
 
-    # The remote head was checked out.
-    mock_remote_head.checkout.assert_called_once_with()
+    # The branch wasn't checked out in the cached template.
+    mock_remote_head.checkout.assert_not_called()
 
     # App's config template hasn't changed
     assert myapp.template == 'https://github.com/beeware/briefcase-tester-dummy-template.git'
 
-    # Cookiecutter was invoked with the path to the *cached* template name
+    # Cookiecutter was invoked with the path to a snapshot of the template
     create_command.cookiecutter.assert_called_once_with(
-        os.fsdecode(Path.home() / '.cookiecutters' / 'briefcase-tester-dummy-template'),
+        snapshot_path(create_command, 'briefcase-tester-dummy-template'),
         no_input=True,
         checkout=create_command.python_version_tag,
         output_dir=os.fsdecode(create_command.platform_path),
@@ -317,33 +387,35 @@ def test_cached_template_offline(create_command, myapp, capsys):
     mock_remote_head = mock.MagicMock()
 
     # Git returns a Repo, that repo can return a remote, and it has
-    # heads that can be accessed. However, calling fetch on the remote
-    # will cause a git error (error code 128).
+    # heads that can be accessed. However, contacting the template
+    # repository will cause a git error (error code 128).
     create_command.git.Repo.return_value = mock_repo
     mock_repo.remote.return_value = mock_remote
     mock_remote.refs.__getitem__.return_value = mock_remote_head
-    mock_remote.fetch.side_effect = git_exceptions.GitCommandError('git', 128)
+    mock_repo.git.ls_remote.return_value = 'fedcba\trefs/heads/3.X\n'
+    mock_template_repo(mock_repo)
+    mock_repo.git.ls_remote.side_effect = git_exceptions.GitCommandError('git', 128)
 
     # Generate the template.
     create_command.generate_app_template(myapp)
 
-    # An attempt to fetch the repo origin was made
-    mock_repo.remote.assert_called_once_with(name='origin')
-    mock_remote.fetch.assert_called_once_with()
+    # An attempt to contact the repo origin was made, so nothing was fetched
+    mock_repo.git.ls_remote.assert_called_once_with('origin', 'refs/heads/3.X')
+    mock_remote.fetch.assert_not_called()
 
     # A warning was raised to the user about the fetch problem
     output = capsys.readouterr().out
     assert "WARNING: Unable to update template (is your computer offline?)" in output
 
-    # The remote head was checked out.
-    mock_remote_head.checkout.assert_called_once_with()
+    # The branch wasn't checked out in the cached template.
+    mock_remote_head.checkout.assert_not_called()
 
     # App's config template hasn't changed
     assert myapp.template == 'https://github.com/beeware/briefcase-tester-dummy-template.git'
 
-    # Cookiecutter was invoked with the path to the *cached* template name
+    # Cookiecutter was invoked with the path to a snapshot of the template
     create_command.cookiecutter.assert_called_once_with(
-        os.fsdecode(Path.home() / '.cookiecutters' / 'briefcase-tester-dummy-template'),
+        snapshot_path(create_command, 'briefcase-tester-dummy-template'),
         no_input=True,
         checkout=create_command.python_version_tag,
         output_dir=os.fsdecode(create_command.platform_path),
@@ -369,3 +441,93 @@ def test_cached_missing_branch_template(create_command, myapp):
     # Generating the template under there conditions raises an error
     with pytest.raises(TemplateUnsupportedVersion):
         create_command.generate_app_template(myapp)
+
+
+@pytest.fixture
+def rendering_command(create_command, myapp):
+    "A create command whose template renders a small bundle"
+    create_command.git.Repo.return_value = mock_template_repo(mock.MagicMock())
+
+    def render(template, output_dir, extra_context, **kwargs):
+        bundle_path = Path(output_dir) / '{app_name}.bundle'.format(**extra_context)
+        (bundle_path / 'content').mkdir(parents=True)
+        (bundle_path / 'content' / 'version.txt').write_text(extra_context['version'])
+        (bundle_path / 'empty').mkdir()
+    create_command.cookiecutter.side_effect = render
+
+    return create_command
+
+
+def test_rendered_template_cached(rendering_command, myapp, capsys):
+    "A rendered template is cached, and reused when the same template is rendered with the same context"
+    rendering_command.generate_app_template(myapp)
+    bundle_path = rendering_command.bundle_path(myapp)
+
+    # The rendering has been stored in the cache.
+    entries = list((rendering_command.dot_briefcase_path / 'rendered').iterdir())
+    assert len(entries) == 1
+    assert (entries[0] / 'content' / 'version.txt').read_text() == '1.2.3'
+    assert rendering_command.cache.stats('rendered')['misses'] == 1
+
+    # Remove the bundle, and generate it again.
+    rendering_command.shutil.rmtree(bundle_path)
+    capsys.readouterr()
+    rendering_command.generate_app_template(myapp)
+
+    # The template wasn't rendered again.
+    assert rendering_command.cookiecutter.call_count == 1
+    assert "Using cached rendering of template (sha abc123)" in capsys.readouterr().out
+    assert (bundle_path / 'content' / 'version.txt').read_text() == '1.2.3'
+    assert (bundle_path / 'empty').is_dir()
+    assert rendering_command.cache.stats('rendered')['hits'] == 1
+
+    # The bundle is a copy of the cache entry, not a link to it.
+    (bundle_path / 'content' / 'version.txt').write_text('modified')
+    assert (entries[0] / 'content' / 'version.txt').read_text() == '1.2.3'
+
+
+def test_rendered_template_context_changed(rendering_command, myapp):
+    "If the context changes, the template is rendered again"
+    rendering_command.generate_app_template(myapp)
+    rendering_command.shutil.rmtree(rendering_command.bundle_path(myapp))
+
+    myapp.version = '1.2.4'
+    rendering_command.generate_app_template(myapp)
+
+    assert rendering_command.cookiecutter.call_count == 2
+    assert (rendering_command.bundle_path(myapp) / 'content' / 'version.txt').read_text() == '1.2.4'
+    assert len(list((rendering_command.dot_briefcase_path / 'rendered').iterdir())) == 2
+
+
+def test_rendered_template_revision_changed(rendering_command, myapp):
+    "If the template has a new commit, the template is rendered again"
+    rendering_command.generate_app_template(myapp)
+    rendering_command.shutil.rmtree(rendering_command.bundle_path(myapp))
+
+    mock_template_repo(rendering_command.git.Repo.return_value, hexsha='def456')
+    rendering_command.generate_app_template(myapp)
+
+    assert rendering_command.cookiecutter.call_count == 2
+
+
+def test_local_template_not_cached(rendering_command, myapp, tmp_path):
+    "Renderings of local templates aren't cached"
+    myapp.template = os.fsdecode(tmp_path / 'template')
+
+    rendering_command.generate_app_template(myapp)
+    rendering_command.shutil.rmtree(rendering_command.bundle_path(myapp))
+    rendering_command.generate_app_template(myapp)
+
+    assert rendering_command.cookiecutter.call_count == 2
+    assert not (rendering_command.dot_briefcase_path / 'rendered').exists()
+
+
+def test_rendered_template_not_cached_without_snapshot(rendering_command, myapp):
+    "If the template can't be cloned, the template is passed to cookiecutter, and the rendering isn't cached"
+    rendering_command.git.Repo.side_effect = git_exceptions.NoSuchPathError
+    rendering_command.git.Repo.clone_from.side_effect = git_exceptions.GitCommandError('git', 128)
+
+    rendering_command.generate_app_template(myapp)
+
+    assert rendering_command.cookiecutter.call_args.args[0] == myapp.template
+    assert not (rendering_command.dot_briefcase_path / 'rendered').exists()
@@ -1,3 +1,4 @@
+import os
 from unittest import mock
 
 import pytest
@@ -226,3 +227,54 @@ def test_replace_sources(create_command, myapp, tmp_path, app_path):
 
     # Metadata has been created
     assert_dist_info(app_path)
+
+
+def test_incremental_install(create_command, myapp, tmp_path, app_path, capsys):
+    "On a second install, only the sources that have changed are copied."
+    # Create the mock sources
+    # src /
+    #   first /
+    #     demo.py
+    #     stale.py
+    #     unchanged.py
+    demo_src = tmp_path / 'src' / 'first' / 'demo.py'
+    demo_src.parent.mkdir(parents=True)
+    with (demo_src).open('w') as f:
+        f.write("print('hello first')\n")
+    stale_src = tmp_path / 'src' / 'first' / 'stale.py'
+    with (stale_src).open('w') as f:
+        f.write("print('hello stale')\n")
+    unchanged_src = tmp_path / 'src' / 'first' / 'unchanged.py'
+    with (unchanged_src).open('w') as f:
+        f.write("print('hello unchanged')\n")
+
+    myapp.sources = ['src/first']
+
+    create_command.install_app_code(myapp)
+    assert "3 copied, 0 removed, 0 unchanged" in capsys.readouterr().out
+
+    # A manifest of the installed sources has been written.
+    assert create_command.sources_manifest_path(myapp).exists()
+
+    # Modify one source, and remove another.
+    with (demo_src).open('w') as f:
+        f.write("print('hello again, first')\n")
+    stat_result = demo_src.stat()
+    os.utime(demo_src, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1000000))
+    stale_src.unlink()
+
+    # Mark the unchanged file in the bundle, so we can tell it isn't copied.
+    with (app_path / 'first' / 'unchanged.py').open('a') as f:
+        f.write('# installed\n')
+
+    create_command.install_app_code(myapp)
+    assert "1 copied, 1 removed, 1 unchanged" in capsys.readouterr().out
+
+    with (app_path / 'first' / 'demo.py').open() as f:
+        assert f.read() == "print('hello again, first')\n"
+    assert not (app_path / 'first' / 'stale.py').exists()
+    with (app_path / 'first' / 'unchanged.py').open() as f:
+        assert f.read() == "print('hello unchanged')\n# installed\n"
+
+    # Metadata has been created
+    assert_dist_info(app_path)
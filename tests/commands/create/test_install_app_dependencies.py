@@ -1,22 +1,50 @@
+import json
 import subprocess
 import sys
+from copy import copy
 
 import pytest
 
-from briefcase.commands.create import DependencyInstallError
+from briefcase.commands.create import DependencyInstallError, ZipPackagesUnsupported
+
+
+def resolution_report(packages):
+    "Generate a pip installation report that resolves each package to version 1.0"
+    return {
+        'install': [
+            {
+                'metadata': {'name': package, 'version': '1.0'},
+                'download_info': {
+                    'url': 'https://example.com/{package}-1.0-py3-none-any.whl'.format(package=package),
+                    'archive_info': {'hashes': {'sha256': '{package}-hash'.format(package=package)}},
+                },
+            }
+            for package in packages
+        ]
+    }
 
 
 def create_installation_artefacts(app_packages_path, packages):
     """Utility method for generating a function that will mock installation artefacts.
 
-    Creates a function that when invoked, creates a dummy ``__init__.py``
-    and ``__main__.py`` for each package named in ``packages``.
+    Creates a function that when invoked as ``pip install``, creates a dummy
+    ``__init__.py`` and ``__main__.py`` for each package named in ``packages``.
+    When invoked as ``pip install --dry-run``, it writes a report resolving
+    the requirements to version 1.0 of each package.
 
     :param app_packages_path: The pathlib object where app packages will be installed
     :param packages: A list of package names to mock.
     :returns: A function that will create files to mock the named installed packages.
     """
     def _create_installation_artefacts(*args, **kwargs):
+        if args and '--dry-run' in args[0]:
+            report_path = [arg for arg in args[0] if arg.startswith('--report=')][0][len('--report='):]
+            with open(report_path, 'w') as f:
+                json.dump(resolution_report(packages), f)
+            return
+        if args and 'install' not in args[0]:
+            # Fetching wheels doesn't install anything.
+            return
         for package in packages:
             (app_packages_path / package).mkdir(parents=True)
             with (app_packages_path / package / '__init__.py').open('w') as f:
@@ -26,6 +54,15 @@ def create_installation_artefacts(app_packages_path, packages):
     return _create_installation_artefacts
 
 
+def pip_installs(create_command):
+    "Count the number of times ``pip install`` has been invoked to install packages"
+    return sum(
+        1
+        for call in create_command.subprocess.run.call_args_list
+        if 'install' in call.args[0] and '--dry-run' not in call.args[0]
+    )
+
+
 def test_no_requires(create_command, myapp, app_packages_path):
     "If an app has no requirements, install_app_dependencies is a no-op."
     myapp.requires = None
@@ -61,6 +98,8 @@ def test_valid_requires(create_command, myapp, app_packages_path):
             "--upgrade",
             "--no-user",
             '--target={}'.format(app_packages_path),
+            '--no-index',
+            '--find-links={}'.format(create_command.wheelhouse_path),
             'first',
             'second',
             'third',
@@ -84,15 +123,14 @@ def test_invalid_requires(create_command, myapp, app_packages_path):
     with pytest.raises(DependencyInstallError):
         create_command.install_app_dependencies(myapp)
 
-    # But the request to install was still made
+    # But the request to fetch the requirements was still made
     create_command.subprocess.run.assert_called_with(
         [
             sys.executable,
             "-m",
-            "pip", "install",
-            "--upgrade",
-            "--no-user",
-            '--target={}'.format(app_packages_path),
+            "pip", "wheel",
+            '--find-links={}'.format(create_command.wheelhouse_path),
+            '--wheel-dir={}'.format(create_command.wheelhouse_path),
             'does-not-exist',
         ],
         check=True,
@@ -114,15 +152,14 @@ def test_offline(create_command, myapp, app_packages_path):
     with pytest.raises(DependencyInstallError):
         create_command.install_app_dependencies(myapp)
 
-    # But the request to install was still made
+    # But the request to fetch the requirements was still made
     create_command.subprocess.run.assert_called_with(
         [
             sys.executable,
             "-m",
-            "pip", "install",
-            "--upgrade",
-            "--no-user",
-            '--target={}'.format(app_packages_path),
+            "pip", "wheel",
+            '--find-links={}'.format(create_command.wheelhouse_path),
+            '--wheel-dir={}'.format(create_command.wheelhouse_path),
             'first',
             'second',
             'third',
@@ -143,7 +180,7 @@ def test_install_dependencies(create_command, myapp, app_packages_path):
     # Install the dependencies
     create_command.install_app_dependencies(myapp)
 
-    # The request to install was made
+    # The request to install from the lock file was made
     create_command.subprocess.run.assert_called_with(
         [
             sys.executable,
@@ -152,9 +189,10 @@ def test_install_dependencies(create_command, myapp, app_packages_path):
             "--upgrade",
             "--no-user",
             '--target={}'.format(app_packages_path),
-            'first',
-            'second',
-            'third',
+            '--no-index',
+            '--find-links={}'.format(create_command.wheelhouse_path),
+            '--no-deps',
+            '--requirement={}'.format(create_command.bundle_path(myapp) / 'briefcase-requirements.txt'),
         ],
         check=True,
     )
@@ -191,9 +229,10 @@ def test_replace_existing_dependencies(create_command, myapp, app_packages_path)
             "--upgrade",
             "--no-user",
             '--target={}'.format(app_packages_path),
-            'first',
-            'second',
-            'third',
+            '--no-index',
+            '--find-links={}'.format(create_command.wheelhouse_path),
+            '--no-deps',
+            '--requirement={}'.format(create_command.bundle_path(myapp) / 'briefcase-requirements.txt'),
         ],
         check=True,
     )
@@ -209,3 +248,313 @@ def test_replace_existing_dependencies(create_command, myapp, app_packages_path)
     # The old app packages no longer exist.
     assert not (app_packages_path / 'old').exists()
     assert not (app_packages_path / 'ancient').exists()
+
+
+def test_dependencies_cached(create_command, myapp, app_packages_path):
+    "Installed dependencies are cached, and reused by a subsequent install"
+    myapp.requires = ['first', 'second']
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, myapp.requires)
+
+    # Install the dependencies
+    create_command.install_app_dependencies(myapp)
+    assert pip_installs(create_command) == 1
+
+    # A copy of the dependencies has been stored in the cache.
+    fingerprint = create_command.dependency_fingerprint(myapp)
+    cache_path = create_command.dot_briefcase_path / 'dependencies' / fingerprint
+    assert (cache_path / 'first' / '__main__.py').exists()
+    assert (cache_path / 'second' / '__main__.py').exists()
+
+    # Remove the installed dependencies, and install again.
+    create_command.shutil.rmtree(app_packages_path)
+    app_packages_path.mkdir()
+    create_command.install_app_dependencies(myapp)
+
+    # pip wasn't invoked again; the dependencies came from the cache.
+    assert pip_installs(create_command) == 1
+    assert (app_packages_path / 'first' / '__main__.py').exists()
+    assert (app_packages_path / 'second' / '__main__.py').exists()
+
+
+def test_dependencies_up_to_date(create_command, myapp, app_packages_path, capsys):
+    "If the bundle already has the current dependencies, nothing is installed"
+    myapp.requires = ['first', 'second']
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, myapp.requires)
+    create_command.install_app_dependencies(myapp)
+    capsys.readouterr()
+
+    # Mark the installed dependencies, so we can tell they aren't replaced.
+    (app_packages_path / 'first' / 'marker').write_text('installed')
+
+    create_command.install_app_dependencies(myapp)
+
+    assert capsys.readouterr().out == "Dependencies are up to date.\n"
+    assert pip_installs(create_command) == 1
+    assert (app_packages_path / 'first' / 'marker').exists()
+
+
+def test_dependencies_changed(create_command, myapp, app_packages_path):
+    "If the requirements change, the dependencies are reinstalled"
+    myapp.requires = ['first']
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, ['first'])
+    create_command.install_app_dependencies(myapp)
+
+    myapp.requires = ['second']
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, ['second'])
+    create_command.install_app_dependencies(myapp)
+
+    assert pip_installs(create_command) == 2
+    assert not (app_packages_path / 'first').exists()
+    assert (app_packages_path / 'second' / '__main__.py').exists()
+
+
+def test_dependencies_evicted(create_command, myapp, app_packages_path):
+    "If the cached dependencies have been removed from the cache, they are reinstalled"
+    myapp.requires = ['first']
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, ['first'])
+    create_command.install_app_dependencies(myapp)
+
+    # Evict the dependencies from the cache.
+    fingerprint = create_command.dependency_fingerprint(myapp)
+    create_command.shutil.rmtree(create_command.dot_briefcase_path / 'dependencies' / fingerprint)
+
+    create_command.install_app_dependencies(myapp)
+
+    assert pip_installs(create_command) == 2
+    assert (app_packages_path / 'first' / '__main__.py').exists()
+
+
+def test_local_dependencies_not_cached(create_command, myapp, app_packages_path):
+    "Dependencies that include local packages are always installed by pip"
+    myapp.requires = ['first', './local']
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, ['first', 'local'])
+    create_command.install_app_dependencies(myapp)
+
+    create_command.shutil.rmtree(app_packages_path)
+    app_packages_path.mkdir()
+    create_command.install_app_dependencies(myapp)
+
+    assert pip_installs(create_command) == 2
+    assert not (create_command.dot_briefcase_path / 'dependencies').exists()
+
+
+def test_failed_install_not_recorded(create_command, myapp, app_packages_path):
+    "If pip fails, the dependencies aren't recorded as installed"
+    myapp.requires = ['first']
+    create_command.subprocess.run.side_effect = subprocess.CalledProcessError(
+        cmd=['python', '-m', 'pip', '...'],
+        returncode=1
+    )
+
+    with pytest.raises(DependencyInstallError):
+        create_command.install_app_dependencies(myapp)
+
+    assert not create_command.dependencies_manifest_path(myapp).exists()
+
+
+def test_wheelhouse_used(create_command, myapp, app_packages_path):
+    "If the wheelhouse can satisfy the requirements, nothing is fetched"
+    myapp.requires = ['first']
+    create_command.wheelhouse_path.mkdir(parents=True)
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, ['first'])
+
+    create_command.install_app_dependencies(myapp)
+
+    # The requirements were resolved; then the wheelhouse was checked
+    # without using the network, and the requirements were installed from it.
+    calls = [call.args[0] for call in create_command.subprocess.run.call_args_list]
+    assert [call[3] for call in calls] == ['install', 'download', 'install']
+    assert '--dry-run' in calls[0]
+    assert '--no-index' in calls[1]
+    assert '--no-index' in calls[2]
+
+
+def test_local_dependencies_bypass_wheelhouse(create_command, myapp, app_packages_path):
+    "Requirements that include local packages are installed by pip as normal"
+    myapp.requires = ['first', './local']
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, ['first', 'local'])
+
+    create_command.install_app_dependencies(myapp)
+
+    create_command.subprocess.run.assert_called_once_with(
+        [
+            sys.executable,
+            "-m",
+            "pip", "install",
+            "--upgrade",
+            "--no-user",
+            '--target={}'.format(app_packages_path),
+            'first',
+            './local',
+        ],
+        check=True,
+    )
+
+
+def test_dependencies_locked(create_command, myapp, app_packages_path):
+    "Resolved dependencies are pinned by a lock file, which is used by subsequent installs"
+    myapp.requires = ['first', 'second']
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, myapp.requires)
+    create_command.install_app_dependencies(myapp)
+
+    lock_path = create_command.dependency_lock_path(myapp)
+    assert lock_path == (
+        create_command.base_path / 'briefcase-locks' / 'my-app-tester-{arch}-py{tag}.txt'.format(
+            arch=create_command.host_arch,
+            tag=create_command.python_version_tag,
+        )
+    )
+    content = lock_path.read_text()
+    assert '# requires: ["first", "second"]\n' in content
+    assert 'first==1.0 \\\n    --hash=sha256:first-hash\n' in content
+    assert 'second==1.0 \\\n    --hash=sha256:second-hash\n' in content
+
+    # Install again, without the dependency cache; the requirements
+    # aren't resolved again.
+    create_command.shutil.rmtree(create_command.dot_briefcase_path / 'dependencies')
+    create_command.subprocess.run.reset_mock()
+    create_command.install_app_dependencies(myapp)
+
+    assert not any(
+        '--dry-run' in call.args[0]
+        for call in create_command.subprocess.run.call_args_list
+    )
+    assert pip_installs(create_command) == 1
+
+
+def test_lock_outdated(create_command, myapp, app_packages_path):
+    "If the requirements change, the lock file is regenerated"
+    myapp.requires = ['first']
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, ['first'])
+    create_command.install_app_dependencies(myapp)
+
+    myapp.requires = ['second']
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, ['second'])
+    create_command.install_app_dependencies(myapp)
+
+    content = create_command.dependency_lock_path(myapp).read_text()
+    assert '# requires: ["second"]\n' in content
+    assert 'first' not in content
+    assert 'second==1.0' in content
+
+
+def test_lock_resolved_with_project(create_command, myapp, app_packages_path):
+    "The requirements are resolved consistently with the other apps in the project"
+    myapp.requires = ['first']
+    other = copy(myapp)
+    other.app_name = 'other-app'
+    other.requires = ['second']
+    create_command.apps = {'my-app': myapp, 'other-app': other}
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, ['first'])
+
+    create_command.install_app_dependencies(myapp)
+
+    resolutions = [
+        call.args[0]
+        for call in create_command.subprocess.run.call_args_list
+        if '--dry-run' in call.args[0]
+    ]
+    # The project was resolved as a whole; then the app was resolved,
+    # constrained by the project resolution.
+    assert len(resolutions) == 2
+    assert resolutions[0][-2:] == ['first', 'second']
+    assert resolutions[1][-1:] == ['first']
+    assert '--constraint={}'.format(
+        create_command.bundle_path(myapp) / 'briefcase-constraints.txt'
+    ) in resolutions[1]
+    # Temporary files have been removed.
+    assert not (create_command.bundle_path(myapp) / 'briefcase-constraints.txt').exists()
+    assert not (create_command.bundle_path(myapp) / 'briefcase-resolution.json').exists()
+
+
+def test_lock_unavailable(create_command, myapp, app_packages_path, capsys):
+    "If the requirements can't be locked, they are installed without a lock file"
+    myapp.requires = ['first']
+    install = create_installation_artefacts(app_packages_path, ['first'])
+
+    def no_report(*args, **kwargs):
+        # An old version of pip, that doesn't support installation reports.
+        if '--dry-run' in args[0]:
+            raise subprocess.CalledProcessError(cmd=args[0], returncode=2)
+        install(*args, **kwargs)
+    create_command.subprocess.run.side_effect = no_report
+
+    create_command.install_app_dependencies(myapp)
+
+    assert 'Unable to lock dependencies' in capsys.readouterr().out
+    assert not create_command.dependency_lock_path(myapp).exists()
+    assert create_command.subprocess.run.call_args.args[0][-1] == 'first'
+    assert (app_packages_path / 'first' / '__main__.py').exists()
+
+
+def test_dependencies_pruned(create_command, myapp, app_packages_path):
+    "If pruning is enabled, installed dependencies are pruned before they are cached"
+    myapp.requires = ['first']
+    myapp.prune = True
+
+    install = create_installation_artefacts(app_packages_path, ['first'])
+
+    def install_with_tests(*args, **kwargs):
+        install(*args, **kwargs)
+        if 'install' in args[0] and '--dry-run' not in args[0]:
+            (app_packages_path / 'first' / 'tests').mkdir()
+            (app_packages_path / 'first' / 'tests' / 'test_first.py').write_text('')
+    create_command.subprocess.run.side_effect = install_with_tests
+
+    create_command.install_app_dependencies(myapp)
+
+    assert (app_packages_path / 'first' / '__main__.py').exists()
+    assert not (app_packages_path / 'first' / 'tests').exists()
+    cache_path = create_command.dot_briefcase_path / 'dependencies' / create_command.dependency_fingerprint(myapp)
+    assert (cache_path / 'first' / '__main__.py').exists()
+    assert not (cache_path / 'first' / 'tests').exists()
+
+    # Changing the pruning configuration changes the fingerprint.
+    fingerprint = create_command.dependency_fingerprint(myapp)
+    myapp.prune_patterns = ['**/*.txt']
+    assert create_command.dependency_fingerprint(myapp) != fingerprint
+
+
+def test_bytecode_ignored_when_up_to_date(create_command, myapp, app_packages_path, capsys):
+    "Bytecode compiled after the dependencies were installed doesn't invalidate them"
+    myapp.requires = ['first']
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, ['first'])
+    create_command.install_app_dependencies(myapp)
+    capsys.readouterr()
+
+    (app_packages_path / '__pycache__').mkdir()
+    create_command.install_app_dependencies(myapp)
+
+    assert capsys.readouterr().out == "Dependencies are up to date.\n"
+
+
+def test_dependencies_packed(create_command, myapp, app_packages_path):
+    "If packing is enabled, installed dependencies are packed before they are cached"
+    myapp.requires = ['first']
+    myapp.zip_packages = True
+    create_command._load_path_index(myapp)['app_packages_site_dir'] = True
+    create_command.subprocess.run.side_effect = create_installation_artefacts(app_packages_path, ['first'])
+
+    create_command.install_app_dependencies(myapp)
+
+    assert not (app_packages_path / 'first').exists()
+    assert (app_packages_path / 'briefcase-packages.zip').exists()
+    cache_path = create_command.dot_briefcase_path / 'dependencies' / create_command.dependency_fingerprint(myapp)
+    assert (cache_path / 'briefcase-packages.zip').exists()
+    assert (cache_path / 'briefcase-packages.pth').exists()
+
+    # Packing changes the fingerprint.
+    fingerprint = create_command.dependency_fingerprint(myapp)
+    myapp.zip_packages = False
+    assert create_command.dependency_fingerprint(myapp) != fingerprint
+
+
+def test_zip_packages_unsupported(create_command, myapp, app_packages_path):
+    "If the template doesn't support packed dependencies, nothing is installed"
+    myapp.requires = ['first']
+    myapp.zip_packages = True
+
+    with pytest.raises(ZipPackagesUnsupported):
+        create_command.install_app_dependencies(myapp)
+
+    create_command.subprocess.run.assert_not_called()
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 from briefcase.config import AppConfig
@@ -17,14 +18,14 @@ def test_no_resources(create_command):
     # Prime the path index with no targets
     create_command._path_index = {myapp: {}}
 
-    install_image = mock.MagicMock()
-    create_command.install_image = install_image
+    resolve_image = mock.MagicMock(return_value=None)
+    create_command.resolve_image = resolve_image
 
     # Install app resources
     create_command.install_app_resources(myapp)
 
-    # No icons, splash image or document types, so no calls to install images
-    install_image.assert_not_called()
+    # No icons, splash image or document types, so no images to resolve
+    resolve_image.assert_not_called()
 
 
 def test_icon_target(create_command, tmp_path):
@@ -49,14 +50,14 @@ def test_icon_target(create_command, tmp_path):
         }
     }
 
-    install_image = mock.MagicMock()
-    create_command.install_image = install_image
+    resolve_image = mock.MagicMock(return_value=None)
+    create_command.resolve_image = resolve_image
 
     # Install app resources
     create_command.install_app_resources(myapp)
 
-    # 2 calls to install icons will be made
-    install_image.assert_has_calls([
+    # 2 calls to resolve icons will be made
+    resolve_image.assert_has_calls([
         mock.call(
             'application icon',
             source='images/icon',
@@ -102,14 +103,14 @@ def test_icon_variant_target(create_command, tmp_path):
         }
     }
 
-    install_image = mock.MagicMock()
-    create_command.install_image = install_image
+    resolve_image = mock.MagicMock(return_value=None)
+    create_command.resolve_image = resolve_image
 
     # Install app resources
     create_command.install_app_resources(myapp)
 
-    # 3 calls to install icons will be made
-    install_image.assert_has_calls([
+    # 3 calls to resolve icons will be made
+    resolve_image.assert_has_calls([
         mock.call(
             'application icon',
             source={'round': 'images/round', 'square': 'images/square'},
@@ -156,14 +157,14 @@ def test_splash_target(create_command, tmp_path):
         }
     }
 
-    install_image = mock.MagicMock()
-    create_command.install_image = install_image
+    resolve_image = mock.MagicMock(return_value=None)
+    create_command.resolve_image = resolve_image
 
     # Install app resources
     create_command.install_app_resources(myapp)
 
-    # 2 calls to install splash images will be made
-    install_image.assert_has_calls([
+    # 2 calls to resolve splash images will be made
+    resolve_image.assert_has_calls([
         mock.call(
             'splash image',
             source='images/splash',
@@ -209,14 +210,14 @@ def test_splash_variant_target(create_command, tmp_path):
         }
     }
 
-    install_image = mock.MagicMock()
-    create_command.install_image = install_image
+    resolve_image = mock.MagicMock(return_value=None)
+    create_command.resolve_image = resolve_image
 
     # Install app resources
     create_command.install_app_resources(myapp)
 
-    # 3 calls to install splashes will be made
-    install_image.assert_has_calls([
+    # 3 calls to resolve splashes will be made
+    resolve_image.assert_has_calls([
         mock.call(
             'splash image',
             source={'portrait': 'images/portrait', 'landscape': 'images/landscape'},
@@ -275,14 +276,14 @@ def test_doctype_icon_target(create_command, tmp_path):
         }
     }
 
-    install_image = mock.MagicMock()
-    create_command.install_image = install_image
+    resolve_image = mock.MagicMock(return_value=None)
+    create_command.resolve_image = resolve_image
 
     # Install app resources
     create_command.install_app_resources(myapp)
 
-    # 2 calls to install doctype icon images will be made
-    install_image.assert_has_calls([
+    # 2 calls to resolve doctype icon images will be made
+    resolve_image.assert_has_calls([
         mock.call(
             'icon for .mydoc documents',
             source='images/mydoc-icon',
@@ -305,3 +306,88 @@ def test_doctype_icon_target(create_command, tmp_path):
             target=tmp_path / 'tester/my-app.bundle/path/to/other-icon-20.png'
         ),
     ], any_order=True)
+
+
+def test_unchanged_images_skipped(create_command, tmp_path, capsys, monkeypatch):
+    "Images whose target already matches the source aren't copied again"
+    monkeypatch.setattr('briefcase.commands.create.can_generate_images', lambda: False)
+    myapp = AppConfig(
+        app_name='my-app',
+        formal_name='My App',
+        bundle='com.example',
+        version='1.2.3',
+        description='This is a simple app',
+        sources=['src/my_app'],
+        icon='images/icon',
+        splash='images/splash',
+    )
+    create_command._path_index = {
+        myapp: {
+            'icon': {
+                '10': 'path/to/icon-10.png',
+                '20': 'path/to/icon-20.png',
+            },
+            'splash': 'path/to/splash.png',
+        }
+    }
+    (tmp_path / 'images').mkdir()
+    (tmp_path / 'images' / 'icon-10.png').write_bytes(b'icon 10')
+    (tmp_path / 'images' / 'icon-20.png').write_bytes(b'icon 20')
+    bundle_path = tmp_path / 'tester' / 'my-app.bundle'
+
+    create_command.install_app_resources(myapp)
+
+    assert capsys.readouterr().out == (
+        "Installing images/icon-10.png as 10px application icon...\n"
+        "Installing images/icon-20.png as 20px application icon...\n"
+        "Unable to find images/splash.png for splash image; using default\n"
+        "2 image(s) installed, 0 already up to date, 1 not found.\n"
+        "Install Pillow (`pip install Pillow`) to generate missing image sizes "
+        "from the largest image that is available.\n"
+    )
+    assert (bundle_path / 'path' / 'to' / 'icon-20.png').read_bytes() == b'icon 20'
+
+    # Change one of the source images, and install again.
+    (tmp_path / 'images' / 'icon-20.png').write_bytes(b'new icon 20')
+    create_command.install_app_resources(myapp)
+
+    assert capsys.readouterr().out == (
+        "Installing images/icon-20.png as 20px application icon...\n"
+        "Unable to find images/splash.png for splash image; using default\n"
+        "1 image(s) installed, 1 already up to date, 1 not found.\n"
+        "Install Pillow (`pip install Pillow`) to generate missing image sizes "
+        "from the largest image that is available.\n"
+    )
+    assert (bundle_path / 'path' / 'to' / 'icon-20.png').read_bytes() == b'new icon 20'
+
+
+def test_images_copied_concurrently(create_command, tmp_path):
+    "When several images are installed, they are copied by a pool of threads"
+    myapp = AppConfig(
+        app_name='my-app',
+        formal_name='My App',
+        bundle='com.example',
+        version='1.2.3',
+        description='This is a simple app',
+        sources=['src/my_app'],
+        icon='images/icon',
+    )
+    create_command._path_index = {
+        myapp: {
+            'icon': {
+                str(size): 'path/to/icon-{size}.png'.format(size=size)
+                for size in range(10, 20)
+            },
+        }
+    }
+    (tmp_path / 'images').mkdir()
+    for size in range(10, 20):
+        (tmp_path / 'images' / 'icon-{size}.png'.format(size=size)).write_text(str(size))
+
+    with mock.patch('briefcase.commands.create.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as executor:
+        create_command.install_app_resources(myapp)
+
+    executor.assert_called_once()
+    target_path = tmp_path / 'tester' / 'my-app.bundle' / 'path' / 'to'
+    for size in range(10, 20):
+        assert (target_path / 'icon-{size}.png'.format(size=size)).read_text() == str(size)
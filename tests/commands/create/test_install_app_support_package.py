@@ -1,4 +1,5 @@
 import os
+import shutil
 import zipfile
 from unittest import mock
 
@@ -9,6 +10,15 @@ from briefcase.commands.create import InvalidSupportPackage, MissingSupportPacka
 from briefcase.exceptions import MissingNetworkResourceError, NetworkFailure
 
 
+def mock_download(support_file):
+    "Create a mock download_url that unpacks a local file"
+    def download_url(url, download_path, extract_dir):
+        shutil.unpack_archive(os.fsdecode(support_file), extract_dir=os.fsdecode(extract_dir))
+        return support_file
+
+    return mock.MagicMock(side_effect=download_url)
+
+
 def test_install_app_support_package(create_command, myapp, tmp_path, support_path):
     "A support package can be downloaded and unpacked where it is needed"
     # Write a temporary support zip file
@@ -16,8 +26,8 @@ def test_install_app_support_package(create_command, myapp, tmp_path, support_pa
     with zipfile.ZipFile(support_file, 'w') as support_zip:
         support_zip.writestr('internal/file.txt', data='hello world')
 
-    # Modify download_url to return the temp zipfile
-    create_command.download_url = mock.MagicMock(return_value=support_file)
+    # Modify download_url to unpack the temp zipfile
+    create_command.download_url = mock_download(support_file)
 
     # Install the support package
     create_command.install_app_support_package(myapp)
@@ -26,6 +36,7 @@ def test_install_app_support_package(create_command, myapp, tmp_path, support_pa
     create_command.download_url.assert_called_with(
         download_path=create_command.dot_briefcase_path / 'support',
         url='https://briefcase-support.org/python?platform=tester&version=3.X&arch=gothic',
+        extract_dir=mock.ANY,
     )
 
     # Confirm that the full path to the support file
@@ -43,8 +54,8 @@ def test_install_pinned_app_support_package(create_command, myapp, tmp_path, sup
     with zipfile.ZipFile(support_file, 'w') as support_zip:
         support_zip.writestr('internal/file.txt', data='hello world')
 
-    # Modify download_url to return the temp zipfile
-    create_command.download_url = mock.MagicMock(return_value=support_file)
+    # Modify download_url to unpack the temp zipfile
+    create_command.download_url = mock_download(support_file)
 
     # Install the support package
     create_command.install_app_support_package(myapp)
@@ -53,6 +64,7 @@ def test_install_pinned_app_support_package(create_command, myapp, tmp_path, sup
     create_command.download_url.assert_called_with(
         download_path=create_command.dot_briefcase_path / 'support',
         url='https://briefcase-support.org/python?platform=tester&version=3.X&arch=gothic&revision=42',
+        extract_dir=mock.ANY,
     )
 
     # Confirm that the full path to the support file
@@ -86,7 +98,7 @@ def test_install_custom_app_support_package_file(create_command, myapp, tmp_path
     assert (support_path / 'internal' / 'file.txt').exists()
 
 
-def test_support_package_url_with_invalid_custom_support_packge_url(create_command, myapp):
+def test_support_package_url_with_invalid_custom_support_packge_url(create_command, myapp, support_path):
     "Invalid URL for a custom support package raises MissingNetworkResourceError"
 
     # Provide an custom support URL
@@ -106,10 +118,11 @@ def test_support_package_url_with_invalid_custom_support_packge_url(create_comma
     create_command.download_url.assert_called_with(
         download_path=create_command.dot_briefcase_path / 'support',
         url=url,
+        extract_dir=mock.ANY,
     )
 
 
-def test_support_package_url_with_unsupported_platform(create_command, myapp):
+def test_support_package_url_with_unsupported_platform(create_command, myapp, support_path):
     "An unsupported platform raises MissingSupportPackage"
     # Set the host architecture to something unsupported
     create_command.host_arch = 'unknown'
@@ -129,6 +142,7 @@ def test_support_package_url_with_unsupported_platform(create_command, myapp):
     create_command.download_url.assert_called_with(
         download_path=create_command.dot_briefcase_path / 'support',
         url='https://briefcase-support.org/python?platform=tester&version=3.X&arch=unknown',
+        extract_dir=mock.ANY,
     )
 
 
@@ -142,8 +156,8 @@ def test_install_custom_app_support_package_url(create_command, myapp, tmp_path,
     with zipfile.ZipFile(support_file, 'w') as support_zip:
         support_zip.writestr('internal/file.txt', data='hello world')
 
-    # Modify download_url to return the temp zipfile
-    create_command.download_url = mock.MagicMock(return_value=support_file)
+    # Modify download_url to unpack the temp zipfile
+    create_command.download_url = mock_download(support_file)
 
     # Install the support package
     create_command.install_app_support_package(myapp)
@@ -152,6 +166,7 @@ def test_install_custom_app_support_package_url(create_command, myapp, tmp_path,
     create_command.download_url.assert_called_with(
         download_path=create_command.dot_briefcase_path / 'support',
         url='https://example.com/custom/support.zip',
+        extract_dir=mock.ANY,
     )
 
     # Confirm that the full path to the support file
@@ -172,8 +187,8 @@ def test_install_pinned_custom_app_support_package_url(create_command, myapp, tm
     with zipfile.ZipFile(support_file, 'w') as support_zip:
         support_zip.writestr('internal/file.txt', data='hello world')
 
-    # Modify download_url to return the temp zipfile
-    create_command.download_url = mock.MagicMock(return_value=support_file)
+    # Modify download_url to unpack the temp zipfile
+    create_command.download_url = mock_download(support_file)
 
     # Install the support package
     create_command.install_app_support_package(myapp)
@@ -182,6 +197,7 @@ def test_install_pinned_custom_app_support_package_url(create_command, myapp, tm
     create_command.download_url.assert_called_with(
         download_path=create_command.dot_briefcase_path / 'support',
         url='https://example.com/custom/support.zip?revision=42',
+        extract_dir=mock.ANY,
     )
 
     # Confirm that the full path to the support file
@@ -202,8 +218,8 @@ def test_install_pinned_custom_app_support_package_url_with_args(create_command,
     with zipfile.ZipFile(support_file, 'w') as support_zip:
         support_zip.writestr('internal/file.txt', data='hello world')
 
-    # Modify download_url to return the temp zipfile
-    create_command.download_url = mock.MagicMock(return_value=support_file)
+    # Modify download_url to unpack the temp zipfile
+    create_command.download_url = mock_download(support_file)
 
     # Install the support package
     create_command.install_app_support_package(myapp)
@@ -212,6 +228,7 @@ def test_install_pinned_custom_app_support_package_url_with_args(create_command,
     create_command.download_url.assert_called_with(
         download_path=create_command.dot_briefcase_path / 'support',
         url='https://example.com/custom/support.zip?cool=Yes&revision=42',
+        extract_dir=mock.ANY,
     )
 
     # Confirm that the full path to the support file
@@ -237,8 +254,8 @@ def test_invalid_support_package(create_command, myapp, tmp_path, support_path):
     with open(support_file, 'w') as bad_support_zip:
         bad_support_zip.write("This isn't a zip file")
 
-    # Make the download URL return the temp file
-    create_command.download_url = mock.MagicMock(return_value=support_file)
+    # Make the download URL unpack the temp file
+    create_command.download_url = mock_download(support_file)
 
     # Installing the bad support package raises an error
     with pytest.raises(InvalidSupportPackage):
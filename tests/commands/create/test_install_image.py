@@ -3,7 +3,7 @@ from unittest import mock
 
 def test_no_source(create_command, tmp_path):
     "If the app doesn't define a source, no image is installed"
-    create_command.shutil = mock.MagicMock()
+    create_command.copier = mock.MagicMock()
 
     # Try to install the image from no source.
     out_path = tmp_path / 'output.png'
@@ -16,12 +16,12 @@ def test_no_source(create_command, tmp_path):
     )
 
     # No file was installed.
-    create_command.shutil.copy.assert_not_called()
+    create_command.copier.copy.assert_not_called()
 
 
 def test_no_source_with_size(create_command, tmp_path):
     "If the app doesn't define a source, and a size is requested, no image is installed"
-    create_command.shutil = mock.MagicMock()
+    create_command.copier = mock.MagicMock()
 
     # Try to install the image from no source.
     out_path = tmp_path / 'output.png'
@@ -34,12 +34,12 @@ def test_no_source_with_size(create_command, tmp_path):
     )
 
     # No file was installed.
-    create_command.shutil.copy.assert_not_called()
+    create_command.copier.copy.assert_not_called()
 
 
 def test_no_requested_size(create_command, tmp_path, capsys):
     "If the app specifies a no-size image, an un-annotated image is used."
-    create_command.shutil = mock.MagicMock()
+    create_command.copier = mock.MagicMock()
 
     # Create the source image
     source_file = tmp_path / 'input' / 'original.png'
@@ -61,7 +61,7 @@ def test_no_requested_size(create_command, tmp_path, capsys):
     assert capsys.readouterr().out == "Installing input/original.png as sample image...\n"
 
     # The file was copied into position
-    create_command.shutil.copy.assert_called_with(
+    create_command.copier.copy.assert_called_with(
         create_command.base_path / 'input' / 'original.png',
         out_path,
     )
@@ -69,8 +69,8 @@ def test_no_requested_size(create_command, tmp_path, capsys):
 
 def test_no_requested_size_invalid_path(create_command, tmp_path, capsys):
     "If the app specifies an no-size image that doesn't exist, an error is raised."
-    create_command.shutil = mock.MagicMock()
-    create_command.shutil.copy.side_effect = FileNotFoundError
+    create_command.copier = mock.MagicMock()
+    create_command.copier.copy.side_effect = FileNotFoundError
 
     # Try to install the image
     out_path = tmp_path / 'output.png'
@@ -88,12 +88,12 @@ def test_no_requested_size_invalid_path(create_command, tmp_path, capsys):
     )
 
     # The file was not copied
-    assert create_command.shutil.copy.call_count == 0
+    assert create_command.copier.copy.call_count == 0
 
 
 def test_requested_size(create_command, tmp_path, capsys):
     "If the app specifies a sized image, an anoated image filename is used."
-    create_command.shutil = mock.MagicMock()
+    create_command.copier = mock.MagicMock()
 
     # Create the source image
     source_file = tmp_path / 'input' / 'original-3742.png'
@@ -115,7 +115,7 @@ def test_requested_size(create_command, tmp_path, capsys):
     assert capsys.readouterr().out == "Installing input/original-3742.png as 3742px sample image...\n"
 
     # The file was copied into position
-    create_command.shutil.copy.assert_called_with(
+    create_command.copier.copy.assert_called_with(
         create_command.base_path / 'input' / 'original-3742.png',
         out_path,
     )
@@ -123,8 +123,8 @@ def test_requested_size(create_command, tmp_path, capsys):
 
 def test_requested_size_invalid_path(create_command, tmp_path, capsys):
     "If the app specifies an sized image that doesn't exist, an error is raised."
-    create_command.shutil = mock.MagicMock()
-    create_command.shutil.copy.side_effect = FileNotFoundError
+    create_command.copier = mock.MagicMock()
+    create_command.copier.copy.side_effect = FileNotFoundError
 
     # Try to install the image
     out_path = tmp_path / 'output.png'
@@ -142,12 +142,12 @@ def test_requested_size_invalid_path(create_command, tmp_path, capsys):
     )
 
     # The file was not copied
-    assert create_command.shutil.copy.call_count == 0
+    assert create_command.copier.copy.call_count == 0
 
 
 def test_variant_with_no_requested_size(create_command, tmp_path, capsys):
     "If the app specifies a variant with no size, the variant is used unsized."
-    create_command.shutil = mock.MagicMock()
+    create_command.copier = mock.MagicMock()
 
     # Create the source image
     source_file = tmp_path / 'input' / 'original.png'
@@ -171,7 +171,7 @@ def test_variant_with_no_requested_size(create_command, tmp_path, capsys):
     assert capsys.readouterr().out == "Installing input/original.png as round sample image...\n"
 
     # The file was copied into position
-    create_command.shutil.copy.assert_called_with(
+    create_command.copier.copy.assert_called_with(
         create_command.base_path / 'input' / 'original.png',
         out_path,
     )
@@ -180,7 +180,7 @@ def test_variant_with_no_requested_size(create_command, tmp_path, capsys):
 def test_variant_without_variant_source_and_no_requested_size(create_command, tmp_path, capsys):
     """If the template specifies a variant with no size, but app doesn't have
     variants, a message is reported."""
-    create_command.shutil = mock.MagicMock()
+    create_command.copier = mock.MagicMock()
 
     # Create the source image
     source_file = tmp_path / 'input' / 'original.png'
@@ -202,12 +202,12 @@ def test_variant_without_variant_source_and_no_requested_size(create_command, tm
     assert capsys.readouterr().out == "Unable to find round variant for sample image; using default\n"
 
     # No file was installed.
-    create_command.shutil.copy.assert_not_called()
+    create_command.copier.copy.assert_not_called()
 
 
 def test_unknown_variant_with_no_requested_size(create_command, tmp_path, capsys):
     "If the app specifies an unknown variant, an message is reported."
-    create_command.shutil = mock.MagicMock()
+    create_command.copier = mock.MagicMock()
 
     # Create the source image
     source_file = tmp_path / 'input' / 'original.png'
@@ -231,12 +231,12 @@ def test_unknown_variant_with_no_requested_size(create_command, tmp_path, capsys
     assert capsys.readouterr().out == "Unable to find unknown variant for sample image; using default\n"
 
     # No file was installed.
-    create_command.shutil.copy.assert_not_called()
+    create_command.copier.copy.assert_not_called()
 
 
 def test_variant_with_size(create_command, tmp_path, capsys):
     "If the app specifies a variant with a size, the sized variant is used."
-    create_command.shutil = mock.MagicMock()
+    create_command.copier = mock.MagicMock()
 
     # Create the source image
     source_file = tmp_path / 'input' / 'original-3742.png'
@@ -263,7 +263,7 @@ def test_variant_with_size(create_command, tmp_path, capsys):
     )
 
     # The file was copied into position
-    create_command.shutil.copy.assert_called_with(
+    create_command.copier.copy.assert_called_with(
         create_command.base_path / 'input' / 'original-3742.png',
         out_path,
     )
@@ -272,7 +272,7 @@ def test_variant_with_size(create_command, tmp_path, capsys):
 def test_variant_with_size_without_variants(create_command, tmp_path, capsys):
     """If the app specifies a variant with a size, but no variants are specified,
     a message is output."""
-    create_command.shutil = mock.MagicMock()
+    create_command.copier = mock.MagicMock()
 
     # Create the source image
     source_file = tmp_path / 'input' / 'original-3742.png'
@@ -297,12 +297,12 @@ def test_variant_with_size_without_variants(create_command, tmp_path, capsys):
     )
 
     # No file was installed.
-    create_command.shutil.copy.assert_not_called()
+    create_command.copier.copy.assert_not_called()
 
 
 def test_unsized_variant(create_command, tmp_path, capsys):
     "If the app specifies an unsized variant, it is used."
-    create_command.shutil = mock.MagicMock()
+    create_command.copier = mock.MagicMock()
 
     # Create the source image
     source_file = tmp_path / 'input' / 'original.png'
@@ -331,7 +331,7 @@ def test_unsized_variant(create_command, tmp_path, capsys):
     )
 
     # The file was copied into position
-    create_command.shutil.copy.assert_called_with(
+    create_command.copier.copy.assert_called_with(
         create_command.base_path / 'input' / 'original.png',
         out_path,
     )
@@ -0,0 +1,73 @@
+import zipfile
+
+import pytest
+
+from briefcase.commands.create import ZipPackagesUnsupported
+
+
+def create_file(path, content=''):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def test_pack_disabled(create_command, myapp, app_packages_path, capsys):
+    "If packing isn't enabled, nothing is packed"
+    create_file(app_packages_path / 'first' / '__init__.py')
+
+    create_command.pack_app_packages(myapp)
+
+    assert (app_packages_path / 'first' / '__init__.py').exists()
+    assert not (app_packages_path / 'briefcase-packages.zip').exists()
+    assert capsys.readouterr().out == ''
+
+
+def test_pack(create_command, myapp, app_packages_path, capsys):
+    "Pure-Python packages are packed, and packages left on disk are reported"
+    myapp.zip_packages = True
+    create_command._load_path_index(myapp)['app_packages_site_dir'] = True
+    create_file(app_packages_path / 'first' / '__init__.py')
+    create_file(app_packages_path / 'second' / '__init__.py')
+    create_file(app_packages_path / 'second' / '_native.pyd')
+
+    create_command.pack_app_packages(myapp)
+
+    output = capsys.readouterr().out
+    assert output.startswith(
+        "Packing installed dependencies into briefcase-packages.zip...\n"
+        "Packed 1 package(s) into briefcase-packages.zip ("
+    )
+    assert output.endswith(
+        "The following packages were left on disk:\n"
+        " - second: contains native extensions\n"
+    )
+    assert not (app_packages_path / 'first').exists()
+    assert (app_packages_path / 'second' / '_native.pyd').exists()
+    with zipfile.ZipFile(app_packages_path / 'briefcase-packages.zip') as archive:
+        assert 'first/__init__.py' in archive.namelist()
+
+
+def test_pack_nothing(create_command, myapp, app_packages_path, capsys):
+    "If no package can be packed, the user is told"
+    myapp.zip_packages = True
+    create_command._load_path_index(myapp)['app_packages_site_dir'] = True
+    create_file(app_packages_path / 'first' / 'module.py')
+
+    create_command.pack_app_packages(myapp)
+
+    assert capsys.readouterr().out == (
+        "Packing installed dependencies into briefcase-packages.zip...\n"
+        "No packages could be packed.\n"
+        "The following packages were left on disk:\n"
+        " - first: namespace package\n"
+    )
+
+
+def test_pack_unsupported(create_command, myapp, app_packages_path):
+    "If the template doesn't process the app packages as a site directory, an error is raised"
+    myapp.zip_packages = True
+    create_file(app_packages_path / 'first' / '__init__.py')
+
+    with pytest.raises(ZipPackagesUnsupported, match="doesn't support zip_packages"):
+        create_command.pack_app_packages(myapp)
+
+    assert (app_packages_path / 'first' / '__init__.py').exists()
@@ -0,0 +1,53 @@
+import importlib.util
+import subprocess
+from pathlib import Path
+
+
+def test_precompile(create_command, myapp, app_path, app_packages_path, capsys):
+    "The app code and dependencies are compiled"
+    (app_path / 'my_app').mkdir()
+    (app_path / 'my_app' / '__init__.py').write_text('')
+    (app_packages_path / 'first').mkdir()
+    (app_packages_path / 'first' / '__init__.py').write_text('value = 1\n')
+
+    create_command.precompile_app(myapp)
+
+    assert "2 compiled, 0 from cache, 0 unchanged, 0 could not be compiled." in capsys.readouterr().out
+    for source in [app_path / 'my_app' / '__init__.py', app_packages_path / 'first' / '__init__.py']:
+        assert Path(importlib.util.cache_from_source(str(source), optimization='')).exists()
+    # Import timing isn't measured unless output is verbose.
+    create_command.subprocess.check_output.assert_not_called()
+
+    # A second compilation doesn't compile anything.
+    create_command.precompile_app(myapp)
+    assert "0 compiled, 0 from cache, 2 unchanged" in capsys.readouterr().out
+
+
+def test_precompile_verbose(create_command, myapp, app_path, capsys):
+    "In verbose mode, the import time is reported before and after compilation"
+    create_command.verbosity = 2
+    (app_path / 'my_app').mkdir()
+    (app_path / 'my_app' / '__init__.py').write_text('')
+    create_command.subprocess.check_output.side_effect = ['0.25\n', '0.125\n']
+
+    create_command.precompile_app(myapp)
+
+    assert (
+        "Import time of my_app: 0.250s before precompiling, 0.125s after."
+        in capsys.readouterr().out
+    )
+    script = create_command.subprocess.check_output.call_args.args[0][-1]
+    assert 'import my_app' in script
+
+
+def test_precompile_verbose_import_fails(create_command, myapp, app_path, capsys):
+    "If the app can't be imported, the import time isn't reported"
+    create_command.verbosity = 2
+    create_command.subprocess.check_output.side_effect = subprocess.CalledProcessError(
+        cmd=['python'],
+        returncode=1,
+    )
+
+    create_command.precompile_app(myapp)
+
+    assert "Unable to measure the import time of my_app." in capsys.readouterr().out
@@ -0,0 +1,72 @@
+def create_file(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'x' * size)
+
+
+def test_prune_disabled(create_command, myapp, app_packages_path, capsys):
+    "If pruning isn't enabled, nothing is removed"
+    create_file(app_packages_path / 'first' / 'tests' / 'test_first.py', 10)
+
+    create_command.prune_app_packages(myapp)
+
+    assert (app_packages_path / 'first' / 'tests' / 'test_first.py').exists()
+    assert capsys.readouterr().out == ''
+
+
+def test_prune_defaults(create_command, myapp, app_packages_path, capsys):
+    "Content that isn't needed at runtime is removed, and reported by package"
+    myapp.prune = True
+    create_file(app_packages_path / 'first' / '__init__.py', 10)
+    create_file(app_packages_path / 'first' / 'tests' / 'test_first.py', 2000)
+    create_file(app_packages_path / 'first' / '__pycache__' / '__init__.cpython-38.pyc', 100)
+    # A nested test directory may be a runtime subpackage.
+    create_file(app_packages_path / 'first' / 'sub' / 'test' / '__init__.py', 10)
+    create_file(app_packages_path / 'first' / 'sub' / 'docs' / '__init__.py', 10)
+    create_file(app_packages_path / 'first-1.0.dist-info' / 'RECORD', 48)
+    create_file(app_packages_path / 'first-1.0.dist-info' / 'METADATA', 10)
+    create_file(app_packages_path / 'second' / '__init__.py', 10)
+    create_file(app_packages_path / 'second' / 'py.typed', 0)
+    create_file(app_packages_path / 'bin' / 'second-cli', 500)
+
+    create_command.prune_app_packages(myapp)
+
+    assert capsys.readouterr().out == (
+        "Pruning installed dependencies...\n"
+        " - first: 2.1 KB (3 file(s))\n"
+        " - bin: 500 B (1 file(s))\n"
+        " - second: 0 B (1 file(s))\n"
+        "Removed 2.6 KB from installed dependencies.\n"
+    )
+    assert (app_packages_path / 'first' / '__init__.py').exists()
+    assert not (app_packages_path / 'first' / 'tests').exists()
+    assert not (app_packages_path / 'first' / '__pycache__').exists()
+    assert (app_packages_path / 'first' / 'sub' / 'test' / '__init__.py').exists()
+    assert (app_packages_path / 'first' / 'sub' / 'docs' / '__init__.py').exists()
+    assert (app_packages_path / 'first-1.0.dist-info' / 'METADATA').exists()
+    assert not (app_packages_path / 'first-1.0.dist-info' / 'RECORD').exists()
+    assert not (app_packages_path / 'second' / 'py.typed').exists()
+    assert not (app_packages_path / 'bin').exists()
+
+
+def test_prune_extra_patterns(create_command, myapp, app_packages_path, capsys):
+    "Additional patterns can be configured"
+    myapp.prune = True
+    myapp.prune_patterns = ['**/examples/']
+    create_file(app_packages_path / 'first' / 'examples' / 'demo.py', 10)
+    create_file(app_packages_path / 'first' / 'tests' / 'test_first.py', 10)
+
+    create_command.prune_app_packages(myapp)
+
+    assert not (app_packages_path / 'first' / 'examples').exists()
+    assert not (app_packages_path / 'first' / 'tests').exists()
+    assert " - first: 20 B (2 file(s))\n" in capsys.readouterr().out
+
+
+def test_prune_nothing(create_command, myapp, app_packages_path, capsys):
+    "If there is nothing to prune, the user is told"
+    myapp.prune = True
+    create_file(app_packages_path / 'first' / '__init__.py', 10)
+
+    create_command.prune_app_packages(myapp)
+
+    assert capsys.readouterr().out == "Pruning installed dependencies...\nNothing to prune.\n"
@@ -0,0 +1,84 @@
+from briefcase.downloads import read_json
+
+
+def create_file(path, content=''):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def create_stdlib(support_path):
+    stdlib_path = support_path / 'lib' / 'python3.X'
+    create_file(stdlib_path / 'os.py')
+    create_file(stdlib_path / 'encodings' / '__init__.py')
+    create_file(stdlib_path / 'json' / '__init__.py')
+    create_file(stdlib_path / 'csv.py', 'x' * 100)
+    create_file(stdlib_path / 'tkinter' / '__init__.py', 'x' * 2000)
+    return stdlib_path
+
+
+def test_prune_stdlib(create_command, myapp, app_path, support_path, capsys):
+    "Modules that the app doesn't import are removed, and reported"
+    stdlib_path = create_stdlib(support_path)
+    create_file(app_path / 'my_app' / 'app.py', 'import json\n')
+
+    create_command.prune_app_stdlib(myapp)
+
+    assert capsys.readouterr().out == (
+        "Tracing standard library imports...\n"
+        " - tkinter: 2.0 KB (1 file(s))\n"
+        " - csv: 100 B (1 file(s))\n"
+        "Removed 2 module(s) (2.1 KB) from the standard library.\n"
+    )
+    assert (stdlib_path / 'json' / '__init__.py').exists()
+    assert not (stdlib_path / 'csv.py').exists()
+    assert read_json(create_command.stdlib_manifest_path(myapp)) == {'removed': ['csv', 'tkinter']}
+
+
+def test_prune_stdlib_includes(create_command, myapp, app_path, support_path, capsys):
+    "Modules named by the app are retained"
+    stdlib_path = create_stdlib(support_path)
+    myapp.stdlib_includes = ['csv', 'tkinter']
+
+    create_command.prune_app_stdlib(myapp)
+
+    assert (stdlib_path / 'csv.py').exists()
+    assert "Removed 1 module(s)" in capsys.readouterr().out
+
+
+def test_prune_stdlib_many_modules(create_command, myapp, support_path, capsys):
+    "Only the largest removed modules are listed"
+    stdlib_path = create_stdlib(support_path)
+    for i in range(12):
+        create_file(stdlib_path / 'module{i}.py'.format(i=i))
+
+    create_command.prune_app_stdlib(myapp)
+
+    output = capsys.readouterr().out
+    assert " - ... and 5 other module(s)\n" in output
+    assert "Removed 15 module(s) (2.1 KB) from the standard library.\n" in output
+
+
+def test_prune_stdlib_not_found(create_command, myapp, support_path, capsys):
+    "If the support package doesn't contain a standard library directory, nothing is pruned"
+    create_file(support_path / 'python3X.zip')
+
+    create_command.prune_app_stdlib(myapp)
+
+    assert capsys.readouterr().out == (
+        "The support package doesn't contain a standard library that can be pruned.\n"
+    )
+
+
+def test_prune_stdlib_previously_removed(create_command, myapp, app_path, support_path, capsys):
+    "If the app imports a module removed by an earlier prune, the user is warned"
+    create_stdlib(support_path)
+    create_command.prune_app_stdlib(myapp)
+    capsys.readouterr()
+
+    create_file(app_path / 'my_app' / 'app.py', 'import csv\n')
+    create_command.prune_app_stdlib(myapp)
+
+    output = capsys.readouterr().out
+    assert "WARNING: The app now imports csv, which was removed from the standard library" in output
+    assert "Nothing to prune." in output
+    assert read_json(create_command.stdlib_manifest_path(myapp)) == {'removed': ['csv', 'json', 'tkinter']}
@@ -0,0 +1,21 @@
+STAGES = ['verify', 'generate', 'support', 'dependencies', 'code', 'resources', 'stdlib', 'bytecode']
+
+
+def in_stage_order(actions):
+    """
+    Sort the actions recorded by a tracking create command into stage order.
+
+    Once the template for an app has been generated, the remaining creation
+    stages for that app run concurrently, so they can be recorded in any
+    order. Apps are still created one after the other.
+
+    :param actions: The actions recorded by the command.
+    :returns: The actions, sorted into the order the stages are defined.
+    """
+    app_index = 0
+    keys = []
+    for action in actions:
+        if action[0] == 'generate':
+            app_index += 1
+        keys.append((app_index, STAGES.index(action[0])))
+    return [action for key, action in sorted(zip(keys, actions), key=lambda pair: pair[0])]
@@ -0,0 +1,31 @@
+from unittest import mock
+
+import pytest
+
+from briefcase.commands import DepsCommand
+from briefcase.config import AppConfig
+
+
+@pytest.fixture
+def deps_command(tmp_path):
+    command = DepsCommand(base_path=tmp_path, home_path=tmp_path / 'home')
+    command.subprocess = mock.MagicMock()
+    command.apps = {
+        'first': AppConfig(
+            app_name='first',
+            bundle='com.example',
+            version='0.0.1',
+            description='The first simple app',
+            sources=['src/first'],
+            requires=['toga', 'requests>=2.0'],
+        ),
+        'second': AppConfig(
+            app_name='second',
+            bundle='com.example',
+            version='0.0.2',
+            description='The second simple app',
+            sources=['src/second'],
+            requires=['toga', './local'],
+        ),
+    }
+    return command
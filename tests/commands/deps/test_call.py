@@ -0,0 +1,88 @@
+import subprocess
+import sys
+
+import pytest
+
+from briefcase.commands.create import DependencyInstallError
+from briefcase.exceptions import BriefcaseCommandError
+
+
+def fetch_call(deps_command, *requires):
+    wheelhouse = deps_command.wheelhouse_path
+    return (
+        [
+            sys.executable, '-m',
+            'pip', 'wheel',
+            '--find-links={}'.format(wheelhouse),
+            '--wheel-dir={}'.format(wheelhouse),
+        ] + list(requires),
+    )
+
+
+def test_fetch(deps_command, capsys):
+    "The dependencies of every app are fetched into the wheelhouse"
+    deps_command('fetch')
+
+    assert [call.args for call in deps_command.subprocess.run.call_args_list] == [
+        fetch_call(deps_command, 'toga', 'requests>=2.0'),
+        fetch_call(deps_command, 'toga'),
+    ]
+    assert deps_command.wheelhouse_path.is_dir()
+
+    output = capsys.readouterr().out
+    assert '[first] Fetching dependencies' in output
+    assert '[second] Fetching dependencies' in output
+    # The local requirement of the second app was skipped.
+    assert 'Skipping 1 requirement(s)' in output
+
+
+def test_fetch_app(deps_command, capsys):
+    "The dependencies of a single app can be fetched"
+    deps_command('fetch', appnames=['second'])
+
+    assert [call.args for call in deps_command.subprocess.run.call_args_list] == [
+        fetch_call(deps_command, 'toga'),
+    ]
+    assert '[first]' not in capsys.readouterr().out
+
+
+def test_fetch_unknown_app(deps_command):
+    "An unknown app raises an error"
+    with pytest.raises(BriefcaseCommandError, match="named 'unknown'"):
+        deps_command('fetch', appnames=['unknown'])
+
+
+def test_fetch_no_requirements(deps_command, capsys):
+    "If an app has no requirements, nothing is fetched"
+    deps_command.apps['first'].requires = None
+
+    deps_command('fetch', appnames=['first'])
+
+    deps_command.subprocess.run.assert_not_called()
+    assert 'No application dependencies.' in capsys.readouterr().out
+
+
+def test_fetch_failure(deps_command):
+    "If the requirements can't be fetched, an error is raised"
+    deps_command.subprocess.run.side_effect = subprocess.CalledProcessError(cmd=['pip'], returncode=1)
+
+    with pytest.raises(DependencyInstallError):
+        deps_command('fetch')
+
+
+def test_fetch_requirements(deps_command, capsys):
+    "Named requirements are fetched instead of the app dependencies"
+    deps_command('fetch', requirements=['numpy==1.21.0'])
+
+    assert [call.args for call in deps_command.subprocess.run.call_args_list] == [
+        fetch_call(deps_command, 'numpy==1.21.0'),
+    ]
+    assert '[first]' not in capsys.readouterr().out
+
+
+def test_fetch_nothing(deps_command):
+    "If there are no apps and no named requirements, an error is raised"
+    deps_command.apps = {}
+
+    with pytest.raises(BriefcaseCommandError, match="No requirements to fetch"):
+        deps_command('fetch')
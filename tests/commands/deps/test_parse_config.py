@@ -0,0 +1,31 @@
+from briefcase.commands import DepsCommand
+
+
+def test_no_project(tmp_path, monkeypatch):
+    "The deps command can be used outside a project"
+    monkeypatch.chdir(tmp_path)
+    command = DepsCommand(base_path=tmp_path, home_path=tmp_path / 'home')
+
+    command.parse_config('pyproject.toml')
+
+    assert command.apps == {}
+
+
+def test_project(tmp_path, monkeypatch):
+    "In a project, the apps of the project are used"
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'pyproject.toml').write_text("""
+[tool.briefcase]
+project_name = "Sample"
+bundle = "com.example"
+version = "0.0.1"
+
+[tool.briefcase.app.first]
+description = "The first app"
+sources = ['src/first']
+""")
+    command = DepsCommand(base_path=tmp_path, home_path=tmp_path / 'home')
+
+    command.parse_config('pyproject.toml')
+
+    assert list(command.apps) == ['first']
@@ -51,6 +51,12 @@ class DummyUpdateCommand(UpdateCommand):
         with (self.bundle_path(app) / 'resources').open('w') as f:
             f.write("app resources")
 
+    def prune_app_stdlib(self, app):
+        self.actions.append(('stdlib', app))
+
+    def precompile_app(self, app):
+        self.actions.append(('bytecode', app))
+
 
 @pytest.fixture
 def update_command(tmp_path):
@@ -71,3 +71,29 @@ def test_update_app_with_resources(update_command, first_app):
     assert not (update_command.platform_path / 'first.dummy' / 'dependencies').exists()
     # ... and the app still exists
     assert (update_command.platform_path / 'first.dummy' / 'Content').exists()
+
+
+def test_update_app_precompile(update_command, first_app):
+    "If the app requests precompilation, bytecode is compiled after the code is updated"
+    update_command.apps['first'].precompile = True
+
+    update_command.update_app(update_command.apps['first'])
+
+    assert update_command.actions == [
+        ('code', update_command.apps['first']),
+        ('bytecode', update_command.apps['first']),
+    ]
+
+
+def test_update_app_prune_stdlib(update_command, first_app):
+    "If the app requests stdlib pruning, the stdlib is pruned after the code is updated"
+    update_command.apps['first'].prune_stdlib = True
+    update_command.apps['first'].precompile = True
+
+    update_command.update_app(update_command.apps['first'])
+
+    assert update_command.actions == [
+        ('code', update_command.apps['first']),
+        ('stdlib', update_command.apps['first']),
+        ('bytecode', update_command.apps['first']),
+    ]
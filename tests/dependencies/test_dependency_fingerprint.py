@@ -0,0 +1,64 @@
+from briefcase.dependencies import dependency_fingerprint, pip_config
+
+
+def test_stable():
+    "The fingerprint doesn't depend on the order or formatting of requirements"
+    assert dependency_fingerprint(
+        ['toga>=0.3', 'pillow'],
+        python_version_tag='3.10',
+    ) == dependency_fingerprint(
+        ['pillow', '  toga>=0.3 '],
+        python_version_tag='3.10',
+    )
+
+
+def test_requirements_change():
+    "The fingerprint changes if the requirements change"
+    assert dependency_fingerprint(
+        ['toga>=0.3'],
+        python_version_tag='3.10',
+    ) != dependency_fingerprint(
+        ['toga>=0.4'],
+        python_version_tag='3.10',
+    )
+
+
+def test_context_change():
+    "The fingerprint changes if the context changes"
+    assert dependency_fingerprint(
+        ['toga'],
+        python_version_tag='3.10',
+        platform='macOS',
+    ) != dependency_fingerprint(
+        ['toga'],
+        python_version_tag='3.10',
+        platform='linux',
+    )
+
+
+def test_uncacheable():
+    "If any requirement can't be cached, there is no fingerprint"
+    assert dependency_fingerprint(['toga', './local'], python_version_tag='3.10') is None
+
+
+def test_pip_config(tmp_path):
+    "The pip configuration includes PIP_ variables and configuration files"
+    config_file = tmp_path / 'custom.conf'
+    config_file.write_text('[global]\nindex-url = https://example.com/simple\n')
+    environ = {
+        'PIP_INDEX_URL': 'https://example.com/simple',
+        'PIP_CONFIG_FILE': str(config_file),
+        'PATH': '/usr/bin',
+    }
+
+    config = pip_config(tmp_path, environ)
+
+    assert config['environment'] == {
+        'PIP_INDEX_URL': 'https://example.com/simple',
+        'PIP_CONFIG_FILE': str(config_file),
+    }
+    assert str(config_file) in config['files']
+
+    # Changing the content of the configuration file changes the config.
+    config_file.write_text('[global]\nindex-url = https://example.com/other\n')
+    assert pip_config(tmp_path, environ) != config
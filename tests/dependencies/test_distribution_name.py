@@ -0,0 +1,18 @@
+import pytest
+
+from briefcase.dependencies import distribution_name
+
+
+@pytest.mark.parametrize(
+    'name, distribution',
+    [
+        ('numpy', 'numpy'),
+        ('six.py', 'six.py'),
+        ('numpy-1.22.0.dist-info', 'numpy'),
+        ('toga_core-0.3.0.dist-info', 'toga_core'),
+        ('legacy-1.0-py3.8.egg-info', 'legacy'),
+    ]
+)
+def test_distribution_name(name, distribution):
+    "The distribution that owns an installed item can be determined"
+    assert distribution_name(name) == distribution
@@ -0,0 +1,55 @@
+from briefcase.dependencies import format_constraints, format_lock, locked_requires
+
+PACKAGES = [
+    ('first', '1.0', 'abc123'),
+    ('second', '2.0', 'def456'),
+]
+
+
+def test_hashes():
+    "If every hash is known, the lock file includes the hashes"
+    content = format_lock(PACKAGES, ['second', 'first >= 1.0'], description='My app\nLocked')
+
+    assert content == (
+        '# My app\n'
+        '# Locked\n'
+        '# requires: ["first >= 1.0", "second"]\n'
+        'first==1.0 \\\n'
+        '    --hash=sha256:abc123\n'
+        'second==2.0 \\\n'
+        '    --hash=sha256:def456\n'
+    )
+
+
+def test_unknown_hash():
+    "If any hash is unknown, the lock file doesn't include hashes"
+    content = format_lock(
+        [('first', '1.0', 'abc123'), ('second', '2.0', None)],
+        ['first', 'second'],
+        description='My app',
+    )
+
+    assert content == (
+        '# My app\n'
+        '# requires: ["first", "second"]\n'
+        'first==1.0\n'
+        'second==2.0\n'
+    )
+
+
+def test_locked_requires():
+    "The requirements of a lock file can be recovered"
+    content = format_lock(PACKAGES, ['second', '  first>=1.0'], description='My app')
+
+    assert locked_requires(content) == ['first>=1.0', 'second']
+
+
+def test_locked_requires_missing():
+    "A lock file that doesn't record its requirements has no requirements"
+    assert locked_requires('first==1.0\n') is None
+    assert locked_requires('# requires: [not json\n') is None
+
+
+def test_format_constraints():
+    "Resolved packages can be used as constraints"
+    assert format_constraints(PACKAGES) == 'first==1.0\nsecond==2.0\n'
@@ -0,0 +1,38 @@
+import pytest
+
+from briefcase.dependencies import is_cacheable_requirement
+
+
+@pytest.mark.parametrize(
+    'requirement',
+    [
+        'toga',
+        'toga==0.3.0',
+        'toga >= 0.3, < 0.4',
+        'pillow[extra]; sys_platform == "win32"',
+        'toga @ https://example.com/toga-0.3.0-py3-none-any.whl',
+    ]
+)
+def test_cacheable(requirement):
+    "Requirements that describe packages by name or URL can be cached"
+    assert is_cacheable_requirement(requirement)
+
+
+@pytest.mark.parametrize(
+    'requirement',
+    [
+        './local/package',
+        '../sibling',
+        '/absolute/path/to/package.whl',
+        '~/package',
+        'dist/package-1.0-py3-none-any.whl',
+        'subdir\\package',
+        '-e ./local',
+        'package @ file:///path/to/package',
+        'git+https://github.com/beeware/toga.git',
+        'toga @ git+https://github.com/beeware/toga.git@main',
+    ]
+)
+def test_not_cacheable(requirement):
+    "Requirements for local files and version control checkouts can't be cached"
+    assert not is_cacheable_requirement(requirement)
@@ -0,0 +1,72 @@
+import pytest
+
+from briefcase.dependencies import resolved_packages
+
+
+def package(name, version, url, **archive_info):
+    return {
+        'metadata': {'name': name, 'version': version},
+        'download_info': {'url': url, 'archive_info': archive_info},
+    }
+
+
+def test_hashes():
+    "Packages are extracted from the report, with their hashes, sorted by name"
+    report = {
+        'install': [
+            package(
+                'toga-core', '0.3.0', 'https://example.com/toga_core-0.3.0-py3-none-any.whl',
+                hashes={'sha256': 'abc123'},
+            ),
+            package(
+                'Pillow', '9.0.1', 'https://example.com/Pillow-9.0.1.tar.gz',
+                hash='sha256=def456',
+            ),
+        ]
+    }
+
+    assert resolved_packages(report) == [
+        ('Pillow', '9.0.1', 'def456'),
+        ('toga-core', '0.3.0', 'abc123'),
+    ]
+
+
+def test_local_archive(tmp_path):
+    "The hash of a local archive is computed, if pip doesn't report it"
+    wheel = tmp_path / 'first-1.0-py3-none-any.whl'
+    wheel.write_bytes(b'wheel content')
+    report = {'install': [package('first', '1.0', wheel.as_uri())]}
+
+    assert resolved_packages(report) == [
+        (
+            'first',
+            '1.0',
+            'a97fd600481e6e7dfeb7aed24120e3e9aba03c5364c6ad77fd40f3bbdf1e42ad',
+        ),
+    ]
+
+
+def test_unknown_hash():
+    "If the hash of a remote archive isn't reported, it is unknown"
+    report = {'install': [package('first', '1.0', 'https://example.com/first-1.0.tar.gz')]}
+
+    assert resolved_packages(report) == [('first', '1.0', None)]
+
+
+def test_directory():
+    "A package that isn't an archive can't be locked"
+    report = {
+        'install': [{
+            'metadata': {'name': 'local', 'version': '1.0'},
+            'download_info': {'url': 'file:///path/to/local', 'dir_info': {}},
+        }]
+    }
+
+    with pytest.raises(ValueError, match='local was not resolved to a package archive'):
+        resolved_packages(report)
+
+
+def test_no_report():
+    "An empty report is an error"
+    with pytest.raises(ValueError, match='did not produce an installation report'):
+        resolved_packages({})
@@ -0,0 +1,86 @@
+from briefcase.downloads import DownloadIndex, file_sha256
+
+
+def test_file_sha256(tmp_path):
+    "The SHA256 hash of a file can be computed"
+    filename = tmp_path / 'content.txt'
+    with filename.open('wb') as f:
+        f.write(b'hello world')
+
+    assert file_sha256(filename) == (
+        'b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9'
+    )
+
+
+def test_missing_index(tmp_path):
+    "If the index file doesn't exist, no downloads are known"
+    index = DownloadIndex(tmp_path / 'downloads.json')
+
+    assert index.get('https://example.com/something.zip') is None
+
+
+def test_corrupted_index(tmp_path):
+    "If the index file is corrupted, no downloads are known"
+    with (tmp_path / 'downloads.json').open('w') as f:
+        f.write('this is not JSON')
+    index = DownloadIndex(tmp_path / 'downloads.json')
+
+    assert index.get('https://example.com/something.zip') is None
+
+
+def test_record(tmp_path):
+    "A download can be recorded, and retrieved by a different index instance"
+    index = DownloadIndex(tmp_path / 'cache' / 'downloads.json')
+    index.record(
+        'https://example.com/something.zip',
+        filename=tmp_path / 'something.zip',
+        sha256='abcd',
+        etag='"1234"',
+    )
+
+    entry = DownloadIndex(tmp_path / 'cache' / 'downloads.json').get(
+        'https://example.com/something.zip'
+    )
+    assert entry['filename'] == str(tmp_path / 'something.zip')
+    assert entry['sha256'] == 'abcd'
+    assert entry['etag'] == '"1234"'
+    assert entry['last_modified'] is None
+
+    # No temporary files are left behind
+    assert [p.name for p in (tmp_path / 'cache').iterdir()] == ['downloads.json']
+
+
+def test_refresh(tmp_path):
+    "The fetch time of an entry can be refreshed"
+    index = DownloadIndex(tmp_path / 'downloads.json')
+    index.record(
+        'https://example.com/something.zip',
+        filename=tmp_path / 'something.zip',
+        sha256='abcd',
+    )
+    entries = index._load()
+    entries['https://example.com/something.zip']['fetched'] = 0
+    index._save(entries)
+
+    index.refresh('https://example.com/something.zip')
+    assert index.get('https://example.com/something.zip')['fetched'] > 0
+
+    # Refreshing an unknown URL is a no-op
+    index.refresh('https://example.com/unknown.zip')
+    assert index.get('https://example.com/unknown.zip') is None
+
+
+def test_discard(tmp_path):
+    "An entry can be removed from the index"
+    index = DownloadIndex(tmp_path / 'downloads.json')
+    index.record(
+        'https://example.com/something.zip',
+        filename=tmp_path / 'something.zip',
+        sha256='abcd',
+    )
+
+    index.discard('https://example.com/something.zip')
+    assert index.get('https://example.com/something.zip') is None
+
+    # Discarding an unknown URL is a no-op
+    index.discard('https://example.com/unknown.zip')
@@ -0,0 +1,45 @@
+from unittest import mock
+
+import requests
+
+from briefcase.downloads import HTTPSession
+
+
+def test_adapters():
+    "HTTP and HTTPS requests use a pooled adapter with a retry policy"
+    session = HTTPSession(retries=5, backoff_factor=2, pool_size=7)
+
+    for prefix in ['http://', 'https://']:
+        adapter = session.get_adapter(prefix + 'example.com/')
+        assert adapter._pool_maxsize == 7
+
+        retry = adapter.max_retries
+        assert retry.total == 5
+        assert retry.connect == 5
+        assert retry.read == 5
+        assert retry.status == 5
+        assert retry.backoff_factor == 2
+        assert set(retry.status_forcelist) == {500, 502, 503, 504}
+        assert not retry.raise_on_status
+
+
+def test_default_timeout():
+    "If no timeout is provided, the session timeout is used"
+    session = HTTPSession(timeout=42)
+
+    with mock.patch.object(requests.Session, 'request') as mock_request:
+        session.get('https://example.com/something.zip', stream=True)
+
+    assert mock_request.call_count == 1
+    assert mock_request.call_args[1]['timeout'] == 42
+
+
+def test_explicit_timeout():
+    "An explicit timeout overrides the session timeout"
+    session = HTTPSession(timeout=42)
+
+    with mock.patch.object(requests.Session, 'request') as mock_request:
+        session.get('https://example.com/something.zip', timeout=5)
+
+    assert mock_request.call_count == 1
+    assert mock_request.call_args[1]['timeout'] == 5
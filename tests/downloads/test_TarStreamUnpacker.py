@@ -0,0 +1,67 @@
+import io
+import tarfile
+
+import pytest
+
+from briefcase.downloads import DownloadProgress, TarStreamUnpacker
+
+
+def tar_content(mode='w:gz'):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode=mode) as tar:
+        info = tarfile.TarInfo('internal/file.txt')
+        info.size = 11
+        tar.addfile(info, io.BytesIO(b'hello world'))
+    return buffer.getvalue()
+
+
+def chunked(content, size=7):
+    return [content[i:i + size] for i in range(0, len(content), size)]
+
+
+@pytest.mark.parametrize('mode', ['w', 'w:gz', 'w:bz2', 'w:xz'])
+def test_unpack(tmp_path, mode):
+    "A (compressed) tar archive can be unpacked from a stream of chunks"
+    content = tar_content(mode)
+    archive = io.BytesIO()
+    unpacker = TarStreamUnpacker(tmp_path / 'extract')
+
+    unpacker.unpack(
+        chunked(content),
+        archive=archive,
+        progress=DownloadProgress(len(content), quiet=True),
+    )
+
+    assert unpacker.unpacked
+    assert (tmp_path / 'extract' / 'internal' / 'file.txt').read_text() == 'hello world'
+    # The full archive was written, including any trailing padding.
+    assert archive.getvalue() == content
+
+
+def test_unpack_incomplete(tmp_path):
+    "If the stream ends before the expected size, an error is raised"
+    content = tar_content()
+    unpacker = TarStreamUnpacker(tmp_path / 'extract')
+
+    with pytest.raises((EOFError, tarfile.TarError)):
+        unpacker.unpack(
+            chunked(content[:-10]),
+            archive=io.BytesIO(),
+            progress=DownloadProgress(len(content), quiet=True),
+        )
+
+    assert not unpacker.unpacked
+
+
+def test_unpack_invalid(tmp_path):
+    "If the content isn't a tar archive, an error is raised"
+    unpacker = TarStreamUnpacker(tmp_path / 'extract')
+
+    with pytest.raises(tarfile.TarError):
+        unpacker.unpack(
+            [b"This isn't a tar file"],
+            archive=io.BytesIO(),
+            progress=DownloadProgress(None, quiet=True),
+        )
+
+    assert not unpacker.unpacked
@@ -0,0 +1,75 @@
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from briefcase.integrations.android_sdk import AndroidSDK
+
+
+@pytest.fixture
+def mock_command(tmp_path):
+    command = MagicMock()
+    command.tools_path = tmp_path / "tools"
+    command.os = MagicMock()
+    command.os.environ = {'JAVA_HOME': '/path/to/java'}
+    command.os.access = os.access
+    command.os.X_OK = os.X_OK
+    command.host_os = 'Unknown'
+
+    return command
+
+
+def create_sdk(root_path):
+    "Create a minimal Android SDK"
+    (root_path / 'tools' / 'bin').mkdir(parents=True)
+    (root_path / 'tools' / 'bin' / 'sdkmanager').touch(mode=0o755)
+
+
+def test_missing(mock_command):
+    "If there is no SDK, a download is planned"
+    assert AndroidSDK.download_plan(mock_command) == [
+        (
+            "https://dl.google.com/android/repository/sdk-tools-unknown-4333796.zip",
+            mock_command.tools_path,
+        ),
+    ]
+
+
+def test_missing_jdk(mock_command):
+    "If there is no JDK, the JDK download is also planned"
+    mock_command.os.environ = {}
+
+    plan = AndroidSDK.download_plan(mock_command)
+
+    assert len(plan) == 2
+    assert plan[1] == (
+        "https://dl.google.com/android/repository/sdk-tools-unknown-4333796.zip",
+        mock_command.tools_path,
+    )
+
+
+def test_managed_sdk(mock_command):
+    "If there is a Briefcase-managed SDK, no download is planned"
+    create_sdk(mock_command.tools_path / 'android_sdk')
+
+    assert AndroidSDK.download_plan(mock_command) == []
+
+
+def test_user_sdk(mock_command, tmp_path):
+    "If ANDROID_SDK_ROOT points at an SDK, no download is planned"
+    create_sdk(tmp_path / 'user_sdk')
+    mock_command.os.environ['ANDROID_SDK_ROOT'] = os.fsdecode(tmp_path / 'user_sdk')
+
+    assert AndroidSDK.download_plan(mock_command) == []
+
+
+def test_invalid_user_sdk(mock_command, tmp_path):
+    "If ANDROID_SDK_ROOT doesn't point at an SDK, a download is planned"
+    mock_command.os.environ['ANDROID_SDK_ROOT'] = os.fsdecode(tmp_path / 'user_sdk')
+
+    assert AndroidSDK.download_plan(mock_command) == [
+        (
+            "https://dl.google.com/android/repository/sdk-tools-unknown-4333796.zip",
+            mock_command.tools_path,
+        ),
+    ]
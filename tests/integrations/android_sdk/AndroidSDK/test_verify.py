@@ -80,7 +80,7 @@ def test_succeeds_immediately_in_happy_path(mock_command, host_os, tmp_path):
     mock_command.download_url.assert_not_called()
     mock_command.subprocess.run.assert_not_called()
     mock_command.subprocess.check_output.assert_not_called()
-    mock_command.shutil.unpack_archive.assert_not_called()
+    mock_command.unpack_archive.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == android_sdk_root_path
@@ -109,7 +109,7 @@ def test_user_provided_sdk(mock_command, tmp_path):
     mock_command.download_url.assert_not_called()
     mock_command.subprocess.run.assert_not_called()
     mock_command.subprocess.check_output.assert_not_called()
-    mock_command.shutil.unpack_archive.assert_not_called()
+    mock_command.unpack_archive.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == existing_android_sdk_root_path
@@ -140,7 +140,7 @@ def test_invalid_user_provided_sdk(mock_command, tmp_path):
     mock_command.download_url.assert_not_called()
     mock_command.subprocess.run.assert_not_called()
     mock_command.subprocess.check_output.assert_not_called()
-    mock_command.shutil.unpack_archive.assert_not_called()
+    mock_command.unpack_archive.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == android_sdk_root_path
@@ -164,11 +164,6 @@ def test_download_sdk(mock_command, tmp_path, host_os):
         cache_file.__fspath__.return_value = "/path/to/download.zip"
     mock_command.download_url.return_value = cache_file
 
-    # Create a file that would have been created by unpacking the archive
-    example_tool = android_sdk_root_path / "tools" / "bin" / "exampletool"
-    example_tool.parent.mkdir(parents=True)
-    example_tool.touch(0o644)
-
     # Set up a side effect for accepting the license
     mock_command.subprocess.run.side_effect = accept_license(android_sdk_root_path)
 
@@ -183,19 +178,14 @@ def test_download_sdk(mock_command, tmp_path, host_os):
         url=url,
         download_path=mock_command.tools_path,
     )
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    mock_command.shutil.unpack_archive.assert_called_once_with(
-        "/path/to/download.zip",
-        extract_dir=os.fsdecode(android_sdk_root_path)
+    mock_command.unpack_archive.assert_called_once_with(
+        cache_file,
+        extract_dir=android_sdk_root_path
     )
 
     # The cached file will be deleted
     cache_file.unlink.assert_called_once_with()
 
-    # On non-Windows, ensure the unpacked binary was made executable
-    if host_os != 'Windows':
-        assert os.access(example_tool, os.X_OK)
-
     # The license has been accepted
     assert (android_sdk_root_path / "licenses" / "android-sdk-license").exists()
 
@@ -247,10 +237,9 @@ def test_download_sdk_if_sdkmanager_not_executable(mock_command, tmp_path):
         url="https://dl.google.com/android/repository/sdk-tools-unknown-4333796.zip",
         download_path=mock_command.tools_path,
     )
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    mock_command.shutil.unpack_archive.assert_called_once_with(
-        "/path/to/download.zip",
-        extract_dir=os.fsdecode(android_sdk_root_path)
+    mock_command.unpack_archive.assert_called_once_with(
+        cache_file,
+        extract_dir=android_sdk_root_path
     )
 
     # The cached file will be deleted
@@ -276,7 +265,7 @@ def test_raises_networkfailure_on_connectionerror(mock_command):
         download_path=mock_command.tools_path,
     )
     # But no unpack occurred
-    assert mock_command.shutil.unpack_archive.call_count == 0
+    assert mock_command.unpack_archive.call_count == 0
 
 
 def test_detects_bad_zipfile(mock_command, tmp_path):
@@ -294,7 +283,7 @@ def test_detects_bad_zipfile(mock_command, tmp_path):
     mock_command.download_url.return_value = cache_file
 
     # But the unpack will fail.
-    mock_command.shutil.unpack_archive.side_effect = shutil.ReadError
+    mock_command.unpack_archive.side_effect = shutil.ReadError
 
     with pytest.raises(BriefcaseCommandError):
         AndroidSDK.verify(mock_command, jdk=MagicMock())
@@ -304,8 +293,7 @@ def test_detects_bad_zipfile(mock_command, tmp_path):
         url="https://dl.google.com/android/repository/sdk-tools-unknown-4333796.zip",
         download_path=mock_command.tools_path,
     )
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    mock_command.shutil.unpack_archive.assert_called_once_with(
-        "/path/to/download.zip",
-        extract_dir=os.fsdecode(android_sdk_root_path)
+    mock_command.unpack_archive.assert_called_once_with(
+        cache_file,
+        extract_dir=android_sdk_root_path
     )
@@ -0,0 +1,131 @@
+import importlib.util
+import sys
+import zipfile
+
+import pytest
+
+from briefcase.integrations import bytecode
+from briefcase.integrations.archives import pack_packages
+
+
+def create_file(path, content=''):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def app_packages(tmp_path):
+    path = tmp_path / 'app_packages'
+    create_file(path / 'purepkg' / '__init__.py', 'from .core import answer\n')
+    create_file(path / 'purepkg' / 'core.py', 'answer = 42\n')
+    create_file(path / 'purepkg' / '__pycache__' / 'core.cpython-38.pyc', 'stale')
+    create_file(path / 'purepkg-1.0.dist-info' / 'METADATA', 'Name: purepkg\n')
+    create_file(path / 'single.py', 'value = 1\n')
+    create_file(path / 'nativepkg' / '__init__.py')
+    create_file(path / 'nativepkg' / '_speedups.cpython-38-x86_64-linux-gnu.so')
+    create_file(path / 'datapkg' / '__init__.py', 'import os\nHERE = os.path.dirname(__file__)\n')
+    create_file(path / 'datapkg' / 'data.json', '{}')
+    create_file(path / 'nspkg' / 'module.py')
+    create_file(path / '_cffi_backend.cpython-38-x86_64-linux-gnu.so')
+    return path
+
+
+def test_pack(app_packages):
+    "Pure-Python packages are packed; other packages are left on disk and reported"
+    packed, blocked = pack_packages(app_packages, 'packages.zip')
+
+    assert packed == ['purepkg', 'single.py']
+    assert blocked == {
+        '_cffi_backend.cpython-38-x86_64-linux-gnu.so': 'native extension',
+        'datapkg': 'accesses data files using __file__',
+        'nativepkg': 'contains native extensions',
+        'nspkg': 'namespace package',
+    }
+
+    # Packed packages have been removed from disk
+    assert not (app_packages / 'purepkg').exists()
+    assert not (app_packages / 'single.py').exists()
+    assert (app_packages / 'purepkg-1.0.dist-info' / 'METADATA').exists()
+    assert (app_packages / 'datapkg' / 'data.json').exists()
+    assert (app_packages / 'packages.pth').read_text() == 'packages.zip\n'
+
+    with zipfile.ZipFile(app_packages / 'packages.zip') as archive:
+        assert sorted(archive.namelist()) == [
+            'purepkg/__init__.py',
+            'purepkg/__init__.pyc',
+            'purepkg/core.py',
+            'purepkg/core.pyc',
+            'single.py',
+            'single.pyc',
+        ]
+        header = archive.read('purepkg/core.pyc')[:16]
+    assert header[:4] == importlib.util.MAGIC_NUMBER
+    assert int.from_bytes(header[4:8], 'little') == bytecode.UNCHECKED_HASH_FLAGS
+    assert header[8:16] == importlib.util.source_hash(b'answer = 42\n')
+
+
+def test_packed_packages_importable(app_packages):
+    "Packed packages can be imported from the archive"
+    pack_packages(app_packages, 'packages.zip')
+
+    archive_path = str(app_packages / 'packages.zip')
+    sys.path.insert(0, archive_path)
+    try:
+        import purepkg
+        assert purepkg.answer == 42
+        assert purepkg.__file__.startswith(archive_path)
+    finally:
+        sys.path.remove(archive_path)
+        sys.modules.pop('purepkg.core', None)
+        sys.modules.pop('purepkg', None)
+
+
+def test_reproducible(app_packages, tmp_path):
+    "Packing the same content produces the same archive"
+    pack_packages(app_packages, 'packages.zip')
+    first = (app_packages / 'packages.zip').read_bytes()
+
+    other = tmp_path / 'other'
+    create_file(other / 'purepkg' / '__init__.py', 'from .core import answer\n')
+    create_file(other / 'purepkg' / 'core.py', 'answer = 42\n')
+    create_file(other / 'single.py', 'value = 1\n')
+    pack_packages(other, 'packages.zip')
+
+    assert (other / 'packages.zip').read_bytes() == first
+
+
+def test_pack_into_existing(app_packages):
+    "Packing into an existing archive retains its content"
+    pack_packages(app_packages, 'packages.zip')
+    create_file(app_packages / 'extra.py', 'value = 2\n')
+
+    packed, _ = pack_packages(app_packages, 'packages.zip')
+
+    assert packed == ['extra.py']
+    with zipfile.ZipFile(app_packages / 'packages.zip') as archive:
+        names = archive.namelist()
+    assert 'extra.py' in names
+    assert 'purepkg/core.py' in names
+
+
+def test_invalid_source(tmp_path):
+    "Sources that can't be compiled are packed without bytecode"
+    create_file(tmp_path / 'template.py', 'def {{ invalid }}:\n')
+
+    packed, _ = pack_packages(tmp_path, 'packages.zip')
+
+    assert packed == ['template.py']
+    with zipfile.ZipFile(tmp_path / 'packages.zip') as archive:
+        assert archive.namelist() == ['template.py']
+
+
+def test_nothing_to_pack(tmp_path):
+    "If nothing can be packed, no archive is created"
+    create_file(tmp_path / 'nspkg' / 'module.py')
+
+    packed, blocked = pack_packages(tmp_path, 'packages.zip')
+
+    assert packed == []
+    assert blocked == {'nspkg': 'namespace package'}
+    assert not (tmp_path / 'packages.zip').exists()
+    assert not (tmp_path / 'packages.pth').exists()
@@ -0,0 +1,103 @@
+import os
+import shutil
+import stat
+import sys
+import zipfile
+
+import pytest
+
+from briefcase.integrations.archives import unpack_zip
+
+
+def add_member(archive, name, data, mode):
+    "Add a member to a zip file, with Unix permissions"
+    info = zipfile.ZipInfo(name)
+    info.create_system = 3
+    info.external_attr = mode << 16
+    archive.writestr(info, data)
+
+
+@pytest.fixture
+def zip_path(tmp_path):
+    zip_path = tmp_path / 'archive.zip'
+    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        add_member(archive, 'tools/', '', stat.S_IFDIR | 0o755)
+        add_member(archive, 'tools/bin/sdkmanager', '#!/bin/sh', stat.S_IFREG | 0o755)
+        add_member(archive, 'tools/lib/data.txt', 'data', stat.S_IFREG | 0o644)
+        for index in range(20):
+            add_member(
+                archive,
+                'tools/lib/module{index}.py'.format(index=index),
+                'x' * (index * 100),
+                stat.S_IFREG | 0o644,
+            )
+        # A member without Unix metadata
+        archive.writestr('tools/README', 'readme')
+    return zip_path
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_unpack(zip_path, tmp_path, workers):
+    "All members of a zip file are extracted"
+    unpack_zip(zip_path, extract_dir=tmp_path / 'out', workers=workers)
+
+    assert (tmp_path / 'out' / 'tools' / 'bin' / 'sdkmanager').read_text() == '#!/bin/sh'
+    assert (tmp_path / 'out' / 'tools' / 'lib' / 'data.txt').read_text() == 'data'
+    assert (tmp_path / 'out' / 'tools' / 'README').read_text() == 'readme'
+    for index in range(20):
+        path = tmp_path / 'out' / 'tools' / 'lib' / 'module{index}.py'.format(index=index)
+        assert path.read_text() == 'x' * (index * 100)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="Unix permissions aren't available on Windows")
+def test_permissions(zip_path, tmp_path):
+    "Unix permissions stored in the archive are restored"
+    unpack_zip(zip_path, extract_dir=tmp_path / 'out')
+
+    assert os.access(tmp_path / 'out' / 'tools' / 'bin' / 'sdkmanager', os.X_OK)
+    assert not os.access(tmp_path / 'out' / 'tools' / 'lib' / 'data.txt', os.X_OK)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="Symlinks require privileges on Windows")
+def test_symlinks(tmp_path):
+    "Symlinks stored in the archive are restored"
+    zip_path = tmp_path / 'archive.zip'
+    with zipfile.ZipFile(zip_path, 'w') as archive:
+        add_member(archive, 'Home/lib/libjli.dylib', 'library', stat.S_IFREG | 0o644)
+        add_member(archive, 'MacOS/libjli.dylib', '../Home/lib/libjli.dylib', stat.S_IFLNK | 0o777)
+
+    unpack_zip(zip_path, extract_dir=tmp_path / 'out')
+
+    link = tmp_path / 'out' / 'MacOS' / 'libjli.dylib'
+    assert link.is_symlink()
+    assert os.readlink(link) == '../Home/lib/libjli.dylib'
+    assert link.read_text() == 'library'
+
+
+def test_unsafe_paths(tmp_path):
+    "Members can't be extracted outside the extraction directory"
+    zip_path = tmp_path / 'archive.zip'
+    with zipfile.ZipFile(zip_path, 'w') as archive:
+        archive.writestr('../../escaped.txt', 'escaped')
+        archive.writestr('/absolute.txt', 'absolute')
+
+    unpack_zip(zip_path, extract_dir=tmp_path / 'a' / 'b' / 'out')
+
+    assert (tmp_path / 'a' / 'b' / 'out' / 'escaped.txt').read_text() == 'escaped'
+    assert (tmp_path / 'a' / 'b' / 'out' / 'absolute.txt').read_text() == 'absolute'
+    assert not (tmp_path / 'escaped.txt').exists()
+
+
+def test_bad_zipfile(tmp_path):
+    "If the file isn't a zip file, a ReadError is raised"
+    zip_path = tmp_path / 'archive.zip'
+    zip_path.write_text("This isn't a zip file")
+
+    with pytest.raises(shutil.ReadError):
+        unpack_zip(zip_path, extract_dir=tmp_path / 'out')
+
+
+def test_missing_zipfile(tmp_path):
+    "If the file doesn't exist, a ReadError is raised"
+    with pytest.raises(shutil.ReadError):
+        unpack_zip(tmp_path / 'archive.zip', extract_dir=tmp_path / 'out')
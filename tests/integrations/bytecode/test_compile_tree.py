@@ -0,0 +1,144 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+from briefcase.integrations import bytecode
+from briefcase.integrations.bytecode import compile_tree
+
+
+@pytest.fixture
+def tree(tmp_path):
+    app_path = tmp_path / 'app'
+    (app_path / 'myapp').mkdir(parents=True)
+    (app_path / 'myapp' / '__init__.py').write_text('')
+    (app_path / 'myapp' / 'app.py').write_text('def main():\n    return 42\n')
+    (app_path / 'myapp' / 'template.py').write_text('def {{ invalid }}:\n')
+    return app_path
+
+
+def pyc(source):
+    return importlib.util.cache_from_source(str(source), optimization='')
+
+
+def test_compile(tree, tmp_path):
+    "Every source file is compiled into an unchecked-hash pyc"
+    counts = compile_tree([tree], tmp_path / 'cache', workers=1)
+
+    assert counts == {'compiled': 2, 'cached': 0, 'unchanged': 0, 'failed': 1}
+
+    with open(pyc(tree / 'myapp' / 'app.py'), 'rb') as f:
+        header = f.read(16)
+    assert header[:4] == importlib.util.MAGIC_NUMBER
+    assert int.from_bytes(header[4:8], 'little') == bytecode.UNCHECKED_HASH_FLAGS
+    assert header[8:16] == importlib.util.source_hash((tree / 'myapp' / 'app.py').read_bytes())
+
+    # The compiled output has been cached.
+    assert len(list((tmp_path / 'cache').iterdir())) == 2
+    assert all(
+        path.name.startswith(sys.implementation.cache_tag)
+        for path in (tmp_path / 'cache').iterdir()
+    )
+
+
+def test_compiled_module_is_used(tree, tmp_path):
+    "The compiled module can be imported, even if the source is stale"
+    compile_tree([tree], tmp_path / 'cache', workers=1)
+
+    # Unchecked pycs are used without validating the source.
+    (tree / 'myapp' / 'app.py').write_text('def main():\n    return 0\n')
+    sys.path.insert(0, str(tree))
+    try:
+        import myapp.app
+        assert myapp.app.main() == 42
+    finally:
+        sys.path.remove(str(tree))
+        sys.modules.pop('myapp.app', None)
+        sys.modules.pop('myapp', None)
+
+
+def test_recompile_unchanged(tree, tmp_path):
+    "Sources whose pyc is current aren't compiled again"
+    compile_tree([tree], tmp_path / 'cache', workers=1)
+    counts = compile_tree([tree], tmp_path / 'cache', workers=1)
+
+    assert counts == {'compiled': 0, 'cached': 0, 'unchanged': 2, 'failed': 1}
+
+
+def test_recompile_changed(tree, tmp_path):
+    "Only sources that have changed are compiled again"
+    compile_tree([tree], tmp_path / 'cache', workers=1)
+    (tree / 'myapp' / 'app.py').write_text('def main():\n    return 0\n')
+
+    counts = compile_tree([tree], tmp_path / 'cache', workers=1)
+
+    assert counts == {'compiled': 1, 'cached': 0, 'unchanged': 1, 'failed': 1}
+
+
+def test_from_cache(tree, tmp_path):
+    "Compiled output is reused from the cache"
+    compile_tree([tree], tmp_path / 'cache', workers=1)
+
+    # A new copy of the same sources (e.g., a different bundle)
+    other = tmp_path / 'other'
+    (other / 'myapp').mkdir(parents=True)
+    for name in ['__init__.py', 'app.py']:
+        (other / 'myapp' / name).write_bytes((tree / 'myapp' / name).read_bytes())
+
+    counts = compile_tree([other], tmp_path / 'cache', workers=1)
+
+    assert counts == {'compiled': 0, 'cached': 2, 'unchanged': 0, 'failed': 0}
+    assert (
+        open(pyc(other / 'myapp' / 'app.py'), 'rb').read()
+        == open(pyc(tree / 'myapp' / 'app.py'), 'rb').read()
+    )
+
+
+@pytest.mark.parametrize('cached', [False, True])
+def test_hard_linked_pyc(tree, tmp_path, cached):
+    "A pyc that is hard linked to another file is replaced, not overwritten"
+    if cached:
+        # Populate the cache with the compiled output of the sources.
+        other = tmp_path / 'other'
+        (other / 'myapp').mkdir(parents=True)
+        (other / 'myapp' / 'app.py').write_bytes((tree / 'myapp' / 'app.py').read_bytes())
+        compile_tree([other], tmp_path / 'cache', workers=1)
+
+    # The existing pyc is a stale hard link to a shared file.
+    shared = tmp_path / 'shared.pyc'
+    shared.write_bytes(b'shared content')
+    os.makedirs(os.path.dirname(pyc(tree / 'myapp' / 'app.py')))
+    os.link(str(shared), pyc(tree / 'myapp' / 'app.py'))
+
+    counts = compile_tree([tree], tmp_path / 'cache', workers=1)
+
+    assert counts['cached' if cached else 'compiled'] >= 1
+    assert shared.read_bytes() == b'shared content'
+    assert not os.path.samefile(str(shared), pyc(tree / 'myapp' / 'app.py'))
+    with open(pyc(tree / 'myapp' / 'app.py'), 'rb') as f:
+        assert f.read(4) == importlib.util.MAGIC_NUMBER
+    # No temporary files are left behind.
+    assert not [
+        name
+        for name in os.listdir(os.path.dirname(pyc(tree / 'myapp' / 'app.py')))
+        if name.endswith('.tmp')
+    ]
+
+
+def test_parallel(tmp_path, monkeypatch):
+    "Many files are compiled by a pool of workers"
+    monkeypatch.setattr(bytecode, 'FILES_PER_WORKER', 2)
+    app_path = tmp_path / 'app'
+    app_path.mkdir()
+    for i in range(8):
+        (app_path / 'module{i}.py'.format(i=i)).write_text('value = {i}\n'.format(i=i))
+
+    counts = compile_tree([app_path], tmp_path / 'cache', workers=2)
+
+    assert counts == {'compiled': 8, 'cached': 0, 'unchanged': 0, 'failed': 0}
+    for i in range(8):
+        assert (app_path / '__pycache__' / 'module{i}.{tag}.pyc'.format(
+            i=i,
+            tag=sys.implementation.cache_tag,
+        )).exists()
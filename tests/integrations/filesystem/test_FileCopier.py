@@ -0,0 +1,178 @@
+import errno
+import os
+
+import pytest
+
+from briefcase.integrations import filesystem
+from briefcase.integrations.filesystem import FileCopier, copy_range
+
+
+def unsupported(src, dst):
+    raise OSError(errno.EOPNOTSUPP, 'not supported')
+
+
+@pytest.fixture
+def source(tmp_path):
+    source = tmp_path / 'source.bin'
+    source.write_bytes(b'\x00\x01' * 1000)
+    return source
+
+
+def test_reflink(source, tmp_path, monkeypatch):
+    "A clone is the preferred mechanism"
+    cloned = []
+
+    def reflink(src, dst):
+        cloned.append(src)
+        with open(src, 'rb') as f, open(dst, 'xb') as g:
+            g.write(f.read())
+
+    monkeypatch.setattr(filesystem, 'reflink', reflink)
+
+    assert FileCopier().copy(source, tmp_path / 'target.bin') == 'reflink'
+    assert cloned == [source]
+    assert (tmp_path / 'target.bin').read_bytes() == source.read_bytes()
+
+
+def test_copy_file_range(source, tmp_path, monkeypatch):
+    "If clones aren't supported, copy_file_range() is used"
+    monkeypatch.setattr(filesystem, 'reflink', unsupported)
+    copied = []
+
+    def copy_range(src, dst):
+        copied.append(src)
+        with open(src, 'rb') as f, open(dst, 'xb') as g:
+            g.write(f.read())
+
+    monkeypatch.setattr(filesystem, 'copy_range', copy_range)
+
+    assert FileCopier().copy(source, tmp_path / 'target.bin') == 'copy_file_range'
+    assert copied == [source]
+
+
+def test_hardlink(source, tmp_path, monkeypatch):
+    "Hard links are only used if they are allowed"
+    monkeypatch.setattr(filesystem, 'reflink', unsupported)
+    monkeypatch.setattr(filesystem, 'copy_range', unsupported)
+    copier = FileCopier()
+
+    assert copier.copy(source, tmp_path / 'copy.bin') == 'copy'
+    assert not os.path.samefile(source, tmp_path / 'copy.bin')
+
+    assert copier.copy(source, tmp_path / 'link.bin', hardlink=True) == 'hardlink'
+    assert os.path.samefile(source, tmp_path / 'link.bin')
+
+
+def test_unsupported_not_retried(source, tmp_path, monkeypatch):
+    "Once a mechanism has failed as unsupported, it isn't attempted again"
+    attempts = []
+
+    def reflink(src, dst):
+        attempts.append(src)
+        unsupported(src, dst)
+
+    monkeypatch.setattr(filesystem, 'reflink', reflink)
+    copier = FileCopier()
+
+    copier.copy(source, tmp_path / 'first.bin')
+    copier.copy(source, tmp_path / 'second.bin')
+
+    assert attempts == [source]
+    assert (tmp_path / 'second.bin').read_bytes() == source.read_bytes()
+
+
+def test_unexpected_error(source, tmp_path, monkeypatch):
+    "An error that isn't caused by a lack of support is raised"
+    monkeypatch.setattr(
+        filesystem,
+        'reflink',
+        lambda src, dst: (_ for _ in ()).throw(OSError(errno.ENOSPC, 'disk full')),
+    )
+
+    with pytest.raises(OSError):
+        FileCopier().copy(source, tmp_path / 'target.bin')
+
+
+def test_replace_target(source, tmp_path):
+    "An existing target is replaced"
+    target = tmp_path / 'target.bin'
+    target.write_bytes(b'old')
+
+    FileCopier().copy(source, target)
+
+    assert target.read_bytes() == source.read_bytes()
+
+
+@pytest.mark.parametrize('count, workers', [(3, 4), (100, 4), (100, 1)])
+def test_copy_files(tmp_path, count, workers):
+    "Many files can be copied, in serial or in parallel"
+    (tmp_path / 'source').mkdir()
+    (tmp_path / 'target').mkdir()
+    pairs = []
+    for i in range(count):
+        src = tmp_path / 'source' / 'file{i}.txt'.format(i=i)
+        src.write_text('content {i}'.format(i=i))
+        pairs.append((src, tmp_path / 'target' / 'file{i}.txt'.format(i=i)))
+
+    counts = FileCopier(workers=workers).copy_files(pairs)
+
+    assert sum(counts.values()) == count
+    for i in range(count):
+        assert (tmp_path / 'target' / 'file{i}.txt'.format(i=i)).read_text() == 'content {i}'.format(i=i)
+
+
+@pytest.mark.skipif(not hasattr(os, 'copy_file_range'), reason="copy_file_range() is not available")
+def test_copy_range(source, tmp_path):
+    "copy_file_range() copies the content and metadata of a file"
+    source.chmod(0o751)
+    target = tmp_path / 'target.bin'
+
+    try:
+        copy_range(source, target)
+    except OSError as e:
+        if e.errno in filesystem.UNSUPPORTED_ERRNOS:
+            pytest.skip("copy_file_range() is not supported on this filesystem")
+        raise
+
+    assert target.read_bytes() == source.read_bytes()
+    assert target.stat().st_mode & 0o777 == 0o751
+    assert target.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+
+def test_copy_range_unavailable(source, tmp_path, monkeypatch):
+    "If copy_file_range() isn't available, an unsupported error is raised"
+    monkeypatch.delattr(os, 'copy_file_range', raising=False)
+
+    with pytest.raises(OSError) as exc_info:
+        copy_range(source, tmp_path / 'target.bin')
+
+    assert exc_info.value.errno in filesystem.UNSUPPORTED_ERRNOS
+    assert not (tmp_path / 'target.bin').exists()
+
+
+@pytest.mark.skipif(not hasattr(os, 'copy_file_range'), reason="copy_file_range() is not available")
+def test_copy_range_incomplete(source, tmp_path, monkeypatch):
+    "If copy_file_range() stops copying early, the partial copy is removed and another mechanism is used"
+    copy_file_range = os.copy_file_range
+    calls = []
+
+    def short_copy(src, dst, count, *args, **kwargs):
+        calls.append(count)
+        if len(calls) == 1:
+            return copy_file_range(src, dst, 100)
+        return 0
+
+    monkeypatch.setattr(os, 'copy_file_range', short_copy)
+
+    with pytest.raises(OSError) as exc_info:
+        copy_range(source, tmp_path / 'target.bin')
+
+    assert exc_info.value.errno in filesystem.UNSUPPORTED_ERRNOS
+    assert not (tmp_path / 'target.bin').exists()
+
+    # The copier falls back to the next mechanism, and copies all the content.
+    monkeypatch.setattr(filesystem, 'reflink', unsupported)
+    copier = FileCopier()
+
+    assert copier.copy(source, tmp_path / 'target.bin') != 'copy_file_range'
+    assert (tmp_path / 'target.bin').read_bytes() == source.read_bytes()
@@ -0,0 +1,53 @@
+import threading
+
+from briefcase.integrations.filesystem import file_lock, file_lock_held, hold_file_lock
+
+
+def test_lock_file_created(tmp_path):
+    "The lock file (and its directory) is created, and the lock can be reacquired"
+    lock_path = tmp_path / 'locks' / 'test.lock'
+
+    with file_lock(lock_path):
+        assert lock_path.exists()
+    with file_lock(lock_path):
+        pass
+
+    assert lock_path.exists()
+
+
+def test_lock_is_exclusive(tmp_path):
+    "The lock can only be held by one holder at a time"
+    lock_path = tmp_path / 'test.lock'
+    events = []
+
+    def other_holder():
+        # Each holder opens the lock file separately, like another process.
+        with file_lock(lock_path):
+            events.append('second')
+
+    with file_lock(lock_path):
+        thread = threading.Thread(target=other_holder)
+        thread.start()
+        thread.join(timeout=0.2)
+
+        # The other holder is still waiting for the lock.
+        assert thread.is_alive()
+        events.append('first')
+
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert events == ['first', 'second']
+
+
+def test_file_lock_held(tmp_path):
+    "A lock held by someone else can be detected"
+    lock_path = tmp_path / 'test.lock'
+    assert not file_lock_held(lock_path)
+
+    lock_file = hold_file_lock(lock_path)
+    try:
+        assert file_lock_held(lock_path)
+    finally:
+        lock_file.close()
+
+    assert not file_lock_held(lock_path)
@@ -0,0 +1,115 @@
+import errno
+import os
+import sys
+
+import pytest
+
+from briefcase.integrations import filesystem
+from briefcase.integrations.filesystem import materialize_tree
+
+
+@pytest.fixture
+def source(tmp_path):
+    source = tmp_path / 'source'
+    (source / 'lib' / 'pkg').mkdir(parents=True)
+    (source / 'lib' / 'pkg' / 'module.py').write_text('code')
+    (source / 'lib' / 'data.bin').write_bytes(b'\x00\x01')
+    (source / 'bin').mkdir()
+    (source / 'bin' / 'tool').write_text('#!/bin/sh')
+    (source / 'bin' / 'tool').chmod(0o755)
+    return source
+
+
+def unsupported(src, dst):
+    raise OSError(errno.EOPNOTSUPP, 'not supported')
+
+
+def test_copy(source, tmp_path, monkeypatch):
+    "If clones aren't supported, and hard links aren't allowed, the tree is copied"
+    monkeypatch.setattr(filesystem, 'reflink', unsupported)
+    monkeypatch.setattr(filesystem, 'copy_range', unsupported)
+    target = tmp_path / 'target'
+
+    counts = materialize_tree(source, target)
+
+    assert counts == {'reflink': 0, 'copy_file_range': 0, 'hardlink': 0, 'copy': 3}
+    assert (target / 'lib' / 'pkg' / 'module.py').read_text() == 'code'
+    assert (target / 'lib' / 'data.bin').read_bytes() == b'\x00\x01'
+    assert (target / 'bin' / 'tool').read_text() == '#!/bin/sh'
+    # The copy is independent of the source
+    assert not os.path.samefile(target / 'lib' / 'data.bin', source / 'lib' / 'data.bin')
+    if sys.platform != 'win32':
+        assert os.stat(target / 'bin' / 'tool').st_mode & 0o777 == 0o755
+
+
+def test_hardlink(source, tmp_path, monkeypatch):
+    "If hard links are allowed, they are used in preference to copies"
+    monkeypatch.setattr(
+        filesystem,
+        'reflink',
+        lambda src, dst: (_ for _ in ()).throw(OSError(errno.EXDEV, 'cross device')),
+    )
+    monkeypatch.setattr(filesystem, 'copy_range', unsupported)
+    target = tmp_path / 'target'
+
+    counts = materialize_tree(source, target, hardlink=True)
+
+    assert counts == {'reflink': 0, 'copy_file_range': 0, 'hardlink': 3, 'copy': 0}
+    assert os.path.samefile(target / 'lib' / 'data.bin', source / 'lib' / 'data.bin')
+
+
+def test_reflink(source, tmp_path, monkeypatch):
+    "Clones are used if they are supported"
+    cloned = []
+
+    def reflink(src, dst):
+        cloned.append(os.path.basename(src))
+        with open(src, 'rb') as f, open(dst, 'wb') as g:
+            g.write(f.read())
+
+    monkeypatch.setattr(filesystem, 'reflink', reflink)
+    target = tmp_path / 'target'
+
+    counts = materialize_tree(source, target, hardlink=True)
+
+    assert counts == {'reflink': 3, 'copy_file_range': 0, 'hardlink': 0, 'copy': 0}
+    assert sorted(cloned) == ['data.bin', 'module.py', 'tool']
+
+
+def test_unexpected_error(source, tmp_path, monkeypatch):
+    "An error that isn't caused by a lack of support is raised"
+    monkeypatch.setattr(
+        filesystem,
+        'reflink',
+        lambda src, dst: (_ for _ in ()).throw(OSError(errno.ENOSPC, 'disk full')),
+    )
+
+    with pytest.raises(OSError):
+        materialize_tree(source, tmp_path / 'target')
+
+
+def test_merge(source, tmp_path):
+    "Content is merged into an existing target, replacing existing files"
+    target = tmp_path / 'target'
+    (target / 'lib').mkdir(parents=True)
+    (target / 'lib' / 'data.bin').write_bytes(b'old')
+    (target / 'README').write_text('readme')
+
+    materialize_tree(source, target)
+
+    assert (target / 'lib' / 'data.bin').read_bytes() == b'\x00\x01'
+    assert (target / 'README').read_text() == 'readme'
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="Symlinks require privileges on Windows")
+def test_symlinks(source, tmp_path):
+    "Symlinks are reproduced as symlinks"
+    (source / 'lib' / 'link.bin').symlink_to('data.bin')
+    (source / 'pkg-link').symlink_to('lib/pkg')
+    target = tmp_path / 'target'
+
+    materialize_tree(source, target)
+
+    assert os.readlink(target / 'lib' / 'link.bin') == 'data.bin'
+    assert os.readlink(target / 'pkg-link') == 'lib/pkg'
+    assert (target / 'pkg-link' / 'module.py').read_text() == 'code'
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from briefcase.integrations.filesystem import glob_regex, prune_tree
+
+
+@pytest.mark.parametrize(
+    'pattern, path, is_dir, matched',
+    [
+        ('**/tests/', 'tests', True, True),
+        ('**/tests/', 'first/tests', True, True),
+        ('**/tests/', 'first/sub/tests', True, True),
+        ('**/tests/', 'first/tests', False, False),
+        ('**/tests/', 'first/tests.py', False, False),
+        ('*/tests/', 'first/tests', True, True),
+        ('*/tests/', 'first/sub/tests', True, False),
+        ('**/*.pyi', 'first/__init__.pyi', False, True),
+        ('**/*.pyi', 'module.pyi', False, True),
+        ('*.dist-info/RECORD', 'first-1.0.dist-info/RECORD', False, True),
+        ('*.dist-info/RECORD', 'first/first-1.0.dist-info/RECORD', False, False),
+        ('first/data?.txt', 'first/data1.txt', False, True),
+        ('first/data?.txt', 'first/data10.txt', False, False),
+        ('first/**', 'first/sub/data.txt', False, True),
+    ]
+)
+def test_glob_regex(pattern, path, is_dir, matched):
+    "Glob patterns match whole relative paths"
+    regex, directory = glob_regex(pattern)
+    assert (bool(regex.match(path)) and (is_dir or not directory)) == matched
+
+
+def create_file(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'x' * size)
+
+
+def test_prune_tree(tmp_path):
+    "Matching files and directories are removed, and the removal is reported by top-level item"
+    create_file(tmp_path / 'first' / '__init__.py', 10)
+    create_file(tmp_path / 'first' / '__init__.pyi', 20)
+    create_file(tmp_path / 'first' / 'tests' / 'test_first.py', 30)
+    create_file(tmp_path / 'first' / 'tests' / 'data' / 'sample.txt', 40)
+    create_file(tmp_path / 'first-1.0.dist-info' / 'RECORD', 50)
+    create_file(tmp_path / 'first-1.0.dist-info' / 'METADATA', 60)
+    create_file(tmp_path / 'second.py', 70)
+    create_file(tmp_path / 'second.pyi', 80)
+
+    removed = prune_tree(tmp_path, ['**/tests/', '**/*.pyi', '*.dist-info/RECORD'])
+
+    assert removed == {
+        'first': {'files': 3, 'bytes': 90},
+        'first-1.0.dist-info': {'files': 1, 'bytes': 50},
+        'second.pyi': {'files': 1, 'bytes': 80},
+    }
+    assert (tmp_path / 'first' / '__init__.py').exists()
+    assert not (tmp_path / 'first' / '__init__.pyi').exists()
+    assert not (tmp_path / 'first' / 'tests').exists()
+    assert (tmp_path / 'first-1.0.dist-info' / 'METADATA').exists()
+    assert not (tmp_path / 'first-1.0.dist-info' / 'RECORD').exists()
+    assert (tmp_path / 'second.py').exists()
+    assert not (tmp_path / 'second.pyi').exists()
+
+
+def test_prune_nothing(tmp_path):
+    "If nothing matches, nothing is removed"
+    create_file(tmp_path / 'first' / '__init__.py', 10)
+
+    assert prune_tree(tmp_path, ['**/tests/']) == {}
+    assert (tmp_path / 'first' / '__init__.py').exists()
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink'), reason="Symlinks aren't supported")
+def test_prune_symlink(tmp_path):
+    "A symlink to a directory is removed without removing the directory it refers to"
+    create_file(tmp_path / 'data' / 'sample.txt', 10)
+    (tmp_path / 'first').mkdir()
+    os.symlink(str(tmp_path / 'data'), str(tmp_path / 'first' / 'docs'))
+
+    prune_tree(tmp_path / 'first', ['**/docs'])
+
+    assert not os.path.lexists(str(tmp_path / 'first' / 'docs'))
+    assert (tmp_path / 'data' / 'sample.txt').exists()
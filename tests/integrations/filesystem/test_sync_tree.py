@@ -0,0 +1,161 @@
+import os
+
+import pytest
+
+from briefcase.integrations.filesystem import sync_tree
+
+
+@pytest.fixture
+def source(tmp_path):
+    source = tmp_path / 'source'
+    (source / 'pkg' / 'sub').mkdir(parents=True)
+    (source / 'pkg' / '__init__.py').write_text('init')
+    (source / 'pkg' / 'sub' / 'module.py').write_text('code')
+    (source / 'app.py').write_text('app')
+    return source
+
+
+def touch(path, offset):
+    "Move the modification time of a file, without changing its content"
+    stat_result = path.stat()
+    os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + offset))
+
+
+def test_initial_sync(source, tmp_path):
+    "Without a manifest, the full tree is copied"
+    target = tmp_path / 'target'
+
+    manifest, counts = sync_tree(source, target)
+
+    assert counts == {'copied': 3, 'removed': 0, 'unchanged': 0}
+    assert (target / 'pkg' / 'sub' / 'module.py').read_text() == 'code'
+    assert (target / 'app.py').read_text() == 'app'
+    assert sorted(manifest['files'].keys()) == [
+        'app.py',
+        os.path.join('pkg', '__init__.py'),
+        os.path.join('pkg', 'sub', 'module.py'),
+    ]
+
+
+def test_initial_sync_replaces_target(source, tmp_path):
+    "Without a manifest, any existing content in the target is discarded"
+    target = tmp_path / 'target'
+    (target / 'old').mkdir(parents=True)
+    (target / 'old' / 'stale.py').write_text('stale')
+    (target / 'app.py').write_text('old app')
+
+    manifest, counts = sync_tree(source, target)
+
+    assert counts == {'copied': 3, 'removed': 0, 'unchanged': 0}
+    assert not (target / 'old').exists()
+    assert (target / 'app.py').read_text() == 'app'
+
+
+def test_unchanged(source, tmp_path):
+    "If nothing has changed, nothing is copied"
+    target = tmp_path / 'target'
+    manifest, counts = sync_tree(source, target)
+
+    new_manifest, counts = sync_tree(source, target, manifest=manifest)
+
+    assert counts == {'copied': 0, 'removed': 0, 'unchanged': 3}
+    assert new_manifest == manifest
+
+
+def test_changes(source, tmp_path):
+    "Added and modified files are copied; deleted files and directories are removed"
+    target = tmp_path / 'target'
+    manifest, counts = sync_tree(source, target)
+
+    (source / 'app.py').write_text('new app content')
+    touch(source / 'app.py', 1000000)
+    (source / 'pkg' / 'sub' / 'module.py').unlink()
+    (source / 'pkg' / 'sub').rmdir()
+    (source / 'pkg' / 'extra.py').write_text('extra')
+
+    new_manifest, counts = sync_tree(source, target, manifest=manifest)
+
+    assert counts == {'copied': 2, 'removed': 1, 'unchanged': 1}
+    assert (target / 'app.py').read_text() == 'new app content'
+    assert (target / 'pkg' / 'extra.py').read_text() == 'extra'
+    assert not (target / 'pkg' / 'sub').exists()
+    assert os.path.join('pkg', 'sub', 'module.py') not in new_manifest['files']
+
+
+def test_unknown_files_removed(source, tmp_path):
+    "Files added to the target that aren't in the source are removed"
+    target = tmp_path / 'target'
+    manifest, counts = sync_tree(source, target)
+    (target / 'pkg' / 'stray.py').write_text('stray')
+
+    manifest, counts = sync_tree(source, target, manifest=manifest)
+
+    assert counts == {'copied': 0, 'removed': 1, 'unchanged': 3}
+    assert not (target / 'pkg' / 'stray.py').exists()
+
+
+def test_missing_target_file(source, tmp_path):
+    "If a file has been deleted from the target, it is copied again"
+    target = tmp_path / 'target'
+    manifest, counts = sync_tree(source, target)
+    (target / 'app.py').unlink()
+
+    manifest, counts = sync_tree(source, target, manifest=manifest)
+
+    assert counts == {'copied': 1, 'removed': 0, 'unchanged': 2}
+    assert (target / 'app.py').read_text() == 'app'
+
+
+def test_checksum(source, tmp_path):
+    "If checksums are enabled, a file that has only been touched isn't copied"
+    target = tmp_path / 'target'
+    manifest, counts = sync_tree(source, target, checksum=True)
+    touch(source / 'app.py', 1000000)
+
+    manifest, counts = sync_tree(source, target, manifest=manifest, checksum=True)
+
+    assert counts == {'copied': 0, 'removed': 0, 'unchanged': 3}
+    assert manifest['files']['app.py'][1] == (source / 'app.py').stat().st_mtime_ns
+
+
+def test_without_checksum(source, tmp_path):
+    "If checksums aren't enabled, a file that has been touched is copied"
+    target = tmp_path / 'target'
+    manifest, counts = sync_tree(source, target)
+    touch(source / 'app.py', 1000000)
+
+    manifest, counts = sync_tree(source, target, manifest=manifest)
+
+    assert counts == {'copied': 1, 'removed': 0, 'unchanged': 2}
+
+
+def test_single_file(tmp_path):
+    "A single file can be synchronized"
+    source = tmp_path / 'source.py'
+    source.write_text('single')
+    target = tmp_path / 'target.py'
+
+    manifest, counts = sync_tree(source, target)
+    assert counts == {'copied': 1, 'removed': 0, 'unchanged': 0}
+    assert target.read_text() == 'single'
+
+    manifest, counts = sync_tree(source, target, manifest=manifest)
+    assert counts == {'copied': 0, 'removed': 0, 'unchanged': 1}
+
+
+def test_file_replaces_directory(tmp_path):
+    "If a directory source becomes a file, the target directory is replaced"
+    source = tmp_path / 'source'
+    source.mkdir()
+    (source / 'module.py').write_text('code')
+    target = tmp_path / 'target'
+    manifest, counts = sync_tree(source, target)
+
+    (source / 'module.py').unlink()
+    source.rmdir()
+    source.write_text('now a file')
+
+    manifest, counts = sync_tree(source, target, manifest=manifest)
+
+    assert target.is_file()
+    assert target.read_text() == 'now a file'
@@ -0,0 +1,92 @@
+import pytest
+
+from briefcase.integrations.images import generate_image, image_dimensions, parse_image_size
+
+Image = pytest.importorskip('PIL.Image')
+
+
+@pytest.fixture
+def master(tmp_path):
+    path = tmp_path / 'icon-1024.png'
+    Image.new('RGBA', (1024, 512), (255, 0, 0, 128)).save(path)
+    return path
+
+
+def test_image_dimensions(master, tmp_path):
+    "The dimensions of an image can be read"
+    assert image_dimensions(master) == (1024, 512)
+
+    (tmp_path / 'not-an-image.png').write_text('hello')
+    assert image_dimensions(tmp_path / 'not-an-image.png') is None
+
+
+def test_generate(master, tmp_path):
+    "An image is generated at the requested width, preserving the aspect ratio"
+    path, generated = generate_image(master, 100, '.png', tmp_path / 'cache')
+
+    assert generated
+    assert image_dimensions(path) == (100, 50)
+    with Image.open(path) as image:
+        assert image.mode == 'RGBA'
+
+
+def test_generate_cached(master, tmp_path):
+    "A generated image is reused from the cache"
+    first, _ = generate_image(master, 100, '.png', tmp_path / 'cache')
+    second, generated = generate_image(master, 100, '.png', tmp_path / 'cache')
+
+    assert not generated
+    assert second == first
+
+    # A different size or format is a different image.
+    other, generated = generate_image(master, 64, '.png', tmp_path / 'cache')
+    assert generated
+    assert other != first
+
+
+@pytest.mark.parametrize('suffix, format', [('.ico', 'ICO'), ('.bmp', 'BMP')])
+def test_generate_format(master, tmp_path, suffix, format):
+    "The format of the generated image is determined by its extension"
+    path, _ = generate_image(master, 64, suffix, tmp_path / 'cache')
+
+    assert path.endswith(suffix)
+    with Image.open(path) as image:
+        assert image.format == format
+
+
+@pytest.mark.parametrize(
+    'size, parsed',
+    [
+        (180, (180, None)),
+        ('180', (180, None)),
+        ('1024x768', (1024, 768)),
+        ('round', None),
+        ('1024x', None),
+    ]
+)
+def test_parse_image_size(size, parsed):
+    "Image sizes can be a width, or a width and height"
+    assert parse_image_size(size) == parsed
+
+
+def test_generate_width_and_height(master, tmp_path):
+    "An image with a width and height is scaled to cover the size, and cropped"
+    path, generated = generate_image(master, 100, '.png', tmp_path / 'cache', height=100)
+
+    assert generated
+    assert path.endswith('-100x100.png')
+    assert image_dimensions(path) == (100, 100)
+
+
+def test_generate_unsupported_format(master, tmp_path):
+    "If Pillow can't write the requested format, no image is generated"
+    assert generate_image(master, 64, '.xyz', tmp_path / 'cache') is None
+    assert list((tmp_path / 'cache').iterdir()) == []
+
+
+def test_generate_unreadable_source(tmp_path):
+    "If the source can't be read as an image, no image is generated"
+    (tmp_path / 'icon.png').write_text('hello')
+
+    assert generate_image(tmp_path / 'icon.png', 64, '.png', tmp_path / 'cache') is None
+    assert list((tmp_path / 'cache').iterdir()) == []
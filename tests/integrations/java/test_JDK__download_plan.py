@@ -0,0 +1,47 @@
+from unittest import mock
+
+import pytest
+
+from briefcase.integrations.java import JDK
+
+
+@pytest.fixture
+def test_command(tmp_path):
+    command = mock.MagicMock()
+    command.tools_path = tmp_path / 'tools'
+    command.host_os = 'Linux'
+
+    # Mock environ.get returning no explicit JAVA_HOME
+    command.os.environ.get = mock.MagicMock(return_value='')
+
+    return command
+
+
+def test_no_jdk(test_command):
+    "If there is no JDK, a JDK download is planned"
+    plan = JDK.download_plan(test_command)
+
+    assert plan == [
+        (JDK(test_command, java_home=None).adoptOpenJDK_download_url, test_command.tools_path),
+    ]
+
+
+def test_managed_jdk(test_command):
+    "If there is a Briefcase-managed JDK, no download is planned"
+    (test_command.tools_path / 'java' / 'bin').mkdir(parents=True)
+
+    assert JDK.download_plan(test_command) == []
+
+
+def test_java_home(test_command):
+    "If JAVA_HOME is set, no download is planned"
+    test_command.os.environ.get = mock.MagicMock(return_value='/path/to/java')
+
+    assert JDK.download_plan(test_command) == []
+
+
+def test_macos(test_command):
+    "On macOS, no download is planned"
+    test_command.host_os = 'Darwin'
+
+    assert JDK.download_plan(test_command) == []
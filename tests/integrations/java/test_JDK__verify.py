@@ -337,14 +337,8 @@ def test_successful_jdk_download(test_command, tmp_path, capsys, host_os, jdk_ur
     test_command.download_url.assert_called_with(
         url=jdk_url,
         download_path=tmp_path / "tools",
-    )
-    # The archive was unpacked
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    test_command.shutil.unpack_archive.assert_called_with(
-        "/path/to/download.zip",
-        extract_dir=os.fsdecode(tmp_path / "tools")
-    )
-    # The original archive was deleted
+        extract_dir=tmp_path / "tools",
+    )    # The original archive was deleted
     archive.unlink.assert_called_once_with()
 
 
@@ -378,6 +372,7 @@ def test_jdk_download_failure(test_command, tmp_path):
         url="https://github.com/AdoptOpenJDK/openjdk8-binaries/releases/download/"
             "jdk8u242-b08/OpenJDK8U-jdk_x64_linux_hotspot_8u242b08.tar.gz",
         download_path=tmp_path / "tools",
+        extract_dir=tmp_path / "tools",
     )
     # No attempt was made to unpack the archive
     assert test_command.shutil.unpack_archive.call_count == 0
@@ -388,18 +383,8 @@ def test_invalid_jdk_archive(test_command, tmp_path):
     # Mock Linux as the host
     test_command.host_os = 'Linux'
 
-    # Mock the cached download path
-    # Consider to remove if block when we drop py3.7 support, only keep statements from else.
-    # MagicMock below py3.8 doesn't has __fspath__ attribute.
-    if sys.version_info < (3, 8):
-        archive = FsPathMock("/path/to/download.zip")
-    else:
-        archive = mock.MagicMock()
-        archive.__fspath__.return_value = "/path/to/download.zip"
-    test_command.download_url.return_value = archive
-
     # Mock an unpack failure due to an invalid archive
-    test_command.shutil.unpack_archive.side_effect = shutil.ReadError
+    test_command.download_url.side_effect = shutil.ReadError
 
     with pytest.raises(BriefcaseCommandError):
         JDK.verify(command=test_command)
@@ -409,12 +394,5 @@ def test_invalid_jdk_archive(test_command, tmp_path):
         url="https://github.com/AdoptOpenJDK/openjdk8-binaries/releases/download/"
             "jdk8u242-b08/OpenJDK8U-jdk_x64_linux_hotspot_8u242b08.tar.gz",
         download_path=tmp_path / "tools",
+        extract_dir=tmp_path / "tools",
     )
-    # An attempt was made to unpack the archive.
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    test_command.shutil.unpack_archive.assert_called_with(
-        "/path/to/download.zip",
-        extract_dir=os.fsdecode(tmp_path / "tools")
-    )
-    # The original archive was not deleted
-    assert archive.unlink.call_count == 0
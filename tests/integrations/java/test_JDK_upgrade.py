@@ -1,4 +1,3 @@
-import os
 import shutil
 import sys
 
@@ -90,13 +89,7 @@ def test_existing_install(test_command, tmp_path):
         url="https://github.com/AdoptOpenJDK/openjdk8-binaries/releases/download/"
             "jdk8u242-b08/OpenJDK8U-jdk_x64_linux_hotspot_8u242b08.tar.gz",
         download_path=tmp_path / 'tools',
-    )
-
-    # The archive was unpacked.
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    test_command.shutil.unpack_archive.assert_called_with(
-        "/path/to/download.zip",
-        extract_dir=os.fsdecode(tmp_path / "tools")
+        extract_dir=tmp_path / 'tools',
     )
     # The original archive was deleted
     archive.unlink.assert_called_once_with()
@@ -143,13 +136,7 @@ def test_macOS_existing_install(test_command, tmp_path):
         url="https://github.com/AdoptOpenJDK/openjdk8-binaries/releases/download/"
             "jdk8u242-b08/OpenJDK8U-jdk_x64_mac_hotspot_8u242b08.tar.gz",
         download_path=tmp_path / 'tools',
-    )
-
-    # The archive was unpacked.
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    test_command.shutil.unpack_archive.assert_called_with(
-        "/path/to/download.zip",
-        extract_dir=os.fsdecode(tmp_path / "tools")
+        extract_dir=tmp_path / 'tools',
     )
     # The original archive was deleted
     archive.unlink.assert_called_once_with()
@@ -184,6 +171,7 @@ def test_download_fail(test_command, tmp_path):
         url="https://github.com/AdoptOpenJDK/openjdk8-binaries/releases/download/"
             "jdk8u242-b08/OpenJDK8U-jdk_x64_linux_hotspot_8u242b08.tar.gz",
         download_path=tmp_path / 'tools',
+        extract_dir=tmp_path / 'tools',
     )
 
     # No attempt was made to unpack the archive
@@ -201,18 +189,8 @@ def test_unpack_fail(test_command, tmp_path):
         shutil.rmtree(path)
     test_command.shutil.rmtree.side_effect = rmtree
 
-    # Mock the cached download path
-    # Consider to remove if block when we drop py3.7 support, only keep statements from else.
-    # MagicMock below py3.8 doesn't has __fspath__ attribute.
-    if sys.version_info < (3, 8):
-        archive = FsPathMock("/path/to/download.zip")
-    else:
-        archive = MagicMock()
-        archive.__fspath__.return_value = "/path/to/download.zip"
-    test_command.download_url.return_value = archive
-
     # Mock an unpack failure due to an invalid archive
-    test_command.shutil.unpack_archive.side_effect = shutil.ReadError
+    test_command.download_url.side_effect = shutil.ReadError
 
     # Create an SDK wrapper
     jdk = JDK(test_command, java_home=java_home)
@@ -229,13 +207,5 @@ def test_unpack_fail(test_command, tmp_path):
         url="https://github.com/AdoptOpenJDK/openjdk8-binaries/releases/download/"
             "jdk8u242-b08/OpenJDK8U-jdk_x64_linux_hotspot_8u242b08.tar.gz",
         download_path=tmp_path / 'tools',
+        extract_dir=tmp_path / 'tools',
     )
-
-    # The archive was unpacked.
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    test_command.shutil.unpack_archive.assert_called_with(
-        "/path/to/download.zip",
-        extract_dir=os.fsdecode(tmp_path / "tools")
-    )
-    # The original archive was not deleted
-    assert archive.unlink.call_count == 0
@@ -0,0 +1,33 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from briefcase.integrations.linuxdeploy import LinuxDeploy
+
+
+@pytest.fixture
+def mock_command(tmp_path):
+    command = MagicMock()
+    command.host_arch = 'wonky'
+    command.tools_path = tmp_path / 'tools'
+    command.tools_path.mkdir()
+
+    return command
+
+
+def test_missing(mock_command):
+    "If linuxdeploy isn't installed, a download is planned"
+    assert LinuxDeploy.download_plan(mock_command) == [
+        (
+            'https://github.com/linuxdeploy/linuxdeploy/'
+            'releases/download/continuous/linuxdeploy-wonky.AppImage',
+            mock_command.tools_path,
+        )
+    ]
+
+
+def test_exists(mock_command):
+    "If linuxdeploy is installed, no download is planned"
+    (mock_command.tools_path / 'linuxdeploy-wonky.AppImage').touch()
+
+    assert LinuxDeploy.download_plan(mock_command) == []
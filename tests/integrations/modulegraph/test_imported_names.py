@@ -0,0 +1,53 @@
+import pytest
+
+from briefcase.integrations.modulegraph import imported_names
+
+
+def test_import_statements():
+    "Import statements anywhere in the source are found"
+    source = '\n'.join([
+        'import os, json.decoder',
+        'from xml.etree import ElementTree',
+        'from . import sibling',
+        'from .sibling import value',
+        'try:',
+        '    import ssl',
+        'except ImportError:',
+        '    ssl = None',
+        'def lazy():',
+        '    import sqlite3',
+    ])
+
+    assert imported_names(source) == {'os', 'json', 'xml', 'ssl', 'sqlite3'}
+
+
+def test_dynamic_imports():
+    "Dynamic imports of string literals are found"
+    source = '\n'.join([
+        'import importlib',
+        'importlib.import_module("csv")',
+        '__import__("email.parser")',
+        'importlib.import_module(".relative", package="pkg")',
+        'importlib.import_module(name)',
+    ])
+
+    assert imported_names(source) == {'importlib', 'csv', 'email'}
+
+
+def test_script_only_code():
+    "Imports that only run when the module is executed as a script are ignored"
+    source = '\n'.join([
+        'import os',
+        'def _test():',
+        '    import doctest',
+        'if __name__ == "__main__":',
+        '    import unittest',
+    ])
+
+    assert imported_names(source) == {'os'}
+
+
+def test_invalid_source():
+    "Source that isn't valid Python raises an error"
+    with pytest.raises(SyntaxError):
+        imported_names('print "hello"')
@@ -0,0 +1,106 @@
+import zipfile
+
+import pytest
+
+from briefcase.integrations.modulegraph import find_stdlib, shake_stdlib
+
+
+def create_file(path, content=''):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def stdlib_path(tmp_path):
+    path = tmp_path / 'support' / 'lib' / 'python3.X'
+    create_file(path / 'os.py', 'import stat\n')
+    create_file(path / 'stat.py')
+    create_file(path / 'site.py', 'import os\n')
+    create_file(path / 'encodings' / '__init__.py', 'import codecs\n')
+    create_file(path / 'encodings' / 'utf_8.py')
+    create_file(path / 'codecs.py')
+    create_file(path / '_sysconfigdata__linux.py')
+    create_file(path / 'json' / '__init__.py', 'from .decoder import JSONDecoder\n')
+    create_file(path / 'json' / 'decoder.py', 'import re\ntry:\n    import _json\nexcept ImportError:\n    pass\n')
+    create_file(path / 're.py', 'def _test():\n    import doctest\n')
+    create_file(path / 'csv.py')
+    create_file(path / 'doctest.py', 'import unittest\n')
+    create_file(path / 'unittest' / '__init__.py')
+    create_file(path / 'tkinter' / '__init__.py', 'import _tkinter\n')
+    create_file(path / '__pycache__' / 'csv.cpython-3X.pyc', 'x' * 100)
+    create_file(path / 'lib-dynload' / '_json.cpython-3X-x86_64-linux-gnu.so', 'x' * 10)
+    create_file(path / 'lib-dynload' / '_tkinter.cpython-3X-x86_64-linux-gnu.so', 'x' * 1000)
+    create_file(path / 'site-packages' / 'README.txt')
+    return path
+
+
+@pytest.fixture
+def app_path(tmp_path):
+    path = tmp_path / 'app'
+    create_file(path / 'myapp' / '__init__.py')
+    create_file(path / 'myapp' / 'app.py', 'import json\n')
+    return path
+
+
+def test_find_stdlib(stdlib_path, tmp_path):
+    "The standard library is found in the support package"
+    assert find_stdlib(tmp_path / 'support') == str(stdlib_path)
+
+
+def test_find_stdlib_missing(tmp_path):
+    "If the standard library is not stored as files, it isn't found"
+    create_file(tmp_path / 'support' / 'python3X.zip')
+
+    assert find_stdlib(tmp_path / 'support') is None
+
+
+def test_shake(stdlib_path, app_path):
+    "Modules that can't be imported by the app are removed"
+    removed = shake_stdlib(stdlib_path, [app_path])
+
+    assert removed == {
+        '_tkinter': {'files': 1, 'bytes': 1000},
+        'csv': {'files': 2, 'bytes': 100},
+        'doctest': {'files': 1, 'bytes': 16},
+        'tkinter': {'files': 1, 'bytes': 16},
+        'unittest': {'files': 1, 'bytes': 0},
+    }
+    # Modules reachable from the app, or needed by the interpreter, are retained.
+    for name in ['os.py', 'stat.py', 'site.py', 'codecs.py', 'encodings/utf_8.py', '_sysconfigdata__linux.py',
+                 'json/decoder.py', 're.py', 'lib-dynload/_json.cpython-3X-x86_64-linux-gnu.so']:
+        assert (stdlib_path / name).exists()
+    # Content that isn't a module is retained.
+    assert (stdlib_path / 'site-packages' / 'README.txt').exists()
+    assert not (stdlib_path / 'tkinter').exists()
+    assert not (stdlib_path / '__pycache__' / 'csv.cpython-3X.pyc').exists()
+
+
+def test_shake_includes(stdlib_path, app_path):
+    "Modules can be explicitly retained"
+    removed = shake_stdlib(stdlib_path, [app_path], includes=['csv', 'tkinter.ttk'])
+
+    assert sorted(removed) == ['doctest', 'unittest']
+    assert (stdlib_path / 'tkinter' / '__init__.py').exists()
+    assert (stdlib_path / 'lib-dynload' / '_tkinter.cpython-3X-x86_64-linux-gnu.so').exists()
+
+
+def test_shake_direct_development_import(stdlib_path, app_path):
+    "Development modules are retained if the app imports them directly"
+    create_file(app_path / 'myapp' / 'tests.py', 'import unittest\n')
+
+    removed = shake_stdlib(stdlib_path, [app_path])
+
+    assert 'unittest' not in removed
+    assert 'doctest' in removed
+
+
+def test_shake_packed_dependencies(stdlib_path, app_path, tmp_path):
+    "Imports in zip files of packed dependencies are traced"
+    app_packages_path = tmp_path / 'app_packages'
+    app_packages_path.mkdir()
+    with zipfile.ZipFile(app_packages_path / 'packages.zip', 'w') as archive:
+        archive.writestr('dep/__init__.py', 'import csv\n')
+
+    removed = shake_stdlib(stdlib_path, [app_path, app_packages_path])
+
+    assert 'csv' not in removed
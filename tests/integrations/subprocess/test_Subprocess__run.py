@@ -1,4 +1,9 @@
 import os
+import subprocess
+
+import pytest
+
+from briefcase.jobs import run_stages
 
 
 def test_simple_call(mock_sub, capsys):
@@ -42,3 +47,48 @@ def test_simple_verbose_call(mock_sub, capsys):
 
     mock_sub._subprocess.run.assert_called_with(['hello', 'world'])
     assert capsys.readouterr().out == ">>> hello world\n"
+
+
+def test_stage_output_captured(mock_sub, capsys):
+    "The output of a process run by a concurrent stage is reported in stage order"
+    mock_sub._subprocess.run.return_value = subprocess.CompletedProcess(
+        args=['pip'], returncode=0, stdout=b'pip output\n'
+    )
+
+    def first():
+        print('first stage')
+
+    def second():
+        print('second stage')
+        mock_sub.run(['pip'])
+
+    run_stages([('first', first, []), ('second', second, [])])
+
+    mock_sub._subprocess.run.assert_called_with(
+        ['pip'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    assert capsys.readouterr().out == "first stage\nsecond stage\npip output\n"
+
+
+def test_stage_output_captured_failure(mock_sub, capsys):
+    "If a process run by a concurrent stage fails, its output is still reported"
+    mock_sub._subprocess.run.side_effect = subprocess.CalledProcessError(
+        cmd=['pip'], returncode=1, output='pip failed\n'
+    )
+
+    def stage():
+        mock_sub.run(['pip'], check=True, universal_newlines=True)
+
+    with pytest.raises(subprocess.CalledProcessError):
+        run_stages([('stage', stage, [])])
+
+    assert capsys.readouterr().out == "pip failed\n"
+
+
+def test_stage_output_redirected(mock_sub):
+    "If the output of a process run by a stage is redirected, it isn't captured"
+    run_stages([('stage', lambda: mock_sub.run(['pip'], stdout=subprocess.DEVNULL), [])])
+
+    mock_sub._subprocess.run.assert_called_with(['pip'], stdout=subprocess.DEVNULL)
@@ -0,0 +1,47 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from briefcase.integrations.wix import WIX_DOWNLOAD_URL, WiX
+
+
+@pytest.fixture
+def mock_command(tmp_path):
+    command = MagicMock()
+    command.host_os = 'Windows'
+    command.tools_path = tmp_path / 'tools'
+    command.os.environ.get.return_value = None
+
+    return command
+
+
+def test_non_windows_host(mock_command):
+    "If the host OS isn't Windows, no download is planned"
+    mock_command.host_os = 'Other OS'
+
+    assert WiX.download_plan(mock_command) == []
+
+
+def test_wix_env(mock_command):
+    "If the WIX environment variable is set, no download is planned"
+    mock_command.os.environ.get.return_value = 'C:\\WiX'
+
+    assert WiX.download_plan(mock_command) == []
+
+
+def test_missing(mock_command):
+    "If there is no WiX install, a download is planned"
+    assert WiX.download_plan(mock_command) == [
+        (WIX_DOWNLOAD_URL, mock_command.tools_path),
+    ]
+
+
+def test_exists(mock_command):
+    "If there is a Briefcase-managed WiX install, no download is planned"
+    wix_path = mock_command.tools_path / 'wix'
+    wix_path.mkdir(parents=True)
+    (wix_path / 'heat.exe').touch()
+    (wix_path / 'light.exe').touch()
+    (wix_path / 'candle.exe').touch()
+
+    assert WiX.download_plan(mock_command) == []
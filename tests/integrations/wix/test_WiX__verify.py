@@ -126,10 +126,9 @@ def test_download_wix(mock_command, tmp_path):
     )
 
     # The download was unpacked.
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    mock_command.shutil.unpack_archive.assert_called_with(
-        os.fsdecode(wix_zip_path),
-        extract_dir=os.fsdecode(wix_path)
+    mock_command.unpack_archive.assert_called_with(
+        wix_zip,
+        extract_dir=wix_path
     )
 
     # The zip file was removed
@@ -179,7 +178,7 @@ def test_download_fail(mock_command, tmp_path):
     )
 
     # ... but the unpack didn't happen
-    assert mock_command.shutil.unpack_archive.call_count == 0
+    assert mock_command.unpack_archive.call_count == 0
 
 
 def test_unpack_fail(mock_command, tmp_path):
@@ -202,7 +201,7 @@ def test_unpack_fail(mock_command, tmp_path):
     mock_command.download_url.return_value = wix_zip
 
     # Mock an unpack failure
-    mock_command.shutil.unpack_archive.side_effect = EOFError
+    mock_command.unpack_archive.side_effect = EOFError
 
     # Verify the install. This will trigger a download,
     # but the unpack will fail
@@ -219,10 +218,9 @@ def test_unpack_fail(mock_command, tmp_path):
     )
 
     # The download was unpacked.
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    mock_command.shutil.unpack_archive.assert_called_with(
-        os.fsdecode(wix_zip_path),
-        extract_dir=os.fsdecode(wix_path)
+    mock_command.unpack_archive.assert_called_with(
+        wix_zip,
+        extract_dir=wix_path
     )
 
     # The zip file was not removed
@@ -0,0 +1,29 @@
+from briefcase.jobs import prefix_output
+
+
+def test_prefix_lines():
+    "Every line of output is prefixed"
+    assert prefix_output('[first]', 'hello\nworld\n') == '[first] hello\n[first] world\n'
+
+
+def test_already_prefixed():
+    "Lines that already have the prefix aren't prefixed again"
+    assert prefix_output('[first]', '[first] Created.\nDone\n') == '[first] Created.\n[first] Done\n'
+
+
+def test_blank_lines():
+    "Blank lines are preserved, but not prefixed"
+    assert prefix_output('[first]', 'hello\n\nworld') == '[first] hello\n\n[first] world\n'
+
+
+def test_progress_bar():
+    "Only the final state of a line that has been rewritten is retained"
+    assert prefix_output('[first]', '\r#.. 33%\r##. 66%\r### 100%\nDone\n') == (
+        '[first] ### 100%\n'
+        '[first] Done\n'
+    )
+
+
+def test_no_output():
+    "If there is no output, nothing is produced"
+    assert prefix_output('[first]', '') == ''
@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+
+from briefcase.jobs import run_stages
+
+
+def test_dependencies():
+    "Stages are only started once their dependencies are complete"
+    events = []
+
+    def stage(name):
+        def run():
+            events.append(name)
+        return run
+
+    run_stages([
+        ('first', stage('first'), []),
+        ('second', stage('second'), ['first']),
+        ('third', stage('third'), ['second']),
+    ])
+
+    assert events == ['first', 'second', 'third']
+
+
+def test_concurrent():
+    "Independent stages run at the same time"
+    # Each stage waits until both stages have started; if the stages
+    # weren't concurrent, this would time out.
+    barrier = threading.Barrier(2, timeout=5)
+
+    run_stages([
+        ('first', barrier.wait, []),
+        ('second', barrier.wait, []),
+    ])
+
+
+def test_serial(capsys):
+    "If the stages can't run concurrently, they are run in stage order in the current thread"
+    threads = []
+
+    def stage(name):
+        def run():
+            threads.append(threading.current_thread())
+            print(name)
+        return run
+
+    run_stages(
+        [
+            ('first', stage('first'), []),
+            ('second', stage('second'), []),
+        ],
+        concurrent=False,
+    )
+
+    assert threads == [threading.current_thread()] * 2
+    assert capsys.readouterr().out == "first\nsecond\n"
+
+
+def test_ordered_output(capsys):
+    "Output is reported in stage order, regardless of completion order"
+    second_done = threading.Event()
+
+    def first():
+        print("first starts")
+        # Don't finish until the second stage has finished.
+        second_done.wait(timeout=5)
+        print("first ends")
+
+    def second():
+        print("second")
+        second_done.set()
+
+    def third():
+        print("third")
+
+    run_stages([
+        ('first', first, []),
+        ('second', second, []),
+        ('third', third, ['second']),
+    ])
+
+    assert capsys.readouterr().out == "first starts\nfirst ends\nsecond\nthird\n"
+
+
+def test_failure(capsys):
+    "If a stage fails, dependent stages aren't started, and the error is raised"
+    events = []
+
+    def broken():
+        print("breaking")
+        raise ValueError("broken")
+
+    with pytest.raises(ValueError, match="broken"):
+        run_stages([
+            ('first', lambda: events.append('first'), []),
+            ('broken', broken, ['first']),
+            ('after', lambda: events.append('after'), ['broken']),
+        ])
+
+    assert events == ['first']
+    # Output from the failed stage is still reported.
+    assert capsys.readouterr().out == "breaking\n"
+
+
+def test_first_failure_raised():
+    "If several stages fail, the error from the earliest stage is raised"
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fail(message):
+        def run():
+            barrier.wait()
+            raise ValueError(message)
+        return run
+
+    with pytest.raises(ValueError, match="first"):
+        run_stages([
+            ('first', fail('first'), []),
+            ('second', fail('second'), []),
+        ])
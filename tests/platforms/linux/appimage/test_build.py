@@ -60,6 +60,9 @@ def build_command(tmp_path, first_app_config):
     command.Docker = Docker
 
     command.linuxdeploy = LinuxDeploy(command)
+
+    # Don't start any background downloads
+    command.prefetch_downloads = mock.MagicMock()
     return command
 
 
@@ -28,7 +28,7 @@ def test_install_app_dependencies(first_app_config, tmp_path):
     "If Docker is in use, a docker context is used to invoke pip"
     first_app_config.requires = ['foo==1.2.3', 'bar>=4.5']
 
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(base_path=tmp_path, home_path=tmp_path / "home")
     command.use_docker = True
     command.subprocess = MagicMock()
     docker = MagicMock()
@@ -57,6 +57,8 @@ def test_install_app_dependencies(first_app_config, tmp_path):
             '--target={tmp_path}/linux/appimage/First App/path/to/app_packages'.format(
                 tmp_path=tmp_path
             ),
+            '--no-index',
+            '--find-links={}'.format(command.wheelhouse_path),
             'foo==1.2.3',
             'bar>=4.5',
         ],
@@ -72,7 +74,7 @@ def test_install_app_dependencies_no_docker(first_app_config, tmp_path):
     "If docker is *not* in use, calls are made on raw subprocess"
     first_app_config.requires = ['foo==1.2.3', 'bar>=4.5']
 
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(base_path=tmp_path, home_path=tmp_path / "home")
     command.use_docker = False
     command.subprocess = MagicMock()
     docker = MagicMock()
@@ -102,8 +104,38 @@ def test_install_app_dependencies_no_docker(first_app_config, tmp_path):
             '--target={tmp_path}/linux/appimage/First App/path/to/app_packages'.format(
                 tmp_path=tmp_path
             ),
+            '--no-index',
+            '--find-links={}'.format(command.wheelhouse_path),
             'foo==1.2.3',
             'bar>=4.5',
         ],
         check=True
     )
+
+
+@pytest.mark.parametrize('use_docker, concurrent', [(True, False), (False, True)])
+def test_concurrent_stages(first_app_config, tmp_path, use_docker, concurrent):
+    "Stages are only run concurrently if Docker isn't in use"
+    command = LinuxAppImageCreateCommand(base_path=tmp_path, home_path=tmp_path / "home")
+    command.use_docker = use_docker
+    command._path_index = {
+        first_app_config: {
+            'app_path': 'AppDir/app',
+            'app_packages_path': 'AppDir/app_packages',
+            'support_path': 'AppDir/support',
+        }
+    }
+
+    assert command.concurrent_stages(first_app_config) == concurrent
+
+
+def test_dependency_fingerprint(first_app_config, tmp_path):
+    "Dependencies installed in Docker have a different fingerprint to those installed on the host"
+    first_app_config.requires = ['foo==1.2.3']
+    command = LinuxAppImageCreateCommand(base_path=tmp_path, home_path=tmp_path / "home")
+
+    command.use_docker = False
+    native = command.dependency_fingerprint(first_app_config)
+
+    command.use_docker = True
+    assert command.dependency_fingerprint(first_app_config) != native
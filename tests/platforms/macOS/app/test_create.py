@@ -1,3 +1,5 @@
+import os
+import shutil
 import zipfile
 from unittest import mock
 
@@ -20,8 +22,11 @@ def test_install_app_support_package(first_app_config, tmp_path):
 
     create_command = macOSAppCreateCommand(base_path=tmp_path)
 
-    # Modify download_url to return the temp zipfile
-    create_command.download_url = mock.MagicMock(return_value=support_file)
+    # Modify download_url to unpack the temp zipfile
+    def download_url(url, download_path, extract_dir):
+        shutil.unpack_archive(os.fsdecode(support_file), extract_dir=os.fsdecode(extract_dir))
+        return support_file
+    create_command.download_url = mock.MagicMock(side_effect=download_url)
 
     # Mock support package path
     create_command.support_path = mock.MagicMock(return_value=support_path)
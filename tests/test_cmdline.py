@@ -4,7 +4,13 @@ import pytest
 
 from briefcase import __version__
 from briefcase.cmdline import parse_cmdline
-from briefcase.commands import DevCommand, NewCommand, UpgradeCommand
+from briefcase.commands import (
+    CacheCommand,
+    DepsCommand,
+    DevCommand,
+    NewCommand,
+    UpgradeCommand
+)
 from briefcase.exceptions import (
     InvalidFormatError,
     NoCommandError,
@@ -132,6 +138,70 @@ def test_upgrade_command(monkeypatch):
     }
 
 
+def test_cache_command(monkeypatch):
+    "``briefcase cache stats`` returns the cache command"
+    # Pretend we're on macOS, regardless of where the tests run.
+    monkeypatch.setattr(sys, 'platform', 'darwin')
+
+    cmd, options = parse_cmdline('cache stats'.split())
+
+    assert isinstance(cmd, CacheCommand)
+    assert cmd.platform == 'macOS'
+    assert cmd.output_format is None
+    assert options == {
+        'action': 'stats',
+        'categories': None,
+        'max_size': None,
+    }
+
+
+def test_cache_prune_command(monkeypatch):
+    "``briefcase cache prune`` accepts a category and a maximum size"
+    # Pretend we're on macOS, regardless of where the tests run.
+    monkeypatch.setattr(sys, 'platform', 'darwin')
+
+    cmd, options = parse_cmdline('cache prune -c support --max-size 500M'.split())
+
+    assert isinstance(cmd, CacheCommand)
+    assert options == {
+        'action': 'prune',
+        'categories': ['support'],
+        'max_size': 500 * 1024 * 1024,
+    }
+
+
+def test_deps_command(monkeypatch):
+    "``briefcase deps fetch`` returns the deps command"
+    # Pretend we're on macOS, regardless of where the tests run.
+    monkeypatch.setattr(sys, 'platform', 'darwin')
+
+    cmd, options = parse_cmdline('deps fetch -a first'.split())
+
+    assert isinstance(cmd, DepsCommand)
+    assert cmd.platform == 'macOS'
+    assert cmd.output_format is None
+    assert options == {
+        'action': 'fetch',
+        'requirements': [],
+        'appnames': ['first'],
+    }
+
+
+def test_deps_command_requirements(monkeypatch):
+    "``briefcase deps fetch`` accepts requirements to fetch"
+    # Pretend we're on macOS, regardless of where the tests run.
+    monkeypatch.setattr(sys, 'platform', 'darwin')
+
+    cmd, options = parse_cmdline('deps fetch toga requests>=2.0'.split())
+
+    assert isinstance(cmd, DepsCommand)
+    assert options == {
+        'action': 'fetch',
+        'requirements': ['toga', 'requests>=2.0'],
+        'appnames': None,
+    }
+
+
 def test_bare_command(monkeypatch):
     "``briefcase create`` returns the macOS create app command"
     # Pretend we're on macOS, regardless of where the tests run.
@@ -144,7 +214,7 @@ def test_bare_command(monkeypatch):
     assert cmd.output_format == 'app'
     assert cmd.input.enabled
     assert cmd.verbosity == 1
-    assert options == {}
+    assert options == {'jobs': 1}
 
 
 @pytest.mark.skipif(sys.platform != 'linux', reason="requires Linux")
@@ -158,7 +228,7 @@ def test_linux_default():
     assert cmd.output_format == 'appimage'
     assert cmd.input.enabled
     assert cmd.verbosity == 1
-    assert options == {}
+    assert options == {'jobs': 1}
 
 
 @pytest.mark.skipif(sys.platform != 'darwin', reason="requires macOS")
@@ -202,7 +272,7 @@ def test_bare_command_help(monkeypatch, capsys):
     # Help message is for default platform and format
     output = capsys.readouterr().out
     assert output.startswith(
-        "usage: briefcase create macOS app [-h] [-v] [-V] [--no-input]\n"
+        "usage: briefcase create macOS app [-h] [-v] [-V] [--no-input] [-j JOBS]\n"
         "\n"
         "Create and populate a macOS app.\n"
     )
@@ -258,7 +328,7 @@ def test_command_explicit_platform(monkeypatch):
     assert cmd.output_format == 'appimage'
     assert cmd.input.enabled
     assert cmd.verbosity == 1
-    assert options == {}
+    assert options == {'jobs': 1}
 
 
 def test_command_explicit_platform_case_handling(monkeypatch):
@@ -274,7 +344,7 @@ def test_command_explicit_platform_case_handling(monkeypatch):
     assert cmd.output_format == 'app'
     assert cmd.input.enabled
     assert cmd.verbosity == 1
-    assert options == {}
+    assert options == {'jobs': 1}
 
 
 def test_command_explicit_platform_help(monkeypatch, capsys):
@@ -290,7 +360,7 @@ def test_command_explicit_platform_help(monkeypatch, capsys):
     # Help message is for default platform and format
     output = capsys.readouterr().out
     assert output.startswith(
-        "usage: briefcase create macOS app [-h] [-v] [-V] [--no-input]\n"
+        "usage: briefcase create macOS app [-h] [-v] [-V] [--no-input] [-j JOBS]\n"
         "\n"
         "Create and populate a macOS app.\n"
     )
@@ -321,7 +391,7 @@ def test_command_explicit_format(monkeypatch):
     assert cmd.output_format == 'app'
     assert cmd.input.enabled
     assert cmd.verbosity == 1
-    assert options == {}
+    assert options == {'jobs': 1}
 
 
 def test_command_unknown_format(monkeypatch):
@@ -355,7 +425,7 @@ def test_command_explicit_format_help(monkeypatch, capsys):
     # Help message is for default platform, but app format
     output = capsys.readouterr().out
     assert output.startswith(
-        "usage: briefcase create macOS app [-h] [-v] [-V] [--no-input]\n"
+        "usage: briefcase create macOS app [-h] [-v] [-V] [--no-input] [-j JOBS]\n"
         "\n"
         "Create and populate a macOS app.\n"
     )
@@ -386,7 +456,7 @@ def test_command_disable_input(monkeypatch):
     assert cmd.output_format == 'app'
     assert not cmd.input.enabled
     assert cmd.verbosity == 1
-    assert options == {}
+    assert options == {'jobs': 1}
 
 
 def test_command_options(monkeypatch, capsys):
@@ -1,3 +1,6 @@
+import io
+import tarfile
+
 from briefcase.console import Console, InputDisabled
 from unittest.mock import MagicMock
 
@@ -27,3 +30,21 @@ class FsPathMock(MagicMock):
     def _get_child_mock(self, **kw):
         """Create child mocks with right MagicMock class."""
         return MagicMock(**kw)
+
+
+def template_archive(files):
+    """
+    Create a side effect for ``Repo.archive()`` that writes a tar archive.
+
+    :param files: A dictionary mapping the name of each file in the archive
+        to its content.
+    """
+    def archive(ostream, treeish=None, **kwargs):
+        with tarfile.open(fileobj=ostream, mode='w') as tar:
+            for name, content in files.items():
+                data = content.encode('utf-8')
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+
+    return archive